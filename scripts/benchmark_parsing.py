@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Parsing Benchmark
+
+Times the ways a whole log can be parsed with the analyzer's event type
+subscriptions, to check that a read path actually pays for itself:
+
+    text   text-mode readline loop through ESOLogParser.parse_line (the
+           original read-all loop)
+    bulk   the binary, offset-tracking reader behind iter_entries
+    cache  the sidecar parse cache (--parse-cache), read warm; the cold run
+           that builds the sidecar is reported separately, with its size
+    parallel  worker processes packing byte ranges (--parse-workers); the
+           packing CPU time of all ranges and the parent's share (rebuilding
+           entries from packed ranges) are reported separately. With enough
+           cores the wall time approaches the parent's share
+
+Each path is run --repeat times and the fastest run is reported.
+
+--decode-share also times how much of parsing the hot record types
+(HOT_EVENT_TYPES) is UTF-8 decoding, the most a bytes-level decoder could
+save on them.
+
+Usage:
+    python3 scripts/benchmark_parsing.py LOG_FILE [--repeat 3] [--paths text,bulk] [--workers 0] [--decode-share]
+"""
+
+import argparse
+import mmap
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from esolog_tail import ESOLogAnalyzer
+from eso_log_cache import iter_cached_entries, iter_record_entries, pack_byte_range
+from eso_log_parallel import PARALLEL_CHUNK_SIZE, default_workers, iter_entries_parallel
+from eso_log_parser import ESOLogParser, iter_entries, iter_mmap_lines, split_byte_ranges
+
+# Record types that make up most of a raid log
+HOT_EVENT_TYPES = ('COMBAT_EVENT', 'EFFECT_CHANGED', 'BEGIN_CAST')
+
+
+def new_parser() -> ESOLogParser:
+    """A parser subscribed like the analyzer's, with record decoding"""
+    return ESOLogParser(event_types=ESOLogAnalyzer.SUBSCRIBED_EVENT_TYPES,
+                        record_event_types=ESOLogAnalyzer.RECORD_EVENT_TYPES)
+
+
+def parse_text(log_file: Path) -> int:
+    """Parse through a text-mode readline loop, counting entries"""
+    parser = new_parser()
+    count = 0
+    with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            line = line.strip()
+            if line and parser.parse_line(line):
+                count += 1
+    return count
+
+
+def parse_bulk(log_file: Path) -> int:
+    """Parse through the binary reader, counting entries"""
+    return sum(1 for _ in iter_entries(log_file, parser=new_parser()))
+
+
+def parse_cache(log_file: Path) -> int:
+    """Parse through the sidecar parse cache without reading lines back, counting entries"""
+    return sum(1 for _ in iter_cached_entries(log_file, new_parser(), cache_file=benchmark_cache_file(log_file),
+                                              lines=False))
+
+
+def benchmark_cache_file(log_file: Path) -> Path:
+    """Sidecar used by the cache path, kept apart from the log's own"""
+    return log_file.with_name(log_file.name + '.benchmark.esocache')
+
+
+def build_cache(log_file: Path):
+    """Time building the benchmark sidecar from scratch"""
+    cache_file = benchmark_cache_file(log_file)
+    cache_file.unlink(missing_ok=True)
+    started = time.perf_counter()
+    count = parse_cache(log_file)
+    elapsed = time.perf_counter() - started
+    size_mb = cache_file.stat().st_size / (1024 * 1024)
+    print(f"  {'cold':8s} {elapsed:7.2f} s  {count:,} entries, sidecar {size_mb:.1f} MB")
+
+
+def parse_parallel(log_file: Path, workers: int = 0) -> int:
+    """Parse byte ranges in worker processes, counting entries"""
+    return sum(1 for _ in iter_entries_parallel(log_file, new_parser(), workers, lines=False))
+
+
+def split_parallel(log_file: Path):
+    """Time the two halves of the parallel path in this process: packing every range, then rebuilding the entries"""
+    parser = new_parser()
+    event_types = frozenset(parser.structured_parser.subscribed_event_types)
+    ranges = split_byte_ranges(log_file, PARALLEL_CHUNK_SIZE)
+    started = time.perf_counter()
+    packed = [pack_byte_range(log_file, start, end, event_types) for start, end in ranges]
+    elapsed = time.perf_counter() - started
+    print(f"  {'pack':8s} {elapsed:7.2f} s  worker CPU time for {len(ranges)} ranges")
+
+    count = 0
+    with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+        started = time.perf_counter()
+        for (_, end), (names, records) in zip(ranges, packed):
+            count += sum(1 for _ in iter_record_entries(records, 0, len(records), end, names, parser,
+                                                        log_file, log, False, [], {}))
+        elapsed = time.perf_counter() - started
+    print(f"  {'parent':8s} {elapsed:7.2f} s  {count:,} entries rebuilt from packed ranges")
+
+
+def decode_share(log_file: Path, repeat: int):
+    """Print the time spent UTF-8 decoding the hot record lines against the time to parse them"""
+    markers = [f',{event_type},'.encode('ascii') for event_type in HOT_EVENT_TYPES]
+    raw_lines = [raw for _, raw in iter_mmap_lines(log_file) if any(marker in raw[:32] for marker in markers)]
+    parser = new_parser()
+
+    decode_time = parse_time = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        lines = [raw.decode('utf-8', 'ignore') for raw in raw_lines]
+        elapsed = time.perf_counter() - started
+        decode_time = elapsed if decode_time is None else min(decode_time, elapsed)
+
+        started = time.perf_counter()
+        for line in lines:
+            parser._parse_wanted_line(line)
+        elapsed = time.perf_counter() - started
+        parse_time = elapsed if parse_time is None else min(parse_time, elapsed)
+
+    total = decode_time + parse_time
+    print(f"  {'decode':8s} {decode_time:7.2f} s  {100 * decode_time / total:4.1f}% of parsing "
+          f"{len(raw_lines):,} {'/'.join(HOT_EVENT_TYPES)} lines ({total:.2f} s)")
+
+
+PATHS = {
+    'text': parse_text,
+    'bulk': parse_bulk,
+    'cache': parse_cache,
+    'parallel': parse_parallel,
+}
+
+
+def run_benchmark(log_file: Path, paths, repeat: int, workers: int = 0, decode: bool = False):
+    """Print the fastest of repeat runs of each read path"""
+    size_mb = log_file.stat().st_size / (1024 * 1024)
+    print(f"Parsing Benchmark: {log_file} ({size_mb:.1f} MB), best of {repeat}")
+    for name in paths:
+        if name == 'cache':
+            build_cache(log_file)
+        if name == 'parallel':
+            split_parallel(log_file)
+            print(f"  ({workers or default_workers()} workers)")
+        best = None
+        count = 0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            count = PATHS[name](log_file, workers) if name == 'parallel' else PATHS[name](log_file)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        print(f"  {name:8s} {best:7.2f} s  {size_mb / best:6.1f} MB/s  {count:,} entries")
+    if 'cache' in paths:
+        benchmark_cache_file(log_file).unlink(missing_ok=True)
+    if decode:
+        decode_share(log_file, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the read paths that parse a whole log")
+    parser.add_argument('log_file', type=Path, help='Encounter log to parse')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs of each path; the fastest is reported (default: 3)')
+    parser.add_argument('--paths', default=','.join(PATHS),
+                        help=f"Comma-separated read paths to time (default: {','.join(PATHS)})")
+    parser.add_argument('--workers', type=int, default=0,
+                        help='Worker processes of the parallel path (default: 0, one per CPU but one)')
+    parser.add_argument('--decode-share', action='store_true',
+                        help='Also time the share of UTF-8 decoding in parsing the hot record types')
+    args = parser.parse_args()
+
+    paths = [name.strip() for name in args.paths.split(',') if name.strip()]
+    unknown = [name for name in paths if name not in PATHS]
+    if unknown:
+        parser.error(f"unknown read path(s): {', '.join(unknown)}")
+    run_benchmark(args.log_file, paths, args.repeat, args.workers, args.decode_share)
+
+
+if __name__ == "__main__":
+    main()
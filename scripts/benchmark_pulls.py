@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Pull Cost Benchmark
+
+Feeds a synthetic trial session of many pulls through the analyzer and reports
+the processing time per pull (including its buff uptime table), to check that
+the cost of a pull does not grow with the length of the session, e.g. through
+the global buff history copied into every pull.
+
+Usage:
+    python3 scripts/benchmark_pulls.py [--pulls 200] [--players 12] [--buff-events 40]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from esolog_tail import ESOLogAnalyzer, BUFF_ABILITY_IDS
+
+
+def unit_state(unit_id: int) -> str:
+    """A unit state block (unitId, resources, shield, position) of a healthy unit."""
+    return f"{unit_id},30000/30000,20000/20000,20000/20000,500/500,1000/1000,0,0.5000,0.5000,1.0000"
+
+
+def session_lines(pulls: int, players: int, buff_events: int):
+    """Yield the log lines of a session: players join a trial, then fight pulls applying group buffs."""
+    yield '0,BEGIN_LOG,1755729685851,15,"NA Megaserver","en","eso.live.11.1"'
+    yield '1,ZONE_CHANGED,1301,"Coral Aerie",VETERAN'
+    for unit_id in range(1, players + 1):
+        yield (f'2,UNIT_ADDED,{unit_id},PLAYER,F,{unit_id},0,F,117,7,"Player {unit_id}","@player{unit_id}",'
+               f'{1000 + unit_id},50,3084,0,PLAYER_ALLY,T')
+
+    buff_ids = [BUFF_ABILITY_IDS['powerful_assault'], BUFF_ABILITY_IDS['major_courage']]
+    timestamp = 1000
+    for pull in range(pulls):
+        yield f'{timestamp},BEGIN_COMBAT'
+        # Every buff period is also recorded by the analyzer's global buff tracking, across pulls
+        for event in range(buff_events):
+            timestamp += 250
+            target = event % players + 1
+            buff_id = buff_ids[event % len(buff_ids)]
+            yield f'{timestamp},EFFECT_CHANGED,GAINED,1,{pull * buff_events + event},{buff_id},{unit_state(1)},{unit_state(target)}'
+            yield f'{timestamp + 100},EFFECT_CHANGED,FADED,1,{pull * buff_events + event},{buff_id},{unit_state(1)},{unit_state(target)}'
+        timestamp += 1000
+        yield f'{timestamp},END_COMBAT'
+        timestamp += 5000
+
+
+def run_benchmark(pulls: int, players: int, buff_events: int):
+    """Process the session and print the average time per pull over each tenth of it."""
+    analyzer = ESOLogAnalyzer()
+    pull_times = []
+    pull_started = None
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for line in session_lines(pulls, players, buff_events):
+            entry = analyzer.log_parser.parse_line(line)
+            if entry is None:
+                continue
+            if entry.event_type == "BEGIN_COMBAT":
+                pull_started = time.perf_counter()
+            analyzer.process_log_entry(entry)
+            if entry.event_type == "END_COMBAT" and pull_started is not None:
+                # Include the per-player uptime table a report of the pull would build
+                analyzer.current_encounter.get_buff_uptime_table()
+                pull_times.append(time.perf_counter() - pull_started)
+
+    print(f"Pull Cost Benchmark: {pulls} pulls, {players} players, {buff_events} buff events per pull")
+    bucket_size = max(1, len(pull_times) // 10)
+    for bucket_start in range(0, len(pull_times), bucket_size):
+        bucket = pull_times[bucket_start:bucket_start + bucket_size]
+        print(f"  Pulls {bucket_start + 1:4d}-{bucket_start + len(bucket):4d}: "
+              f"{sum(bucket) / len(bucket) * 1000:.3f} ms/pull")
+
+    history_periods = sum(len(periods) for unit_buffs in analyzer.global_player_buffs.values()
+                          for periods in unit_buffs.values())
+    encounter_periods = sum(len(periods) for unit_buffs in analyzer.current_encounter.player_buffs.values()
+                            for periods in unit_buffs.values())
+    print(f"Global buff history left: {history_periods} periods")
+    print(f"Buff periods in the last pull: {encounter_periods}")
+    if len(pull_times) >= 2 * bucket_size:
+        first = sum(pull_times[:bucket_size])
+        last = sum(pull_times[-bucket_size:])
+        print(f"Last/first pull cost ratio: {last / first:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how the per-pull processing cost develops over a long session")
+    parser.add_argument('--pulls', type=int, default=200, help='Number of pulls in the session (default: 200)')
+    parser.add_argument('--players', type=int, default=12, help='Number of players in the group (default: 12)')
+    parser.add_argument('--buff-events', type=int, default=40, help='Group buff applications per pull (default: 40)')
+    args = parser.parse_args()
+
+    run_benchmark(args.pulls, args.players, args.buff_events)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,620 @@
+#!/usr/bin/env python3
+"""
+Pre-build script to generate per-line-type decoders for ESO encounter logs.
+
+Reads the machine-readable copy of the encounter log format
+(data/encounterlog/encounterlog_format.json, which mirrors
+docs/encounterlog-format.md) and generates src/eso_log_decoders.py with one
+straight-line decoder function and one record class per line type.
+
+Supporting a new log version is a spec edit followed by re-running this script.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SPEC_FILE = Path(__file__).parent.parent / "data" / "encounterlog" / "encounterlog_format.json"
+OUTPUT_FILE = Path(__file__).parent.parent / "src" / "eso_log_decoders.py"
+
+SCALAR_TYPES = {'int': 'int', 'float': 'float', 'str': 'str', 'bool': 'bool'}
+
+# Composites decoded lazily: their first field is decoded with the line, every
+# other one from the raw tokens when it is read. Unit states take 10 of the
+# ~30 tokens of a combat line, and consumers rarely read more than one of them.
+LAZY_COMPOSITES = ('unitState',)
+
+# struct codes of the packed form (see generate_packers). Ints are packed as
+# int32 and floats as int32 ten-thousandths (the log writes four decimals): a
+# record with a value that does not fit cannot be packed and is kept as its
+# line instead. Strings are packed as codes into a caller-kept table.
+PACK_CODES = {'int': 'i', 'float': 'i', 'bool': '?', 'str': 'I', 'ratio': 'ii'}
+
+
+def load_spec(spec_file: Path = SPEC_FILE) -> Optional[Dict]:
+    """Load the machine-readable encounter log format spec."""
+    if not spec_file.exists():
+        print(f"Warning: Spec file not found: {spec_file}")
+        return None
+
+    try:
+        with open(spec_file, 'r', encoding='utf-8') as f:
+            spec = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error reading spec: {e}")
+        return None
+
+    print(f"Loaded {len(spec.get('line_types', {}))} line types from {spec_file}")
+    return spec
+
+
+def snake_case(name: str) -> str:
+    """Convert a spec field name (camelCase) to a Python attribute name."""
+    name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
+    name = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name)
+    return name.lower()
+
+
+def class_name(name: str, suffix: str = "") -> str:
+    """Convert a line type (COMBAT_EVENT) or composite (unitState) to a class name."""
+    if '_' in name or name.isupper():
+        base = ''.join(part.capitalize() for part in name.lower().split('_'))
+    else:
+        base = name[0].upper() + name[1:]
+    return base + suffix
+
+
+def decoder_name(name: str) -> str:
+    """Name of the generated decoder function for a line type or composite."""
+    return 'decode_' + snake_case(name) if '_' not in name else 'decode_' + name.lower()
+
+
+def attributes(fields: List[Dict], composites: Dict) -> List[Tuple[str, str]]:
+    """(attribute name, annotation) pairs of a record, expanding ratio fields."""
+    result = []
+    for spec_field in fields:
+        name = snake_case(spec_field['name'])
+        field_type = spec_field['type']
+        optional = spec_field.get('optional', False)
+
+        if field_type == 'ratio':
+            result.append((name, 'int'))
+            result.append((name + '_max', 'int'))
+            continue
+
+        if field_type.endswith('[]'):
+            item_type = field_type[:-2]
+            annotation = f"List[{SCALAR_TYPES.get(item_type) or class_name(item_type)}]"
+        elif field_type in SCALAR_TYPES:
+            annotation = SCALAR_TYPES[field_type]
+        elif field_type in composites:
+            annotation = class_name(field_type)
+        else:
+            raise ValueError(f"Unknown field type {field_type!r} for {spec_field['name']}")
+
+        if optional:
+            annotation = f"Optional[{annotation}]"
+        result.append((name, annotation))
+    return result
+
+
+def scalar_expression(field_type: str, token: str) -> str:
+    """Python expression converting one token to the given scalar type."""
+    if field_type == 'int':
+        return f"int({token})"
+    if field_type == 'float':
+        return f"float({token})"
+    if field_type == 'bool':
+        return f"{token} == 'T'"
+    return token
+
+
+def index_expression(base: str, offset: int) -> str:
+    """Index expression into fields: a constant, or the cursor plus an offset."""
+    if base == '':
+        return str(offset)
+    return f"{base} + {offset}" if offset else base
+
+
+def token_width(spec_field: Dict, composites: Dict) -> int:
+    """Number of CSV tokens a fixed-width field occupies."""
+    field_type = spec_field['type']
+    return len(composites[field_type]) if field_type in composites else 1
+
+
+def generate_record_class(name: str, doc: str, attrs: List[Tuple[str, str]]) -> str:
+    """Generate a slotted dataclass record."""
+    code = "@dataclass\n"
+    code += f"class {name}:\n"
+    code += f'    """{doc}"""\n'
+    slots = ', '.join(f"'{attr}'" for attr, _ in attrs)
+    code += f"    __slots__ = ({slots}{',' if len(attrs) == 1 else ''})\n"
+    for attr, annotation in attrs:
+        code += f"    {attr}: {annotation}\n"
+    return code + "\n\n"
+
+
+def generate_lazy_record_class(name: str, doc: str, fields: List[Dict], composites: Dict) -> str:
+    """Generate a record that keeps its raw tokens and decodes fields on access."""
+    attrs = attributes(fields, composites)
+    first, first_annotation = attrs[0]
+
+    code = f"class {name}:\n"
+    code += f'    """\n    {doc}\n\n'
+    code += f"    {first} is decoded with the line; every other field is decoded from\n"
+    code += "    the raw tokens each time it is read.\n"
+    code += '    """\n'
+    code += f"    __slots__ = ('_fields', '_i', '{first}')\n\n"
+    code += "    def __init__(self, fields: List[str], i: int):\n"
+    code += "        self._fields = fields\n"
+    code += "        self._i = i\n"
+    code += f"        self.{first} = {scalar_expression(fields[0]['type'], 'fields[i]')}\n\n"
+
+    for offset, spec_field in enumerate(fields[1:], 1):
+        variable = snake_case(spec_field['name'])
+        token = f"self._fields[self._i + {offset}]"
+        if spec_field['type'] == 'ratio':
+            getters = [(variable, f"int({token}.partition('/')[0])"),
+                       (variable + '_max', f"int({token}.partition('/')[2])")]
+        else:
+            getters = [(variable, scalar_expression(spec_field['type'], token))]
+        for attr, expression in getters:
+            annotation = dict(attrs)[attr]
+            code += "    @property\n"
+            code += f"    def {attr}(self) -> {annotation}:\n"
+            code += f"        return {expression}\n\n"
+
+    values = ', '.join(f"self.{attr}" for attr, _ in attrs)
+    code += "    def _values(self) -> tuple:\n"
+    code += f"        return ({values})\n\n"
+    code += "    def __eq__(self, other):\n"
+    code += f"        if not isinstance(other, {name}):\n"
+    code += "            return NotImplemented\n"
+    code += "        return self._values() == other._values()\n\n"
+    code += "    __hash__ = None\n\n"
+    names = ', '.join(f"'{attr}'" for attr, _ in attrs)
+    code += "    def __repr__(self) -> str:\n"
+    code += f"        names = ({names})\n"
+    code += f"        return '{name}(' + ', '.join(f'{{n}}={{v!r}}' for n, v in zip(names, self._values())) + ')'\n"
+    return code + "\n\n"
+
+
+def generate_composite_decoder(name: str, fields: List[Dict]) -> str:
+    """Generate the decoder of a composite record starting at fields[i]."""
+    record = class_name(name)
+    code = f"def _{decoder_name(name)}(fields: List[str], i: int) -> {record}:\n"
+    code += f'    """Decode a <{name}> occupying fields[i:i + {len(fields)}]"""\n'
+    if name in LAZY_COMPOSITES:
+        return code + f"    return {record}(fields, i)\n\n\n"
+
+    arguments = []
+    for offset, spec_field in enumerate(fields):
+        token = f"fields[{index_expression('i', offset)}]"
+        if spec_field['type'] == 'ratio':
+            variable = snake_case(spec_field['name'])
+            code += f"    {variable} = {token}.split('/')\n"
+            arguments.append(f"int({variable}[0])")
+            arguments.append(f"int({variable}[1])")
+        else:
+            arguments.append(scalar_expression(spec_field['type'], token))
+
+    code += f"    return {record}(\n"
+    code += ',\n'.join(f"        {argument}" for argument in arguments)
+    code += "\n    )\n\n\n"
+    return code
+
+
+def generate_line_decoder(line_type: str, fields: List[Dict], composites: Dict) -> str:
+    """Generate the straight-line decoder of one line type."""
+    record = class_name(line_type, 'Line')
+    signature = ', '.join([line_type] + [
+        f"<{f['name']}>" if f['type'] in composites else f['name'] for f in fields
+    ])
+
+    # Minimum token count: line number, type, then every required field (an
+    # asterisk shorthand or an array counts as a single token)
+    min_length = 2
+    for spec_field in fields:
+        if spec_field.get('optional'):
+            continue
+        if spec_field.get('same_as') or spec_field['type'].endswith('[]'):
+            min_length += 1
+        else:
+            min_length += token_width(spec_field, composites)
+
+    body = []
+    arguments = ["int(fields[0])"]
+    base = ''  # '' while indices are constant, 'i' once a variable-width field was decoded
+    offset = 2
+    groups = None  # index of the next bracketed array once arrays started
+
+    for position, spec_field in enumerate(fields):
+        variable = snake_case(spec_field['name'])
+        field_type = spec_field['type']
+        optional = spec_field.get('optional', False)
+        index = index_expression(base, offset)
+        has_following = position < len(fields) - 1
+
+        if field_type.endswith('[]'):
+            item_type = field_type[:-2]
+            if groups is None:
+                body.append(f"arrays = _group_bracketed(fields[{index}:])")
+                groups = 0
+            if item_type in SCALAR_TYPES:
+                item = scalar_expression(item_type, 'value')
+                arguments.append(f"[{item} for value in arrays[{groups}]]")
+            else:
+                arguments.append(f"[_{decoder_name(item_type)}(item, 0) for item in arrays[{groups}]]")
+            groups += 1
+            continue
+
+        if groups is not None:
+            raise ValueError(f"{line_type}: fields after an array are not supported")
+
+        if field_type in composites:
+            width = len(composites[field_type])
+            decode = f"_{decoder_name(field_type)}(fields, {index})"
+            if spec_field.get('same_as'):
+                same_as = snake_case(spec_field['same_as'])
+                body.append(f"if fields[{index}] == '*':")
+                body.append(f"    {variable} = {same_as}")
+                if has_following:
+                    body.append(f"    i = {index_expression(base, offset + 1)}")
+                body.append("else:")
+                body.append(f"    {variable} = {decode}")
+                if has_following:
+                    body.append(f"    i = {index_expression(base, offset + width)}")
+                base, offset = 'i', 0
+            elif optional:
+                body.append(f"{variable} = {decode} if len(fields) >= {index_expression(base, offset + width)} else None")
+                offset += width
+            else:
+                body.append(f"{variable} = {decode}")
+                offset += width
+            arguments.append(variable)
+            continue
+
+        token = f"fields[{index}]"
+        expression = scalar_expression(field_type, token)
+        if optional:
+            expression = f"{expression} if len(fields) > {index} else None"
+        arguments.append(expression)
+        offset += 1
+
+    code = f"def {decoder_name(line_type)}(fields: List[str]) -> Optional[{record}]:\n"
+    code += f'    """{signature}"""\n'
+    code += f"    if len(fields) < {min_length} or fields[1] != '{line_type}':\n"
+    code += "        return None\n"
+    code += "    try:\n"
+    for statement in body:
+        code += f"        {statement}\n"
+    code += f"        return {record}(\n"
+    code += ',\n'.join(f"            {argument}" for argument in arguments)
+    code += "\n        )\n"
+    code += "    except (ValueError, IndexError):\n"
+    code += "        return None\n\n\n"
+    return code
+
+
+def packable_composite(name: str, composites: Dict) -> bool:
+    """Whether a composite has a packed form: lazy, with only numeric fields."""
+    return name in LAZY_COMPOSITES and all(
+        f['type'] in PACK_CODES and f['type'] != 'str' for f in composites[name]
+    )
+
+
+def packable(fields: List[Dict], composites: Dict) -> bool:
+    """Whether a line type has a packed form: fixed-width scalars and packable composites only."""
+    for spec_field in fields:
+        field_type = spec_field['type']
+        if field_type in composites:
+            if spec_field.get('optional') or not packable_composite(field_type, composites):
+                return False
+        elif field_type not in PACK_CODES or field_type == 'ratio':
+            return False
+        elif spec_field.get('optional') and field_type != 'int':
+            return False
+    return True
+
+
+def generate_composite_packer(name: str, fields: List[Dict], composites: Dict) -> str:
+    """Generate the packed struct, packer and read-back class of a lazy composite."""
+    record = class_name(name)
+    packed = f"_PACKED_{snake_case(name).upper()}"
+    attrs = attributes(fields, composites)
+    fmt = '<' + ''.join(PACK_CODES[f['type']] for f in fields)
+
+    # Flattened value index of each attribute (ratios take two)
+    value_types = [f['type'] for f in fields for _ in range(2 if f['type'] == 'ratio' else 1)]
+
+    code = f"{packed} = struct.Struct('{fmt}')\n\n\n"
+    code += f"class Packed{record}({record}):\n"
+    code += f'    """\n    <{name}> read back from its packed form\n\n'
+    code += "    Every field was decoded when it was packed; reads index the unpacked values.\n"
+    code += '    """\n'
+    code += "    __slots__ = ()\n\n"
+    code += "    def __init__(self, values: tuple):\n"
+    code += "        self._fields = values\n"
+    code += "        self._i = 0\n"
+    code += f"        self.{attrs[0][0]} = values[0]\n\n"
+    for index, (attr, annotation) in enumerate(attrs[1:], 1):
+        code += "    @property\n"
+        code += f"    def {attr}(self) -> {annotation}:\n"
+        if value_types[index] == 'float':
+            code += f"        return self._fields[{index}] / _DECIMAL_SCALE\n\n"
+        else:
+            code += f"        return self._fields[{index}]\n\n"
+
+    # Decode the raw tokens straight into the pack arguments rather than through the properties
+    arguments = [f"value.{attrs[0][0]}"]
+    statements = []
+    for offset, spec_field in enumerate(fields[1:], 1):
+        token = f"f[i + {offset}]"
+        field_type = spec_field['type']
+        if field_type == 'ratio':
+            variable = snake_case(spec_field['name'])
+            statements.append(f"{variable} = {token}.partition('/')")
+            arguments += [f"int({variable}[0])", f"int({variable}[2])"]
+        elif field_type == 'float':
+            arguments.append(f"_pack_decimal(float({token}))")
+        else:
+            arguments.append(scalar_expression(field_type, token))
+
+    code += "\n"
+    code += f"def _pack_{snake_case(name)}(value: {record}) -> bytes:\n"
+    code += f'    """Pack a <{name}> (ValueError: a malformed token)"""\n'
+    code += f"    if isinstance(value, Packed{record}):\n"
+    code += f"        return {packed}.pack(*value._fields)\n"
+    code += "    f = value._fields\n"
+    code += "    i = value._i\n"
+    code += ''.join(f"    {statement}\n" for statement in statements)
+    code += f"    return {packed}.pack({', '.join(arguments)})\n\n\n"
+    return code
+
+
+def generate_line_packer(line_type: str, fields: List[Dict], composites: Dict) -> str:
+    """Generate the packed struct, packer and unpacker of one line type."""
+    record = class_name(line_type, 'Line')
+    packed = f"_PACKED_{line_type}"
+    name = decoder_name(line_type)[len('decode_'):]
+
+    fmt = '<i'
+    pack_values = ["record.line_number"]
+    unpack_arguments = ["v[0]"]
+    composite_fields = []  # (variable, composite, same_as variable)
+    for spec_field in fields:
+        variable = snake_case(spec_field['name'])
+        field_type = spec_field['type']
+        if field_type in composites:
+            composite_fields.append((variable, field_type, snake_case(spec_field['same_as']) if spec_field.get('same_as') else None))
+            unpack_arguments.append(variable)
+            continue
+        index = len(pack_values)
+        fmt += PACK_CODES[field_type]
+        if field_type == 'str':
+            pack_values.append(f"string_code(record.{variable})")
+            unpack_arguments.append(f"strings[v[{index}]]")
+        elif spec_field.get('optional'):
+            pack_values.append(f"_pack_optional(record.{variable})")
+            unpack_arguments.append(f"None if v[{index}] == _NO_INT else v[{index}]")
+        else:
+            pack_values.append(f"record.{variable}")
+            unpack_arguments.append(f"v[{index}]")
+
+    same_flags = [(variable, same_as) for variable, _, same_as in composite_fields if same_as]
+    for variable, same_as in same_flags:
+        fmt += '?'
+        pack_values.append(f"record.{variable} is record.{same_as}")
+
+    code = f"{packed} = struct.Struct('{fmt}')\n\n\n"
+    code += f"def pack_{name}(record: {record}, string_code: Callable[[str], int]) -> bytes:\n"
+    code += f'    """Pack a {line_type} record (struct.error: a value does not fit, ValueError: a malformed unit state)"""\n'
+    parts = [f"{packed}.pack({', '.join(pack_values)})"]
+    for variable, composite, same_as in composite_fields:
+        part = f"_pack_{snake_case(composite)}(record.{variable})"
+        if same_as:
+            part = f"(b'' if record.{variable} is record.{same_as} else {part})"
+        parts.append(part)
+    if len(parts) == 1:
+        code += f"    return {parts[0]}\n\n\n"
+    else:
+        code += "    return (" + "\n            + ".join(parts) + ")\n\n\n"
+
+    code += f"def unpack_{name}(data: bytes, i: int, strings: List[str]) -> Tuple[{record}, int]:\n"
+    code += f'    """Unpack a {line_type} record packed at data[i:], returning it and the offset after it"""\n'
+    code += f"    v = {packed}.unpack_from(data, i)\n"
+    code += f"    i += {packed}.size\n"
+    flag_index = len(pack_values) - len(same_flags)
+    for variable, composite, same_as in composite_fields:
+        composite_packed = f"_PACKED_{snake_case(composite).upper()}"
+        read = [f"{variable} = Packed{class_name(composite)}({composite_packed}.unpack_from(data, i))",
+                f"i += {composite_packed}.size"]
+        if same_as:
+            code += f"    if v[{flag_index}]:\n"
+            code += f"        {variable} = {same_as}\n"
+            code += "    else:\n"
+            code += ''.join(f"        {statement}\n" for statement in read)
+            flag_index += 1
+        else:
+            code += ''.join(f"    {statement}\n" for statement in read)
+    code += f"    return {record}({', '.join(unpack_arguments)}), i\n\n\n"
+    return code
+
+
+def generate_packers(spec: Dict) -> str:
+    """Generate the packed binary form of every line type that has one."""
+    composites = spec['composites']
+    line_types = spec['line_types']
+
+    code = '''# ============================================================================
+# PACKED RECORDS
+# ============================================================================
+#
+# A binary form of the decoded records of fixed-width line types, for
+# caches that read them back without tokenizing or decoding the line again.
+# Strings are packed as codes into a table the caller keeps.
+
+# Packed value of an absent optional int
+_NO_INT = -2 ** 31
+
+
+def _pack_optional(value: Optional[int]) -> int:
+    """Packed value of an optional int"""
+    if value is None:
+        return _NO_INT
+    if value == _NO_INT:
+        raise struct.error("value collides with the absent marker")
+    return value
+
+
+# Packed floats are ten-thousandths
+_DECIMAL_SCALE = 10000
+
+
+def _pack_decimal(value: float) -> int:
+    """Packed value of a float with at most four decimals"""
+    try:
+        scaled = round(value * _DECIMAL_SCALE)
+    except (OverflowError, ValueError):
+        raise struct.error("float is not finite") from None
+    if scaled / _DECIMAL_SCALE != value:
+        raise struct.error("float has more than four decimals")
+    return scaled
+
+
+'''
+    for name, fields in composites.items():
+        if packable_composite(name, composites):
+            code += generate_composite_packer(name, fields, composites)
+
+    packed_types = [line_type for line_type, fields in line_types.items() if packable(fields, composites)]
+    for line_type in packed_types:
+        code += generate_line_packer(line_type, line_types[line_type], composites)
+
+    code += "# Packer and unpacker of each line type that has a packed form\n"
+    code += "PACKERS: Dict[str, Callable[[Any, Callable[[str], int]], bytes]] = {\n"
+    for line_type in packed_types:
+        code += f"    '{line_type}': pack_{decoder_name(line_type)[len('decode_'):]},\n"
+    code += "}\n"
+    code += "UNPACKERS: Dict[str, Callable[[bytes, int, List[str]], Tuple[Any, int]]] = {\n"
+    for line_type in packed_types:
+        code += f"    '{line_type}': unpack_{decoder_name(line_type)[len('decode_'):]},\n"
+    code += "}\n"
+    return code
+
+
+def generate_python_module(spec: Dict) -> str:
+    """Generate Python module code from the format spec."""
+    composites = spec['composites']
+    line_types = spec['line_types']
+
+    code = f'''"""
+Auto-generated encounter log decoders.
+Generated from data/encounterlog/encounterlog_format.json by
+scripts/generate_log_decoders.py - DO NOT EDIT MANUALLY.
+
+One record class and one straight-line decoder per line type of encounter
+log version {spec['log_version']}. Decoders take the tokenized line (see
+eso_log_structures.tokenize_line) and return None for malformed lines.
+Field names follow docs/encounterlog-format.md.
+
+Line types with only fixed-width fields also get a packed binary form
+(PACKERS / UNPACKERS), which the parse cache stores.
+"""
+
+import struct
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+LOG_VERSION = {spec['log_version']}
+
+
+def _group_bracketed(tokens: List[str]) -> List[List[Any]]:
+    """Regroup comma-split tokens into their (possibly nested) [..] arrays"""
+    groups = []
+    stack = []
+    for token in tokens:
+        opened = len(token) - len(token.lstrip('['))
+        for _ in range(opened):
+            stack.append([])
+        token = token[opened:]
+        value = token.rstrip(']')
+        closed = len(token) - len(value)
+        if value:
+            stack[-1].append(value)
+        for _ in range(closed):
+            completed = stack.pop()
+            if stack:
+                stack[-1].append(completed)
+            else:
+                groups.append(completed)
+    return groups
+
+
+# ============================================================================
+# COMPOSITE RECORDS
+# ============================================================================
+
+'''
+
+    for name, fields in composites.items():
+        doc = f"<{name}>: " + ', '.join(f['name'] for f in fields)
+        if name in LAZY_COMPOSITES:
+            code += generate_lazy_record_class(class_name(name), doc, fields, composites)
+        else:
+            code += generate_record_class(class_name(name), doc, attributes(fields, composites))
+        code += generate_composite_decoder(name, fields)
+
+    code += '''# ============================================================================
+# LINE RECORDS AND DECODERS
+# ============================================================================
+
+'''
+
+    for line_type, fields in line_types.items():
+        attrs = [('line_number', 'int')] + attributes(fields, composites)
+        code += generate_record_class(class_name(line_type, 'Line'), f"{line_type} line", attrs)
+        code += generate_line_decoder(line_type, fields, composites)
+
+    code += "# Decoder for each line type name\n"
+    code += "DECODERS: Dict[str, Callable[[List[str]], Any]] = {\n"
+    for line_type in line_types:
+        code += f"    '{line_type}': {decoder_name(line_type)},\n"
+    code += "}\n\n\n"
+
+    code += '''def decode_fields(fields: List[str]) -> Optional[Any]:
+    """Decode a tokenized line of any known line type"""
+    if len(fields) < 2:
+        return None
+    decoder = DECODERS.get(fields[1])
+    return decoder(fields) if decoder else None
+
+
+'''
+    code += generate_packers(spec)
+    return code
+
+
+def main():
+    """Main function to generate the decoder module."""
+    print("Generating encounter log decoders...")
+
+    spec = load_spec()
+    if not spec:
+        print("Failed to load the encounter log format spec")
+        return 1
+
+    python_code = generate_python_module(spec)
+
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+        f.write(python_code)
+
+    print(f"Generated {OUTPUT_FILE}")
+    print(f"  - Log version: {spec['log_version']}")
+    print(f"  - Line types: {len(spec['line_types'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
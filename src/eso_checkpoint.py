@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+ESO Analyzer Checkpoint
+
+A sidecar file next to an encounter log that holds the analyzer's session
+state (see ESOLogAnalyzer.get_checkpoint_state) together with the log offset
+it covers, so a restarted tail resumes from that offset instead of losing the
+session or re-reading the whole log.
+
+The checkpoint is a sequence of pickled frames. The first (base) frame holds
+the format version, the analyzer version, the log's prefix checksum and a
+full checkpoint; each later frame replaces the state and offset of the one
+before it. Append-only sequences in the state (columns, see
+ESOLogAnalyzer.get_checkpoint_columns) are pickled apart from it, and a frame
+only holds what was appended to them since the previous frame, so a save
+costs what changed rather than everything the session has accumulated.
+
+Like the parse cache the checkpoint is keyed by the log's prefix checksum: a
+checkpoint of another (or a rewritten or truncated) log is ignored. The base
+frame is written to a temporary file that replaces the previous checkpoint,
+and frames are appended after the last complete one, so an interrupted save
+leaves the previous checkpoint intact.
+"""
+
+import io
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+from eso_log_cache import PREFIX_SIZE, _prefix_crc
+from version import __version__
+
+CHECKPOINT_SUFFIX = '.esocheckpoint'
+CHECKPOINT_FORMAT_VERSION = 2
+
+# Errors of pickling the analyzer state
+SAVE_ERRORS = (OSError, pickle.PicklingError, AttributeError, TypeError, ValueError)
+# Errors of unpickling a damaged or foreign checkpoint
+LOAD_ERRORS = (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, KeyError, TypeError, ValueError)
+
+
+def checkpoint_path_for(log_file: Union[str, Path]) -> Path:
+    """Default checkpoint path of a log file"""
+    log_file = Path(log_file)
+    return log_file.with_name(log_file.name + CHECKPOINT_SUFFIX)
+
+
+class _StatePickler(pickle.Pickler):
+    """Pickles the state with each column replaced by its name"""
+
+    def __init__(self, file, columns: Dict[str, Sequence]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._names = {id(column): name for name, column in columns.items()}
+
+    def persistent_id(self, obj):
+        return self._names.get(id(obj))
+
+
+class _StateUnpickler(pickle.Unpickler):
+    """Unpickles a state pickled by _StatePickler, putting its columns back"""
+
+    def __init__(self, file, columns: Dict[str, Sequence]):
+        super().__init__(file)
+        self._columns = columns
+
+    def persistent_load(self, pid):
+        try:
+            return self._columns[pid]
+        except KeyError:
+            raise pickle.UnpicklingError(f"checkpoint column {pid!r} is missing") from None
+
+
+class CheckpointWriter:
+    """
+    Saves the checkpoints of one log file.
+
+    Saves append a frame to the checkpoint while it is the one this writer
+    last wrote; the file is rewritten from a base frame on the first save,
+    after a failed save, and once the appended frames outgrow the base frame
+    (which bounds the file at about twice a full checkpoint).
+    """
+
+    def __init__(self, log_file: Union[str, Path], checkpoint_file: Optional[Union[str, Path]] = None):
+        self.log_file = Path(log_file)
+        self.checkpoint_file = Path(checkpoint_file) if checkpoint_file else checkpoint_path_for(self.log_file)
+        # Column name -> (column, length saved) as of the last frame
+        self._saved_columns: Dict[str, Tuple[Sequence, int]] = {}
+        # Checkpoint size after the last frame (None: rewrite on the next save)
+        self._end: Optional[int] = None
+        self._base_size = 0
+
+    def save(self, position: int, state: Dict[str, Any], columns: Optional[Dict[str, Sequence]] = None) -> bool:
+        """
+        Save the analyzer state covering the log up to position.
+
+        columns are the append-only sequences (lists or arrays) inside state;
+        they must only grow between saves, or be replaced by new objects.
+        Returns False (after printing why) if the checkpoint could not be written.
+        """
+        columns = columns or {}
+        rewrite = self._end is None or self._end - self._base_size > self._base_size
+        try:
+            frame = self._frame(position, state, columns, rewrite)
+            if rewrite:
+                self._write_base(frame)
+            else:
+                self._append(frame)
+        except SAVE_ERRORS as e:
+            print(f"Cannot write checkpoint {self.checkpoint_file}: {e}")
+            self._end = None
+            return False
+        self._saved_columns = {name: (column, len(column)) for name, column in columns.items()}
+        return True
+
+    def _frame(self, position: int, state: Dict[str, Any], columns: Dict[str, Sequence], base: bool) -> bytes:
+        """Pickle a frame: the state, and what was appended to each column since the last frame"""
+        frame_columns = {}
+        for name, column in columns.items():
+            saved = None if base else self._saved_columns.get(name)
+            start = saved[1] if saved and saved[0] is column and len(column) >= saved[1] else 0
+            frame_columns[name] = (start, column[start:] if start else column)
+
+        state_pickle = io.BytesIO()
+        _StatePickler(state_pickle, columns).dump(state)
+        frame = {
+            'saved_at': time.time(),
+            'position': position,
+            'columns': frame_columns,
+            'state': state_pickle.getvalue(),
+        }
+        if base:
+            prefix_length = min(PREFIX_SIZE, self.log_file.stat().st_size)
+            frame.update({
+                'format_version': CHECKPOINT_FORMAT_VERSION,
+                'analyzer_version': __version__,
+                'prefix_length': prefix_length,
+                'prefix_crc': _prefix_crc(self.log_file, prefix_length),
+            })
+        return pickle.dumps(frame, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _write_base(self, frame: bytes):
+        """Atomically replace the checkpoint with a base frame"""
+        temp_file = self.checkpoint_file.with_name(self.checkpoint_file.name + '.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(frame)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.checkpoint_file)
+        self._end = self._base_size = len(frame)
+
+    def _append(self, frame: bytes):
+        """Append a frame after the last complete one"""
+        with open(self.checkpoint_file, 'r+b') as f:
+            f.seek(self._end)
+            f.truncate()
+            f.write(frame)
+            f.flush()
+            os.fsync(f.fileno())
+        self._end += len(frame)
+
+
+def save_checkpoint(log_file: Union[str, Path], position: int, state: Dict[str, Any],
+                    checkpoint_file: Optional[Union[str, Path]] = None,
+                    columns: Optional[Dict[str, Sequence]] = None) -> bool:
+    """
+    Atomically write a full checkpoint of the analyzer state covering the log up to position.
+
+    Returns False (after printing why) if the checkpoint could not be written.
+    A tail saving repeatedly uses a CheckpointWriter, which appends instead.
+    """
+    return CheckpointWriter(log_file, checkpoint_file).save(position, state, columns)
+
+
+def _read_frames(f) -> Optional[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Sequence]]]:
+    """
+    Read (base frame, last complete frame, columns) from a checkpoint file.
+
+    A frame left incomplete by an interrupted save ends the checkpoint.
+    Returns None if the base frame is not one of this format and analyzer version.
+    """
+    size = os.fstat(f.fileno()).st_size
+    base = frame = pickle.load(f)
+    if (not isinstance(base, dict)
+            or base.get('format_version') != CHECKPOINT_FORMAT_VERSION
+            or base.get('analyzer_version') != __version__):
+        return None
+    columns: Dict[str, Sequence] = {}
+    last = None
+    while True:
+        # Check every column first, so a mismatched frame leaves the columns untouched
+        updates = frame['columns']
+        if any(start and len(columns.get(name, ())) != start for name, (start, _) in updates.items()):
+            return (base, last, columns) if last else None
+        extended = {}
+        for name, (start, tail) in updates.items():
+            if start:
+                extended[name] = columns[name]
+                extended[name].extend(tail)
+            else:
+                extended[name] = tail
+        columns, last = extended, frame
+
+        if f.tell() >= size:
+            return base, last, columns
+        try:
+            frame = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, ValueError, KeyError, TypeError):
+            return base, last, columns
+
+
+def load_checkpoint(log_file: Union[str, Path],
+                    checkpoint_file: Optional[Union[str, Path]] = None) -> Optional[Tuple[int, Dict[str, Any]]]:
+    """
+    Read the checkpoint of a log file as (position, analyzer state).
+
+    Returns None if there is no checkpoint, it cannot be read, it was written
+    by another version of the analyzer or it does not match the log.
+    """
+    log_file = Path(log_file)
+    checkpoint_file = Path(checkpoint_file) if checkpoint_file else checkpoint_path_for(log_file)
+    try:
+        with open(checkpoint_file, 'rb') as f:
+            frames = _read_frames(f)
+    except FileNotFoundError:
+        return None
+    except LOAD_ERRORS as e:
+        print(f"Ignoring unreadable checkpoint {checkpoint_file}: {e}")
+        return None
+
+    if frames is None:
+        return None
+    base, last, columns = frames
+    try:
+        log_size = log_file.stat().st_size
+    except OSError:
+        return None
+    prefix_length = base['prefix_length']
+    if (last['position'] > log_size or prefix_length > log_size
+            or _prefix_crc(log_file, prefix_length) != base['prefix_crc']):
+        return None
+
+    try:
+        state = _StateUnpickler(io.BytesIO(last['state']), columns).load()
+    except LOAD_ERRORS as e:
+        print(f"Ignoring unreadable checkpoint {checkpoint_file}: {e}")
+        return None
+    return last['position'], state
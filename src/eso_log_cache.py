@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+ESO Log Parse Cache
+
+A sidecar file next to an encounter log that holds its decoded records in a
+compact binary format, so re-reading a log neither tokenizes nor decodes the
+lines already seen and only pays for the bytes appended since the last run.
+
+Sidecar layout (little-endian):
+    header   magic, format version, covered_end, records_end, prefix length,
+             prefix CRC32, event type table (padded to TABLE_SIZE bytes)
+    records  offset u64, event type u8, kind u8, payload length u32, then
+             the payload:
+             KIND_PACKED  the eso_log_decoders packed record (see PACKERS)
+             KIND_LINE    none; the line is parsed again from the log
+             KIND_STRING  a utf-8 string, the next code of the string table
+                          packed records refer to
+
+No line text is stored: offset locates the line in the log, which is only
+read for line types that cannot be packed, for event types the reader does
+not decode as records, and for callers that want the lines (log splitting).
+
+The cache is keyed by the log's prefix checksum (the first PREFIX_SIZE bytes,
+which start with the BEGIN_LOG line and its timestamp): a new or rewritten
+log invalidates it, a grown log extends it. Records are appended first and
+the header is rewritten last, so an interrupted update leaves the previous
+state intact.
+"""
+
+import mmap
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+from eso_log_decoders import DECODERS, PACKERS, UNPACKERS
+from eso_log_parser import (ESOLogEntry, ESOLogParser, _is_record, _legacy_timestamp, complete_lines_end,
+                            detect_compression, iter_entries, iter_mmap_lines)
+from eso_log_structures import EventType, sniff_event_type, tokenize_line
+
+CACHE_SUFFIX = '.esocache'
+CACHE_MAGIC = b'ESOC'
+CACHE_FORMAT_VERSION = 2
+
+# Bytes of the log hashed to recognise it
+PREFIX_SIZE = 64 * 1024
+
+# Bytes reserved for the comma-separated event type names records are coded against
+TABLE_SIZE = 2048
+
+# magic, version, covered_end, records_end, prefix_length, prefix_crc, event type table
+_HEADER = struct.Struct(f'<4sHQQII{TABLE_SIZE}s')
+# offset, event type code, kind, payload length
+_RECORD = struct.Struct('<QBBI')
+
+# Record kinds
+KIND_LINE = 0
+KIND_PACKED = 1
+KIND_STRING = 2
+
+# Initial event type table; types the parser passes through unknown are appended
+EVENT_TYPE_NAMES = tuple(event_type.value for event_type in EventType)
+
+
+def cache_path_for(log_file: Union[str, Path]) -> Path:
+    """Default sidecar path of a log file"""
+    log_file = Path(log_file)
+    return log_file.with_name(log_file.name + CACHE_SUFFIX)
+
+
+def _prefix_crc(log_file: Union[str, Path], length: int) -> int:
+    """CRC32 of the first length bytes of a file"""
+    with open(log_file, 'rb') as f:
+        return zlib.crc32(f.read(length))
+
+
+def _read_log_line(log_file: Path, offset: int) -> str:
+    """The log line starting at offset, as iter_mmap_lines reads it"""
+    with open(log_file, 'rb') as f:
+        f.seek(offset)
+        return f.readline().strip().decode('utf-8', 'ignore')
+
+
+class CachedLogEntry(ESOLogEntry):
+    """
+    An ESOLogEntry rebuilt from a packed record.
+
+    It equals the entry the parser makes of the same line: fields and
+    original_line are read back from the log (and tokenized) on first access,
+    since the analyzer's own handlers only use the record.
+    """
+
+    __slots__ = ('_log_file', '_offset', '_line', '_fields')
+
+    def __init__(self, timestamp: int, event_type: str, structured: Any, log_file: Path, offset: int,
+                 line: Optional[str] = None):
+        self.timestamp = timestamp
+        self.event_type = event_type
+        self.structured = structured
+        self._log_file = log_file
+        self._offset = offset
+        self._line = line
+        self._fields = None
+
+    @property
+    def original_line(self) -> str:
+        if self._line is None:
+            self._line = _read_log_line(self._log_file, self._offset)
+        return self._line
+
+    @original_line.setter
+    def original_line(self, line: str):
+        self._line = line
+
+    @property
+    def fields(self) -> List[str]:
+        if self._fields is None:
+            self._fields = tokenize_line(self.original_line)[2:]
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields: List[str]):
+        self._fields = fields
+
+    def __reduce__(self):
+        return (ESOLogEntry, (self.timestamp, self.event_type, self.fields, self.original_line, self.structured))
+
+
+def _read_mapped_line(log: mmap.mmap, offset: int) -> str:
+    """The log line starting at offset in a mapped log, as iter_mmap_lines reads it"""
+    end = log.find(b'\n', offset)
+    if end < 0:
+        end = len(log)
+    return log[offset:end].strip().decode('utf-8', 'ignore')
+
+
+def iter_record_entries(data: Union[bytes, mmap.mmap], position: int, records_end: int, end_offset: int,
+                        names: Tuple[str, ...], parser: ESOLogParser, log_file: Path, log: mmap.mmap, lines: bool,
+                        strings: List[str], string_codes: Dict[str, int]) -> Iterator[Tuple[int, ESOLogEntry, str]]:
+    """
+    Rebuild the subscribed entries of the records in data[position:records_end] that start before end_offset.
+
+    names is the event type table the records are coded against, and log the
+    mapped log_file. KIND_STRING records are added to strings and
+    string_codes as they are read. See ParsedLogCache.iter_entries for the
+    entries yielded.
+    """
+    is_subscribed = parser.structured_parser.is_subscribed
+    # Per event type code: None (not subscribed), its unpacker (packed
+    # records are used as they are) or False (the line is parsed again)
+    readers: Dict[int, Any] = {}
+    record_size = _RECORD.size
+    unpack_record = _RECORD.unpack_from
+    while position < records_end:
+        offset, code, kind, length = unpack_record(data, position)
+        if offset >= end_offset:
+            return
+        payload_start = position + record_size
+        position = payload_start + length
+
+        if kind == KIND_STRING:
+            string = data[payload_start:position].decode('utf-8')
+            string_codes[string] = len(strings)
+            strings.append(string)
+            continue
+
+        if code in readers:
+            reader = readers[code]
+        else:
+            name = names[code]
+            if not is_subscribed(name):
+                reader = None
+            elif name in parser.record_event_types:
+                reader = UNPACKERS.get(name, False)
+            else:
+                reader = False
+            readers[code] = reader
+
+        if reader is None:
+            continue
+        if kind == KIND_PACKED and reader:
+            record = reader(data, payload_start, strings)[0]
+            line = _read_mapped_line(log, offset) if lines else None
+            name = names[code]
+            entry = CachedLogEntry(_legacy_timestamp(name, record), name, record, log_file, offset, line)
+            yield offset, entry, line or ''
+            continue
+        line = _read_mapped_line(log, offset)
+        entry = parser._parse_wanted_line(line)
+        if entry:
+            yield offset, entry, line
+
+
+class ParsedLogCache:
+    """Sidecar cache of the decoded records of one log file."""
+
+    def __init__(self, log_file: Union[str, Path], cache_file: Optional[Union[str, Path]] = None):
+        self.log_file = Path(log_file)
+        self.cache_file = Path(cache_file) if cache_file else cache_path_for(self.log_file)
+        self.covered_end = 0
+        self.records_end = 0
+        self.prefix_length = 0
+        self.prefix_crc = 0
+        self.event_type_names: Tuple[str, ...] = EVENT_TYPE_NAMES
+        # Why the last read could not update the sidecar (None: it could, or had nothing to add)
+        self.error: Optional[str] = None
+        # String table of the packed records, rebuilt from the KIND_STRING records as they are read
+        self._strings: List[str] = []
+        self._string_codes: Dict[str, int] = {}
+        self._load_header()
+
+    def _load_header(self):
+        """Read the sidecar header, resetting the cache if it does not match the log"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    return
+                magic, version, covered_end, records_end, prefix_length, prefix_crc, table = _HEADER.unpack(header)
+                names = table.rstrip(b'\0').decode('utf-8').split(',')
+        except (OSError, UnicodeDecodeError, struct.error):
+            return
+
+        if magic != CACHE_MAGIC or version != CACHE_FORMAT_VERSION:
+            return
+        try:
+            log_size = self.log_file.stat().st_size
+        except OSError:
+            return
+        if covered_end > log_size or _prefix_crc(self.log_file, prefix_length) != prefix_crc:
+            return
+
+        self.covered_end = covered_end
+        self.records_end = records_end
+        self.prefix_length = prefix_length
+        self.prefix_crc = prefix_crc
+        self.event_type_names = tuple(names)
+
+    def _header_bytes(self) -> bytes:
+        return _HEADER.pack(CACHE_MAGIC, CACHE_FORMAT_VERSION, self.covered_end, self.records_end,
+                            self.prefix_length, self.prefix_crc, ','.join(self.event_type_names).encode('utf-8'))
+
+    def iter_entries(self, parser: ESOLogParser, end_offset: Optional[int] = None,
+                     lines: bool = True) -> Iterator[Tuple[int, ESOLogEntry, str]]:
+        """
+        Yield (byte_offset, entry, line) for the log up to end_offset, like eso_log_parser.iter_entries.
+
+        Entries already in the sidecar are read back from it; the rest of the
+        log up to end_offset is parsed, yielded and appended to the sidecar.
+        Only event types parser is subscribed to are yielded.
+
+        Entries of parser's record_event_types that were packed are rebuilt
+        from the sidecar without touching the log: they carry their record
+        (see ESOLogParser.decode_record), and their fields and original_line
+        are only read back from the log when accessed (see CachedLogEntry).
+        line is '' unless lines is set. Other entries are parsed again from
+        their line in the log and equal a fresh parse.
+
+        Without end_offset the whole file is read; a trailing partial line
+        (one still being written) is parsed but not cached. Compressed logs
+        are archives rather than growing files and are parsed uncached. If
+        the sidecar cannot be written, the entries are still yielded and the
+        reason is left in self.error.
+        """
+        if detect_compression(self.log_file):
+            yield from iter_entries(self.log_file, 0, end_offset, parser=parser)
+            return
+
+        file_end = None
+        if end_offset is None:
+            file_end = self.log_file.stat().st_size
+            end_offset = complete_lines_end(self.log_file, 0, file_end)
+
+        yield from self._iter_cached(parser, end_offset, lines)
+
+        if end_offset > self.covered_end:
+            yield from self._extend(parser, end_offset)
+
+        if file_end is not None and file_end > end_offset:
+            yield from iter_entries(self.log_file, end_offset, file_end, parser=parser)
+
+    def _iter_cached(self, parser: ESOLogParser, end_offset: int, lines: bool) -> Iterator[Tuple[int, ESOLogEntry, str]]:
+        """Rebuild the subscribed entries of the sidecar records before end_offset"""
+        if not self.records_end:
+            return
+
+        strings = self._strings = []
+        string_codes = self._string_codes = {}
+        with open(self.cache_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data, \
+                open(self.log_file, 'rb') as log_f, mmap.mmap(log_f.fileno(), 0, access=mmap.ACCESS_READ) as log:
+            yield from iter_record_entries(data, _HEADER.size, min(self.records_end, len(data)), end_offset,
+                                           self.event_type_names, parser, self.log_file, log, lines,
+                                           strings, string_codes)
+
+    def _extend(self, parser: ESOLogParser, end_offset: int) -> Iterator[Tuple[int, ESOLogEntry, str]]:
+        """Parse [covered_end, end_offset) of the log, yielding entries and appending every line's record to the sidecar"""
+        if not self.covered_end:
+            # New or invalidated cache: key it to the log's current prefix
+            self.prefix_length = min(PREFIX_SIZE, self.log_file.stat().st_size)
+            self.prefix_crc = _prefix_crc(self.log_file, self.prefix_length)
+            self.event_type_names = EVENT_TYPE_NAMES
+            self.records_end = 0
+            self._strings = []
+            self._string_codes = {}
+
+        code_of = {name: code for code, name in enumerate(self.event_type_names)}
+        # Strings coded by the record being packed, written ahead of it
+        pending: List[str] = []
+
+        def string_code(string: str) -> int:
+            code = self._string_codes.get(string)
+            if code is None:
+                code = self._string_codes[string] = len(self._strings)
+                self._strings.append(string)
+                pending.append(string)
+            return code
+
+        try:
+            if self.records_end:
+                cache = open(self.cache_file, 'r+b')
+                cache.truncate(self.records_end)
+                cache.seek(self.records_end)
+            else:
+                cache = open(self.cache_file, 'w+b')
+                cache.write(self._header_bytes())
+        except OSError as e:
+            self.error = f"Cannot write parse cache {self.cache_file}: {e}"
+            cache = None
+
+        wants_line = parser.structured_parser.wants_line
+        try:
+            for offset, raw_line in iter_mmap_lines(self.log_file, self.covered_end, end_offset):
+                line = raw_line.decode('utf-8', 'ignore')
+                entry = parser._parse_wanted_line(line) if wants_line(line) else None
+
+                if cache:
+                    event_type = sniff_event_type(line)
+                    code = code_of.get(event_type)
+                    if code is None and event_type:
+                        code = self._add_event_type(event_type, code_of)
+                        if code is None:
+                            # Leave the sidecar as it was; the appended records are past records_end
+                            self.error = f"Parse cache event type table is full, not caching {self.log_file}"
+                            cache.close()
+                            cache = None
+                    if code is not None:
+                        record = entry.structured if entry and _is_record(entry.structured) else None
+                        cache.write(self._encode_record(offset, event_type, code, line, record, string_code, pending))
+
+                if entry:
+                    yield offset, entry, line
+
+            if cache:
+                self.records_end = cache.tell()
+                self.covered_end = end_offset
+                cache.flush()
+                cache.seek(0)
+                cache.write(self._header_bytes())
+        finally:
+            if cache:
+                cache.close()
+
+    def _add_event_type(self, event_type: str, code_of) -> Optional[int]:
+        """Append an event type to the table, returning its code or None if the table is full"""
+        names = self.event_type_names + (event_type,)
+        if len(names) > 256 or len(','.join(names).encode('utf-8')) > TABLE_SIZE:
+            return None
+        self.event_type_names = names
+        code_of[event_type] = len(names) - 1
+        return code_of[event_type]
+
+    @staticmethod
+    def _encode_record(offset: int, event_type: str, code: int, line: str, record: Any,
+                       string_code, pending: List[str]) -> bytes:
+        """
+        Encode the sidecar record of one log line, preceded by the strings it added to the table.
+
+        record is the line's decoded record if the parser already has it;
+        otherwise a packable line is decoded here. Lines that cannot be
+        packed (no packer, malformed, or a value out of range) are stored as
+        KIND_LINE.
+        """
+        packer = PACKERS.get(event_type)
+        payload = None
+        if packer:
+            if record is None:
+                record = DECODERS[event_type](tokenize_line(line))
+            if record is not None:
+                try:
+                    payload = packer(record, string_code)
+                except (struct.error, ValueError):
+                    payload = None
+
+        # Strings coded before a pack failed stay in the table, so they are always written
+        encoded = b''.join(_RECORD.pack(offset, 0, KIND_STRING, len(raw)) + raw
+                           for raw in (string.encode('utf-8') for string in pending))
+        pending.clear()
+
+        if payload is None:
+            return encoded + _RECORD.pack(offset, code, KIND_LINE, 0)
+        return encoded + _RECORD.pack(offset, code, KIND_PACKED, len(payload)) + payload
+
+
+def pack_byte_range(log_file: Union[str, Path], start_offset: int, end_offset: int,
+                    event_types: Optional[FrozenSet[str]] = None) -> Optional[Tuple[Tuple[str, ...], bytes]]:
+    """
+    Encode the lines of [start_offset, end_offset) of a log as sidecar records (no header).
+
+    Only lines of event_types are encoded (None: every type). Returns the
+    event type table the records are coded against and the records, with
+    their own string table, or None if the range holds more event types than
+    a record can code.
+    """
+    names = list(EVENT_TYPE_NAMES)
+    code_of = {name: code for code, name in enumerate(names)}
+    string_codes: Dict[str, int] = {}
+    pending: List[str] = []
+
+    def string_code(string: str) -> int:
+        code = string_codes.get(string)
+        if code is None:
+            code = string_codes[string] = len(string_codes)
+            pending.append(string)
+        return code
+
+    records = []
+    encode_record = ParsedLogCache._encode_record
+    for offset, raw_line in iter_mmap_lines(log_file, start_offset, end_offset):
+        line = raw_line.decode('utf-8', 'ignore')
+        event_type = sniff_event_type(line)
+        if not event_type or (event_types is not None and event_type not in event_types):
+            continue
+        code = code_of.get(event_type)
+        if code is None:
+            if len(names) >= 256:
+                return None
+            code = code_of[event_type] = len(names)
+            names.append(event_type)
+        records.append(encode_record(offset, event_type, code, line, None, string_code, pending))
+    return tuple(names), b''.join(records)
+
+
+def iter_cached_entries(log_file: Union[str, Path], parser: ESOLogParser, end_offset: Optional[int] = None,
+                        cache_file: Optional[Union[str, Path]] = None,
+                        lines: bool = True) -> Iterator[Tuple[int, ESOLogEntry, str]]:
+    """Stream (byte_offset, entry, line) through the log's sidecar parse cache (see ParsedLogCache)"""
+    return ParsedLogCache(log_file, cache_file).iter_entries(parser, end_offset, lines)
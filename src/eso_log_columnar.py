@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+ESO Log Columnar Decoder
+
+Offline analysis mode that decodes blocks of COMBAT_EVENT and EFFECT_CHANGED
+lines into columnar NumPy arrays instead of one Python object per line, and
+computes the damage aggregates of ESOLogAnalyzer (total_damage, player_damage,
+enemy_damage) with vectorized group-bys.
+
+Read mode uses it with --columnar-damage: load_damage_columns decodes the
+log's hits and deaths once, the analyzer skips COMBAT_EVENT lines, and each
+encounter's totals and player deaths are filled from the columns (see
+ESOLogAnalyzer.use_damage_columns).
+
+Requires NumPy (installed with pandas from requirements.txt); check
+NUMPY_AVAILABLE before use.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from eso_log_structures import slotted_dataclass
+from eso_log_parser import iter_raw_lines
+
+# Event types the columnar decoder supports
+COLUMNAR_EVENT_TYPES = ('COMBAT_EVENT', 'EFFECT_CHANGED')
+
+# Lines decoded per batch by iter_column_batches
+COLUMN_BATCH_SIZE = 65536
+
+# Action results counted as damage by ESOLogAnalyzer
+DAMAGE_RESULTS = ('DAMAGE', 'CRITICAL_DAMAGE')
+
+# Action result of a dying unit, counted as a death by ESOLogAnalyzer
+DEATH_RESULTS = ('DIED_XP',)
+
+# Full-line field indices per event type:
+# (result, value, overflow, ability_id, source_unit_id, target_unit_id)
+# COMBAT_EVENT: line, type, actionResult, damageType, powerType, hitValue, overflow,
+#               castTrackId, abilityId, <sourceUnitState>, <targetUnitState>
+# EFFECT_CHANGED: line, type, changeType, stackCount, castTrackId, abilityId,
+#                 <sourceUnitState>, <targetUnitState>
+_FIELD_INDICES = {
+    'COMBAT_EVENT': (2, 5, 6, 8, 9, 19),
+    'EFFECT_CHANGED': (2, 3, None, 5, 6, 16),
+}
+
+
+@slotted_dataclass
+class ColumnBatch:
+    """
+    Columnar block of COMBAT_EVENT or EFFECT_CHANGED lines.
+
+    result holds codes into result_names (actionResult for COMBAT_EVENT,
+    changeType for EFFECT_CHANGED). value is hitValue for COMBAT_EVENT and
+    stackCount for EFFECT_CHANGED; overflow is always 0 for EFFECT_CHANGED.
+    A '*' target is resolved to the source unit.
+    """
+    event_type: str
+    result_names: List[str]
+    line_number: 'np.ndarray'
+    result: 'np.ndarray'
+    value: 'np.ndarray'
+    overflow: 'np.ndarray'
+    ability_id: 'np.ndarray'
+    source_unit_id: 'np.ndarray'
+    target_unit_id: 'np.ndarray'
+    target_health: 'np.ndarray'
+    target_health_max: 'np.ndarray'
+
+    def __len__(self) -> int:
+        return len(self.line_number)
+
+    def select(self, mask: 'np.ndarray') -> 'ColumnBatch':
+        """Return the rows selected by a boolean mask or index array"""
+        return ColumnBatch(
+            self.event_type, self.result_names,
+            self.line_number[mask], self.result[mask], self.value[mask], self.overflow[mask],
+            self.ability_id[mask], self.source_unit_id[mask], self.target_unit_id[mask],
+            self.target_health[mask], self.target_health_max[mask]
+        )
+
+    def between(self, start_time: int, end_time: int) -> 'ColumnBatch':
+        """Return the rows logged within [start_time, end_time] (ms since log start)"""
+        return self.select((self.line_number >= start_time) & (self.line_number <= end_time))
+
+    def result_mask(self, *names: str) -> 'np.ndarray':
+        """Boolean mask of rows whose result is one of names"""
+        codes = [code for code, name in enumerate(self.result_names) if name in names]
+        return np.isin(self.result, codes)
+
+
+def decode_columns(lines: Iterable[Union[str, bytes]], event_type: str = 'COMBAT_EVENT') -> Optional[ColumnBatch]:
+    """
+    Decode lines of a single event type into a ColumnBatch.
+
+    Lines of other event types and lines too short to hold the fields are
+    skipped. Numeric conversion is done per column by NumPy; if a column
+    holds a malformed value the offending rows are dropped.
+
+    Returns None if NumPy is not available or the event type is unsupported.
+    """
+    if not NUMPY_AVAILABLE or event_type not in _FIELD_INDICES:
+        return None
+
+    result_index, value_index, overflow_index, ability_index, source_index, target_index = _FIELD_INDICES[event_type]
+    type_token = event_type.encode('ascii')
+
+    # One list of raw tokens per column; converted in bulk below
+    line_numbers, results, values, overflows, abilities = [], [], [], [], []
+    sources, targets, target_healths = [], [], []
+    for line in lines:
+        if isinstance(line, str):
+            line = line.encode('utf-8')
+        fields = line.split(b',')
+        if len(fields) <= target_index or fields[1] != type_token:
+            continue
+
+        if fields[target_index] == b'*':
+            target = fields[source_index]
+            health = fields[source_index + 1]
+        elif len(fields) > target_index + 1:
+            target = fields[target_index]
+            health = fields[target_index + 1]
+        else:
+            continue
+
+        line_numbers.append(fields[0])
+        results.append(fields[result_index])
+        values.append(fields[value_index])
+        overflows.append(fields[overflow_index] if overflow_index is not None else b'0')
+        abilities.append(fields[ability_index])
+        sources.append(fields[source_index])
+        targets.append(target)
+        target_healths.append(health)
+
+    health_parts = np.char.partition(np.array(target_healths, dtype=bytes), b'/') if target_healths else None
+    raw_columns = [
+        line_numbers, values, overflows, abilities, sources, targets,
+        health_parts[:, 0] if health_parts is not None else [],
+        health_parts[:, 2] if health_parts is not None else [],
+    ]
+
+    try:
+        numeric = [np.array(column, dtype=bytes).astype(np.int64) for column in raw_columns]
+    except ValueError:
+        valid = np.array([_is_int_row(row) for row in zip(*raw_columns)], dtype=bool)
+        numeric = [np.array(column, dtype=bytes)[valid].astype(np.int64) for column in raw_columns]
+        results = np.array(results, dtype=bytes)[valid]
+
+    result_names, result_codes = np.unique(np.array(results, dtype=bytes), return_inverse=True)
+
+    return ColumnBatch(
+        event_type,
+        [name.decode('utf-8') for name in result_names],
+        numeric[0],
+        result_codes.astype(np.int16).reshape(-1),
+        numeric[1],
+        numeric[2],
+        numeric[3],
+        numeric[4],
+        numeric[5],
+        numeric[6],
+        numeric[7],
+    )
+
+
+def _is_int_row(tokens: Sequence[bytes]) -> bool:
+    """Whether every token of a row converts to an integer"""
+    try:
+        for token in tokens:
+            int(token)
+    except ValueError:
+        return False
+    return True
+
+
+def iter_column_batches(log_file: Union[str, Path], event_type: str = 'COMBAT_EVENT',
+                        batch_size: int = COLUMN_BATCH_SIZE, start_offset: int = 0,
+                        end_offset: Optional[int] = None) -> Iterator[ColumnBatch]:
+    """
+    Decode a log file into ColumnBatch blocks of up to batch_size lines of one event type.
+
+    Lines are filtered on their raw bytes, so other event types are never decoded.
+    """
+    if not NUMPY_AVAILABLE or event_type not in _FIELD_INDICES:
+        return
+
+    marker = b',' + event_type.encode('ascii') + b','
+    block = []
+    for _, raw in iter_raw_lines(log_file, start_offset, end_offset):
+        if marker in raw[:len(marker) + 12]:
+            block.append(raw)
+            if len(block) >= batch_size:
+                yield decode_columns(block, event_type)
+                block = []
+
+    if block:
+        yield decode_columns(block, event_type)
+
+
+def concat_batches(batches: Iterable[ColumnBatch]) -> Optional[ColumnBatch]:
+    """Concatenate batches of the same event type, re-coding their results"""
+    batches = [batch for batch in batches if batch is not None]
+    if not batches:
+        return None
+
+    result_names = sorted({name for batch in batches for name in batch.result_names})
+    code_of = {name: code for code, name in enumerate(result_names)}
+    results = [
+        np.array([code_of[name] for name in batch.result_names], dtype=np.int16)[batch.result]
+        if len(batch) else batch.result
+        for batch in batches
+    ]
+
+    def column(name: str) -> 'np.ndarray':
+        return np.concatenate([getattr(batch, name) for batch in batches])
+
+    return ColumnBatch(
+        batches[0].event_type, result_names,
+        column('line_number'), np.concatenate(results), column('value'), column('overflow'),
+        column('ability_id'), column('source_unit_id'), column('target_unit_id'),
+        column('target_health'), column('target_health_max')
+    )
+
+
+def load_damage_columns(log_file: Union[str, Path], start_offset: int = 0,
+                        end_offset: Optional[int] = None) -> Optional[ColumnBatch]:
+    """
+    Decode the COMBAT_EVENT rows of a log that the damage aggregates use (hits with a positive value and deaths) into one batch.
+
+    Other rows are dropped batch by batch, so memory holds only those rows.
+    Returns None if NumPy is not available or the log has no such rows.
+    """
+    def rows() -> Iterator[ColumnBatch]:
+        for batch in iter_column_batches(log_file, 'COMBAT_EVENT', start_offset=start_offset, end_offset=end_offset):
+            yield batch.select((batch.result_mask(*DAMAGE_RESULTS) & (batch.value > 0))
+                               | batch.result_mask(*DEATH_RESULTS))
+
+    return concat_batches(rows())
+
+
+def damage_totals(batch: ColumnBatch, source_owner: Dict[str, Optional[str]],
+                  hostile_unit_ids: Iterable[str]) -> Tuple[int, Dict[str, int], Dict[str, int]]:
+    """
+    Vectorized equivalent of the damage tracking in ESOLogAnalyzer._handle_combat_event.
+
+    Counts DAMAGE/CRITICAL_DAMAGE rows with a positive hit value whose target is
+    hostile and whose source is a key of source_owner (players, their long unit
+    IDs and their pets). source_owner maps each source to the short unit ID of
+    the player credited in player_damage, or None for a pet without a known owner.
+
+    Returns (total_damage, player_damage, enemy_damage) keyed by unit ID, like
+    CombatEncounter.get_player_damage and get_enemy_damage.
+    """
+    if batch is None or not len(batch):
+        return 0, {}, {}
+
+    sources = _unit_id_array(source_owner)
+    hostiles = _unit_id_array(hostile_unit_ids)
+
+    mask = (batch.result_mask(*DAMAGE_RESULTS) & (batch.value > 0)
+            & np.isin(batch.target_unit_id, hostiles) & np.isin(batch.source_unit_id, sources))
+    hits = batch.value[mask]
+    if not len(hits):
+        return 0, {}, {}
+
+    # Group by target
+    targets, target_index = np.unique(batch.target_unit_id[mask], return_inverse=True)
+    target_sums = np.bincount(target_index.reshape(-1), weights=hits)
+    enemy_damage = {str(unit_id): int(total) for unit_id, total in zip(targets, target_sums)}
+
+    # Group by source, then fold sources into their owning player
+    source_ids, source_index = np.unique(batch.source_unit_id[mask], return_inverse=True)
+    source_sums = np.bincount(source_index.reshape(-1), weights=hits)
+    player_damage: Dict[str, int] = {}
+    for unit_id, total in zip(source_ids, source_sums):
+        owner = source_owner.get(str(unit_id))
+        if owner is not None:
+            player_damage[owner] = player_damage.get(owner, 0) + int(total)
+
+    return int(hits.sum()), player_damage, enemy_damage
+
+
+def _unit_id_array(unit_ids: Iterable[str]) -> 'np.ndarray':
+    """Integer array of the numeric unit IDs in unit_ids"""
+    # Long (character) IDs do not fit the int64 unit columns, and never appear in them
+    max_unit_id = np.iinfo(np.int64).max
+    return np.array([int(unit_id) for unit_id in unit_ids
+                     if unit_id.isdigit() and int(unit_id) <= max_unit_id], dtype=np.int64)
+
+
+def encounter_source_owners(encounter) -> Dict[str, Optional[str]]:
+    """
+    Map every unit ID whose damage a CombatEncounter credits to the owning player.
+
+    Covers players' short and long unit IDs and the pets it tracks.
+    """
+    source_owner: Dict[str, Optional[str]] = {}
+    for player in encounter.players.values():
+        source_owner[player.unit_id] = player.unit_id
+        for long_unit_id in player.long_unit_ids:
+            source_owner[long_unit_id] = player.unit_id
+
+    for pet_id, owner_id in encounter.get_pet_ownership().items():
+        if pet_id in source_owner:
+            continue
+        owner = encounter.find_player_by_unit_id(owner_id)
+        source_owner[pet_id] = owner.unit_id if owner else None
+
+    return source_owner
+
+
+def encounter_damage_totals(batch: ColumnBatch, encounter) -> Tuple[int, Dict[str, int], Dict[str, int]]:
+    """
+    Compute (total_damage, player_damage, enemy_damage) of a CombatEncounter from a ColumnBatch.
+
+    Only rows between the encounter's start and end time are counted. Hostility
+    and pet ownership are taken from the encounter as it stands, rather than as
+    they were at each event.
+    """
+    if batch is None:
+        return 0, {}, {}
+
+    if encounter.end_time:
+        batch = batch.between(encounter.start_time, encounter.end_time)
+
+    hostile_unit_ids = [unit_id for unit_id, enemy in encounter.enemies.items() if enemy.is_hostile]
+    return damage_totals(batch, encounter_source_owners(encounter), hostile_unit_ids)
+
+
+def encounter_player_deaths(batch: ColumnBatch, encounter) -> int:
+    """
+    Count the deaths of a CombatEncounter's players (by short or long unit ID) in a ColumnBatch.
+
+    Only rows between the encounter's start and end time are counted.
+    """
+    if batch is None:
+        return 0
+
+    if encounter.end_time:
+        batch = batch.between(encounter.start_time, encounter.end_time)
+
+    player_unit_ids = [unit_id for player in encounter.players.values()
+                       for unit_id in (player.unit_id, *player.long_unit_ids)]
+    mask = batch.result_mask(*DEATH_RESULTS) & np.isin(batch.target_unit_id, _unit_id_array(player_unit_ids))
+    return int(mask.sum())
+
+
+def encounter_enemy_health(batch: ColumnBatch, encounter) -> Dict[str, Tuple[int, int]]:
+    """
+    Map each of a CombatEncounter's enemies hit in a ColumnBatch to its last (health, max health) as a target.
+
+    Only rows between the encounter's start and end time are used, and like
+    ESOLogAnalyzer only max health values from 1000 to 100000000 are trusted.
+    """
+    if batch is None:
+        return {}
+
+    if encounter.end_time:
+        batch = batch.between(encounter.start_time, encounter.end_time)
+
+    mask = ((batch.target_health_max >= 1000) & (batch.target_health_max <= 100000000) &
+            np.isin(batch.target_unit_id, _unit_id_array(encounter.enemies)))
+    targets = batch.target_unit_id[mask]
+    # Rows are in log order, so the last row of each target is its first in reverse
+    unit_ids, first_reversed = np.unique(targets[::-1], return_index=True)
+    last = len(targets) - 1 - first_reversed
+    health = batch.target_health[mask][last]
+    health_max = batch.target_health_max[mask][last]
+    return {str(unit_id): (int(current), int(maximum))
+            for unit_id, current, maximum in zip(unit_ids, health, health_max)}
+
+
+def encounter_killed_hostiles(batch: ColumnBatch, encounter) -> List[str]:
+    """
+    List the unit IDs of a CombatEncounter's hostile enemies that die in a ColumnBatch.
+
+    Only rows between the encounter's start and end time are counted.
+    """
+    if batch is None:
+        return []
+
+    if encounter.end_time:
+        batch = batch.between(encounter.start_time, encounter.end_time)
+
+    hostile_unit_ids = [unit_id for unit_id, enemy in encounter.enemies.items() if enemy.is_hostile]
+    mask = batch.result_mask(*DEATH_RESULTS) & np.isin(batch.target_unit_id, _unit_id_array(hostile_unit_ids))
+    return [str(unit_id) for unit_id in np.unique(batch.target_unit_id[mask])]
@@ -0,0 +1,1499 @@
+"""
+Auto-generated encounter log decoders.
+Generated from data/encounterlog/encounterlog_format.json by
+scripts/generate_log_decoders.py - DO NOT EDIT MANUALLY.
+
+One record class and one straight-line decoder per line type of encounter
+log version 15. Decoders take the tokenized line (see
+eso_log_structures.tokenize_line) and return None for malformed lines.
+Field names follow docs/encounterlog-format.md.
+
+Line types with only fixed-width fields also get a packed binary form
+(PACKERS / UNPACKERS), which the parse cache stores.
+"""
+
+import struct
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+LOG_VERSION = 15
+
+
+def _group_bracketed(tokens: List[str]) -> List[List[Any]]:
+    """Regroup comma-split tokens into their (possibly nested) [..] arrays"""
+    groups = []
+    stack = []
+    for token in tokens:
+        opened = len(token) - len(token.lstrip('['))
+        for _ in range(opened):
+            stack.append([])
+        token = token[opened:]
+        value = token.rstrip(']')
+        closed = len(token) - len(value)
+        if value:
+            stack[-1].append(value)
+        for _ in range(closed):
+            completed = stack.pop()
+            if stack:
+                stack[-1].append(completed)
+            else:
+                groups.append(completed)
+    return groups
+
+
+# ============================================================================
+# COMPOSITE RECORDS
+# ============================================================================
+
+class UnitState:
+    """
+    <unitState>: unitId, health, magicka, stamina, ultimate, werewolf, shield, mapNormalisedX, mapNormalisedY, headingRadians
+
+    unit_id is decoded with the line; every other field is decoded from
+    the raw tokens each time it is read.
+    """
+    __slots__ = ('_fields', '_i', 'unit_id')
+
+    def __init__(self, fields: List[str], i: int):
+        self._fields = fields
+        self._i = i
+        self.unit_id = int(fields[i])
+
+    @property
+    def health(self) -> int:
+        return int(self._fields[self._i + 1].partition('/')[0])
+
+    @property
+    def health_max(self) -> int:
+        return int(self._fields[self._i + 1].partition('/')[2])
+
+    @property
+    def magicka(self) -> int:
+        return int(self._fields[self._i + 2].partition('/')[0])
+
+    @property
+    def magicka_max(self) -> int:
+        return int(self._fields[self._i + 2].partition('/')[2])
+
+    @property
+    def stamina(self) -> int:
+        return int(self._fields[self._i + 3].partition('/')[0])
+
+    @property
+    def stamina_max(self) -> int:
+        return int(self._fields[self._i + 3].partition('/')[2])
+
+    @property
+    def ultimate(self) -> int:
+        return int(self._fields[self._i + 4].partition('/')[0])
+
+    @property
+    def ultimate_max(self) -> int:
+        return int(self._fields[self._i + 4].partition('/')[2])
+
+    @property
+    def werewolf(self) -> int:
+        return int(self._fields[self._i + 5].partition('/')[0])
+
+    @property
+    def werewolf_max(self) -> int:
+        return int(self._fields[self._i + 5].partition('/')[2])
+
+    @property
+    def shield(self) -> int:
+        return int(self._fields[self._i + 6])
+
+    @property
+    def map_normalised_x(self) -> float:
+        return float(self._fields[self._i + 7])
+
+    @property
+    def map_normalised_y(self) -> float:
+        return float(self._fields[self._i + 8])
+
+    @property
+    def heading_radians(self) -> float:
+        return float(self._fields[self._i + 9])
+
+    def _values(self) -> tuple:
+        return (self.unit_id, self.health, self.health_max, self.magicka, self.magicka_max, self.stamina, self.stamina_max, self.ultimate, self.ultimate_max, self.werewolf, self.werewolf_max, self.shield, self.map_normalised_x, self.map_normalised_y, self.heading_radians)
+
+    def __eq__(self, other):
+        if not isinstance(other, UnitState):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        names = ('unit_id', 'health', 'health_max', 'magicka', 'magicka_max', 'stamina', 'stamina_max', 'ultimate', 'ultimate_max', 'werewolf', 'werewolf_max', 'shield', 'map_normalised_x', 'map_normalised_y', 'heading_radians')
+        return 'UnitState(' + ', '.join(f'{n}={v!r}' for n, v in zip(names, self._values())) + ')'
+
+
+def _decode_unit_state(fields: List[str], i: int) -> UnitState:
+    """Decode a <unitState> occupying fields[i:i + 10]"""
+    return UnitState(fields, i)
+
+
+@dataclass
+class EquipmentInfo:
+    """<equipmentInfo>: slot, id, isCP, level, trait, displayQuality, setId, enchantType, isEnchantCP, enchantLevel, enchantQuality"""
+    __slots__ = ('slot', 'id', 'is_cp', 'level', 'trait', 'display_quality', 'set_id', 'enchant_type', 'is_enchant_cp', 'enchant_level', 'enchant_quality')
+    slot: str
+    id: int
+    is_cp: bool
+    level: int
+    trait: str
+    display_quality: str
+    set_id: int
+    enchant_type: str
+    is_enchant_cp: bool
+    enchant_level: int
+    enchant_quality: str
+
+
+def _decode_equipment_info(fields: List[str], i: int) -> EquipmentInfo:
+    """Decode a <equipmentInfo> occupying fields[i:i + 11]"""
+    return EquipmentInfo(
+        fields[i],
+        int(fields[i + 1]),
+        fields[i + 2] == 'T',
+        int(fields[i + 3]),
+        fields[i + 4],
+        fields[i + 5],
+        int(fields[i + 6]),
+        fields[i + 7],
+        fields[i + 8] == 'T',
+        int(fields[i + 9]),
+        fields[i + 10]
+    )
+
+
+@dataclass
+class ScribingInfo:
+    """<scribingInfo>: focusScript, signatureScript, affixScript"""
+    __slots__ = ('focus_script', 'signature_script', 'affix_script')
+    focus_script: str
+    signature_script: str
+    affix_script: str
+
+
+def _decode_scribing_info(fields: List[str], i: int) -> ScribingInfo:
+    """Decode a <scribingInfo> occupying fields[i:i + 3]"""
+    return ScribingInfo(
+        fields[i],
+        fields[i + 1],
+        fields[i + 2]
+    )
+
+
+# ============================================================================
+# LINE RECORDS AND DECODERS
+# ============================================================================
+
+@dataclass
+class BeginLogLine:
+    """BEGIN_LOG line"""
+    __slots__ = ('line_number', 'time_since_epoch_ms', 'log_version', 'realm_name', 'language', 'game_version')
+    line_number: int
+    time_since_epoch_ms: int
+    log_version: int
+    realm_name: str
+    language: str
+    game_version: str
+
+
+def decode_begin_log(fields: List[str]) -> Optional[BeginLogLine]:
+    """BEGIN_LOG, timeSinceEpochMS, logVersion, realmName, language, gameVersion"""
+    if len(fields) < 7 or fields[1] != 'BEGIN_LOG':
+        return None
+    try:
+        return BeginLogLine(
+            int(fields[0]),
+            int(fields[2]),
+            int(fields[3]),
+            fields[4],
+            fields[5],
+            fields[6]
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class EndLogLine:
+    """END_LOG line"""
+    __slots__ = ('line_number',)
+    line_number: int
+
+
+def decode_end_log(fields: List[str]) -> Optional[EndLogLine]:
+    """END_LOG"""
+    if len(fields) < 2 or fields[1] != 'END_LOG':
+        return None
+    try:
+        return EndLogLine(
+            int(fields[0])
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class BeginCombatLine:
+    """BEGIN_COMBAT line"""
+    __slots__ = ('line_number',)
+    line_number: int
+
+
+def decode_begin_combat(fields: List[str]) -> Optional[BeginCombatLine]:
+    """BEGIN_COMBAT"""
+    if len(fields) < 2 or fields[1] != 'BEGIN_COMBAT':
+        return None
+    try:
+        return BeginCombatLine(
+            int(fields[0])
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class EndCombatLine:
+    """END_COMBAT line"""
+    __slots__ = ('line_number',)
+    line_number: int
+
+
+def decode_end_combat(fields: List[str]) -> Optional[EndCombatLine]:
+    """END_COMBAT"""
+    if len(fields) < 2 or fields[1] != 'END_COMBAT':
+        return None
+    try:
+        return EndCombatLine(
+            int(fields[0])
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class PlayerInfoLine:
+    """PLAYER_INFO line"""
+    __slots__ = ('line_number', 'unit_id', 'long_term_effect_ability_ids', 'long_term_effect_stack_counts', 'equipment', 'primary_ability_ids', 'backup_ability_ids')
+    line_number: int
+    unit_id: int
+    long_term_effect_ability_ids: List[int]
+    long_term_effect_stack_counts: List[int]
+    equipment: List[EquipmentInfo]
+    primary_ability_ids: List[int]
+    backup_ability_ids: List[int]
+
+
+def decode_player_info(fields: List[str]) -> Optional[PlayerInfoLine]:
+    """PLAYER_INFO, unitId, longTermEffectAbilityIds, longTermEffectStackCounts, equipment, primaryAbilityIds, backupAbilityIds"""
+    if len(fields) < 8 or fields[1] != 'PLAYER_INFO':
+        return None
+    try:
+        arrays = _group_bracketed(fields[3:])
+        return PlayerInfoLine(
+            int(fields[0]),
+            int(fields[2]),
+            [int(value) for value in arrays[0]],
+            [int(value) for value in arrays[1]],
+            [_decode_equipment_info(item, 0) for item in arrays[2]],
+            [int(value) for value in arrays[3]],
+            [int(value) for value in arrays[4]]
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class BeginCastLine:
+    """BEGIN_CAST line"""
+    __slots__ = ('line_number', 'duration_ms', 'channeled', 'cast_track_id', 'ability_id', 'source_unit_state', 'target_unit_state')
+    line_number: int
+    duration_ms: int
+    channeled: bool
+    cast_track_id: int
+    ability_id: int
+    source_unit_state: UnitState
+    target_unit_state: UnitState
+
+
+def decode_begin_cast(fields: List[str]) -> Optional[BeginCastLine]:
+    """BEGIN_CAST, durationMS, channeled, castTrackId, abilityId, <sourceUnitState>, <targetUnitState>"""
+    if len(fields) < 17 or fields[1] != 'BEGIN_CAST':
+        return None
+    try:
+        source_unit_state = _decode_unit_state(fields, 6)
+        if fields[16] == '*':
+            target_unit_state = source_unit_state
+        else:
+            target_unit_state = _decode_unit_state(fields, 16)
+        return BeginCastLine(
+            int(fields[0]),
+            int(fields[2]),
+            fields[3] == 'T',
+            int(fields[4]),
+            int(fields[5]),
+            source_unit_state,
+            target_unit_state
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class EndCastLine:
+    """END_CAST line"""
+    __slots__ = ('line_number', 'end_reason', 'cast_track_id', 'interrupted_ability_id', 'interrupting_ability_id', 'interrupting_unit_id')
+    line_number: int
+    end_reason: str
+    cast_track_id: int
+    interrupted_ability_id: int
+    interrupting_ability_id: Optional[int]
+    interrupting_unit_id: Optional[int]
+
+
+def decode_end_cast(fields: List[str]) -> Optional[EndCastLine]:
+    """END_CAST, endReason, castTrackId, interruptedAbilityId, interruptingAbilityId, interruptingUnitId"""
+    if len(fields) < 5 or fields[1] != 'END_CAST':
+        return None
+    try:
+        return EndCastLine(
+            int(fields[0]),
+            fields[2],
+            int(fields[3]),
+            int(fields[4]),
+            int(fields[5]) if len(fields) > 5 else None,
+            int(fields[6]) if len(fields) > 6 else None
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class CombatEventLine:
+    """COMBAT_EVENT line"""
+    __slots__ = ('line_number', 'action_result', 'damage_type', 'power_type', 'hit_value', 'overflow', 'cast_track_id', 'ability_id', 'source_unit_state', 'target_unit_state')
+    line_number: int
+    action_result: str
+    damage_type: str
+    power_type: int
+    hit_value: int
+    overflow: int
+    cast_track_id: int
+    ability_id: int
+    source_unit_state: UnitState
+    target_unit_state: UnitState
+
+
+def decode_combat_event(fields: List[str]) -> Optional[CombatEventLine]:
+    """COMBAT_EVENT, actionResult, damageType, powerType, hitValue, overflow, castTrackId, abilityId, <sourceUnitState>, <targetUnitState>"""
+    if len(fields) < 20 or fields[1] != 'COMBAT_EVENT':
+        return None
+    try:
+        source_unit_state = _decode_unit_state(fields, 9)
+        if fields[19] == '*':
+            target_unit_state = source_unit_state
+        else:
+            target_unit_state = _decode_unit_state(fields, 19)
+        return CombatEventLine(
+            int(fields[0]),
+            fields[2],
+            fields[3],
+            int(fields[4]),
+            int(fields[5]),
+            int(fields[6]),
+            int(fields[7]),
+            int(fields[8]),
+            source_unit_state,
+            target_unit_state
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class HealthRegenLine:
+    """HEALTH_REGEN line"""
+    __slots__ = ('line_number', 'effective_regen', 'unit_state')
+    line_number: int
+    effective_regen: int
+    unit_state: UnitState
+
+
+def decode_health_regen(fields: List[str]) -> Optional[HealthRegenLine]:
+    """HEALTH_REGEN, effectiveRegen, <unitState>"""
+    if len(fields) < 13 or fields[1] != 'HEALTH_REGEN':
+        return None
+    try:
+        unit_state = _decode_unit_state(fields, 3)
+        return HealthRegenLine(
+            int(fields[0]),
+            int(fields[2]),
+            unit_state
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class UnitAddedLine:
+    """UNIT_ADDED line"""
+    __slots__ = ('line_number', 'unit_id', 'unit_type', 'is_local_player', 'player_per_session_id', 'monster_id', 'is_boss', 'class_id', 'race_id', 'name', 'display_name', 'character_id', 'level', 'champion_points', 'owner_unit_id', 'reaction', 'is_grouped_with_local_player')
+    line_number: int
+    unit_id: int
+    unit_type: str
+    is_local_player: bool
+    player_per_session_id: int
+    monster_id: int
+    is_boss: bool
+    class_id: int
+    race_id: int
+    name: str
+    display_name: str
+    character_id: int
+    level: int
+    champion_points: int
+    owner_unit_id: int
+    reaction: str
+    is_grouped_with_local_player: bool
+
+
+def decode_unit_added(fields: List[str]) -> Optional[UnitAddedLine]:
+    """UNIT_ADDED, unitId, unitType, isLocalPlayer, playerPerSessionId, monsterId, isBoss, classId, raceId, name, displayName, characterId, level, championPoints, ownerUnitId, reaction, isGroupedWithLocalPlayer"""
+    if len(fields) < 18 or fields[1] != 'UNIT_ADDED':
+        return None
+    try:
+        return UnitAddedLine(
+            int(fields[0]),
+            int(fields[2]),
+            fields[3],
+            fields[4] == 'T',
+            int(fields[5]),
+            int(fields[6]),
+            fields[7] == 'T',
+            int(fields[8]),
+            int(fields[9]),
+            fields[10],
+            fields[11],
+            int(fields[12]),
+            int(fields[13]),
+            int(fields[14]),
+            int(fields[15]),
+            fields[16],
+            fields[17] == 'T'
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class UnitChangedLine:
+    """UNIT_CHANGED line"""
+    __slots__ = ('line_number', 'unit_id', 'class_id', 'race_id', 'name', 'display_name', 'character_id', 'level', 'champion_points', 'owner_unit_id', 'reaction', 'is_grouped_with_local_player')
+    line_number: int
+    unit_id: int
+    class_id: int
+    race_id: int
+    name: str
+    display_name: str
+    character_id: int
+    level: int
+    champion_points: int
+    owner_unit_id: int
+    reaction: str
+    is_grouped_with_local_player: bool
+
+
+def decode_unit_changed(fields: List[str]) -> Optional[UnitChangedLine]:
+    """UNIT_CHANGED, unitId, classId, raceId, name, displayName, characterId, level, championPoints, ownerUnitId, reaction, isGroupedWithLocalPlayer"""
+    if len(fields) < 13 or fields[1] != 'UNIT_CHANGED':
+        return None
+    try:
+        return UnitChangedLine(
+            int(fields[0]),
+            int(fields[2]),
+            int(fields[3]),
+            int(fields[4]),
+            fields[5],
+            fields[6],
+            int(fields[7]),
+            int(fields[8]),
+            int(fields[9]),
+            int(fields[10]),
+            fields[11],
+            fields[12] == 'T'
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class UnitRemovedLine:
+    """UNIT_REMOVED line"""
+    __slots__ = ('line_number', 'unit_id')
+    line_number: int
+    unit_id: int
+
+
+def decode_unit_removed(fields: List[str]) -> Optional[UnitRemovedLine]:
+    """UNIT_REMOVED, unitId"""
+    if len(fields) < 3 or fields[1] != 'UNIT_REMOVED':
+        return None
+    try:
+        return UnitRemovedLine(
+            int(fields[0]),
+            int(fields[2])
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class EffectChangedLine:
+    """EFFECT_CHANGED line"""
+    __slots__ = ('line_number', 'change_type', 'stack_count', 'cast_track_id', 'ability_id', 'source_unit_state', 'target_unit_state', 'player_initiated_remove_cast_track_id')
+    line_number: int
+    change_type: str
+    stack_count: int
+    cast_track_id: int
+    ability_id: int
+    source_unit_state: UnitState
+    target_unit_state: UnitState
+    player_initiated_remove_cast_track_id: Optional[int]
+
+
+def decode_effect_changed(fields: List[str]) -> Optional[EffectChangedLine]:
+    """EFFECT_CHANGED, changeType, stackCount, castTrackId, abilityId, <sourceUnitState>, <targetUnitState>, playerInitiatedRemoveCastTrackId"""
+    if len(fields) < 17 or fields[1] != 'EFFECT_CHANGED':
+        return None
+    try:
+        source_unit_state = _decode_unit_state(fields, 6)
+        if fields[16] == '*':
+            target_unit_state = source_unit_state
+            i = 17
+        else:
+            target_unit_state = _decode_unit_state(fields, 16)
+            i = 26
+        return EffectChangedLine(
+            int(fields[0]),
+            fields[2],
+            int(fields[3]),
+            int(fields[4]),
+            int(fields[5]),
+            source_unit_state,
+            target_unit_state,
+            int(fields[i]) if len(fields) > i else None
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class AbilityInfoLine:
+    """ABILITY_INFO line"""
+    __slots__ = ('line_number', 'ability_id', 'name', 'icon_path', 'interruptible', 'blockable', 'scribing_info')
+    line_number: int
+    ability_id: int
+    name: str
+    icon_path: str
+    interruptible: bool
+    blockable: bool
+    scribing_info: Optional[ScribingInfo]
+
+
+def decode_ability_info(fields: List[str]) -> Optional[AbilityInfoLine]:
+    """ABILITY_INFO, abilityId, name, iconPath, interruptible, blockable, <scribingInfo>"""
+    if len(fields) < 7 or fields[1] != 'ABILITY_INFO':
+        return None
+    try:
+        scribing_info = _decode_scribing_info(fields, 7) if len(fields) >= 10 else None
+        return AbilityInfoLine(
+            int(fields[0]),
+            int(fields[2]),
+            fields[3],
+            fields[4],
+            fields[5] == 'T',
+            fields[6] == 'T',
+            scribing_info
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class EffectInfoLine:
+    """EFFECT_INFO line"""
+    __slots__ = ('line_number', 'ability_id', 'effect_type', 'status_effect_type', 'effect_bar_display_behaviour', 'grants_synergy_ability_id')
+    line_number: int
+    ability_id: int
+    effect_type: str
+    status_effect_type: str
+    effect_bar_display_behaviour: str
+    grants_synergy_ability_id: Optional[int]
+
+
+def decode_effect_info(fields: List[str]) -> Optional[EffectInfoLine]:
+    """EFFECT_INFO, abilityId, effectType, statusEffectType, effectBarDisplayBehaviour, grantsSynergyAbilityId"""
+    if len(fields) < 6 or fields[1] != 'EFFECT_INFO':
+        return None
+    try:
+        return EffectInfoLine(
+            int(fields[0]),
+            int(fields[2]),
+            fields[3],
+            fields[4],
+            fields[5],
+            int(fields[6]) if len(fields) > 6 else None
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class MapChangedLine:
+    """MAP_CHANGED line"""
+    __slots__ = ('line_number', 'id', 'name', 'texture_path')
+    line_number: int
+    id: int
+    name: str
+    texture_path: str
+
+
+def decode_map_changed(fields: List[str]) -> Optional[MapChangedLine]:
+    """MAP_CHANGED, id, name, texturePath"""
+    if len(fields) < 5 or fields[1] != 'MAP_CHANGED':
+        return None
+    try:
+        return MapChangedLine(
+            int(fields[0]),
+            int(fields[2]),
+            fields[3],
+            fields[4]
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class ZoneChangedLine:
+    """ZONE_CHANGED line"""
+    __slots__ = ('line_number', 'id', 'name', 'dungeon_difficulty')
+    line_number: int
+    id: int
+    name: str
+    dungeon_difficulty: str
+
+
+def decode_zone_changed(fields: List[str]) -> Optional[ZoneChangedLine]:
+    """ZONE_CHANGED, id, name, dungeonDifficulty"""
+    if len(fields) < 5 or fields[1] != 'ZONE_CHANGED':
+        return None
+    try:
+        return ZoneChangedLine(
+            int(fields[0]),
+            int(fields[2]),
+            fields[3],
+            fields[4]
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class TrialInitLine:
+    """TRIAL_INIT line"""
+    __slots__ = ('line_number', 'id', 'in_progress', 'completed', 'start_time_ms', 'duration_ms', 'success', 'final_score')
+    line_number: int
+    id: int
+    in_progress: bool
+    completed: bool
+    start_time_ms: int
+    duration_ms: int
+    success: bool
+    final_score: int
+
+
+def decode_trial_init(fields: List[str]) -> Optional[TrialInitLine]:
+    """TRIAL_INIT, id, inProgress, completed, startTimeMS, durationMS, success, finalScore"""
+    if len(fields) < 9 or fields[1] != 'TRIAL_INIT':
+        return None
+    try:
+        return TrialInitLine(
+            int(fields[0]),
+            int(fields[2]),
+            fields[3] == 'T',
+            fields[4] == 'T',
+            int(fields[5]),
+            int(fields[6]),
+            fields[7] == 'T',
+            int(fields[8])
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class BeginTrialLine:
+    """BEGIN_TRIAL line"""
+    __slots__ = ('line_number', 'id', 'start_time_ms')
+    line_number: int
+    id: int
+    start_time_ms: int
+
+
+def decode_begin_trial(fields: List[str]) -> Optional[BeginTrialLine]:
+    """BEGIN_TRIAL, id, startTimeMS"""
+    if len(fields) < 4 or fields[1] != 'BEGIN_TRIAL':
+        return None
+    try:
+        return BeginTrialLine(
+            int(fields[0]),
+            int(fields[2]),
+            int(fields[3])
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class EndTrialLine:
+    """END_TRIAL line"""
+    __slots__ = ('line_number', 'id', 'duration_ms', 'success', 'final_score', 'final_vitality_bonus')
+    line_number: int
+    id: int
+    duration_ms: int
+    success: bool
+    final_score: int
+    final_vitality_bonus: int
+
+
+def decode_end_trial(fields: List[str]) -> Optional[EndTrialLine]:
+    """END_TRIAL, id, durationMS, success, finalScore, finalVitalityBonus"""
+    if len(fields) < 7 or fields[1] != 'END_TRIAL':
+        return None
+    try:
+        return EndTrialLine(
+            int(fields[0]),
+            int(fields[2]),
+            int(fields[3]),
+            fields[4] == 'T',
+            int(fields[5]),
+            int(fields[6])
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class EndlessDungeonBeginLine:
+    """ENDLESS_DUNGEON_BEGIN line"""
+    __slots__ = ('line_number', 'id', 'start_time_ms', 'unknown_boolean')
+    line_number: int
+    id: int
+    start_time_ms: int
+    unknown_boolean: bool
+
+
+def decode_endless_dungeon_begin(fields: List[str]) -> Optional[EndlessDungeonBeginLine]:
+    """ENDLESS_DUNGEON_BEGIN, id, startTimeMS, unknownBoolean"""
+    if len(fields) < 5 or fields[1] != 'ENDLESS_DUNGEON_BEGIN':
+        return None
+    try:
+        return EndlessDungeonBeginLine(
+            int(fields[0]),
+            int(fields[2]),
+            int(fields[3]),
+            fields[4] == 'T'
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class EndlessDungeonEndLine:
+    """ENDLESS_DUNGEON_END line"""
+    __slots__ = ('line_number', 'id', 'duration_ms', 'final_score', 'unknown_boolean')
+    line_number: int
+    id: int
+    duration_ms: int
+    final_score: int
+    unknown_boolean: bool
+
+
+def decode_endless_dungeon_end(fields: List[str]) -> Optional[EndlessDungeonEndLine]:
+    """ENDLESS_DUNGEON_END, id, durationMS, finalScore, unknownBoolean"""
+    if len(fields) < 6 or fields[1] != 'ENDLESS_DUNGEON_END':
+        return None
+    try:
+        return EndlessDungeonEndLine(
+            int(fields[0]),
+            int(fields[2]),
+            int(fields[3]),
+            int(fields[4]),
+            fields[5] == 'T'
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class EndlessDungeonStageEndLine:
+    """ENDLESS_DUNGEON_STAGE_END line"""
+    __slots__ = ('line_number', 'id', 'dungeon_begin_start_time_ms')
+    line_number: int
+    id: int
+    dungeon_begin_start_time_ms: int
+
+
+def decode_endless_dungeon_stage_end(fields: List[str]) -> Optional[EndlessDungeonStageEndLine]:
+    """ENDLESS_DUNGEON_STAGE_END, id, dungeonBeginStartTimeMS"""
+    if len(fields) < 4 or fields[1] != 'ENDLESS_DUNGEON_STAGE_END':
+        return None
+    try:
+        return EndlessDungeonStageEndLine(
+            int(fields[0]),
+            int(fields[2]),
+            int(fields[3])
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class EndlessDungeonBuffAddedLine:
+    """ENDLESS_DUNGEON_BUFF_ADDED line"""
+    __slots__ = ('line_number', 'id', 'ability_id')
+    line_number: int
+    id: int
+    ability_id: int
+
+
+def decode_endless_dungeon_buff_added(fields: List[str]) -> Optional[EndlessDungeonBuffAddedLine]:
+    """ENDLESS_DUNGEON_BUFF_ADDED, id, abilityId"""
+    if len(fields) < 4 or fields[1] != 'ENDLESS_DUNGEON_BUFF_ADDED':
+        return None
+    try:
+        return EndlessDungeonBuffAddedLine(
+            int(fields[0]),
+            int(fields[2]),
+            int(fields[3])
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+@dataclass
+class EndlessDungeonBuffRemovedLine:
+    """ENDLESS_DUNGEON_BUFF_REMOVED line"""
+    __slots__ = ('line_number', 'id', 'ability_id')
+    line_number: int
+    id: int
+    ability_id: int
+
+
+def decode_endless_dungeon_buff_removed(fields: List[str]) -> Optional[EndlessDungeonBuffRemovedLine]:
+    """ENDLESS_DUNGEON_BUFF_REMOVED, id, abilityId"""
+    if len(fields) < 4 or fields[1] != 'ENDLESS_DUNGEON_BUFF_REMOVED':
+        return None
+    try:
+        return EndlessDungeonBuffRemovedLine(
+            int(fields[0]),
+            int(fields[2]),
+            int(fields[3])
+        )
+    except (ValueError, IndexError):
+        return None
+
+
+# Decoder for each line type name
+DECODERS: Dict[str, Callable[[List[str]], Any]] = {
+    'BEGIN_LOG': decode_begin_log,
+    'END_LOG': decode_end_log,
+    'BEGIN_COMBAT': decode_begin_combat,
+    'END_COMBAT': decode_end_combat,
+    'PLAYER_INFO': decode_player_info,
+    'BEGIN_CAST': decode_begin_cast,
+    'END_CAST': decode_end_cast,
+    'COMBAT_EVENT': decode_combat_event,
+    'HEALTH_REGEN': decode_health_regen,
+    'UNIT_ADDED': decode_unit_added,
+    'UNIT_CHANGED': decode_unit_changed,
+    'UNIT_REMOVED': decode_unit_removed,
+    'EFFECT_CHANGED': decode_effect_changed,
+    'ABILITY_INFO': decode_ability_info,
+    'EFFECT_INFO': decode_effect_info,
+    'MAP_CHANGED': decode_map_changed,
+    'ZONE_CHANGED': decode_zone_changed,
+    'TRIAL_INIT': decode_trial_init,
+    'BEGIN_TRIAL': decode_begin_trial,
+    'END_TRIAL': decode_end_trial,
+    'ENDLESS_DUNGEON_BEGIN': decode_endless_dungeon_begin,
+    'ENDLESS_DUNGEON_END': decode_endless_dungeon_end,
+    'ENDLESS_DUNGEON_STAGE_END': decode_endless_dungeon_stage_end,
+    'ENDLESS_DUNGEON_BUFF_ADDED': decode_endless_dungeon_buff_added,
+    'ENDLESS_DUNGEON_BUFF_REMOVED': decode_endless_dungeon_buff_removed,
+}
+
+
+def decode_fields(fields: List[str]) -> Optional[Any]:
+    """Decode a tokenized line of any known line type"""
+    if len(fields) < 2:
+        return None
+    decoder = DECODERS.get(fields[1])
+    return decoder(fields) if decoder else None
+
+
+# ============================================================================
+# PACKED RECORDS
+# ============================================================================
+#
+# A binary form of the decoded records of fixed-width line types, for
+# caches that read them back without tokenizing or decoding the line again.
+# Strings are packed as codes into a table the caller keeps.
+
+# Packed value of an absent optional int
+_NO_INT = -2 ** 31
+
+
+def _pack_optional(value: Optional[int]) -> int:
+    """Packed value of an optional int"""
+    if value is None:
+        return _NO_INT
+    if value == _NO_INT:
+        raise struct.error("value collides with the absent marker")
+    return value
+
+
+# Packed floats are ten-thousandths
+_DECIMAL_SCALE = 10000
+
+
+def _pack_decimal(value: float) -> int:
+    """Packed value of a float with at most four decimals"""
+    try:
+        scaled = round(value * _DECIMAL_SCALE)
+    except (OverflowError, ValueError):
+        raise struct.error("float is not finite") from None
+    if scaled / _DECIMAL_SCALE != value:
+        raise struct.error("float has more than four decimals")
+    return scaled
+
+
+_PACKED_UNIT_STATE = struct.Struct('<iiiiiiiiiiiiiii')
+
+
+class PackedUnitState(UnitState):
+    """
+    <unitState> read back from its packed form
+
+    Every field was decoded when it was packed; reads index the unpacked values.
+    """
+    __slots__ = ()
+
+    def __init__(self, values: tuple):
+        self._fields = values
+        self._i = 0
+        self.unit_id = values[0]
+
+    @property
+    def health(self) -> int:
+        return self._fields[1]
+
+    @property
+    def health_max(self) -> int:
+        return self._fields[2]
+
+    @property
+    def magicka(self) -> int:
+        return self._fields[3]
+
+    @property
+    def magicka_max(self) -> int:
+        return self._fields[4]
+
+    @property
+    def stamina(self) -> int:
+        return self._fields[5]
+
+    @property
+    def stamina_max(self) -> int:
+        return self._fields[6]
+
+    @property
+    def ultimate(self) -> int:
+        return self._fields[7]
+
+    @property
+    def ultimate_max(self) -> int:
+        return self._fields[8]
+
+    @property
+    def werewolf(self) -> int:
+        return self._fields[9]
+
+    @property
+    def werewolf_max(self) -> int:
+        return self._fields[10]
+
+    @property
+    def shield(self) -> int:
+        return self._fields[11]
+
+    @property
+    def map_normalised_x(self) -> float:
+        return self._fields[12] / _DECIMAL_SCALE
+
+    @property
+    def map_normalised_y(self) -> float:
+        return self._fields[13] / _DECIMAL_SCALE
+
+    @property
+    def heading_radians(self) -> float:
+        return self._fields[14] / _DECIMAL_SCALE
+
+
+def _pack_unit_state(value: UnitState) -> bytes:
+    """Pack a <unitState> (ValueError: a malformed token)"""
+    if isinstance(value, PackedUnitState):
+        return _PACKED_UNIT_STATE.pack(*value._fields)
+    f = value._fields
+    i = value._i
+    health = f[i + 1].partition('/')
+    magicka = f[i + 2].partition('/')
+    stamina = f[i + 3].partition('/')
+    ultimate = f[i + 4].partition('/')
+    werewolf = f[i + 5].partition('/')
+    return _PACKED_UNIT_STATE.pack(value.unit_id, int(health[0]), int(health[2]), int(magicka[0]), int(magicka[2]), int(stamina[0]), int(stamina[2]), int(ultimate[0]), int(ultimate[2]), int(werewolf[0]), int(werewolf[2]), int(f[i + 6]), _pack_decimal(float(f[i + 7])), _pack_decimal(float(f[i + 8])), _pack_decimal(float(f[i + 9])))
+
+
+_PACKED_BEGIN_LOG = struct.Struct('<iiiIII')
+
+
+def pack_begin_log(record: BeginLogLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a BEGIN_LOG record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_BEGIN_LOG.pack(record.line_number, record.time_since_epoch_ms, record.log_version, string_code(record.realm_name), string_code(record.language), string_code(record.game_version))
+
+
+def unpack_begin_log(data: bytes, i: int, strings: List[str]) -> Tuple[BeginLogLine, int]:
+    """Unpack a BEGIN_LOG record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_BEGIN_LOG.unpack_from(data, i)
+    i += _PACKED_BEGIN_LOG.size
+    return BeginLogLine(v[0], v[1], v[2], strings[v[3]], strings[v[4]], strings[v[5]]), i
+
+
+_PACKED_END_LOG = struct.Struct('<i')
+
+
+def pack_end_log(record: EndLogLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a END_LOG record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_END_LOG.pack(record.line_number)
+
+
+def unpack_end_log(data: bytes, i: int, strings: List[str]) -> Tuple[EndLogLine, int]:
+    """Unpack a END_LOG record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_END_LOG.unpack_from(data, i)
+    i += _PACKED_END_LOG.size
+    return EndLogLine(v[0]), i
+
+
+_PACKED_BEGIN_COMBAT = struct.Struct('<i')
+
+
+def pack_begin_combat(record: BeginCombatLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a BEGIN_COMBAT record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_BEGIN_COMBAT.pack(record.line_number)
+
+
+def unpack_begin_combat(data: bytes, i: int, strings: List[str]) -> Tuple[BeginCombatLine, int]:
+    """Unpack a BEGIN_COMBAT record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_BEGIN_COMBAT.unpack_from(data, i)
+    i += _PACKED_BEGIN_COMBAT.size
+    return BeginCombatLine(v[0]), i
+
+
+_PACKED_END_COMBAT = struct.Struct('<i')
+
+
+def pack_end_combat(record: EndCombatLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a END_COMBAT record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_END_COMBAT.pack(record.line_number)
+
+
+def unpack_end_combat(data: bytes, i: int, strings: List[str]) -> Tuple[EndCombatLine, int]:
+    """Unpack a END_COMBAT record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_END_COMBAT.unpack_from(data, i)
+    i += _PACKED_END_COMBAT.size
+    return EndCombatLine(v[0]), i
+
+
+_PACKED_BEGIN_CAST = struct.Struct('<ii?ii?')
+
+
+def pack_begin_cast(record: BeginCastLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a BEGIN_CAST record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return (_PACKED_BEGIN_CAST.pack(record.line_number, record.duration_ms, record.channeled, record.cast_track_id, record.ability_id, record.target_unit_state is record.source_unit_state)
+            + _pack_unit_state(record.source_unit_state)
+            + (b'' if record.target_unit_state is record.source_unit_state else _pack_unit_state(record.target_unit_state)))
+
+
+def unpack_begin_cast(data: bytes, i: int, strings: List[str]) -> Tuple[BeginCastLine, int]:
+    """Unpack a BEGIN_CAST record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_BEGIN_CAST.unpack_from(data, i)
+    i += _PACKED_BEGIN_CAST.size
+    source_unit_state = PackedUnitState(_PACKED_UNIT_STATE.unpack_from(data, i))
+    i += _PACKED_UNIT_STATE.size
+    if v[5]:
+        target_unit_state = source_unit_state
+    else:
+        target_unit_state = PackedUnitState(_PACKED_UNIT_STATE.unpack_from(data, i))
+        i += _PACKED_UNIT_STATE.size
+    return BeginCastLine(v[0], v[1], v[2], v[3], v[4], source_unit_state, target_unit_state), i
+
+
+_PACKED_END_CAST = struct.Struct('<iIiiii')
+
+
+def pack_end_cast(record: EndCastLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a END_CAST record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_END_CAST.pack(record.line_number, string_code(record.end_reason), record.cast_track_id, record.interrupted_ability_id, _pack_optional(record.interrupting_ability_id), _pack_optional(record.interrupting_unit_id))
+
+
+def unpack_end_cast(data: bytes, i: int, strings: List[str]) -> Tuple[EndCastLine, int]:
+    """Unpack a END_CAST record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_END_CAST.unpack_from(data, i)
+    i += _PACKED_END_CAST.size
+    return EndCastLine(v[0], strings[v[1]], v[2], v[3], None if v[4] == _NO_INT else v[4], None if v[5] == _NO_INT else v[5]), i
+
+
+_PACKED_COMBAT_EVENT = struct.Struct('<iIIiiiii?')
+
+
+def pack_combat_event(record: CombatEventLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a COMBAT_EVENT record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return (_PACKED_COMBAT_EVENT.pack(record.line_number, string_code(record.action_result), string_code(record.damage_type), record.power_type, record.hit_value, record.overflow, record.cast_track_id, record.ability_id, record.target_unit_state is record.source_unit_state)
+            + _pack_unit_state(record.source_unit_state)
+            + (b'' if record.target_unit_state is record.source_unit_state else _pack_unit_state(record.target_unit_state)))
+
+
+def unpack_combat_event(data: bytes, i: int, strings: List[str]) -> Tuple[CombatEventLine, int]:
+    """Unpack a COMBAT_EVENT record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_COMBAT_EVENT.unpack_from(data, i)
+    i += _PACKED_COMBAT_EVENT.size
+    source_unit_state = PackedUnitState(_PACKED_UNIT_STATE.unpack_from(data, i))
+    i += _PACKED_UNIT_STATE.size
+    if v[8]:
+        target_unit_state = source_unit_state
+    else:
+        target_unit_state = PackedUnitState(_PACKED_UNIT_STATE.unpack_from(data, i))
+        i += _PACKED_UNIT_STATE.size
+    return CombatEventLine(v[0], strings[v[1]], strings[v[2]], v[3], v[4], v[5], v[6], v[7], source_unit_state, target_unit_state), i
+
+
+_PACKED_HEALTH_REGEN = struct.Struct('<ii')
+
+
+def pack_health_regen(record: HealthRegenLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a HEALTH_REGEN record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return (_PACKED_HEALTH_REGEN.pack(record.line_number, record.effective_regen)
+            + _pack_unit_state(record.unit_state))
+
+
+def unpack_health_regen(data: bytes, i: int, strings: List[str]) -> Tuple[HealthRegenLine, int]:
+    """Unpack a HEALTH_REGEN record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_HEALTH_REGEN.unpack_from(data, i)
+    i += _PACKED_HEALTH_REGEN.size
+    unit_state = PackedUnitState(_PACKED_UNIT_STATE.unpack_from(data, i))
+    i += _PACKED_UNIT_STATE.size
+    return HealthRegenLine(v[0], v[1], unit_state), i
+
+
+_PACKED_UNIT_ADDED = struct.Struct('<iiI?ii?iiIIiiiiI?')
+
+
+def pack_unit_added(record: UnitAddedLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a UNIT_ADDED record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_UNIT_ADDED.pack(record.line_number, record.unit_id, string_code(record.unit_type), record.is_local_player, record.player_per_session_id, record.monster_id, record.is_boss, record.class_id, record.race_id, string_code(record.name), string_code(record.display_name), record.character_id, record.level, record.champion_points, record.owner_unit_id, string_code(record.reaction), record.is_grouped_with_local_player)
+
+
+def unpack_unit_added(data: bytes, i: int, strings: List[str]) -> Tuple[UnitAddedLine, int]:
+    """Unpack a UNIT_ADDED record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_UNIT_ADDED.unpack_from(data, i)
+    i += _PACKED_UNIT_ADDED.size
+    return UnitAddedLine(v[0], v[1], strings[v[2]], v[3], v[4], v[5], v[6], v[7], v[8], strings[v[9]], strings[v[10]], v[11], v[12], v[13], v[14], strings[v[15]], v[16]), i
+
+
+_PACKED_UNIT_CHANGED = struct.Struct('<iiiiIIiiiiI?')
+
+
+def pack_unit_changed(record: UnitChangedLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a UNIT_CHANGED record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_UNIT_CHANGED.pack(record.line_number, record.unit_id, record.class_id, record.race_id, string_code(record.name), string_code(record.display_name), record.character_id, record.level, record.champion_points, record.owner_unit_id, string_code(record.reaction), record.is_grouped_with_local_player)
+
+
+def unpack_unit_changed(data: bytes, i: int, strings: List[str]) -> Tuple[UnitChangedLine, int]:
+    """Unpack a UNIT_CHANGED record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_UNIT_CHANGED.unpack_from(data, i)
+    i += _PACKED_UNIT_CHANGED.size
+    return UnitChangedLine(v[0], v[1], v[2], v[3], strings[v[4]], strings[v[5]], v[6], v[7], v[8], v[9], strings[v[10]], v[11]), i
+
+
+_PACKED_UNIT_REMOVED = struct.Struct('<ii')
+
+
+def pack_unit_removed(record: UnitRemovedLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a UNIT_REMOVED record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_UNIT_REMOVED.pack(record.line_number, record.unit_id)
+
+
+def unpack_unit_removed(data: bytes, i: int, strings: List[str]) -> Tuple[UnitRemovedLine, int]:
+    """Unpack a UNIT_REMOVED record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_UNIT_REMOVED.unpack_from(data, i)
+    i += _PACKED_UNIT_REMOVED.size
+    return UnitRemovedLine(v[0], v[1]), i
+
+
+_PACKED_EFFECT_CHANGED = struct.Struct('<iIiiii?')
+
+
+def pack_effect_changed(record: EffectChangedLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a EFFECT_CHANGED record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return (_PACKED_EFFECT_CHANGED.pack(record.line_number, string_code(record.change_type), record.stack_count, record.cast_track_id, record.ability_id, _pack_optional(record.player_initiated_remove_cast_track_id), record.target_unit_state is record.source_unit_state)
+            + _pack_unit_state(record.source_unit_state)
+            + (b'' if record.target_unit_state is record.source_unit_state else _pack_unit_state(record.target_unit_state)))
+
+
+def unpack_effect_changed(data: bytes, i: int, strings: List[str]) -> Tuple[EffectChangedLine, int]:
+    """Unpack a EFFECT_CHANGED record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_EFFECT_CHANGED.unpack_from(data, i)
+    i += _PACKED_EFFECT_CHANGED.size
+    source_unit_state = PackedUnitState(_PACKED_UNIT_STATE.unpack_from(data, i))
+    i += _PACKED_UNIT_STATE.size
+    if v[6]:
+        target_unit_state = source_unit_state
+    else:
+        target_unit_state = PackedUnitState(_PACKED_UNIT_STATE.unpack_from(data, i))
+        i += _PACKED_UNIT_STATE.size
+    return EffectChangedLine(v[0], strings[v[1]], v[2], v[3], v[4], source_unit_state, target_unit_state, None if v[5] == _NO_INT else v[5]), i
+
+
+_PACKED_EFFECT_INFO = struct.Struct('<iiIIIi')
+
+
+def pack_effect_info(record: EffectInfoLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a EFFECT_INFO record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_EFFECT_INFO.pack(record.line_number, record.ability_id, string_code(record.effect_type), string_code(record.status_effect_type), string_code(record.effect_bar_display_behaviour), _pack_optional(record.grants_synergy_ability_id))
+
+
+def unpack_effect_info(data: bytes, i: int, strings: List[str]) -> Tuple[EffectInfoLine, int]:
+    """Unpack a EFFECT_INFO record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_EFFECT_INFO.unpack_from(data, i)
+    i += _PACKED_EFFECT_INFO.size
+    return EffectInfoLine(v[0], v[1], strings[v[2]], strings[v[3]], strings[v[4]], None if v[5] == _NO_INT else v[5]), i
+
+
+_PACKED_MAP_CHANGED = struct.Struct('<iiII')
+
+
+def pack_map_changed(record: MapChangedLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a MAP_CHANGED record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_MAP_CHANGED.pack(record.line_number, record.id, string_code(record.name), string_code(record.texture_path))
+
+
+def unpack_map_changed(data: bytes, i: int, strings: List[str]) -> Tuple[MapChangedLine, int]:
+    """Unpack a MAP_CHANGED record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_MAP_CHANGED.unpack_from(data, i)
+    i += _PACKED_MAP_CHANGED.size
+    return MapChangedLine(v[0], v[1], strings[v[2]], strings[v[3]]), i
+
+
+_PACKED_ZONE_CHANGED = struct.Struct('<iiII')
+
+
+def pack_zone_changed(record: ZoneChangedLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a ZONE_CHANGED record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_ZONE_CHANGED.pack(record.line_number, record.id, string_code(record.name), string_code(record.dungeon_difficulty))
+
+
+def unpack_zone_changed(data: bytes, i: int, strings: List[str]) -> Tuple[ZoneChangedLine, int]:
+    """Unpack a ZONE_CHANGED record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_ZONE_CHANGED.unpack_from(data, i)
+    i += _PACKED_ZONE_CHANGED.size
+    return ZoneChangedLine(v[0], v[1], strings[v[2]], strings[v[3]]), i
+
+
+_PACKED_TRIAL_INIT = struct.Struct('<ii??ii?i')
+
+
+def pack_trial_init(record: TrialInitLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a TRIAL_INIT record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_TRIAL_INIT.pack(record.line_number, record.id, record.in_progress, record.completed, record.start_time_ms, record.duration_ms, record.success, record.final_score)
+
+
+def unpack_trial_init(data: bytes, i: int, strings: List[str]) -> Tuple[TrialInitLine, int]:
+    """Unpack a TRIAL_INIT record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_TRIAL_INIT.unpack_from(data, i)
+    i += _PACKED_TRIAL_INIT.size
+    return TrialInitLine(v[0], v[1], v[2], v[3], v[4], v[5], v[6], v[7]), i
+
+
+_PACKED_BEGIN_TRIAL = struct.Struct('<iii')
+
+
+def pack_begin_trial(record: BeginTrialLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a BEGIN_TRIAL record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_BEGIN_TRIAL.pack(record.line_number, record.id, record.start_time_ms)
+
+
+def unpack_begin_trial(data: bytes, i: int, strings: List[str]) -> Tuple[BeginTrialLine, int]:
+    """Unpack a BEGIN_TRIAL record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_BEGIN_TRIAL.unpack_from(data, i)
+    i += _PACKED_BEGIN_TRIAL.size
+    return BeginTrialLine(v[0], v[1], v[2]), i
+
+
+_PACKED_END_TRIAL = struct.Struct('<iii?ii')
+
+
+def pack_end_trial(record: EndTrialLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a END_TRIAL record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_END_TRIAL.pack(record.line_number, record.id, record.duration_ms, record.success, record.final_score, record.final_vitality_bonus)
+
+
+def unpack_end_trial(data: bytes, i: int, strings: List[str]) -> Tuple[EndTrialLine, int]:
+    """Unpack a END_TRIAL record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_END_TRIAL.unpack_from(data, i)
+    i += _PACKED_END_TRIAL.size
+    return EndTrialLine(v[0], v[1], v[2], v[3], v[4], v[5]), i
+
+
+_PACKED_ENDLESS_DUNGEON_BEGIN = struct.Struct('<iii?')
+
+
+def pack_endless_dungeon_begin(record: EndlessDungeonBeginLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a ENDLESS_DUNGEON_BEGIN record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_ENDLESS_DUNGEON_BEGIN.pack(record.line_number, record.id, record.start_time_ms, record.unknown_boolean)
+
+
+def unpack_endless_dungeon_begin(data: bytes, i: int, strings: List[str]) -> Tuple[EndlessDungeonBeginLine, int]:
+    """Unpack a ENDLESS_DUNGEON_BEGIN record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_ENDLESS_DUNGEON_BEGIN.unpack_from(data, i)
+    i += _PACKED_ENDLESS_DUNGEON_BEGIN.size
+    return EndlessDungeonBeginLine(v[0], v[1], v[2], v[3]), i
+
+
+_PACKED_ENDLESS_DUNGEON_END = struct.Struct('<iiii?')
+
+
+def pack_endless_dungeon_end(record: EndlessDungeonEndLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a ENDLESS_DUNGEON_END record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_ENDLESS_DUNGEON_END.pack(record.line_number, record.id, record.duration_ms, record.final_score, record.unknown_boolean)
+
+
+def unpack_endless_dungeon_end(data: bytes, i: int, strings: List[str]) -> Tuple[EndlessDungeonEndLine, int]:
+    """Unpack a ENDLESS_DUNGEON_END record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_ENDLESS_DUNGEON_END.unpack_from(data, i)
+    i += _PACKED_ENDLESS_DUNGEON_END.size
+    return EndlessDungeonEndLine(v[0], v[1], v[2], v[3], v[4]), i
+
+
+_PACKED_ENDLESS_DUNGEON_STAGE_END = struct.Struct('<iii')
+
+
+def pack_endless_dungeon_stage_end(record: EndlessDungeonStageEndLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a ENDLESS_DUNGEON_STAGE_END record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_ENDLESS_DUNGEON_STAGE_END.pack(record.line_number, record.id, record.dungeon_begin_start_time_ms)
+
+
+def unpack_endless_dungeon_stage_end(data: bytes, i: int, strings: List[str]) -> Tuple[EndlessDungeonStageEndLine, int]:
+    """Unpack a ENDLESS_DUNGEON_STAGE_END record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_ENDLESS_DUNGEON_STAGE_END.unpack_from(data, i)
+    i += _PACKED_ENDLESS_DUNGEON_STAGE_END.size
+    return EndlessDungeonStageEndLine(v[0], v[1], v[2]), i
+
+
+_PACKED_ENDLESS_DUNGEON_BUFF_ADDED = struct.Struct('<iii')
+
+
+def pack_endless_dungeon_buff_added(record: EndlessDungeonBuffAddedLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a ENDLESS_DUNGEON_BUFF_ADDED record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_ENDLESS_DUNGEON_BUFF_ADDED.pack(record.line_number, record.id, record.ability_id)
+
+
+def unpack_endless_dungeon_buff_added(data: bytes, i: int, strings: List[str]) -> Tuple[EndlessDungeonBuffAddedLine, int]:
+    """Unpack a ENDLESS_DUNGEON_BUFF_ADDED record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_ENDLESS_DUNGEON_BUFF_ADDED.unpack_from(data, i)
+    i += _PACKED_ENDLESS_DUNGEON_BUFF_ADDED.size
+    return EndlessDungeonBuffAddedLine(v[0], v[1], v[2]), i
+
+
+_PACKED_ENDLESS_DUNGEON_BUFF_REMOVED = struct.Struct('<iii')
+
+
+def pack_endless_dungeon_buff_removed(record: EndlessDungeonBuffRemovedLine, string_code: Callable[[str], int]) -> bytes:
+    """Pack a ENDLESS_DUNGEON_BUFF_REMOVED record (struct.error: a value does not fit, ValueError: a malformed unit state)"""
+    return _PACKED_ENDLESS_DUNGEON_BUFF_REMOVED.pack(record.line_number, record.id, record.ability_id)
+
+
+def unpack_endless_dungeon_buff_removed(data: bytes, i: int, strings: List[str]) -> Tuple[EndlessDungeonBuffRemovedLine, int]:
+    """Unpack a ENDLESS_DUNGEON_BUFF_REMOVED record packed at data[i:], returning it and the offset after it"""
+    v = _PACKED_ENDLESS_DUNGEON_BUFF_REMOVED.unpack_from(data, i)
+    i += _PACKED_ENDLESS_DUNGEON_BUFF_REMOVED.size
+    return EndlessDungeonBuffRemovedLine(v[0], v[1], v[2]), i
+
+
+# Packer and unpacker of each line type that has a packed form
+PACKERS: Dict[str, Callable[[Any, Callable[[str], int]], bytes]] = {
+    'BEGIN_LOG': pack_begin_log,
+    'END_LOG': pack_end_log,
+    'BEGIN_COMBAT': pack_begin_combat,
+    'END_COMBAT': pack_end_combat,
+    'BEGIN_CAST': pack_begin_cast,
+    'END_CAST': pack_end_cast,
+    'COMBAT_EVENT': pack_combat_event,
+    'HEALTH_REGEN': pack_health_regen,
+    'UNIT_ADDED': pack_unit_added,
+    'UNIT_CHANGED': pack_unit_changed,
+    'UNIT_REMOVED': pack_unit_removed,
+    'EFFECT_CHANGED': pack_effect_changed,
+    'EFFECT_INFO': pack_effect_info,
+    'MAP_CHANGED': pack_map_changed,
+    'ZONE_CHANGED': pack_zone_changed,
+    'TRIAL_INIT': pack_trial_init,
+    'BEGIN_TRIAL': pack_begin_trial,
+    'END_TRIAL': pack_end_trial,
+    'ENDLESS_DUNGEON_BEGIN': pack_endless_dungeon_begin,
+    'ENDLESS_DUNGEON_END': pack_endless_dungeon_end,
+    'ENDLESS_DUNGEON_STAGE_END': pack_endless_dungeon_stage_end,
+    'ENDLESS_DUNGEON_BUFF_ADDED': pack_endless_dungeon_buff_added,
+    'ENDLESS_DUNGEON_BUFF_REMOVED': pack_endless_dungeon_buff_removed,
+}
+UNPACKERS: Dict[str, Callable[[bytes, int, List[str]], Tuple[Any, int]]] = {
+    'BEGIN_LOG': unpack_begin_log,
+    'END_LOG': unpack_end_log,
+    'BEGIN_COMBAT': unpack_begin_combat,
+    'END_COMBAT': unpack_end_combat,
+    'BEGIN_CAST': unpack_begin_cast,
+    'END_CAST': unpack_end_cast,
+    'COMBAT_EVENT': unpack_combat_event,
+    'HEALTH_REGEN': unpack_health_regen,
+    'UNIT_ADDED': unpack_unit_added,
+    'UNIT_CHANGED': unpack_unit_changed,
+    'UNIT_REMOVED': unpack_unit_removed,
+    'EFFECT_CHANGED': unpack_effect_changed,
+    'EFFECT_INFO': unpack_effect_info,
+    'MAP_CHANGED': unpack_map_changed,
+    'ZONE_CHANGED': unpack_zone_changed,
+    'TRIAL_INIT': unpack_trial_init,
+    'BEGIN_TRIAL': unpack_begin_trial,
+    'END_TRIAL': unpack_end_trial,
+    'ENDLESS_DUNGEON_BEGIN': unpack_endless_dungeon_begin,
+    'ENDLESS_DUNGEON_END': unpack_endless_dungeon_end,
+    'ENDLESS_DUNGEON_STAGE_END': unpack_endless_dungeon_stage_end,
+    'ENDLESS_DUNGEON_BUFF_ADDED': unpack_endless_dungeon_buff_added,
+    'ENDLESS_DUNGEON_BUFF_REMOVED': unpack_endless_dungeon_buff_removed,
+}
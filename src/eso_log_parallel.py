@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+ESO Log Parallel Parser
+
+Parses a large log on several cores for read mode (--parse-workers). The
+file is cut into newline-aligned byte ranges; a pool of worker processes
+tokenizes and decodes each range and returns it as one buffer of packed
+parse-cache records (see eso_log_cache.pack_byte_range). The parent only
+unpacks the records and rebuilds the entries, in file order, which costs
+less than parsing the lines itself; ranges are packed ahead while the
+analyzer consumes earlier ones.
+
+Shipping entry objects instead does not pay: unpickling them costs more
+than parsing the lines serially.
+"""
+
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+from eso_log_cache import iter_record_entries, pack_byte_range
+from eso_log_parser import ESOLogEntry, ESOLogParser, detect_compression, split_byte_ranges
+
+# Size of the byte range each worker packs per task
+PARALLEL_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def default_workers() -> int:
+    """Worker processes used for 0 workers: one per CPU, less the one the parent analyzes on"""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def iter_entries_parallel(log_file: Union[str, Path], parser: ESOLogParser, workers: int = 0,
+                          start_offset: int = 0, end_offset: Optional[int] = None, lines: bool = True,
+                          chunk_size: int = PARALLEL_CHUNK_SIZE) -> Iterator[Tuple[int, ESOLogEntry, str]]:
+    """
+    Yield (byte_offset, entry, line) like eso_log_parser.iter_entries, parsing byte ranges in worker processes.
+
+    Only event types parser is subscribed to are packed and yielded, with
+    entries like ParsedLogCache.iter_entries': line is '' for a packed
+    record unless lines is set. At most two ranges per worker are in
+    flight, so memory stays bounded on multi-gigabyte logs. With one worker
+    (0: see default_workers), a single range or a compressed file, the log
+    is parsed in this process instead.
+    """
+    log_file = Path(log_file)
+    workers = workers or default_workers()
+    ranges = split_byte_ranges(log_file, chunk_size, start_offset, end_offset) if workers > 1 else []
+    if len(ranges) <= 1 or detect_compression(log_file):
+        yield from parser.iter_entries(log_file, start_offset, end_offset)
+        return
+
+    subscribed = parser.structured_parser.subscribed_event_types
+    event_types = frozenset(subscribed) if subscribed is not None else None
+
+    with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log, \
+            ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+
+        def next_entries():
+            range_start, range_end, future = pending.popleft()
+            packed = future.result()
+            if packed is None:
+                # Too many event types to code; parse this range here
+                return parser.iter_entries(log_file, range_start, range_end)
+            names, records = packed
+            return iter_record_entries(records, 0, len(records), range_end, names, parser, log_file, log, lines, [], {})
+
+        for range_start, range_end in ranges:
+            if len(pending) >= 2 * workers:
+                yield from next_entries()
+            pending.append((range_start, range_end,
+                            executor.submit(pack_byte_range, log_file, range_start, range_end, event_types)))
+
+        while pending:
+            yield from next_entries()
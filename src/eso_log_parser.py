@@ -7,11 +7,18 @@ Phase 3 Migration: Complete replacement with structured parser while maintaining
 backward compatibility with existing functionality.
 """
 
+import bz2
+import gzip
+import lzma
+import mmap
+import time
 import re
 import csv
 import io
-from typing import Dict, List, Optional, Set, Any
-from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Any, Iterable, Iterator, Tuple, Union
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 
 # Import structured parser for Phase 3 complete replacement
 try:
@@ -37,20 +44,305 @@ try:
         EndlessDungeonBuffAddedEntry as StructuredEndlessDungeonBuffAddedEntry,
         EndlessDungeonBuffRemovedEntry as StructuredEndlessDungeonBuffRemovedEntry,
         EndlessDungeonEndEntry as StructuredEndlessDungeonEndEntry,
-        EventType
+        EventType,
+        tokenize_line,
+        sniff_event_type,
+        slotted_dataclass
     )
+    import eso_log_decoders
+    from eso_log_decoders import DECODERS
     STRUCTURED_PARSER_AVAILABLE = True
 except ImportError:
     STRUCTURED_PARSER_AVAILABLE = False
+    slotted_dataclass = dataclass
 
 
-@dataclass
+# Read size for the bulk (binary) file readers
+BULK_READ_CHUNK_SIZE = 1024 * 1024
+
+# Leading magic bytes of the compressed formats archived logs are read from
+COMPRESSION_MAGIC = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+)
+
+_COMPRESSED_OPENERS = {
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+
+# Legacy event type of each structured entry class. Other classes (END_LOG,
+# UNIT_REMOVED, ...) are named after the class without 'Entry', upper-cased.
+LEGACY_EVENT_TYPES = {
+    'BeginLogEntry': 'BEGIN_LOG',
+    'ZoneChangedEntry': 'ZONE_CHANGED',
+    'MapChangedEntry': 'MAP_CHANGED',
+    'UnitAddedEntry': 'UNIT_ADDED',
+    'UnitChangedEntry': 'UNIT_CHANGED',
+    'AbilityInfoEntry': 'ABILITY_INFO',
+    'PlayerInfoEntry': 'PLAYER_INFO',
+    'BeginCastEntry': 'BEGIN_CAST',
+    'EndCastEntry': 'END_CAST',
+    'EffectChangedEntry': 'EFFECT_CHANGED',
+    'CombatEventEntry': 'COMBAT_EVENT',
+    'BeginCombatEntry': 'BEGIN_COMBAT',
+    'EndCombatEntry': 'END_COMBAT',
+    'TrialInitEntry': 'TRIAL_INIT',
+    'BeginTrialEntry': 'BEGIN_TRIAL',
+    'EndTrialEntry': 'END_TRIAL',
+    'HealthRegenEntry': 'HEALTH_REGEN',
+    'EndlessDungeonBeginEntry': 'ENDLESS_DUNGEON_BEGIN',
+    'EndlessDungeonStageEndEntry': 'ENDLESS_DUNGEON_STAGE_END',
+    'EndlessDungeonBuffAddedEntry': 'ENDLESS_DUNGEON_BUFF_ADDED',
+    'EndlessDungeonBuffRemovedEntry': 'ENDLESS_DUNGEON_BUFF_REMOVED',
+}
+
+# Attribute the legacy timestamp of an event type is taken from (None: no
+# timestamp, 0). Every other event type uses line_number.
+LEGACY_TIMESTAMP_ATTRIBUTES = {
+    'BEGIN_LOG': 'unix_timestamp',
+    'ZONE_CHANGED': 'zone_id',
+    'MAP_CHANGED': 'map_id',
+    'ABILITY_INFO': None,
+    'BEGIN_CAST': None,
+    'END_CAST': None,
+}
+
+
+def _is_record(structured_result: Any) -> bool:
+    """Whether an entry's structured value is an eso_log_decoders record rather than a hand-written entry"""
+    return type(structured_result).__module__ == eso_log_decoders.__name__
+
+
+def _legacy_timestamp(event_type: str, structured_result: Any) -> int:
+    """Timestamp of the legacy entry for a structured entry or decoder record"""
+    attribute = LEGACY_TIMESTAMP_ATTRIBUTES.get(event_type, 'line_number')
+    return getattr(structured_result, attribute, 0) if attribute else 0
+
+
+@slotted_dataclass
+class ReadStats:
+    """Bytes read from a log file and the time spent reading (and decompressing) them."""
+    compression: Optional[str] = None
+    file_bytes: int = 0
+    bytes_read: int = 0
+    read_seconds: float = 0.0
+
+
+def detect_compression(log_file: Union[str, Path]) -> Optional[str]:
+    """Name of the compression of a log file ('gzip', 'bz2' or 'xz') from its magic bytes, or None"""
+    try:
+        with open(log_file, 'rb') as f:
+            head = f.read(6)
+    except OSError:
+        return None
+    for magic, compression in COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def open_log_file(log_file: Union[str, Path], compression: Optional[str] = None):
+    """Open a log file for binary reading, decompressing it as a stream if compression is set"""
+    if compression:
+        return _COMPRESSED_OPENERS[compression](log_file, 'rb')
+    return open(log_file, 'rb')
+
+
+def iter_raw_lines(log_file: Union[str, Path], start_offset: int = 0, end_offset: Optional[int] = None,
+                   chunk_size: int = BULK_READ_CHUNK_SIZE,
+                   stats: Optional[ReadStats] = None) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (byte_offset, raw_line) for every non-empty line of a log file.
+
+    The file is read in binary chunks and split on newlines without decoding,
+    so callers can sniff the event type and drop lines before paying for
+    UTF-8 decoding. raw_line has surrounding whitespace (including the line
+    terminator) stripped; byte_offset is where the line starts in the file.
+    Reading stops at the first line that starts at or after end_offset.
+
+    gzip, bz2 and xz files (see detect_compression) are decompressed as a
+    stream, one chunk at a time; their offsets are into the decompressed
+    data. If stats is given, the bytes read and the time spent in reads
+    (including decompression) are added to it.
+    """
+    compression = detect_compression(log_file)
+    if stats is not None:
+        stats.compression = compression
+        stats.file_bytes = Path(log_file).stat().st_size
+
+    with open_log_file(log_file, compression) as f:
+        if start_offset > 0:
+            f.seek(start_offset)
+
+        offset = start_offset
+        pending = b''
+        while True:
+            if stats is not None:
+                read_start = time.perf_counter()
+                chunk = f.read(chunk_size)
+                stats.read_seconds += time.perf_counter() - read_start
+                stats.bytes_read += len(chunk)
+            else:
+                chunk = f.read(chunk_size)
+            if not chunk:
+                break
+
+            buffer = pending + chunk if pending else chunk
+            lines = buffer.split(b'\n')
+            pending = lines.pop()  # Incomplete last line, finished by the next chunk
+
+            for raw in lines:
+                if end_offset is not None and offset >= end_offset:
+                    return
+                line_offset = offset
+                offset += len(raw) + 1
+                raw = raw.strip()
+                if raw:
+                    yield line_offset, raw
+
+        if pending and (end_offset is None or offset < end_offset):
+            raw = pending.strip()
+            if raw:
+                yield offset, raw
+
+
+def iter_mmap_lines(log_file: Union[str, Path], start_offset: int = 0, end_offset: Optional[int] = None,
+                    chunk_size: int = BULK_READ_CHUNK_SIZE,
+                    stats: Optional[ReadStats] = None) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (byte_offset, raw_line) like iter_raw_lines, from a read-only memory map.
+
+    Each block of about chunk_size bytes is cut at its last newline with
+    mmap.rfind and sliced straight out of the mapping, so no partial line is
+    carried between reads and offsets need no f.tell(). Only the bytes present
+    when the file is opened are mapped. Falls back to iter_raw_lines where the
+    file cannot be mapped (e.g. an empty file) or is compressed, and when
+    stats is requested.
+    """
+    if stats is not None or detect_compression(log_file):
+        yield from iter_raw_lines(log_file, start_offset, end_offset, chunk_size, stats)
+        return
+
+    with open(log_file, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mapped = None
+
+        if mapped is None:
+            yield from iter_raw_lines(log_file, start_offset, end_offset, chunk_size)
+            return
+
+        with mapped:
+            size = len(mapped)
+            end = size if end_offset is None else min(end_offset, size)
+            offset = start_offset
+            while offset < end:
+                block_end = mapped.rfind(b'\n', offset, min(offset + chunk_size, size))
+                if block_end < 0:
+                    # A line longer than chunk_size, or the unterminated last line
+                    block_end = mapped.find(b'\n', offset)
+                    if block_end < 0:
+                        block_end = size
+
+                for raw in mapped[offset:block_end].split(b'\n'):
+                    if offset >= end:
+                        return
+                    line_offset = offset
+                    offset += len(raw) + 1
+                    raw = raw.strip()
+                    if raw:
+                        yield line_offset, raw
+
+
+def iter_entries(log_file: Union[str, Path], start_offset: int = 0, end_offset: Optional[int] = None,
+                 event_types: Optional[Iterable[Any]] = None, parser: Optional['ESOLogParser'] = None,
+                 stats: Optional[ReadStats] = None) -> Iterator[Tuple[int, 'ESOLogEntry', str]]:
+    """
+    Stream the parsed entries of a log file as (byte_offset, entry, line).
+
+    Entries are produced one at a time in file order; the file is never
+    materialized as a list. byte_offset is where the entry's line starts, so
+    a caller can resume from (or index) any entry. Only event_types are
+    decoded (all when None); pass parser to reuse an existing ESOLogParser
+    and its caches instead, in which case its subscriptions apply.
+    Compressed files are decompressed as a stream (see iter_raw_lines). If
+    stats is given, read and decompression time is recorded in it.
+    """
+    if parser is None:
+        parser = ESOLogParser(event_types)
+    return parser.iter_entries(log_file, start_offset, end_offset, stats)
+
+
+def next_line_start(log_file: Union[str, Path], offset: int) -> int:
+    """Offset of the first line starting at or after offset."""
+    if offset <= 0:
+        return 0
+    with open(log_file, 'rb') as f:
+        f.seek(offset - 1)
+        f.readline()  # Finish the line containing offset - 1
+        return f.tell()
+
+
+def complete_lines_end(log_file: Union[str, Path], start_offset: int, end_offset: int) -> int:
+    """
+    Offset just past the last newline in [start_offset, end_offset), or start_offset if there is none.
+
+    Lets a tail reader stop before a line the game is still writing.
+    """
+    if end_offset <= start_offset:
+        return start_offset
+    with open(log_file, 'rb') as f:
+        position = end_offset
+        while position > start_offset:
+            read_start = max(start_offset, position - BULK_READ_CHUNK_SIZE)
+            f.seek(read_start)
+            newline = f.read(position - read_start).rfind(b'\n')
+            if newline >= 0:
+                return read_start + newline + 1
+            position = read_start
+    return start_offset
+
+
+def split_byte_ranges(log_file: Union[str, Path], chunk_size: int, start_offset: int = 0,
+                      end_offset: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Cut [start_offset, end_offset) of a log file into newline-aligned byte ranges.
+
+    Each range is about chunk_size bytes and ends just after a newline (the
+    last range ends at end_offset), so no line straddles two ranges.
+    """
+    if end_offset is None:
+        end_offset = Path(log_file).stat().st_size
+
+    ranges = []
+    with open(log_file, 'rb') as f:
+        range_start = start_offset
+        while range_start < end_offset:
+            cut = range_start + chunk_size
+            if cut >= end_offset:
+                ranges.append((range_start, end_offset))
+                break
+            f.seek(cut)
+            f.readline()  # Advance to the start of the next line
+            range_end = min(f.tell(), end_offset)
+            ranges.append((range_start, range_end))
+            range_start = range_end
+    return ranges
+
+
+@slotted_dataclass
 class ESOLogEntry:
     """Represents a single log entry from the ESO encounter log."""
     timestamp: int
     event_type: str
     fields: List[str]
     original_line: str
+    # Structured entry decoded from the same tokens, reused by the parse_* helpers
+    structured: Any = field(default=None, repr=False, compare=False)
 
     @classmethod
     def parse(cls, line: str) -> Optional['ESOLogEntry']:
@@ -93,7 +385,7 @@ class ESOLogEntry:
             return None
 
 
-@dataclass
+@slotted_dataclass
 class UnitAddedEntry:
     """Parsed UNIT_ADDED entry."""
     timestamp: int
@@ -107,7 +399,7 @@ class UnitAddedEntry:
     alliance: int
 
 
-@dataclass
+@slotted_dataclass
 class AbilityInfoEntry:
     """Parsed ABILITY_INFO entry."""
     timestamp: int
@@ -118,7 +410,7 @@ class AbilityInfoEntry:
     flags: List[str] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class PlayerInfoEntry:
     """Parsed PLAYER_INFO entry."""
     timestamp: int
@@ -131,7 +423,7 @@ class PlayerInfoEntry:
     additional_data: List[str] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class BeginCastEntry:
     """Parsed BEGIN_CAST entry."""
     timestamp: int
@@ -143,7 +435,7 @@ class BeginCastEntry:
     stats: List[str]
 
 
-@dataclass
+@slotted_dataclass
 class EffectChangedEntry:
     """Parsed EFFECT_CHANGED entry."""
     timestamp: int
@@ -156,15 +448,41 @@ class EffectChangedEntry:
     additional_targets: List[List[str]]
 
 
+@slotted_dataclass
+class _PlayerInfoMemo:
+    """Decoded PLAYER_INFO payload, shared by every line that repeats it."""
+    fields: List[str]
+    structured: Any
+    legacy: Optional[PlayerInfoEntry] = None
+
+
 class ESOLogParser:
     """Robust parser for ESO encounter log files with Phase 3 structured parser replacement."""
+
+    # Distinct PLAYER_INFO payloads (builds) remembered. Players re-emit an
+    # unchanged PLAYER_INFO on every BEGIN_COMBAT, so a 12-player group with a
+    # few gear swaps fits comfortably.
+    PLAYER_INFO_CACHE_SIZE = 64
     
-    def __init__(self):
+    def __init__(self, event_types: Optional[List[Any]] = None,
+                 record_event_types: Optional[Iterable[str]] = None):
+        """
+        Args:
+            event_types: Event types (EventType or name) the caller handles. Other
+                lines are skipped before tokenizing. None parses every event type.
+            record_event_types: Event type names whose entries carry the
+                spec-accurate record from eso_log_decoders as .structured, in
+                place of the hand-written structured entry (see decode_record).
+        """
         self.ability_cache: Dict[str, str] = {}
+        self.record_event_types: Set[str] = set(record_event_types or ())
+
+        # LRU of decoded PLAYER_INFO lines keyed by the payload after the line number
+        self._player_info_cache: "OrderedDict[str, _PlayerInfoMemo]" = OrderedDict()
         
         # Initialize structured parser for Phase 3 complete replacement
         if STRUCTURED_PARSER_AVAILABLE:
-            self.structured_parser = ESOLogStructureParser()
+            self.structured_parser = ESOLogStructureParser(event_types)
         else:
             raise ImportError("Structured parser not available. Please ensure eso_log_structures.py is present.")
         
@@ -176,122 +494,167 @@ class ESOLogParser:
         legacy ESOLogEntry objects, while using structured parsing internally
         for all event types.
         """
-        # Use structured parser for all parsing
-        structured_result = self.structured_parser.parse_line(line)
+        # Skip unsubscribed event types before any CSV work
+        if not self.structured_parser.wants_line(line):
+            return None
+
+        return self._parse_wanted_line(line)
+
+    def iter_entries(self, log_file: Union[str, Path], start_offset: int = 0,
+                     end_offset: Optional[int] = None,
+                     stats: Optional[ReadStats] = None) -> Iterator[Tuple[int, ESOLogEntry, str]]:
+        """
+        Bulk-parse a log file, yielding (byte_offset, entry, line) for every parsed line.
+
+        The file is memory-mapped (see iter_mmap_lines), or streamed through a
+        decompressor if it is compressed, and only subscribed lines are
+        tokenized.
+        """
+        wants_line = self.structured_parser.wants_line
+        for offset, raw_line in iter_mmap_lines(log_file, start_offset, end_offset, stats=stats):
+            line = raw_line.decode('utf-8', 'ignore')
+            if not wants_line(line):
+                continue
+
+            entry = self._parse_wanted_line(line)
+            if entry:
+                yield offset, entry, line
+
+    def parse_file(self, log_file: Union[str, Path], start_offset: int = 0,
+                   end_offset: Optional[int] = None) -> Iterator[Tuple[ESOLogEntry, str]]:
+        """Bulk-parse a log file, yielding (entry, line) for every parsed line."""
+        for _, entry, line in self.iter_entries(log_file, start_offset, end_offset):
+            yield entry, line
+
+    def _parse_wanted_line(self, line: str) -> Optional[ESOLogEntry]:
+        """Tokenize and convert a line whose event type is already known to be subscribed."""
+        if sniff_event_type(line) == "PLAYER_INFO":
+            return self._parse_player_info_line(line)
+
+        # Tokenize once; the same field list feeds the structured entry and the legacy fields
+        fields = tokenize_line(line)
+        if len(fields) >= 2 and fields[1] in self.record_event_types:
+            return self._record_entry(fields, line)
+        structured_result = self.structured_parser.parse_fields(fields)
         if not structured_result:
             return None
             
         # Convert structured result to legacy ESOLogEntry for backward compatibility
-        return self._convert_structured_to_legacy_entry(structured_result, line)
+        return self._convert_structured_to_legacy_entry(structured_result, line, fields)
     
-    def _convert_structured_to_legacy_entry(self, structured_result: Any, original_line: str) -> ESOLogEntry:
-        """Convert structured parser result to legacy ESOLogEntry format."""
-        # Extract timestamp based on event type
-        timestamp = 0
-        if hasattr(structured_result, '__class__'):
-            class_name = structured_result.__class__.__name__
-            # Use appropriate timestamp for each event type
-            if class_name == 'BeginLogEntry' and hasattr(structured_result, 'unix_timestamp'):
-                timestamp = structured_result.unix_timestamp
-            elif class_name == 'ZoneChangedEntry' and hasattr(structured_result, 'zone_id'):
-                timestamp = structured_result.zone_id
-            elif class_name == 'MapChangedEntry' and hasattr(structured_result, 'map_id'):
-                timestamp = structured_result.map_id
-            elif class_name == 'UnitAddedEntry' and hasattr(structured_result, 'line_number'):
-                timestamp = structured_result.line_number
-            elif class_name == 'UnitChangedEntry' and hasattr(structured_result, 'line_number'):
-                timestamp = structured_result.line_number
-            elif class_name == 'AbilityInfoEntry' and hasattr(structured_result, 'line_number'):
-                timestamp = 0  # ABILITY_INFO doesn't have timestamps
-            elif class_name == 'PlayerInfoEntry' and hasattr(structured_result, 'line_number'):
-                timestamp = structured_result.line_number
-            elif class_name == 'BeginCastEntry' and hasattr(structured_result, 'line_number'):
-                timestamp = 0  # BEGIN_CAST doesn't have timestamps
-            elif class_name == 'EndCastEntry' and hasattr(structured_result, 'line_number'):
-                timestamp = 0  # END_CAST doesn't have timestamps
-            elif class_name == 'EffectChangedEntry' and hasattr(structured_result, 'line_number'):
-                timestamp = structured_result.line_number  # EFFECT_CHANGED uses line_number as timestamp
-            elif hasattr(structured_result, 'line_number'):
-                timestamp = structured_result.line_number
-        else:
-            timestamp = 0
-            
-        if hasattr(structured_result, '__class__'):
-            class_name = structured_result.__class__.__name__
-            # Map class names to event types
-            if class_name == 'BeginLogEntry':
-                event_type = 'BEGIN_LOG'
-            elif class_name == 'ZoneChangedEntry':
-                event_type = 'ZONE_CHANGED'
-            elif class_name == 'MapChangedEntry':
-                event_type = 'MAP_CHANGED'
-            elif class_name == 'UnitAddedEntry':
-                event_type = 'UNIT_ADDED'
-            elif class_name == 'UnitChangedEntry':
-                event_type = 'UNIT_CHANGED'
-            elif class_name == 'AbilityInfoEntry':
-                event_type = 'ABILITY_INFO'
-            elif class_name == 'PlayerInfoEntry':
-                event_type = 'PLAYER_INFO'
-            elif class_name == 'BeginCastEntry':
-                event_type = 'BEGIN_CAST'
-            elif class_name == 'EndCastEntry':
-                event_type = 'END_CAST'
-            elif class_name == 'EffectChangedEntry':
-                event_type = 'EFFECT_CHANGED'
-            elif class_name == 'CombatEventEntry':
-                event_type = 'COMBAT_EVENT'
-            elif class_name == 'BeginCombatEntry':
-                event_type = 'BEGIN_COMBAT'
-            elif class_name == 'EndCombatEntry':
-                event_type = 'END_COMBAT'
-            elif class_name == 'TrialInitEntry':
-                event_type = 'TRIAL_INIT'
-            elif class_name == 'BeginTrialEntry':
-                event_type = 'BEGIN_TRIAL'
-            elif class_name == 'EndTrialEntry':
-                event_type = 'END_TRIAL'
-            elif class_name == 'HealthRegenEntry':
-                event_type = 'HEALTH_REGEN'
-            elif class_name == 'EndlessDungeonBeginEntry':
-                event_type = 'ENDLESS_DUNGEON_BEGIN'
-            elif class_name == 'EndlessDungeonStageEndEntry':
-                event_type = 'ENDLESS_DUNGEON_STAGE_END'
-            elif class_name == 'EndlessDungeonBuffAddedEntry':
-                event_type = 'ENDLESS_DUNGEON_BUFF_ADDED'
-            elif class_name == 'EndlessDungeonBuffRemovedEntry':
-                event_type = 'ENDLESS_DUNGEON_BUFF_REMOVED'
-            else:
-                event_type = class_name.replace('Entry', '').upper()
+    def _parse_player_info_line(self, line: str) -> Optional[ESOLogEntry]:
+        """
+        Parse a PLAYER_INFO line through the payload LRU.
+
+        An unchanged build costs one hash and one dict lookup; the cached
+        tokens and structured entry are reused and only re-stamped with the
+        new line number.
+        """
+        line_number_str, _, payload = line.partition(',')
+        memo = self._player_info_cache.get(payload)
+
+        if memo is not None:
+            self._player_info_cache.move_to_end(payload)
+            try:
+                structured_result = replace(memo.structured, line_number=int(line_number_str))
+            except ValueError:
+                return None
+            fields = memo.fields
         else:
-            event_type = "UNKNOWN"
-            
+            fields = tokenize_line(line)
+            structured_result = self.structured_parser.parse_fields(fields)
+            if not structured_result:
+                return None
+
+            self._player_info_cache[payload] = _PlayerInfoMemo(fields, structured_result)
+            if len(self._player_info_cache) > self.PLAYER_INFO_CACHE_SIZE:
+                self._player_info_cache.popitem(last=False)
+
+        return self._convert_structured_to_legacy_entry(structured_result, line, fields)
+
+    def subscribe(self, *event_types: Any):
+        """Also parse the given event types (EventType or name)."""
+        self.structured_parser.subscribe(*event_types)
+
+    def unsubscribe(self, *event_types: Any):
+        """Stop parsing the given event types (EventType or name)."""
+        self.structured_parser.unsubscribe(*event_types)
+
+    def subscribe_all(self):
+        """Parse every event type."""
+        self.structured_parser.subscribe_all()
+
+    def _convert_structured_to_legacy_entry(self, structured_result: Any, original_line: str,
+                                            fields: Optional[List[str]] = None) -> ESOLogEntry:
+        """Convert structured parser result to legacy ESOLogEntry format."""
+        class_name = structured_result.__class__.__name__
+        event_type = LEGACY_EVENT_TYPES.get(class_name)
+        if event_type is None:
+            event_type = class_name.replace('Entry', '').upper()
+
         # Use specific conversion methods for trial events
-        if class_name == 'TrialInitEntry':
+        if event_type == 'TRIAL_INIT':
             return self._convert_structured_to_legacy_trial_init(structured_result)
-        elif class_name == 'BeginTrialEntry':
+        elif event_type == 'BEGIN_TRIAL':
             return self._convert_structured_to_legacy_begin_trial(structured_result)
-        elif class_name == 'EndTrialEntry':
+        elif event_type == 'END_TRIAL':
             return self._convert_structured_to_legacy_end_trial(structured_result)
-        
-        # Parse the original line to get fields for backward compatibility
-        try:
-            reader = csv.reader(io.StringIO(original_line))
-            fields = next(reader)
-            # Remove line number and event type from fields
-            if len(fields) >= 2:
-                fields = fields[2:]
-        except:
-            fields = []
-            
-        
-        # Create ESOLogEntry with proper fields
+
+        # Reuse the tokens the structured entry was built from (only tokenize if not supplied)
+        if fields is None:
+            fields = tokenize_line(original_line)
+
+        # Create ESOLogEntry with the fields after line number and event type
         return ESOLogEntry(
-            timestamp=timestamp,
+            timestamp=_legacy_timestamp(event_type, structured_result),
             event_type=event_type,
-            fields=fields,
-            original_line=original_line
+            fields=fields[2:] if len(fields) >= 2 else fields,
+            original_line=original_line,
+            structured=structured_result
         )
+
+    def _record_entry(self, fields: List[str], line: str) -> Optional[ESOLogEntry]:
+        """Decode a line of a record event type straight into its eso_log_decoders record"""
+        event_type = fields[1]
+        record = DECODERS[event_type](fields)
+        if record is None:
+            return None
+        return ESOLogEntry(_legacy_timestamp(event_type, record), event_type, fields[2:], line, record)
+
+    def decode_record(self, entry: ESOLogEntry) -> Any:
+        """
+        Return the spec-accurate eso_log_decoders record of an entry, or None if it is malformed.
+
+        Entries parsed as record_event_types, or read back packed from the
+        parse cache, already carry it. Any other entry (one built by hand) is
+        decoded from its fields, so handlers written against the records also
+        accept legacy entries.
+        """
+        structured_result = getattr(entry, 'structured', None)
+        if _is_record(structured_result):
+            return structured_result
+        decoder = DECODERS.get(entry.event_type)
+        if decoder is None:
+            return None
+        line_number = entry.original_line.partition(',')[0] if entry.original_line else str(entry.timestamp)
+        return decoder([line_number, entry.event_type] + entry.fields)
+
+    def _structured_entry(self, entry: ESOLogEntry) -> Any:
+        """Return the structured entry behind a legacy entry, decoding it only if parse_line did not."""
+        structured_result = getattr(entry, 'structured', None)
+        if structured_result is not None and not _is_record(structured_result):
+            return structured_result
+        if sniff_event_type(entry.original_line) == "PLAYER_INFO":
+            # Go through the payload LRU so repeated builds are decoded once
+            reparsed = self._parse_player_info_line(entry.original_line)
+            return reparsed.structured if reparsed else None
+        return self.structured_parser.parse_line(entry.original_line)
+
+    def _payload_fields(self, entry: ESOLogEntry) -> List[str]:
+        """Return the fields after line number and event type, reusing the entry's tokens when possible."""
+        if getattr(entry, 'structured', None) is not None:
+            return entry.fields
+        return tokenize_line(entry.original_line)[2:]
     
     def parse_unit_added(self, entry: ESOLogEntry) -> Optional[UnitAddedEntry]:
         """
@@ -305,7 +668,7 @@ class ESOLogParser:
         
         # Use structured parser for all parsing
         try:
-            structured_result = self.structured_parser.parse_line(entry.original_line)
+            structured_result = self._structured_entry(entry)
             if isinstance(structured_result, StructuredUnitAddedEntry):
                 # Convert structured result to legacy format for backward compatibility
                 return self._convert_structured_to_legacy_unit_added(structured_result)
@@ -347,7 +710,7 @@ class ESOLogParser:
         
         # Use structured parser for all parsing
         try:
-            structured_result = self.structured_parser.parse_line(entry.original_line)
+            structured_result = self._structured_entry(entry)
             if isinstance(structured_result, StructuredUnitChangedEntry):
                 # Convert structured result to legacy format for backward compatibility
                 return self._convert_structured_to_legacy_unit_changed(structured_result)
@@ -385,7 +748,7 @@ class ESOLogParser:
         
         # Use structured parser for all parsing
         try:
-            structured_result = self.structured_parser.parse_line(entry.original_line)
+            structured_result = self._structured_entry(entry)
             if isinstance(structured_result, StructuredAbilityInfoEntry):
                 # Cache the ability for later use
                 self.ability_cache[str(structured_result.ability_id)] = structured_result.ability_name
@@ -424,10 +787,18 @@ class ESOLogParser:
         
         # Use structured parser for all parsing
         try:
-            structured_result = self.structured_parser.parse_line(entry.original_line)
+            structured_result = self._structured_entry(entry)
             if isinstance(structured_result, StructuredPlayerInfoEntry):
+                # Reuse the legacy conversion of a cached build, re-stamped with this line number
+                memo = self._player_info_cache.get(entry.original_line.partition(',')[2])
+                if memo is not None and memo.legacy is not None:
+                    return replace(memo.legacy, timestamp=structured_result.line_number)
+
                 # Convert structured result to legacy format for backward compatibility
-                return self._convert_structured_to_legacy_player_info(structured_result, entry.timestamp)
+                legacy_result = self._convert_structured_to_legacy_player_info(structured_result, entry.timestamp)
+                if memo is not None:
+                    memo.legacy = legacy_result
+                return legacy_result
         except Exception as e:
             print(f"Structured PLAYER_INFO parsing failed: {e}")
             return None
@@ -475,28 +846,21 @@ class ESOLogParser:
         
         # Use structured parser for all parsing
         try:
-            structured_result = self.structured_parser.parse_line(entry.original_line)
+            structured_result = self._structured_entry(entry)
             if isinstance(structured_result, StructuredBeginCastEntry):
                 # Convert structured result to legacy format for backward compatibility
-                return self._convert_structured_to_legacy_begin_cast(structured_result, entry.original_line)
+                return self._convert_structured_to_legacy_begin_cast(structured_result, self._payload_fields(entry))
         except Exception as e:
             print(f"Structured BEGIN_CAST parsing failed: {e}")
             return None
         
         return None
     
-    def _convert_structured_to_legacy_begin_cast(self, structured: StructuredBeginCastEntry, original_line: str) -> Optional[BeginCastEntry]:
+    def _convert_structured_to_legacy_begin_cast(self, structured: StructuredBeginCastEntry, payload_fields: List[str]) -> Optional[BeginCastEntry]:
         """Convert structured BeginCastEntry to legacy format for backward compatibility"""
         try:
-            # Extract stats from the original line for backward compatibility
-            stats = []
-            try:
-                reader = csv.reader(io.StringIO(original_line))
-                fields = next(reader)
-                if len(fields) > 7:  # Skip line_number, event_type, and first 5 fields
-                    stats = fields[7:]
-            except:
-                pass
+            # Stats follow the first 5 payload fields (line_number and event_type already removed)
+            stats = payload_fields[5:]
                 
             return BeginCastEntry(
                 timestamp=structured.line_number,
@@ -518,28 +882,21 @@ class ESOLogParser:
         
         # Use structured parser for all parsing
         try:
-            structured_result = self.structured_parser.parse_line(entry.original_line)
+            structured_result = self._structured_entry(entry)
             if isinstance(structured_result, StructuredEffectChangedEntry):
                 # Convert structured result to legacy format for backward compatibility
-                return self._convert_structured_to_legacy_effect_changed(structured_result, entry.original_line)
+                return self._convert_structured_to_legacy_effect_changed(structured_result, self._payload_fields(entry))
         except Exception as e:
             print(f"Structured EFFECT_CHANGED parsing failed: {e}")
             return None
         
         return None
     
-    def _convert_structured_to_legacy_effect_changed(self, structured: StructuredEffectChangedEntry, original_line: str) -> Optional[EffectChangedEntry]:
+    def _convert_structured_to_legacy_effect_changed(self, structured: StructuredEffectChangedEntry, payload_fields: List[str]) -> Optional[EffectChangedEntry]:
         """Convert structured EffectChangedEntry to legacy format for backward compatibility"""
         try:
-            # Extract target_stats from the original line for backward compatibility
-            target_stats = []
-            try:
-                reader = csv.reader(io.StringIO(original_line))
-                fields = next(reader)
-                if len(fields) > 7:  # Skip line_number, event_type, and first 5 fields
-                    target_stats = fields[7:]
-            except:
-                pass
+            # Target stats follow the first 5 payload fields (line_number and event_type already removed)
+            target_stats = payload_fields[5:]
                 
             return EffectChangedEntry(
                 timestamp=structured.line_number,  # EFFECT_CHANGED uses line_number as timestamp
@@ -13,11 +13,46 @@ Each structure includes:
 - Parsing methods for converting raw CSV fields to structured data
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Union
+from dataclasses import dataclass, field, fields as dataclass_fields
+from typing import List, Optional, Dict, Any, Union, Iterable, Set
 from enum import Enum
 import csv
-import io
+
+import eso_log_decoders
+
+
+def slotted_dataclass(cls):
+    """
+    @dataclass that stores its fields in __slots__ instead of a per-instance __dict__.
+
+    Long tail sessions and replays keep millions of entries alive, and the
+    __dict__ is the bulk of each small record. The attribute API is unchanged;
+    only setting attributes that are not declared fields is no longer possible.
+    Equivalent to @dataclass(slots=True), which needs Python 3.10+.
+
+    Instances pickle as a constructor call with the field values, which is
+    several times cheaper than the generic slot-state protocol (see
+    eso_checkpoint).
+    """
+    cls = dataclass(cls)
+    field_names = tuple(f.name for f in dataclass_fields(cls))
+
+    def __reduce__(self):
+        return (self.__class__, tuple(getattr(self, name) for name in field_names))
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = field_names
+    for name in field_names:
+        # Class-level defaults would clash with the slot descriptors; the
+        # generated __init__ already carries the defaults.
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__reduce__'] = __reduce__
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
 
 
 class EventType(Enum):
@@ -93,55 +128,174 @@ class Difficulty(Enum):
     NONE = "NONE"
 
 
-@dataclass
+def sniff_event_type(line: str) -> str:
+    """
+    Return the event type name of a raw log line without tokenizing it.
+
+    The event type always sits between the first two commas
+    (line_number,EVENT_TYPE,...) and is never quoted, so a couple of
+    str.find calls are enough to decide whether a line is worth decoding.
+    """
+    first = line.find(',')
+    if first < 0:
+        return ""
+
+    second = line.find(',', first + 1)
+    if second < 0:
+        return line[first + 1:].strip()
+
+    return line[first + 1:second]
+
+
+def tokenize_line(line: str) -> List[str]:
+    """
+    Split a raw log line into its CSV fields.
+
+    This is the single tokenizer stage of the parse path: the returned list is
+    handed to every downstream consumer (structured entries, legacy fields,
+    stats blocks) so a line is only ever split once. Lines without quoted
+    strings - the vast majority, e.g. COMBAT_EVENT and EFFECT_CHANGED - take a
+    plain str.split fast path that yields the same fields as csv.reader.
+    """
+    if not line or not line.strip():
+        return []
+
+    if '"' not in line:
+        return line.rstrip('\r\n').split(',')
+
+    try:
+        return next(csv.reader((line,)))
+    except (csv.Error, StopIteration):
+        return []
+
+
 class UnitStats:
-    """Unit statistics (health, magicka, stamina, etc.)"""
-    current_health: int
-    max_health: int
-    current_magicka: int
-    max_magicka: int
-    current_stamina: int
-    max_stamina: int
-    current_ultimate: int
-    max_ultimate: int
-    werewolf_ultimate: int
-    magicka_regen: float
-    stamina_regen: float
-    ultimate_regen: float
-    forward_camps: int = 0
+    """
+    Unit statistics (health, magicka, stamina, etc.)
+
+    Keeps the raw unit state tokens and decodes a component only when it is
+    read, since consumers rarely need more than the health (and sometimes
+    magicka/stamina) maximum. A malformed component raises ValueError when
+    it is read rather than when the line is parsed.
+    """
+
+    __slots__ = ('_fields', '_start', '_end')
+
+    # Component order of the raw tokens, as also used by __repr__ and __eq__
+    FIELD_NAMES = (
+        'current_health', 'max_health', 'current_magicka', 'max_magicka',
+        'current_stamina', 'max_stamina', 'current_ultimate', 'max_ultimate',
+        'werewolf_ultimate', 'magicka_regen', 'stamina_regen', 'ultimate_regen',
+        'forward_camps',
+    )
+
+    def __init__(self, current_health: int = 0, max_health: int = 0, current_magicka: int = 0,
+                 max_magicka: int = 0, current_stamina: int = 0, max_stamina: int = 0,
+                 current_ultimate: int = 0, max_ultimate: int = 0, werewolf_ultimate: int = 0,
+                 magicka_regen: float = 0.0, stamina_regen: float = 0.0, ultimate_regen: float = 0.0,
+                 forward_camps: int = 0):
+        self._fields = [
+            f"{current_health}/{max_health}", f"{current_magicka}/{max_magicka}",
+            f"{current_stamina}/{max_stamina}", f"{current_ultimate}/{max_ultimate}",
+            f"{werewolf_ultimate}/0", "0", str(magicka_regen), str(stamina_regen),
+            str(ultimate_regen), str(forward_camps),
+        ]
+        self._start = 0
+        self._end = len(self._fields)
 
     @classmethod
     def from_string(cls, stats_str: str) -> 'UnitStats':
         """Parse unit stats from string format like '22762/22762,26657/26657,13021/13021,500/500,1000/1000,0,0.2696,0.5942,5.5492'"""
-        parts = stats_str.split(',')
-        if len(parts) < 9:
+        return cls.from_fields(stats_str.split(','))
+
+    @classmethod
+    def from_fields(cls, fields: List[str], start: int = 0, end: Optional[int] = None) -> 'UnitStats':
+        """Wrap the unit stats at fields[start:end] of a tokenized line without decoding them"""
+        end = len(fields) if end is None else min(end, len(fields))
+        if end - start < 9:
             # Fallback for incomplete stats
-            return cls(0, 0, 0, 0, 0, 0, 0, 0, 0, 0.0, 0.0, 0.0)
-        
-        health = parts[0].split('/')
-        magicka = parts[1].split('/')
-        stamina = parts[2].split('/')
-        ultimate = parts[3].split('/')
-        werewolf = parts[4].split('/')
-        
-        return cls(
-            current_health=int(health[0]),
-            max_health=int(health[1]),
-            current_magicka=int(magicka[0]),
-            max_magicka=int(magicka[1]),
-            current_stamina=int(stamina[0]),
-            max_stamina=int(stamina[1]),
-            current_ultimate=int(ultimate[0]),
-            max_ultimate=int(ultimate[1]),
-            werewolf_ultimate=int(werewolf[0]) if len(werewolf) > 0 else 0,
-            magicka_regen=float(parts[6]),
-            stamina_regen=float(parts[7]),
-            ultimate_regen=float(parts[8]),
-            forward_camps=int(parts[9]) if len(parts) > 9 else 0
-        )
+            return cls()
+        stats = cls.__new__(cls)
+        stats._fields = fields
+        stats._start = start
+        stats._end = end
+        return stats
+
+    def _part(self, index: int) -> str:
+        return self._fields[self._start + index]
+
+    @property
+    def current_health(self) -> int:
+        return int(self._part(0).partition('/')[0])
+
+    @property
+    def max_health(self) -> int:
+        return int(self._part(0).partition('/')[2])
+
+    @property
+    def current_magicka(self) -> int:
+        return int(self._part(1).partition('/')[0])
+
+    @property
+    def max_magicka(self) -> int:
+        return int(self._part(1).partition('/')[2])
+
+    @property
+    def current_stamina(self) -> int:
+        return int(self._part(2).partition('/')[0])
+
+    @property
+    def max_stamina(self) -> int:
+        return int(self._part(2).partition('/')[2])
+
+    @property
+    def current_ultimate(self) -> int:
+        return int(self._part(3).partition('/')[0])
+
+    @property
+    def max_ultimate(self) -> int:
+        return int(self._part(3).partition('/')[2])
+
+    @property
+    def werewolf_ultimate(self) -> int:
+        return int(self._part(4).partition('/')[0])
 
+    @property
+    def magicka_regen(self) -> float:
+        return float(self._part(6))
 
-@dataclass
+    @property
+    def stamina_regen(self) -> float:
+        return float(self._part(7))
+
+    @property
+    def ultimate_regen(self) -> float:
+        return float(self._part(8))
+
+    @property
+    def forward_camps(self) -> int:
+        if self._end - self._start > 9:
+            return int(self._part(9))
+        return 0
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.FIELD_NAMES)
+
+    def __eq__(self, other):
+        if not isinstance(other, UnitStats):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return 'UnitStats(' + ', '.join(f'{name}={value!r}' for name, value in zip(self.FIELD_NAMES, self._values())) + ')'
+
+    def __reduce__(self):
+        return (self.__class__, self._values())
+
+
+@slotted_dataclass
 class GearItem:
     """Individual gear item structure"""
     slot: str  # HEAD, CHEST, MAIN_HAND, etc.
@@ -181,8 +335,21 @@ class GearItem:
 # ============================================================================
 # LOG ENTRY STRUCTURES
 # ============================================================================
-
-@dataclass
+#
+# from_fields builds each entry from the record of its generated decoder
+# (eso_log_decoders), so field positions and types come from the spec alone
+# and the entries only rename fields to their legacy attribute names.
+# Still decoded by hand:
+#   BEGIN_CAST, EFFECT_CHANGED, COMBAT_EVENT - legacy layouts predate the
+#       spec and do not line up with its unit states; the analyzer reads
+#       these types as generated records (RECORD_EVENT_TYPES) and the
+#       entries are kept for existing callers
+#   ENDLESS_DUNGEON_END - legacy layout (result, rounds_completed) is not
+#       the spec's (durationMS, finalScore, unknownBoolean)
+#   PLAYER_INFO - skips a malformed gear item instead of rejecting the line,
+#       so set detection still sees the rest of the build
+
+@slotted_dataclass
 class BeginLogEntry:
     """
     BEGIN_LOG event - starts a new log session
@@ -199,26 +366,26 @@ class BeginLogEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['BeginLogEntry']:
         """Parse BEGIN_LOG entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 7 or fields[1] != "BEGIN_LOG":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                unix_timestamp=int(fields[2]),
-                session_id=int(fields[3]),
-                server_name=fields[4].strip('"'),
-                language=fields[5].strip('"'),
-                game_version=fields[6].strip('"')
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['BeginLogEntry']:
+        """Build BEGIN_LOG entry from an already tokenized line"""
+        record = eso_log_decoders.decode_begin_log(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            unix_timestamp=record.time_since_epoch_ms,
+            # Legacy name of the spec's logVersion, the log format version (not a session)
+            session_id=record.log_version,
+            server_name=record.realm_name,
+            language=record.language,
+            game_version=record.game_version
+        )
 
 
-@dataclass
+@slotted_dataclass
 class EndLogEntry:
     """
     END_LOG event - ends a log session
@@ -230,21 +397,20 @@ class EndLogEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['EndLogEntry']:
         """Parse END_LOG entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 2 or fields[1] != "END_LOG":
-                return None
-                
-            return cls(
-                line_number=int(fields[0])
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['EndLogEntry']:
+        """Build END_LOG entry from an already tokenized line"""
+        record = eso_log_decoders.decode_end_log(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number
+        )
 
 
-@dataclass
+@slotted_dataclass
 class HealthRegenEntry:
     """
     HEALTH_REGEN event - health regeneration
@@ -272,37 +438,40 @@ class HealthRegenEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['HealthRegenEntry']:
         """Parse HEALTH_REGEN entry from CSV line"""
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['HealthRegenEntry']:
+        """Build HEALTH_REGEN entry from an already tokenized line"""
+        record = eso_log_decoders.decode_health_regen(fields)
+        if record is None:
+            return None
+        state = record.unit_state
         try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 13 or fields[1] != "HEALTH_REGEN":
-                return None
-                
             return cls(
-                line_number=int(fields[0]),
-                effective_regen=int(fields[2]),
-                unit_id=int(fields[3]),
-                health_current=int(fields[4].split('/')[0]),
-                health_max=int(fields[4].split('/')[1]),
-                magicka_current=int(fields[5].split('/')[0]),
-                magicka_max=int(fields[5].split('/')[1]),
-                stamina_current=int(fields[6].split('/')[0]),
-                stamina_max=int(fields[6].split('/')[1]),
-                ultimate_current=int(fields[7].split('/')[0]),
-                ultimate_max=int(fields[7].split('/')[1]),
-                werewolf_current=int(fields[8].split('/')[0]),
-                werewolf_max=int(fields[8].split('/')[1]),
-                shield=int(fields[9]),
-                map_normalized_x=float(fields[10]),
-                map_normalized_y=float(fields[11]),
-                heading_radians=float(fields[12])
+                line_number=record.line_number,
+                effective_regen=record.effective_regen,
+                unit_id=state.unit_id,
+                health_current=state.health,
+                health_max=state.health_max,
+                magicka_current=state.magicka,
+                magicka_max=state.magicka_max,
+                stamina_current=state.stamina,
+                stamina_max=state.stamina_max,
+                ultimate_current=state.ultimate,
+                ultimate_max=state.ultimate_max,
+                werewolf_current=state.werewolf,
+                werewolf_max=state.werewolf_max,
+                shield=state.shield,
+                map_normalized_x=state.map_normalised_x,
+                map_normalized_y=state.map_normalised_y,
+                heading_radians=state.heading_radians
             )
-        except (ValueError, IndexError, StopIteration):
+        except ValueError:
             return None
 
 
-@dataclass
+@slotted_dataclass
 class ZoneChangedEntry:
     """
     ZONE_CHANGED event - entering/leaving zones
@@ -317,24 +486,26 @@ class ZoneChangedEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['ZoneChangedEntry']:
         """Parse ZONE_CHANGED entry from CSV line"""
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['ZoneChangedEntry']:
+        """Build ZONE_CHANGED entry from an already tokenized line"""
+        record = eso_log_decoders.decode_zone_changed(fields)
+        if record is None:
+            return None
         try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 5 or fields[1] != "ZONE_CHANGED":
-                return None
-                
             return cls(
-                line_number=int(fields[0]),
-                zone_id=int(fields[2]),
-                zone_name=fields[3].strip('"'),
-                difficulty=Difficulty(fields[4]) if fields[4] in [d.value for d in Difficulty] else Difficulty.NONE
+                line_number=record.line_number,
+                zone_id=record.id,
+                zone_name=record.name,
+                difficulty=Difficulty(record.dungeon_difficulty) if record.dungeon_difficulty in [d.value for d in Difficulty] else Difficulty.NONE
             )
-        except (ValueError, IndexError, StopIteration):
+        except ValueError:
             return None
 
 
-@dataclass
+@slotted_dataclass
 class UnitAddedEntry:
     """
     UNIT_ADDED event - when units (players/enemies) are added to the encounter
@@ -364,37 +535,39 @@ class UnitAddedEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['UnitAddedEntry']:
         """Parse UNIT_ADDED entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
+        return cls.from_fields(tokenize_line(line))
 
-            if len(fields) < 18 or fields[1] != "UNIT_ADDED":
-                return None
-                
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['UnitAddedEntry']:
+        """Build UNIT_ADDED entry from an already tokenized line"""
+        record = eso_log_decoders.decode_unit_added(fields)
+        if record is None:
+            return None
+        try:
             return cls(
-                line_number=int(fields[0]),
-                unit_id=fields[2],
-                unit_type=UnitType(fields[3]),
-                is_local_player=fields[4] == "T",
-                player_per_session_id=int(fields[5]),
-                monster_id=int(fields[6]),
-                is_boss=fields[7] == "T",
-                class_id=int(fields[8]),
-                race_id=int(fields[9]),
-                name=fields[10].strip('"'),
-                display_name=fields[11].strip('"'),
-                character_id=int(fields[12]) if fields[12].isdigit() else 0,
-                level=int(fields[13]),
-                champion_points=int(fields[14]),
-                owner_unit_id=int(fields[15]),
-                reaction=fields[16],
-                is_grouped_with_local_player=fields[17] == "T"
+                line_number=record.line_number,
+                unit_id=str(record.unit_id),
+                unit_type=UnitType(record.unit_type),
+                is_local_player=record.is_local_player,
+                player_per_session_id=record.player_per_session_id,
+                monster_id=record.monster_id,
+                is_boss=record.is_boss,
+                class_id=record.class_id,
+                race_id=record.race_id,
+                name=record.name,
+                display_name=record.display_name,
+                character_id=record.character_id,
+                level=record.level,
+                champion_points=record.champion_points,
+                owner_unit_id=record.owner_unit_id,
+                reaction=record.reaction,
+                is_grouped_with_local_player=record.is_grouped_with_local_player
             )
-        except (ValueError, IndexError, StopIteration):
+        except ValueError:
             return None
 
 
-@dataclass
+@slotted_dataclass
 class UnitChangedEntry:
     """
     UNIT_CHANGED event - when unit properties change
@@ -419,32 +592,31 @@ class UnitChangedEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['UnitChangedEntry']:
         """Parse UNIT_CHANGED entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 13 or fields[1] != "UNIT_CHANGED":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                unit_id=fields[2],
-                class_id=int(fields[3]),
-                race_id=int(fields[4]),
-                name=fields[5].strip('"'),
-                display_name=fields[6].strip('"'),
-                character_id=int(fields[7]) if fields[7].isdigit() else 0,
-                level=int(fields[8]),
-                champion_points=int(fields[9]),
-                owner_unit_id=int(fields[10]),
-                reaction=fields[11],
-                is_grouped_with_local_player=fields[12] == "T"
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['UnitChangedEntry']:
+        """Build UNIT_CHANGED entry from an already tokenized line"""
+        record = eso_log_decoders.decode_unit_changed(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            unit_id=str(record.unit_id),
+            class_id=record.class_id,
+            race_id=record.race_id,
+            name=record.name,
+            display_name=record.display_name,
+            character_id=record.character_id,
+            level=record.level,
+            champion_points=record.champion_points,
+            owner_unit_id=record.owner_unit_id,
+            reaction=record.reaction,
+            is_grouped_with_local_player=record.is_grouped_with_local_player
+        )
 
 
-@dataclass
+@slotted_dataclass
 class AbilityInfoEntry:
     """
     ABILITY_INFO event - ability definitions
@@ -461,26 +633,27 @@ class AbilityInfoEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['AbilityInfoEntry']:
         """Parse ABILITY_INFO entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 7 or fields[1] != "ABILITY_INFO":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                ability_id=int(fields[2]),
-                ability_name=fields[3].strip('"'),
-                icon_path=fields[4].strip('"'),
-                is_passive=fields[5] == "T",
-                is_ultimate=fields[6] == "T"
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['AbilityInfoEntry']:
+        """Build ABILITY_INFO entry from an already tokenized line"""
+        record = eso_log_decoders.decode_ability_info(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            ability_id=record.ability_id,
+            ability_name=record.name,
+            icon_path=record.icon_path,
+            # Legacy names of the spec's interruptible and blockable flags, which
+            # say nothing about the ability being passive or an ultimate
+            is_passive=record.interruptible,
+            is_ultimate=record.blockable
+        )
 
 
-@dataclass
+@slotted_dataclass
 class MapChangedEntry:
     """
     MAP_CHANGED event - map transitions within zones
@@ -495,24 +668,23 @@ class MapChangedEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['MapChangedEntry']:
         """Parse MAP_CHANGED entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 5 or fields[1] != "MAP_CHANGED":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                map_id=int(fields[2]),
-                map_name=fields[3].strip('"'),
-                map_path=fields[4].strip('"')
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['MapChangedEntry']:
+        """Build MAP_CHANGED entry from an already tokenized line"""
+        record = eso_log_decoders.decode_map_changed(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            map_id=record.id,
+            map_name=record.name,
+            map_path=record.texture_path
+        )
 
 
-@dataclass
+@slotted_dataclass
 class BeginCastEntry:
     """
     BEGIN_CAST event - when abilities start casting
@@ -531,23 +703,23 @@ class BeginCastEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['BeginCastEntry']:
         """Parse BEGIN_CAST entry from CSV line"""
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['BeginCastEntry']:
+        """Build BEGIN_CAST entry from an already tokenized line"""
         try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
             if len(fields) < 16 or fields[1] != "BEGIN_CAST":
                 return None
             
             # Parse caster stats (fields 7-15)
-            caster_stats_str = ",".join(fields[7:16])
-            caster_stats = UnitStats.from_string(caster_stats_str)
+            caster_stats = UnitStats.from_fields(fields, 7, 16)
             
             # Parse target stats if present (fields 17+)
             target_stats = None
             if len(fields) > 17 and fields[16] != "0":
-                target_stats_str = ",".join(fields[17:26]) if len(fields) >= 26 else ""
-                if target_stats_str:
-                    target_stats = UnitStats.from_string(target_stats_str)
+                if len(fields) >= 26:
+                    target_stats = UnitStats.from_fields(fields, 17, 26)
                 
             return cls(
                 line_number=int(fields[0]),
@@ -559,11 +731,11 @@ class BeginCastEntry:
                 caster_stats=caster_stats,
                 target_stats=target_stats
             )
-        except (ValueError, IndexError, StopIteration):
+        except (ValueError, IndexError):
             return None
 
 
-@dataclass
+@slotted_dataclass
 class EndCastEntry:
     """
     END_CAST event - when abilities finish casting
@@ -578,24 +750,30 @@ class EndCastEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['EndCastEntry']:
         """Parse END_CAST entry from CSV line"""
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['EndCastEntry']:
+        """Build END_CAST entry from an already tokenized line"""
+        record = eso_log_decoders.decode_end_cast(fields)
+        # Lines without the ability ID were always rejected
+        if record is None or record.interrupted_ability_id is None:
+            return None
         try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 5 or fields[1] != "END_CAST":
-                return None
-                
             return cls(
-                line_number=int(fields[0]),
-                result=CastResult(fields[2]),
-                caster_unit_id=int(fields[3]),
-                ability_id=int(fields[4])
+                line_number=record.line_number,
+                result=CastResult(record.end_reason),
+                # Legacy name of the spec's castTrackId, which identifies the cast
+                # (matching BEGIN_CAST), not the caster's unit
+                caster_unit_id=record.cast_track_id,
+                # The spec's interruptedAbilityId: the ability whose cast ended
+                ability_id=record.interrupted_ability_id
             )
-        except (ValueError, IndexError, StopIteration):
+        except ValueError:
             return None
 
 
-@dataclass
+@slotted_dataclass
 class EffectInfoEntry:
     """
     EFFECT_INFO event - effect definitions
@@ -611,25 +789,27 @@ class EffectInfoEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['EffectInfoEntry']:
         """Parse EFFECT_INFO entry from CSV line"""
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['EffectInfoEntry']:
+        """Build EFFECT_INFO entry from an already tokenized line"""
+        record = eso_log_decoders.decode_effect_info(fields)
+        if record is None:
+            return None
         try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 6 or fields[1] != "EFFECT_INFO":
-                return None
-                
             return cls(
-                line_number=int(fields[0]),
-                effect_id=int(fields[2]),
-                effect_type=EffectType(fields[3]),
-                stack_rule=fields[4],
-                duration_type=fields[5]
+                line_number=record.line_number,
+                effect_id=record.ability_id,
+                effect_type=EffectType(record.effect_type),
+                stack_rule=record.status_effect_type,
+                duration_type=record.effect_bar_display_behaviour
             )
-        except (ValueError, IndexError, StopIteration):
+        except ValueError:
             return None
 
 
-@dataclass
+@slotted_dataclass
 class EffectChangedEntry:
     """
     EFFECT_CHANGED event - when effects are gained/faded/updated
@@ -648,16 +828,17 @@ class EffectChangedEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['EffectChangedEntry']:
         """Parse EFFECT_CHANGED entry from CSV line"""
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['EffectChangedEntry']:
+        """Build EFFECT_CHANGED entry from an already tokenized line"""
         try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
             if len(fields) < 16 or fields[1] != "EFFECT_CHANGED":
                 return None
             
             # Parse target stats (fields 7-15)
-            target_stats_str = ",".join(fields[7:16])
-            target_stats = UnitStats.from_string(target_stats_str)
+            target_stats = UnitStats.from_fields(fields, 7, 16)
             
             # Parse additional targets if present
             additional_targets = []
@@ -675,11 +856,11 @@ class EffectChangedEntry:
                 target_stats=target_stats,
                 additional_targets=additional_targets
             )
-        except (ValueError, IndexError, StopIteration):
+        except (ValueError, IndexError):
             return None
 
 
-@dataclass
+@slotted_dataclass
 class CombatEventEntry:
     """
     COMBAT_EVENT event - combat actions (damage, healing, etc.)
@@ -700,16 +881,17 @@ class CombatEventEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['CombatEventEntry']:
         """Parse COMBAT_EVENT entry from CSV line"""
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['CombatEventEntry']:
+        """Build COMBAT_EVENT entry from an already tokenized line"""
         try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
             if len(fields) < 19 or fields[1] != "COMBAT_EVENT":
                 return None
             
             # Parse target stats (fields 10-18)
-            target_stats_str = ",".join(fields[10:19])
-            target_stats = UnitStats.from_string(target_stats_str)
+            target_stats = UnitStats.from_fields(fields, 10, 19)
                 
             return cls(
                 line_number=int(fields[0]),
@@ -723,11 +905,11 @@ class CombatEventEntry:
                 target_unit_id=int(fields[9]),
                 target_stats=target_stats
             )
-        except (ValueError, IndexError, StopIteration):
+        except (ValueError, IndexError):
             return None
 
 
-@dataclass
+@slotted_dataclass
 class BeginCombatEntry:
     """
     BEGIN_COMBAT event - combat starts
@@ -739,19 +921,20 @@ class BeginCombatEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['BeginCombatEntry']:
         """Parse BEGIN_COMBAT entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 2 or fields[1] != "BEGIN_COMBAT":
-                return None
-                
-            return cls(line_number=int(fields[0]))
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['BeginCombatEntry']:
+        """Build BEGIN_COMBAT entry from an already tokenized line"""
+        record = eso_log_decoders.decode_begin_combat(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number
+        )
 
 
-@dataclass
+@slotted_dataclass
 class EndCombatEntry:
     """
     END_COMBAT event - combat ends
@@ -763,19 +946,20 @@ class EndCombatEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['EndCombatEntry']:
         """Parse END_COMBAT entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 2 or fields[1] != "END_COMBAT":
-                return None
-                
-            return cls(line_number=int(fields[0]))
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['EndCombatEntry']:
+        """Build END_COMBAT entry from an already tokenized line"""
+        record = eso_log_decoders.decode_end_combat(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number
+        )
 
 
-@dataclass
+@slotted_dataclass
 class UnitRemovedEntry:
     """
     UNIT_REMOVED event - when units are removed from the encounter
@@ -788,22 +972,21 @@ class UnitRemovedEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['UnitRemovedEntry']:
         """Parse UNIT_REMOVED entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 3 or fields[1] != "UNIT_REMOVED":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                unit_id=fields[2]
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['UnitRemovedEntry']:
+        """Build UNIT_REMOVED entry from an already tokenized line"""
+        record = eso_log_decoders.decode_unit_removed(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            unit_id=str(record.unit_id)
+        )
 
 
-@dataclass
+@slotted_dataclass
 class TrialInitEntry:
     """
     TRIAL_INIT event - trial initialization
@@ -822,28 +1005,27 @@ class TrialInitEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['TrialInitEntry']:
         """Parse TRIAL_INIT entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 9 or fields[1] != "TRIAL_INIT":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                trial_id=int(fields[2]),
-                in_progress=fields[3] == 'T',
-                completed=fields[4] == 'T',
-                start_time_ms=int(fields[5]),
-                duration_ms=int(fields[6]),
-                success=fields[7] == 'T',
-                final_score=int(fields[8])
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['TrialInitEntry']:
+        """Build TRIAL_INIT entry from an already tokenized line"""
+        record = eso_log_decoders.decode_trial_init(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            trial_id=record.id,
+            in_progress=record.in_progress,
+            completed=record.completed,
+            start_time_ms=record.start_time_ms,
+            duration_ms=record.duration_ms,
+            success=record.success,
+            final_score=record.final_score
+        )
 
 
-@dataclass
+@slotted_dataclass
 class BeginTrialEntry:
     """
     BEGIN_TRIAL event - trial starts
@@ -857,23 +1039,22 @@ class BeginTrialEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['BeginTrialEntry']:
         """Parse BEGIN_TRIAL entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 4 or fields[1] != "BEGIN_TRIAL":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                trial_id=int(fields[2]),
-                start_time_ms=int(fields[3])
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['BeginTrialEntry']:
+        """Build BEGIN_TRIAL entry from an already tokenized line"""
+        record = eso_log_decoders.decode_begin_trial(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            trial_id=record.id,
+            start_time_ms=record.start_time_ms
+        )
 
 
-@dataclass
+@slotted_dataclass
 class EndTrialEntry:
     """
     END_TRIAL event - trial ends
@@ -890,26 +1071,25 @@ class EndTrialEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['EndTrialEntry']:
         """Parse END_TRIAL entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 7 or fields[1] != "END_TRIAL":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                trial_id=int(fields[2]),
-                duration_ms=int(fields[3]),
-                success=fields[4] == 'T',
-                final_score=int(fields[5]),
-                vitality_bonus=int(fields[6])
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['EndTrialEntry']:
+        """Build END_TRIAL entry from an already tokenized line"""
+        record = eso_log_decoders.decode_end_trial(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            trial_id=record.id,
+            duration_ms=record.duration_ms,
+            success=record.success,
+            final_score=record.final_score,
+            vitality_bonus=record.final_vitality_bonus
+        )
 
 
-@dataclass
+@slotted_dataclass
 class EndlessDungeonBeginEntry:
     """
     ENDLESS_DUNGEON_BEGIN event - endless dungeon begins
@@ -924,24 +1104,23 @@ class EndlessDungeonBeginEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['EndlessDungeonBeginEntry']:
         """Parse ENDLESS_DUNGEON_BEGIN entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 5 or fields[1] != "ENDLESS_DUNGEON_BEGIN":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                dungeon_id=int(fields[2]),
-                start_time_ms=int(fields[3]),
-                unknown_boolean=fields[4] == "T"
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['EndlessDungeonBeginEntry']:
+        """Build ENDLESS_DUNGEON_BEGIN entry from an already tokenized line"""
+        record = eso_log_decoders.decode_endless_dungeon_begin(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            dungeon_id=record.id,
+            start_time_ms=record.start_time_ms,
+            unknown_boolean=record.unknown_boolean
+        )
 
 
-@dataclass
+@slotted_dataclass
 class EndlessDungeonStageEndEntry:
     """
     ENDLESS_DUNGEON_STAGE_END event - endless dungeon stage ends
@@ -955,23 +1134,22 @@ class EndlessDungeonStageEndEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['EndlessDungeonStageEndEntry']:
         """Parse ENDLESS_DUNGEON_STAGE_END entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 4 or fields[1] != "ENDLESS_DUNGEON_STAGE_END":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                dungeon_id=int(fields[2]),
-                dungeon_begin_start_time_ms=int(fields[3])
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['EndlessDungeonStageEndEntry']:
+        """Build ENDLESS_DUNGEON_STAGE_END entry from an already tokenized line"""
+        record = eso_log_decoders.decode_endless_dungeon_stage_end(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            dungeon_id=record.id,
+            dungeon_begin_start_time_ms=record.dungeon_begin_start_time_ms
+        )
 
 
-@dataclass
+@slotted_dataclass
 class EndlessDungeonEndEntry:
     """
     ENDLESS_DUNGEON_END event - endless dungeon ends
@@ -986,10 +1164,12 @@ class EndlessDungeonEndEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['EndlessDungeonEndEntry']:
         """Parse ENDLESS_DUNGEON_END entry from CSV line"""
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['EndlessDungeonEndEntry']:
+        """Build ENDLESS_DUNGEON_END entry from an already tokenized line"""
         try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
             if len(fields) < 5 or fields[1] != "ENDLESS_DUNGEON_END":
                 return None
                 
@@ -999,11 +1179,11 @@ class EndlessDungeonEndEntry:
                 result=fields[3],
                 rounds_completed=int(fields[4])
             )
-        except (ValueError, IndexError, StopIteration):
+        except (ValueError, IndexError):
             return None
 
 
-@dataclass
+@slotted_dataclass
 class EndlessDungeonBuffAddedEntry:
     """
     ENDLESS_DUNGEON_BUFF_ADDED event - buff added in endless dungeon
@@ -1017,23 +1197,22 @@ class EndlessDungeonBuffAddedEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['EndlessDungeonBuffAddedEntry']:
         """Parse ENDLESS_DUNGEON_BUFF_ADDED entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 4 or fields[1] != "ENDLESS_DUNGEON_BUFF_ADDED":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                dungeon_id=int(fields[2]),
-                ability_id=int(fields[3])
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['EndlessDungeonBuffAddedEntry']:
+        """Build ENDLESS_DUNGEON_BUFF_ADDED entry from an already tokenized line"""
+        record = eso_log_decoders.decode_endless_dungeon_buff_added(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            dungeon_id=record.id,
+            ability_id=record.ability_id
+        )
 
 
-@dataclass
+@slotted_dataclass
 class EndlessDungeonBuffRemovedEntry:
     """
     ENDLESS_DUNGEON_BUFF_REMOVED event - buff removed in endless dungeon
@@ -1047,23 +1226,22 @@ class EndlessDungeonBuffRemovedEntry:
     @classmethod
     def parse(cls, line: str) -> Optional['EndlessDungeonBuffRemovedEntry']:
         """Parse ENDLESS_DUNGEON_BUFF_REMOVED entry from CSV line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 4 or fields[1] != "ENDLESS_DUNGEON_BUFF_REMOVED":
-                return None
-                
-            return cls(
-                line_number=int(fields[0]),
-                dungeon_id=int(fields[2]),
-                ability_id=int(fields[3])
-            )
-        except (ValueError, IndexError, StopIteration):
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['EndlessDungeonBuffRemovedEntry']:
+        """Build ENDLESS_DUNGEON_BUFF_REMOVED entry from an already tokenized line"""
+        record = eso_log_decoders.decode_endless_dungeon_buff_removed(fields)
+        if record is None:
             return None
+        return cls(
+            line_number=record.line_number,
+            dungeon_id=record.id,
+            ability_id=record.ability_id
+        )
 
 
-@dataclass
+@slotted_dataclass
 class PlayerInfoEntry:
     """
     PLAYER_INFO event - player equipment and abilities
@@ -1080,114 +1258,91 @@ class PlayerInfoEntry:
 
     @classmethod
     def parse(cls, line: str) -> Optional['PlayerInfoEntry']:
-        """Parse PLAYER_INFO entry from CSV line (complex regex parsing required)"""
-        import re
-        
-        # PLAYER_INFO has complex nested arrays that break standard CSV parsing
-        pattern = r'(\d+),PLAYER_INFO,(\d+),\[([^\]]+)\],\[([^\]]+)\],(\[.*\]),(\[.*\]),(\[.*\])'
-        match = re.search(pattern, line)
-        
-        if not match:
-            return None
-            
-        unit_id = int(match.group(2))
-            
+        """Parse PLAYER_INFO entry from CSV line"""
+        return cls.from_fields(tokenize_line(line))
+
+    @classmethod
+    def from_fields(cls, fields: List[str]) -> Optional['PlayerInfoEntry']:
+        """
+        Build PLAYER_INFO entry from an already tokenized line
+
+        PLAYER_INFO carries nested [..] arrays that a comma split breaks into
+        individual tokens; the arrays are regrouped from those tokens by
+        bracket depth instead of re-scanning the raw line.
+        """
         try:
-            line_number = int(match.group(1))
-            unit_id = int(match.group(2))
-            
-            
-            # Parse ability IDs
-            ability_ids_str = match.group(3)
-            ability_ids = [int(x.strip()) for x in ability_ids_str.split(',')]
-            
-            # Parse ability levels  
-            ability_levels_str = match.group(4)
-            ability_levels = [int(x.strip()) for x in ability_levels_str.split(',')]
-            
-            # Parse gear data (complex nested structure)
-            gear_data_str = match.group(5)
-            gear_items = cls._parse_gear_data(gear_data_str)
-            
-            # Parse front bar abilities
-            front_bar_str = match.group(6).strip('[]')
-            front_bar_abilities = [int(x.strip()) for x in front_bar_str.split(',') if x.strip()]
-            
-            # Parse back bar abilities
-            back_bar_str = match.group(7).strip('[]')
-            back_bar_abilities = [int(x.strip()) for x in back_bar_str.split(',') if x.strip()]
-            
-            result = cls(
-                line_number=line_number,
-                unit_id=unit_id,
-                ability_ids=ability_ids,
-                ability_levels=ability_levels,
-                gear_items=gear_items,
-                front_bar_abilities=front_bar_abilities,
-                back_bar_abilities=back_bar_abilities
+            if len(fields) < 8 or fields[1] != "PLAYER_INFO":
+                return None
+
+            groups = cls._group_bracketed(fields[3:])
+            if len(groups) < 5:
+                return None
+
+            ability_ids, ability_levels, gear_data, front_bar, back_bar = groups[:5]
+
+            return cls(
+                line_number=int(fields[0]),
+                unit_id=int(fields[2]),
+                ability_ids=[int(x) for x in ability_ids],
+                ability_levels=[int(x) for x in ability_levels],
+                gear_items=cls._parse_gear_data(gear_data),
+                front_bar_abilities=[int(x) for x in front_bar],
+                back_bar_abilities=[int(x) for x in back_bar]
             )
-            
-            
-            return result
-        except (ValueError, IndexError):
+        except (ValueError, IndexError, TypeError):
             return None
 
     @staticmethod
-    def _parse_gear_data(gear_data_str: str) -> List[GearItem]:
+    def _group_bracketed(tokens: List[str]) -> List[List[Any]]:
         """
-        Parse complex gear data structure with proper nested bracket handling
-        
-        Handles complex configurations that break simple regex parsing:
-        - Nested brackets within gear items
-        - Quoted strings containing commas
-        - Variable-length gear item data
+        Regroup comma-split tokens into their (possibly nested) [..] arrays
+
+        e.g. ['[1', '2]', '[[A', 'B]', '[C', 'D]]'] -> [['1', '2'], [['A', 'B'], ['C', 'D']]]
+        """
+        groups = []
+        stack = []
+
+        for token in tokens:
+            token = token.strip()
+            opened = len(token) - len(token.lstrip('['))
+            for _ in range(opened):
+                stack.append([])
+            token = token[opened:]
+
+            value = token.rstrip(']')
+            closed = len(token) - len(value)
+            if value:
+                if not stack:
+                    raise ValueError(f"Unexpected value outside of array: {value}")
+                stack[-1].append(value)
+
+            for _ in range(closed):
+                completed = stack.pop()
+                if stack:
+                    stack[-1].append(completed)
+                else:
+                    groups.append(completed)
+
+        return groups
+
+    @staticmethod
+    def _parse_gear_data(gear_data: List[Any]) -> List[GearItem]:
+        """
+        Convert grouped gear arrays into GearItem objects
+
+        Malformed or incomplete gear items are skipped.
         """
         gear_items = []
-        
-        # Remove outer brackets if present
-        if gear_data_str.startswith('[[') and gear_data_str.endswith(']]'):
-            gear_data_str = gear_data_str[1:-1]  # Remove one level of brackets
-        
-        # Use a more robust approach to handle nested brackets
-        bracket_count = 0
-        current_item = ""
-        items = []
-        
-        for char in gear_data_str:
-            if char == '[':
-                bracket_count += 1
-                current_item += char
-            elif char == ']':
-                bracket_count -= 1
-                current_item += char
-                if bracket_count == 0:
-                    # Complete gear item found
-                    items.append(current_item.strip())
-                    current_item = ""
-            elif bracket_count == 0 and char == ',':
-                # Skip commas between items (when not inside brackets)
+
+        for gear_parts in gear_data:
+            if not isinstance(gear_parts, list) or len(gear_parts) < 11:
                 continue
-            else:
-                current_item += char
-        
-        # Parse each gear item
-        for item_str in items:
-            if item_str.startswith('[') and item_str.endswith(']'):
-                # Remove brackets and parse CSV-style data
-                item_content = item_str[1:-1]
-                
-                # Use CSV reader to handle quoted strings properly
-                try:
-                    reader = csv.reader(io.StringIO(item_content))
-                    gear_parts = next(reader)
-                    
-                    if len(gear_parts) >= 11:
-                        gear_item = GearItem.from_list(gear_parts)
-                        gear_items.append(gear_item)
-                except (ValueError, IndexError, StopIteration):
-                    # Skip malformed gear items
-                    continue
-        
+            try:
+                gear_items.append(GearItem.from_list(gear_parts))
+            except (ValueError, IndexError):
+                # Skip malformed gear items
+                continue
+
         return gear_items
 
 
@@ -1230,52 +1385,111 @@ class ESOLogStructureParser:
         EventType.ENDLESS_DUNGEON_END: EndlessDungeonEndEntry.parse,
     }
     
+    # Event type lookup by the raw string found in field 1
+    EVENT_TYPES_BY_NAME = {event_type.value: event_type for event_type in EventType}
+
+    # Parsers that work on an already tokenized line (see tokenize_line)
+    FIELD_PARSERS = {
+        event_type: parser.__self__.from_fields
+        for event_type, parser in PARSERS.items()
+    }
+
+    def __init__(self, event_types: Optional[Iterable[Union[EventType, str]]] = None):
+        """
+        Args:
+            event_types: Event types to decode. Lines of any other type are
+                skipped before any CSV work. None subscribes to all event types.
+        """
+        # Event type names to decode; None means every event type
+        self.subscribed_event_types: Optional[Set[str]] = None
+        if event_types is not None:
+            self.subscribed_event_types = set()
+            self.subscribe(*event_types)
+
+    @staticmethod
+    def _event_type_name(event_type: Union[EventType, str]) -> str:
+        """Normalize an EventType or its string value to the string value"""
+        return event_type.value if isinstance(event_type, EventType) else str(event_type)
+
+    def subscribe(self, *event_types: Union[EventType, str]):
+        """Decode the given event types (in addition to any already subscribed)"""
+        if self.subscribed_event_types is None:
+            # Already decoding everything
+            return
+        self.subscribed_event_types.update(self._event_type_name(e) for e in event_types)
+
+    def unsubscribe(self, *event_types: Union[EventType, str]):
+        """Stop decoding the given event types"""
+        if self.subscribed_event_types is None:
+            self.subscribed_event_types = set(self.EVENT_TYPES_BY_NAME)
+        self.subscribed_event_types.difference_update(self._event_type_name(e) for e in event_types)
+
+    def subscribe_all(self):
+        """Decode every event type (the default)"""
+        self.subscribed_event_types = None
+
+    def is_subscribed(self, event_type: Union[EventType, str]) -> bool:
+        """Check whether lines of the given event type will be decoded"""
+        return (self.subscribed_event_types is None or
+                self._event_type_name(event_type) in self.subscribed_event_types)
+
+    def wants_line(self, line: str) -> bool:
+        """Cheap pre-check on a raw line: is its event type subscribed?"""
+        return (self.subscribed_event_types is None or
+                sniff_event_type(line) in self.subscribed_event_types)
+
     def parse_line(self, line: str) -> Optional[Any]:
         """Parse a single log line into the appropriate structured type"""
-        if not line or not line.strip():
+        if not self.wants_line(line):
             return None
-            
-        try:
-            # Extract event type from line
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 2:
-                return None
-                
-            event_type_str = fields[1]
-            
-            # Find matching parser
-            for event_type in EventType:
-                if event_type.value == event_type_str:
-                    parser = self.PARSERS.get(event_type)
-                    if parser:
-                        return parser(line)
-                    break
-                    
+        return self.parse_fields(tokenize_line(line))
+
+    def parse_fields(self, fields: List[str]) -> Optional[Any]:
+        """Parse an already tokenized log line into the appropriate structured type"""
+        if len(fields) < 2:
             return None
-        except (ValueError, IndexError, StopIteration):
+
+        if self.subscribed_event_types is not None and fields[1] not in self.subscribed_event_types:
             return None
 
+        event_type = self.EVENT_TYPES_BY_NAME.get(fields[1])
+        if event_type is None:
+            return None
+
+        parser = self.FIELD_PARSERS.get(event_type)
+        if parser is None:
+            return None
+
+        return parser(fields)
+
+    def decode_line(self, line: str) -> Optional[Any]:
+        """Decode a log line into its spec-accurate record from eso_log_decoders"""
+        if not self.wants_line(line):
+            return None
+        return self.decode_fields(tokenize_line(line))
+
+    def decode_fields(self, fields: List[str]) -> Optional[Any]:
+        """Decode an already tokenized log line with its generated per-line-type decoder"""
+        if len(fields) < 2:
+            return None
+
+        if self.subscribed_event_types is not None and fields[1] not in self.subscribed_event_types:
+            return None
+
+        decoder = eso_log_decoders.DECODERS.get(fields[1])
+        if decoder is None:
+            return None
+
+        return decoder(fields)
+
     def get_event_type(self, line: str) -> Optional[EventType]:
         """Get the event type from a log line"""
-        try:
-            reader = csv.reader(io.StringIO(line))
-            fields = next(reader)
-            
-            if len(fields) < 2:
-                return None
-                
-            event_type_str = fields[1]
-            
-            for event_type in EventType:
-                if event_type.value == event_type_str:
-                    return event_type
-                    
-            return None
-        except (ValueError, IndexError, StopIteration):
+        fields = tokenize_line(line)
+        if len(fields) < 2:
             return None
 
+        return self.EVENT_TYPES_BY_NAME.get(fields[1])
+
 
 # ============================================================================
 # HYBRID PARSER FOR GRADUAL MIGRATION
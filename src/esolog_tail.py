@@ -21,10 +21,14 @@ import sys
 import time
 import csv
 import io
+import multiprocessing
+from array import array
+from bisect import bisect_left
 from pathlib import Path
-from collections import defaultdict, deque
-from typing import Dict, List, Optional, Tuple, Set
+from collections import OrderedDict, defaultdict, deque
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Set
 from datetime import datetime
+from functools import partial
 import click
 import requests
 from colorama import init, Fore, Style
@@ -86,6 +90,11 @@ def highlight_taunt_abilities(ability_list):
 
 # Import our ESO analysis modules
 from eso_sets import ESOSubclassAnalyzer
+from eso_log_parser import iter_entries, complete_lines_end, next_line_start, detect_compression, ReadStats
+from eso_log_cache import ParsedLogCache
+from eso_log_parallel import iter_entries_parallel
+from eso_checkpoint import CheckpointWriter, checkpoint_path_for, load_checkpoint
+from eso_log_decoders import BeginCastLine, CombatEventLine, EffectChangedLine, UnitState
 
 # Known mythic item sets (these typically have only 1 piece and unique bonuses)
 MYTHIC_SETS = {
@@ -119,6 +128,21 @@ NO_FIVE_PIECE_SET_TYPES = {
 # Cache for set types to avoid repeatedly reading Excel file
 _set_type_cache = {}
 
+
+def _deep_getsizeof(obj, seen: Optional[Set[int]] = None) -> int:
+    """Approximate memory use in bytes of a container and everything it holds (each object counted once)."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_getsizeof(key, seen) + _deep_getsizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(_deep_getsizeof(item, seen) for item in obj)
+    return size
+
 def has_five_piece_bonus(set_name: str) -> bool:
     """Check if a set has a 5-piece bonus using the gear set database."""
     # Remove "Perfected " prefix for lookup
@@ -195,6 +219,8 @@ def has_five_piece_bonus(set_name: str) -> bool:
 class ESOLogEntry:
     """Represents a single log entry from the ESO encounter log."""
 
+    __slots__ = ('timestamp', 'event_type', 'fields', 'original_line')
+
     def __init__(self, timestamp: int, event_type: str, fields: List[str], original_line: str = ""):
         self.timestamp = timestamp
         self.event_type = event_type
@@ -345,29 +371,324 @@ class EnemyInfo:
         self.current_health: int = 0
         self.is_hostile: bool = False
 
+class SymbolTable:
+    """Interns string IDs (unit IDs, ability IDs) as dense integers in first-seen order."""
+
+    __slots__ = ('codes', 'symbols')
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}  # symbol -> code
+        self.symbols: List[str] = []  # code -> symbol
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def intern(self, symbol: str) -> int:
+        """Get the code of a symbol, assigning the next free one if it is new."""
+        code = self.codes.get(symbol)
+        if code is None:
+            code = self.codes[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return code
+
+    def code(self, symbol: str) -> Optional[int]:
+        """Get the code of a symbol, or None if it has not been seen."""
+        return self.codes.get(symbol)
+
+    def symbol(self, code: int) -> str:
+        """Get the symbol a code was assigned to."""
+        return self.symbols[code]
+
+class LogSymbols:
+    """Symbol tables of the unit IDs and ability IDs of one log, shared by its encounters."""
+
+    __slots__ = ('units', 'abilities')
+
+    def __init__(self):
+        self.units = SymbolTable()
+        self.abilities = SymbolTable()
+
+class DamageLedger:
+    """
+    Append-only columnar record of the damage dealt in one encounter.
+
+    Each row holds a timestamp, the source unit, the player it is attributed to
+    (-1 if unknown), the target unit, the ability and the amount; units and
+    abilities are LogSymbols codes. Columns are array buffers (np.frombuffer
+    views them without a copy). Rows are appended in log order, so timestamps
+    are non-decreasing and time windows are found by bisection.
+    """
+
+    __slots__ = ('timestamp', 'source', 'player', 'target', 'ability', 'amount')
+
+    def __init__(self):
+        self.timestamp = array('q')
+        self.source = array('i')
+        self.player = array('i')
+        self.target = array('i')
+        self.ability = array('i')
+        self.amount = array('q')
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def append(self, timestamp: int, source: int, player: int, target: int, ability: int, amount: int):
+        """Add a damage row."""
+        self.timestamp.append(timestamp)
+        self.source.append(source)
+        self.player.append(player)
+        self.target.append(target)
+        self.ability.append(ability)
+        self.amount.append(amount)
+
+    def window(self, start: Optional[int] = None, end: Optional[int] = None) -> range:
+        """Row indices with start <= timestamp < end (open-ended where None)."""
+        first = 0 if start is None else bisect_left(self.timestamp, start)
+        last = len(self.timestamp) if end is None else bisect_left(self.timestamp, end)
+        return range(first, max(first, last))
+
+    def _rows(self, start: Optional[int], end: Optional[int], player: Optional[int], target: Optional[int]) -> Iterator[int]:
+        """Row indices in a time window, optionally only of one player and/or one target."""
+        for row in self.window(start, end):
+            if player is not None and self.player[row] != player:
+                continue
+            if target is not None and self.target[row] != target:
+                continue
+            yield row
+
+    def timeline(self, start: int, end: int, bucket: int = 1000,
+                 player: Optional[int] = None, target: Optional[int] = None) -> List[int]:
+        """Damage per bucket (ms) from start to end, e.g. per second with the default bucket."""
+        buckets = [0] * max(0, -(-(end - start) // bucket))
+        for row in self._rows(start, end, player, target):
+            buckets[(self.timestamp[row] - start) // bucket] += self.amount[row]
+        return buckets
+
+    def burst(self, window: int, player: Optional[int] = None) -> Tuple[Optional[int], int]:
+        """Start timestamp and damage of the window (ms) with the most damage, (None, 0) without damage."""
+        if window <= 0:
+            raise ValueError(f"Burst window must be positive, got {window} ms")
+        rows = list(self._rows(None, None, player, None))
+        best_start, best_damage = None, 0
+        damage, first = 0, 0
+        for row in rows:
+            damage += self.amount[row]
+            # Drop rows that fell out of the window ending at this row
+            while self.timestamp[rows[first]] <= self.timestamp[row] - window:
+                damage -= self.amount[rows[first]]
+                first += 1
+            if damage > best_damage:
+                best_start, best_damage = self.timestamp[rows[first]], damage
+        return best_start, best_damage
+
+    def totals_by(self, column: str, start: Optional[int] = None, end: Optional[int] = None,
+                  player: Optional[int] = None, target: Optional[int] = None) -> Dict[int, int]:
+        """Damage per code of a column ('source', 'player', 'target' or 'ability')."""
+        codes = getattr(self, column)
+        totals: Dict[int, int] = defaultdict(int)
+        for row in self._rows(start, end, player, target):
+            totals[codes[row]] += self.amount[row]
+        return dict(totals)
+
+class DamageBreakdown:
+    """Damage of each player per ability and per target, keyed by LogSymbols codes."""
+
+    __slots__ = ('by_ability', 'by_target')
+
+    def __init__(self):
+        self.by_ability: Dict[int, Dict[int, int]] = defaultdict(partial(defaultdict, int))  # player -> ability -> damage
+        self.by_target: Dict[int, Dict[int, int]] = defaultdict(partial(defaultdict, int))  # player -> target -> damage
+
+    def add(self, player: int, ability: int, target: int, amount: int):
+        self.by_ability[player][ability] += amount
+        self.by_target[player][target] += amount
+
+class WindowSum:
+    """Running sum of the amounts added within the last window, expired from the oldest end."""
+
+    __slots__ = ('hits', 'total')
+
+    def __init__(self):
+        self.hits: deque = deque()  # (timestamp, amount), oldest first
+        self.total: int = 0
+
+    def add(self, timestamp: int, amount: int):
+        self.hits.append((timestamp, amount))
+        self.total += amount
+
+    def expire(self, cutoff: int) -> int:
+        """Drop the amounts added at or before cutoff and return the remaining sum."""
+        hits = self.hits
+        while hits and hits[0][0] <= cutoff:
+            self.total -= hits.popleft()[1]
+        return self.total
+
+class SlidingDpsMeter:
+    """
+    Damage over the last window (ms) for the group, each player and each target.
+
+    Players and targets are LogSymbols unit codes, like the DamageLedger's.
+    Every hit is added and expired once, so keeping the meter current costs
+    O(1) per hit regardless of how long the fight has been going.
+    """
+
+    __slots__ = ('window', 'group', 'players', 'targets', 'last_report')
+
+    def __init__(self, window: int = 10000, start_time: int = 0):
+        self.window = window
+        self.group = WindowSum()
+        self.players: Dict[int, WindowSum] = defaultdict(WindowSum)  # player unit code -> damage incl. pets
+        self.targets: Dict[int, WindowSum] = defaultdict(WindowSum)  # target unit code -> damage taken
+        self.last_report = start_time  # Timestamp the meter was last shown at
+
+    def add(self, timestamp: int, player: int, target: int, amount: int):
+        """Add a hit, attributed to a player (-1 if the owner is unknown)."""
+        cutoff = timestamp - self.window
+        self.group.add(timestamp, amount)
+        self.group.expire(cutoff)
+        if player >= 0:
+            player_sum = self.players[player]
+            player_sum.add(timestamp, amount)
+            player_sum.expire(cutoff)
+        target_sum = self.targets[target]
+        target_sum.add(timestamp, amount)
+        target_sum.expire(cutoff)
+
+    def expire(self, now: int):
+        """Expire every window up to now, dropping the players and targets without hits left in it."""
+        cutoff = now - self.window
+        self.group.expire(cutoff)
+        for window_sums in (self.players, self.targets):
+            for unit, window_sum in list(window_sums.items()):
+                window_sum.expire(cutoff)
+                if not window_sum.hits:
+                    del window_sums[unit]
+
+    def dps(self, now: int, start_time: int, player: Optional[int] = None, target: Optional[int] = None) -> float:
+        """Damage per second over the window ending at now (shorter early in a fight that began at start_time)."""
+        if player is not None:
+            window_sum = self.players.get(player)
+        elif target is not None:
+            window_sum = self.targets.get(target)
+        else:
+            window_sum = self.group
+        if window_sum is None:
+            return 0.0
+        damage = window_sum.expire(now - self.window)
+        span = min(self.window, now - start_time)
+        return damage * 1000.0 / span if span > 0 else 0.0
+
+class BuffUptimeTable:
+    """Active time of tracked buffs over an encounter, per holder and for the group (any player holding it)."""
+
+    __slots__ = ('duration', 'holder_time', 'group_time')
+
+    def __init__(self, duration: int):
+        self.duration = duration
+        self.holder_time: Dict[str, Dict[str, int]] = defaultdict(dict)  # buff_name -> unit_id -> active time
+        self.group_time: Dict[str, int] = {}  # buff_name -> time held by at least one player
+
+    @classmethod
+    def sweep(cls, intervals: Iterable[Tuple[str, str, int, int, bool]], duration: int) -> 'BuffUptimeTable':
+        """
+        Build the table from (buff_name, unit_id, start, end, in_group) intervals in one sorted pass.
+
+        Overlapping intervals of the same holder count once, as do overlapping
+        holders of a group buff. Only intervals with in_group set count for the group.
+        """
+        table = cls(duration)
+        transitions = []
+        for buff_name, unit_id, start, end, in_group in intervals:
+            if start < end:
+                transitions.append((start, 1, buff_name, unit_id, in_group))
+                transitions.append((end, -1, buff_name, unit_id, in_group))
+        # At equal times FADED (-1) sorts before GAINED, so back-to-back intervals join up
+        transitions.sort()
+
+        holder_depth: Dict[Tuple[str, str], int] = {}
+        holder_since: Dict[Tuple[str, str], int] = {}
+        group_depth: Dict[str, int] = {}
+        group_since: Dict[str, int] = {}
+        for time_point, delta, buff_name, unit_id, in_group in transitions:
+            key = (buff_name, unit_id)
+            depth = holder_depth.get(key, 0)
+            if delta > 0 and depth == 0:
+                holder_since[key] = time_point
+            elif delta < 0 and depth == 1:
+                held = table.holder_time[buff_name]
+                held[unit_id] = held.get(unit_id, 0) + time_point - holder_since[key]
+            holder_depth[key] = depth + delta
+
+            if in_group:
+                depth = group_depth.get(buff_name, 0)
+                if delta > 0 and depth == 0:
+                    group_since[buff_name] = time_point
+                elif delta < 0 and depth == 1:
+                    table.group_time[buff_name] = table.group_time.get(buff_name, 0) + time_point - group_since[buff_name]
+                group_depth[buff_name] = depth + delta
+        return table
+
+    def uptime(self, buff_name: str, unit_id: Optional[str] = None) -> float:
+        """Uptime percentage of a buff on one holder, or on the group if unit_id is None."""
+        if self.duration <= 0:
+            return 0.0
+        if unit_id is None:
+            active_time = self.group_time.get(buff_name, 0)
+        else:
+            active_time = self.holder_time.get(buff_name, {}).get(unit_id, 0)
+        # Cap at 100% to prevent display issues
+        return min(active_time / self.duration * 100.0, 100.0)
+
+    def rows(self) -> List[Tuple[str, Optional[str], float]]:
+        """(buff_name, unit_id, uptime) rows sorted by buff, the group row (unit_id None) first."""
+        rows = []
+        for buff_name in sorted(set(self.holder_time) | set(self.group_time)):
+            if buff_name in self.group_time:
+                rows.append((buff_name, None, self.uptime(buff_name)))
+            for unit_id in sorted(self.holder_time.get(buff_name, ())):
+                rows.append((buff_name, unit_id, self.uptime(buff_name, unit_id)))
+        return rows
+
 class CombatEncounter:
     """Represents a single combat encounter."""
 
-    def __init__(self):
+    def __init__(self, symbols: Optional[LogSymbols] = None, damage_breakdown: bool = False):
         self.start_time: int = 0
         self.end_time: int = 0
-        self.players: Dict[str, PlayerInfo] = {}  # Keyed by short unit ID
+        self.symbols = symbols if symbols is not None else LogSymbols()
+        # Unit maps are keyed by unit code (see symbols); look them up by unit ID through
+        # get_player, find_unit_owner, get_damage_taken etc., or resolve them with get_player_damage etc.
+        self.players: Dict[int, PlayerInfo] = {}  # Keyed by the unit code of the short unit ID
         self.enemies: Dict[str, EnemyInfo] = {}  # Track enemy units
-        self.abilities_used: Dict[str, Set[str]] = defaultdict(set)
+        # Player unit code -> ability codes (see symbols); names are resolved by get_abilities_used
+        self.abilities_used: Dict[int, Set[int]] = defaultdict(set)
         self.total_damage: int = 0  # Track total damage dealt
-        self.player_damage: Dict[str, int] = {}  # Track damage per player (including pets)
-        self.enemy_damage: Dict[str, int] = {}  # Track damage dealt to each enemy
+        self.damage_ledger = DamageLedger()  # Every hit counted in the totals below, for time-resolved views
+        self.dps_meter: Optional[SlidingDpsMeter] = None  # Live DPS while tailing (see ESOLogAnalyzer.live_dps)
+        # Per-ability and per-target damage of each player, only if enabled
+        self.damage_breakdown: Optional[DamageBreakdown] = DamageBreakdown() if damage_breakdown else None
+        self.player_damage: Dict[int, int] = {}  # Track damage per player unit code (including pets)
+        self.enemy_damage: Dict[int, int] = {}  # Track damage dealt to each enemy unit code
         self.total_health_damaged: int = 0  # Track total health of all damaged enemies
         self.player_deaths: int = 0  # Track player deaths
         self.in_combat = False
         self.finalized = False  # Track if encounter has been finalized (ended)
         
         # Buff tracking
-        self.player_buffs: Dict[str, Dict[str, List[Tuple[int, int]]]] = defaultdict(lambda: defaultdict(list))  # player_id -> buff_name -> [(start_time, end_time)]
-        self.active_buffs: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))  # player_id -> buff_name -> start_time
+        self.player_buffs: Dict[str, Dict[str, List[Tuple[int, int]]]] = defaultdict(partial(defaultdict, list))  # player_id -> buff_name -> [(start_time, end_time)]
+        self.active_buffs: Dict[str, Dict[str, int]] = defaultdict(partial(defaultdict, int))  # player_id -> buff_name -> start_time
+
+        # Live group buff coverage, kept up to date by track_buff (see start_buff_coverage)
+        self.buff_holders: Dict[str, int] = defaultdict(int)  # buff_name -> players currently holding it
+        self.buff_covered_time: Dict[str, int] = defaultdict(int)  # buff_name -> time held by any player so far
+        self.buff_covered_since: Dict[str, int] = {}  # buff_name -> start of the current covered stretch
         
-        # Pet ownership tracking
-        self.pet_ownership: Dict[str, str] = {}
+        # Pet ownership tracking (pet unit code -> owner unit code)
+        self.pet_ownership: Dict[int, int] = {}
+
+        # Owning player of the unit code of every short unit ID, long unit ID and (resolved) pet unit ID,
+        # kept up to date by add_player, associate_long_unit_id and track_pet_ownership
+        self.unit_owners: Dict[int, PlayerInfo] = {}
         
         # Track combat end time
         self.combat_ended_at: Optional[int] = None
@@ -392,7 +713,77 @@ class CombatEncounter:
             return
         player = PlayerInfo(unit_id, name, handle, class_id)
         player.champion_points = champion_points
-        self.players[unit_id] = player
+        self.add_player_info(player)
+
+    def add_player_info(self, player: PlayerInfo):
+        """Add an existing PlayerInfo (e.g. one restored from session data) to this encounter."""
+        unit = self.symbols.units.intern(player.unit_id)
+        replaced = unit in self.players
+        self.players[unit] = player
+        if replaced:
+            # The replaced player's long unit IDs and pets no longer resolve to it
+            self._rebuild_unit_owners()
+            return
+
+        owner = self.unit_owners.get(unit)
+        if owner is None or not owner.has_unit_id(player.unit_id):
+            # A player's own ID takes precedence over a pet mapped to the same ID
+            self.unit_owners[unit] = player
+        self._resolve_pets_of(unit)
+
+    def set_players(self, players: Iterable[PlayerInfo]):
+        """Replace all players (e.g. with those of the previous encounter in the zone)."""
+        units = self.symbols.units
+        self.players = {units.intern(player.unit_id): player for player in players}
+        self._rebuild_unit_owners()
+
+    def get_player(self, unit_id: str) -> Optional[PlayerInfo]:
+        """Get the player with this short unit ID, or None if it is not in the encounter."""
+        unit = self.symbols.units.code(unit_id)
+        return self.players.get(unit) if unit is not None else None
+
+    def has_player(self, unit_id: str) -> bool:
+        """Check if a short unit ID is a player's in this encounter."""
+        unit = self.symbols.units.code(unit_id)
+        return unit is not None and unit in self.players
+
+    def _rebuild_unit_owners(self):
+        """Rebuild unit_owners from players and pet_ownership."""
+        # The first player (in players order) claiming an ID owns it
+        units = self.symbols.units
+        self.unit_owners = {}
+        for player in self.players.values():
+            self.unit_owners.setdefault(units.intern(player.unit_id), player)
+            for long_unit_id in player.long_unit_ids:
+                self.unit_owners.setdefault(units.intern(long_unit_id), player)
+        for pet_unit, owner_unit in self.pet_ownership.items():
+            self._resolve_pet(pet_unit, owner_unit)
+
+    def _find_player(self, unit: int) -> Optional[PlayerInfo]:
+        """Find a player by the unit code of its short or long unit ID."""
+        player = self.unit_owners.get(unit)
+        # unit_owners also maps pets to their owners
+        if player is not None and player.has_unit_id(self.symbols.units.symbol(unit)):
+            return player
+        return None
+
+    def _resolve_pet(self, pet_unit: int, owner_unit: int):
+        """Map a pet to its owner in unit_owners, if the owner is a known player (both by unit code)."""
+        current = self.unit_owners.get(pet_unit)
+        if current is not None and current.has_unit_id(self.symbols.units.symbol(pet_unit)):
+            return  # The ID is a player's own
+
+        owner = self._find_player(owner_unit)
+        if owner:
+            self.unit_owners[pet_unit] = owner
+        elif current is not None:
+            del self.unit_owners[pet_unit]
+
+    def _resolve_pets_of(self, owner_unit: int):
+        """Resolve the pets tracked for an owner unit code that has just become known."""
+        for pet_unit, pet_owner_unit in self.pet_ownership.items():
+            if pet_owner_unit == owner_unit:
+                self._resolve_pet(pet_unit, owner_unit)
 
     def add_enemy(self, unit_id: str, name: str, unit_type: str):
         """Add an enemy to this encounter."""
@@ -400,22 +791,26 @@ class CombatEncounter:
 
     def track_pet_ownership(self, pet_unit_id: str, owner_unit_id: str):
         """Track that a pet belongs to a specific player."""
-        self.pet_ownership[pet_unit_id] = owner_unit_id
+        units = self.symbols.units
+        pet_unit = units.intern(pet_unit_id)
+        owner_unit = self.pet_ownership[pet_unit] = units.intern(owner_unit_id)
+        self._resolve_pet(pet_unit, owner_unit)
+
+    def is_pet(self, unit_id: str) -> bool:
+        """Check if a unit ID is tracked as a pet (whether or not its owner is a known player)."""
+        unit = self.symbols.units.code(unit_id)
+        return unit is not None and unit in self.pet_ownership
+
+    def get_pet_ownership(self) -> Dict[str, str]:
+        """Get the owner unit ID of every tracked pet, keyed by pet unit ID."""
+        symbol = self.symbols.units.symbol
+        return {symbol(pet_unit): symbol(owner_unit) for pet_unit, owner_unit in self.pet_ownership.items()}
 
     def is_friendly_unit(self, unit_id: str) -> bool:
         """Check if a unit ID belongs to a friendly player or their pet."""
-        # Check if it's a known player
-        if self.find_player_by_unit_id(unit_id):
-            return True
-        
-        # Check if it's a known pet of a friendly player
-        if unit_id in self.pet_ownership:
-            owner_id = self.pet_ownership[unit_id]
-            return self.find_player_by_unit_id(owner_id) is not None
-        
         # Note: Removed overly broad 1-50 fallback as it was filtering out legitimate hostile enemies
-            
-        return False
+        unit = self.symbols.units.code(unit_id)
+        return unit is not None and unit in self.unit_owners
     
     def update_highest_health_hostile(self, enemy: EnemyInfo):
         """Update the highest health hostile monster if this enemy has more health."""
@@ -432,11 +827,11 @@ class CombatEncounter:
         """Update the most damaged hostile monster based on player damage."""
         if unit_id in self.enemies:
             enemy = self.enemies[unit_id]
+            damage = self.get_damage_taken(unit_id)
             if (hasattr(enemy, 'is_hostile') and enemy.is_hostile and 
-                unit_id in self.enemy_damage):
-                damage = self.enemy_damage[unit_id]
+                damage is not None):
                 if (self.most_damaged_hostile is None or 
-                    damage > self.enemy_damage.get(self.most_damaged_hostile.unit_id, 0)):
+                    damage > (self.get_damage_taken(self.most_damaged_hostile.unit_id) or 0)):
                     self.most_damaged_hostile = enemy
     
     def update_enemy_health(self, unit_id: str, current_health: int, max_health: int):
@@ -499,8 +894,9 @@ class CombatEncounter:
         max_damage = 0
         most_damaged_enemy = None
         
-        for unit_id, damage in self.enemy_damage.items():
-            enemy = self.enemies.get(unit_id)
+        symbol = self.symbols.units.symbol
+        for unit, damage in self.enemy_damage.items():
+            enemy = self.enemies.get(symbol(unit))
             if enemy:
                 # Skip if not a valid enemy target
                 if not self._is_valid_enemy(enemy):
@@ -512,72 +908,247 @@ class CombatEncounter:
                     
         return most_damaged_enemy
 
-    def add_ability_use(self, unit_id: str, ability_name: str):
+    def add_ability_use(self, unit_id: str, ability_id: str):
         """Record an ability use by a player (for tracking purposes only)."""
         player = self.find_player_by_unit_id(unit_id)
         if player:
-            self.abilities_used[player.unit_id].add(ability_name)
+            self.abilities_used[self.symbols.units.intern(player.unit_id)].add(self.symbols.abilities.intern(ability_id))
+
+    def get_abilities_used(self, ability_cache: Dict[str, str]) -> Dict[str, Set[str]]:
+        """Get the names of the abilities each player used, keyed by short unit ID.
+
+        Abilities without a name in ability_cache (ability_id -> ability_name) are left out.
+        """
+        units = self.symbols.units
+        abilities = self.symbols.abilities
+        abilities_used = {}
+        for unit_code, ability_codes in self.abilities_used.items():
+            names = {ability_cache[abilities.symbol(code)] for code in ability_codes
+                     if abilities.symbol(code) in ability_cache}
+            if names:
+                abilities_used[units.symbol(unit_code)] = names
+        return abilities_used
 
     def find_player_by_unit_id(self, unit_id: str) -> Optional[PlayerInfo]:
         """Find a player by either short or long unit ID."""
-        for player in self.players.values():
-            if player.has_unit_id(unit_id):
-                return player
-        return None
+        unit = self.symbols.units.code(unit_id)
+        return self._find_player(unit) if unit is not None else None
+
+    def find_unit_owner(self, unit_id: str) -> Optional[PlayerInfo]:
+        """Find the player a unit ID belongs to: by short or long unit ID, or as the owner of a pet."""
+        unit = self.symbols.units.code(unit_id)
+        return self.unit_owners.get(unit) if unit is not None else None
 
     def associate_long_unit_id(self, short_unit_id: str, long_unit_id: str):
         """Associate a long unit ID with a player's short unit ID."""
-        if short_unit_id in self.players:
-            self.players[short_unit_id].add_long_unit_id(long_unit_id)
-
-    def add_damage_to_player(self, unit_id: str, damage: int):
-        """Add damage to a specific player's total (players and their pets)."""
-        # Find the player this unit belongs to
-        player = self.find_player_by_unit_id(unit_id)
+        player = self.get_player(short_unit_id)
+        if player is None:
+            return
+        player.add_long_unit_id(long_unit_id)
+
+        long_unit = self.symbols.units.intern(long_unit_id)
+        current = self.unit_owners.get(long_unit)
+        if current is None or not current.has_unit_id(long_unit_id):
+            self.unit_owners[long_unit] = player
+            self._resolve_pets_of(long_unit)
+        elif current is not player:
+            # Claimed by two players: the first in players order owns it
+            self._rebuild_unit_owners()
+
+    def add_damage_to_player(self, unit_id: str, damage: int, target_unit_id: Optional[str] = None,
+                             ability_id: Optional[str] = None):
+        """Add damage to a specific player's total (players and their pets), and to its breakdown if enabled."""
+        # Find the player this unit (or pet) belongs to
+        player = self.find_unit_owner(unit_id)
         if player:
-            if player.unit_id not in self.player_damage:
-                self.player_damage[player.unit_id] = 0
-            self.player_damage[player.unit_id] += damage
-        else:
-            # Check if this is a pet of a player
-            if unit_id in self.pet_ownership:
-                owner_id = self.pet_ownership[unit_id]
-                owner_player = self.find_player_by_unit_id(owner_id)
-                if owner_player:
-                    if owner_player.unit_id not in self.player_damage:
-                        self.player_damage[owner_player.unit_id] = 0
-                    self.player_damage[owner_player.unit_id] += damage
-
-    def track_buff(self, player_unit_id: str, buff_name: str, effect_type: str, timestamp: int):
-        """Track buff applications and removals for uptime calculation."""
+            units = self.symbols.units
+            player_unit = units.intern(player.unit_id)
+            self.player_damage[player_unit] = self.player_damage.get(player_unit, 0) + damage
+
+            breakdown = self.damage_breakdown
+            if breakdown is not None and target_unit_id is not None and ability_id is not None:
+                breakdown.add(player_unit, self.symbols.abilities.intern(ability_id),
+                              units.intern(target_unit_id), damage)
+
+    def add_enemy_damage(self, unit_id: str, damage: int) -> bool:
+        """Add damage dealt to an enemy; returns True if it is the first damage the enemy took."""
+        unit = self.symbols.units.intern(unit_id)
+        taken = self.enemy_damage.get(unit)
+        self.enemy_damage[unit] = damage if taken is None else taken + damage
+        return taken is None
+
+    def get_damage_taken(self, unit_id: str) -> Optional[int]:
+        """Get the damage dealt to an enemy, or None if it took none."""
+        unit = self.symbols.units.code(unit_id)
+        return self.enemy_damage.get(unit) if unit is not None else None
+
+    def get_damage_dealt(self, player_unit_id: str) -> int:
+        """Get the damage dealt by a player (including pets)."""
+        unit = self.symbols.units.code(player_unit_id)
+        return self.player_damage.get(unit, 0) if unit is not None else 0
+
+    def set_damage_totals(self, total_damage: int, player_damage: Dict[str, int], enemy_damage: Dict[str, int]):
+        """
+        Replace the damage totals with ones computed elsewhere (see eso_log_columnar.encounter_damage_totals).
+
+        player_damage and enemy_damage are keyed by unit ID. The health pool and
+        the most damaged hostile are recomputed from them.
+        """
+        units = self.symbols.units
+        self.total_damage = total_damage
+        self.player_damage = {units.intern(unit_id): damage for unit_id, damage in player_damage.items()}
+        self.enemy_damage = {units.intern(unit_id): damage for unit_id, damage in enemy_damage.items()}
+        self.total_health_damaged = 0
+        self.most_damaged_hostile = None
+        for unit_id in enemy_damage:
+            enemy = self.enemies.get(unit_id)
+            if enemy and enemy.max_health > 0:
+                self.total_health_damaged += enemy.max_health
+            self.update_most_damaged_hostile(unit_id)
+
+    def get_player_damage(self) -> Dict[str, int]:
+        """Get the damage dealt by each player (including pets), keyed by short unit ID."""
+        symbol = self.symbols.units.symbol
+        return {symbol(unit): damage for unit, damage in self.player_damage.items()}
+
+    def get_enemy_damage(self) -> Dict[str, int]:
+        """Get the damage dealt to each enemy, keyed by unit ID."""
+        symbol = self.symbols.units.symbol
+        return {symbol(unit): damage for unit, damage in self.enemy_damage.items()}
+
+    def get_damage_breakdown(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """
+        Get the damage of each player per ability and per target.
+
+        Keyed by short unit ID; each value maps 'abilities' to ability_id -> damage
+        and 'targets' to target unit ID -> damage. Empty unless the breakdown is enabled.
+        """
+        breakdown = self.damage_breakdown
+        if breakdown is None:
+            return {}
+        units = self.symbols.units
+        abilities = self.symbols.abilities
+        result = {}
+        for player, ability_damage in breakdown.by_ability.items():
+            result[units.symbol(player)] = {
+                'abilities': {abilities.symbol(ability): damage for ability, damage in ability_damage.items()},
+                'targets': {units.symbol(target): damage for target, damage in breakdown.by_target[player].items()},
+            }
+        return result
+
+    def record_damage(self, timestamp: int, source_unit_id: str, player: Optional[PlayerInfo],
+                      target_unit_id: str, ability_id: str, amount: int):
+        """Add a hit to the damage ledger, attributed to player (None if the owner is unknown)."""
+        units = self.symbols.units
+        self.damage_ledger.append(timestamp, units.intern(source_unit_id),
+                                  units.intern(player.unit_id) if player else -1,
+                                  units.intern(target_unit_id), self.symbols.abilities.intern(ability_id), amount)
+
+    def get_damage_timeline(self, bucket: int = 1000, player_unit_id: Optional[str] = None) -> List[int]:
+        """Damage per bucket (ms, default per second) from the start to the end of the encounter."""
+        end_time = self.end_time if self.end_time > self.start_time else self.start_time
+        player = None
+        if player_unit_id is not None:
+            player = self.symbols.units.code(player_unit_id)
+            if player is None:
+                return [0] * max(0, -(-(end_time - self.start_time) // bucket))
+        return self.damage_ledger.timeline(self.start_time, end_time, bucket, player=player)
+
+    def track_buff(self, player_unit_id: str, buff_name: str, effect_type: str, timestamp: int) -> bool:
+        """
+        Track buff applications and removals for uptime calculation.
+
+        Returns True if the buff went up on the group (first player holding it)
+        or down (last player lost it).
+        """
+        active_buffs = self.active_buffs[player_unit_id]
         if effect_type == "GAINED":
-            # Start tracking this buff
-            self.active_buffs[player_unit_id][buff_name] = timestamp
+            # Start tracking this buff; gaining it again while held refreshes it without a gap
+            if buff_name in active_buffs:
+                return False
+            active_buffs[buff_name] = timestamp
+            if self.has_player(player_unit_id):
+                self.buff_holders[buff_name] += 1
+                if self.buff_holders[buff_name] == 1:
+                    self.buff_covered_since[buff_name] = timestamp
+                    return True
         elif effect_type == "FADED":
             # End tracking this buff and record the duration
-            if buff_name in self.active_buffs[player_unit_id]:
-                start_time = self.active_buffs[player_unit_id][buff_name]
+            if buff_name in active_buffs:
+                start_time = active_buffs[buff_name]
                 self.player_buffs[player_unit_id][buff_name].append((start_time, timestamp))
-                del self.active_buffs[player_unit_id][buff_name]
+                del active_buffs[buff_name]
+                if self.has_player(player_unit_id) and self.buff_holders[buff_name] > 0:
+                    self.buff_holders[buff_name] -= 1
+                    if self.buff_holders[buff_name] == 0:
+                        self._end_buff_coverage(buff_name, timestamp)
+                        return True
+        return False
+
+    def start_buff_coverage(self):
+        """Restart the live group buff coverage at start_time from the buffs players currently hold."""
+        self.buff_holders.clear()
+        self.buff_covered_time.clear()
+        self.buff_covered_since.clear()
+        for player_id, active_buffs in self.active_buffs.items():
+            if self.has_player(player_id):
+                for buff_name in active_buffs:
+                    self.buff_holders[buff_name] += 1
+                    self.buff_covered_since[buff_name] = self.start_time
+
+    def _end_buff_coverage(self, buff_name: str, timestamp: int):
+        """Add the covered stretch of a buff that ends at timestamp (clamped to the encounter start)."""
+        start_time = max(self.buff_covered_since.pop(buff_name), self.start_time)
+        if timestamp > start_time:
+            self.buff_covered_time[buff_name] += timestamp - start_time
+
+    def get_live_group_buff_uptime(self, buff_name: str, now: Optional[int] = None) -> float:
+        """
+        Group uptime percentage of a buff from the live coverage counters, up to now.
+
+        now defaults to the encounter end (or start, while it has none).
+        """
+        if now is None:
+            now = self.end_time if self.end_time > 0 else self.start_time
+        covered_time = self.buff_covered_time.get(buff_name, 0)
+        covered_since = self.buff_covered_since.get(buff_name)
+        if covered_since is not None:
+            covered_time += max(0, now - max(covered_since, self.start_time))
+        duration = now - self.start_time
+        if duration > 0:
+            # Cap at 100% to prevent display issues
+            return min(covered_time / duration * 100.0, 100.0)
+        return 0.0
 
     def get_buff_uptime(self, player_unit_id: str, buff_name: str) -> float:
         """Calculate uptime percentage for a specific buff on a player."""
-        if not self.player_buffs[player_unit_id][buff_name]:
-            return 0.0
-        
-        total_uptime = 0
-        for start_time, end_time in self.player_buffs[player_unit_id][buff_name]:
-            total_uptime += (end_time - start_time)
-        
-        # Add any currently active buff time
-        if buff_name in self.active_buffs[player_unit_id]:
-            current_time = self.end_time if self.end_time > 0 else self.start_time
-            total_uptime += (current_time - self.active_buffs[player_unit_id][buff_name])
-        
-        if self.end_time > self.start_time:
-            duration = self.end_time - self.start_time
-            return (total_uptime / duration) * 100.0
-        return 0.0
+        return self.get_buff_uptime_table([buff_name]).uptime(buff_name, player_unit_id)
+
+    def get_buff_uptime_table(self, buff_names: Optional[Iterable[str]] = None) -> BuffUptimeTable:
+        """
+        Calculate the uptime of every tracked buff (or only buff_names) in one sweep.
+
+        Buff periods, including ones still active, are clamped to the encounter bounds.
+        """
+        wanted = set(buff_names) if buff_names is not None else None
+        encounter_end = self.end_time if self.end_time > 0 else self.start_time
+
+        def intervals():
+            for unit_id, buffs in self.player_buffs.items():
+                in_group = self.has_player(unit_id)
+                for buff_name, periods in buffs.items():
+                    if wanted is None or buff_name in wanted:
+                        for start_time, end_time in periods:
+                            yield (buff_name, unit_id, max(start_time, self.start_time),
+                                   min(end_time, encounter_end), in_group)
+            for unit_id, buffs in self.active_buffs.items():
+                in_group = self.has_player(unit_id)
+                for buff_name, start_time in buffs.items():
+                    if wanted is None or buff_name in wanted:
+                        yield (buff_name, unit_id, max(start_time, self.start_time), encounter_end, in_group)
+
+        duration = self.end_time - self.start_time if self.end_time > self.start_time else 0
+        return BuffUptimeTable.sweep(intervals(), duration)
 
     def finalize_buff_tracking(self):
         """Finalize buff tracking by ending any active buffs at encounter end."""
@@ -587,6 +1158,11 @@ class CombatEncounter:
                 self.player_buffs[player_id][buff_name].append((start_time, end_time))
         self.active_buffs.clear()
 
+        end_time = self.end_time if self.end_time > 0 else self.start_time
+        for buff_name in list(self.buff_covered_since):
+            self._end_buff_coverage(buff_name, end_time)
+        self.buff_holders.clear()
+
     def get_combat_start_time_formatted(self, log_file_path: str = None, log_start_unix: int = None) -> str:
         """Get the combat start time formatted as local date/time."""
         if not self.start_time:
@@ -618,55 +1194,7 @@ class CombatEncounter:
 
     def get_group_buff_uptime(self, buff_name: str) -> float:
         """Calculate uptime percentage for a group buff (active on any player)."""
-        # Collect all time intervals when the buff was active on any player
-        active_intervals = []
-        
-        # Check all players for this buff
-        for player_id in self.players.keys():
-            # Add completed buff periods
-            if buff_name in self.player_buffs[player_id]:
-                for start_time, end_time in self.player_buffs[player_id][buff_name]:
-                    # Clamp intervals to encounter bounds
-                    start_clamped = max(start_time, self.start_time)
-                    end_clamped = min(end_time, self.end_time) if self.end_time > 0 else end_time
-                    if start_clamped < end_clamped:
-                        active_intervals.append((start_clamped, end_clamped))
-            
-            # Add currently active buff
-            if buff_name in self.active_buffs[player_id]:
-                start_time = self.active_buffs[player_id][buff_name]
-                end_time = self.end_time if self.end_time > 0 else self.start_time
-                # Clamp to encounter bounds
-                start_clamped = max(start_time, self.start_time)
-                end_clamped = min(end_time, self.end_time) if self.end_time > 0 else end_time
-                if start_clamped < end_clamped:
-                    active_intervals.append((start_clamped, end_clamped))
-        
-        if not active_intervals:
-            return 0.0
-        
-        # Merge overlapping intervals and calculate total active time
-        active_intervals.sort()  # Sort by start time
-        merged_intervals = []
-        
-        for start, end in active_intervals:
-            if not merged_intervals or merged_intervals[-1][1] < start:
-                # No overlap, add new interval
-                merged_intervals.append((start, end))
-            else:
-                # Overlap exists, extend the last interval
-                merged_intervals[-1] = (merged_intervals[-1][0], max(merged_intervals[-1][1], end))
-        
-        # Calculate total active time
-        total_active_time = sum(end - start for start, end in merged_intervals)
-        
-        # Calculate uptime percentage
-        encounter_duration = self.end_time - self.start_time if self.end_time > self.start_time else 0
-        if encounter_duration > 0:
-            uptime_percentage = (total_active_time / encounter_duration) * 100.0
-            # Cap at 100% to prevent display issues
-            return min(uptime_percentage, 100.0)
-        return 0.0
+        return self.get_buff_uptime_table([buff_name]).uptime(buff_name)
 
     def get_group_buff_analysis(self) -> Dict[str, bool]:
         """Analyze which group buffs are present across all players."""
@@ -676,7 +1204,8 @@ class CombatEncounter:
         for buff_name in group_buffs:
             # Check if any player had this buff during the encounter
             has_buff = False
-            for player_id in self.players.keys():
+            for player in self.players.values():
+                player_id = player.unit_id
                 if buff_name in self.player_buffs[player_id] and self.player_buffs[player_id][buff_name]:
                     has_buff = True
                     break
@@ -691,6 +1220,61 @@ class CombatEncounter:
 class ESOLogAnalyzer:
     """Main analyzer class for processing ESO encounter logs."""
 
+    # Built-in handler method of each event type. process_log_entry dispatches
+    # through the per-instance registry built from this (see register_handler).
+    EVENT_HANDLERS = {
+        "UNIT_ADDED": "_handle_unit_added",
+        "UNIT_CHANGED": "_handle_unit_changed",
+        "ABILITY_INFO": "_handle_ability_info",
+        "PLAYER_INFO": "_handle_player_info",
+        "ZONE_CHANGED": "_handle_zone_changed",
+        "BEGIN_CAST": "_handle_begin_cast",
+        "EFFECT_CHANGED": "_handle_effect_changed",
+        "COMBAT_EVENT": "_handle_combat_event",
+        "BEGIN_COMBAT": "_handle_begin_combat_event",
+        "END_COMBAT": "_handle_end_combat_event",
+        "BEGIN_LOG": "_handle_begin_log_event",
+        "TRIAL_INIT": "_handle_trial_init",
+        "BEGIN_TRIAL": "_handle_begin_trial",
+        "END_TRIAL": "_handle_end_trial",
+        "END_LOG": "_handle_end_log_event",
+        "HEALTH_REGEN": "_handle_health_regen",
+        "ENDLESS_DUNGEON_BEGIN": "_handle_endless_dungeon_begin",
+        "ENDLESS_DUNGEON_STAGE_END": "_handle_endless_dungeon_stage_end",
+        "ENDLESS_DUNGEON_BUFF_ADDED": "_handle_endless_dungeon_buff_added",
+        "ENDLESS_DUNGEON_BUFF_REMOVED": "_handle_endless_dungeon_buff_removed",
+    }
+
+    # Event types the log parser decodes. It skips every other line type
+    # (END_CAST, EFFECT_INFO, MAP_CHANGED, UNIT_REMOVED, ...) before tokenizing
+    # it. HEALTH_REGEN is left out because its handler is a no-op; registering
+    # another handler for an event type subscribes the parser to it.
+    SUBSCRIBED_EVENT_TYPES = [event_type for event_type in EVENT_HANDLERS if event_type != "HEALTH_REGEN"]
+
+    # Group buffs whose loss is announced live while tailing
+    LIVE_ALERT_BUFFS = ("PA", "MCourage")
+
+    # Event types process_log_entry reports in diagnostic mode
+    DIAGNOSTIC_EVENT_TYPES = frozenset([
+        "ZONE_CHANGED", "UNIT_ADDED", "UNIT_CHANGED", "BEGIN_COMBAT", "END_COMBAT", "PLAYER_INFO",
+        "COMBAT_EVENT", "EFFECT_CHANGED", "HEALTH_REGEN", "ENDLESS_DUNGEON_BEGIN", "ENDLESS_DUNGEON_STAGE_END",
+        "ENDLESS_DUNGEON_BUFF_ADDED", "ENDLESS_DUNGEON_BUFF_REMOVED",
+    ])
+
+    # The busiest event types. Their handlers are written against the typed
+    # records of eso_log_decoders, which the log parser attaches to their
+    # entries directly instead of building hand-written structured entries.
+    RECORD_EVENT_TYPES = ["BEGIN_CAST", "EFFECT_CHANGED", "COMBAT_EVENT"]
+
+    # Session state saved in checkpoints (see get_checkpoint_state). Options,
+    # handlers and the gear set database come from the resuming instance.
+    CHECKPOINT_ATTRIBUTES = (
+        "current_encounter", "symbols", "ability_cache", "current_zone", "current_difficulty", "zone_deaths",
+        "log_start_unix_timestamp", "zone_reports", "zone_start_time", "hostile_monsters", "engaged_monsters",
+        "report_buffer", "zone_history", "player_sessions", "unit_id_to_handle", "global_player_buffs",
+        "global_active_buffs", "buff_events_log", "player_buff_counts",
+    )
+
     # Trial ID to name mapping
     TRIAL_NAMES = {
         1: "Aetherian Archive",
@@ -717,8 +1301,10 @@ class ESOLogAnalyzer:
         22: "Lucent Citadel"
     }
 
-    def __init__(self, list_hostiles: bool = False, diagnostic: bool = False, save_reports: bool = False, reports_dir: Optional[Path] = None):
+    def __init__(self, list_hostiles: bool = False, diagnostic: bool = False, save_reports: bool = False, reports_dir: Optional[Path] = None,
+                 damage_breakdown: bool = False):
         self.current_encounter: Optional[CombatEncounter] = None
+        self.symbols = LogSymbols()  # Unit and ability ID symbol tables of the current log
         self.ability_cache: Dict[str, str] = {}  # ability_id -> ability_name
         self.gear_cache: Dict[str, str] = {}  # gear_item_id -> gear_set_name
         self.current_zone: Optional[str] = None  # Track current zone name
@@ -734,11 +1320,19 @@ class ESOLogAnalyzer:
         
         # Testing flag for listing hostile monsters
         self.list_hostiles = list_hostiles
-        self.hostile_monsters: List[Tuple[str, str, str]] = []  # (unit_id, name, unit_type)
+        self.hostile_monsters: deque = deque()  # (unit_id, name, unit_type)
         self.engaged_monsters: Set[str] = set()  # Track monsters that appear in combat events
         
         # Diagnostic mode for debugging data flow and timing
         self.diagnostic = diagnostic
+
+        # Track and report each player's damage per ability and per target
+        self.damage_breakdown = damage_breakdown
+
+        # Damage totals and player deaths come from these eso_log_columnar columns
+        # instead of COMBAT_EVENT lines once use_damage_columns is called (read mode)
+        self.columnar_damage = False
+        self.damage_columns = None
         
         # Report saving functionality
         self.save_reports = save_reports
@@ -748,8 +1342,25 @@ class ESOLogAnalyzer:
         # Zone history tracking for rewind functionality
         self.zone_history: List[Tuple[int, str]] = []  # (timestamp, zone_name)
         self.max_zone_history = 10  # Keep last 10 zone changes
+
+        # Caps on accumulators that would otherwise grow over a long tail session (see get_memory_usage)
+        self.max_buff_events = 10000  # buff_events_log entries (diagnostic mode)
+        self.max_buff_count_timestamps = 10000  # player_buff_counts timestamps (diagnostic mode)
+        self.max_hostile_monsters = 1000  # hostile_monsters entries (--list-hostiles)
+        self.max_zone_report_lines = 50000  # Lines a zone report collects before it is saved early
+        self.max_player_sessions = 500  # Remembered player sessions, least recently updated dropped first
+        self.max_symbols = 200000  # Interned unit and ability IDs before the next encounter starts fresh symbol tables
         
         
+        # Print when a LIVE_ALERT_BUFFS buff drops off the whole group mid-fight (set while tailing)
+        self.live_buff_alerts = False
+
+        # Print a sliding-window DPS meter during combat (set while tailing)
+        self.live_dps = False
+        self.live_dps_window = 10000  # DPS averaging window in ms
+        self.live_dps_refresh = 5000  # Log time in ms between meter lines
+        self.live_dps_top_players = 5  # Players shown per meter line
+
         # Group buff ability IDs - using constants from BuffTheGroup addon
         self.major_courage_ids = {
             BUFF_ABILITY_IDS['major_courage'],  # Major Courage - Increases Weapon and Spell Damage by 430
@@ -766,20 +1377,33 @@ class ESOLogAnalyzer:
         }
         
         # Session tracking for players going offline/online
-        self.player_sessions: Dict[str, Dict] = {}  # handle+name -> {unit_id, name, equipped_abilities, gear_data, last_seen}
+        self.player_sessions: Dict[str, Dict] = OrderedDict()  # handle+name -> {unit_id, name, equipped_abilities, gear_data, last_seen}, least recently updated first
         self.unit_id_to_handle: Dict[str, str] = {}  # unit_id -> handle
         
         # Global buff tracking for buffs applied before combat starts
-        self.global_player_buffs: Dict[str, Dict[str, List[Tuple[int, int]]]] = defaultdict(lambda: defaultdict(list))  # unit_id -> buff_name -> [(start_time, end_time)]
-        self.global_active_buffs: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))  # unit_id -> buff_name -> start_time
+        self.global_player_buffs: Dict[str, Dict[str, List[Tuple[int, int]]]] = defaultdict(partial(defaultdict, list))  # unit_id -> buff_name -> [(start_time, end_time)]
+        self.global_active_buffs: Dict[str, Dict[str, int]] = defaultdict(partial(defaultdict, int))  # unit_id -> buff_name -> start_time
         
         # Diagnostic buff tracking
-        self.buff_events_log: List[Dict] = []  # List of buff events for debugging
-        self.player_buff_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))  # timestamp -> buff_name -> count
+        self.buff_events_log: deque = deque()  # Recent buff events for debugging
+        self.player_buff_counts: Dict[str, Dict[str, int]] = defaultdict(partial(defaultdict, int))  # timestamp -> buff_name -> count
         
         # Initialize the robust log parser
         from eso_log_parser import ESOLogParser
-        self.log_parser = ESOLogParser()
+        self.log_parser = ESOLogParser(event_types=self.SUBSCRIBED_EVENT_TYPES,
+                                       record_event_types=self.RECORD_EVENT_TYPES)
+
+        # Handlers of each event type, for process_log_entry
+        self.handlers: Dict[str, List[Callable[[ESOLogEntry], None]]] = {
+            event_type: [getattr(self, method_name)] for event_type, method_name in self.EVENT_HANDLERS.items()
+        }
+
+        # Handler of each typed record, for process_record
+        self._record_handlers = {
+            BeginCastLine: self._handle_begin_cast_record,
+            EffectChangedLine: self._handle_effect_changed_record,
+            CombatEventLine: self._handle_combat_event_record,
+        }
         
         # Initialize gear set mapping database
         self._initialize_gear_database()
@@ -800,6 +1424,142 @@ class ESOLogAnalyzer:
                 # Log buff event for diagnostics
                 self._log_buff_event(unit_id, buff_name, effect_type, timestamp)
 
+    def _print_live_buff_alert(self, buff_name: str, timestamp: int):
+        """Announce a group buff going down (or back up) during a fight of 3+ players."""
+        encounter = self.current_encounter
+        if buff_name not in self.LIVE_ALERT_BUFFS or not encounter.in_combat or len(encounter.players) < 3:
+            return
+        uptime = encounter.get_live_group_buff_uptime(buff_name, timestamp)
+        fight_time = self._format_duration(max(0, timestamp - encounter.start_time) / 1000)
+        if encounter.buff_holders[buff_name]:
+            print(f"{Fore.GREEN}[{fight_time}] {buff_name} up ({uptime:.1f}% so far){Style.RESET_ALL}")
+        else:
+            print(f"{Fore.RED}[{fight_time}] {buff_name} DOWN ({uptime:.1f}% so far){Style.RESET_ALL}")
+
+    def _prune_global_buff_history(self, timestamp: int):
+        """Drop completed global buff periods that do not overlap timestamp (the start of the current pull)."""
+        for unit_id in list(self.global_player_buffs):
+            unit_buffs = self.global_player_buffs[unit_id]
+            for buff_name in list(unit_buffs):
+                buff_periods = [period for period in unit_buffs[buff_name] if period[0] <= timestamp < period[1]]
+                if buff_periods:
+                    unit_buffs[buff_name] = buff_periods
+                else:
+                    del unit_buffs[buff_name]
+            if not unit_buffs:
+                del self.global_player_buffs[unit_id]
+
+    def _prune_for_new_zone(self, timestamp: int):
+        """Prune accumulators whose contents only matter within a zone, at the ZONE_CHANGED at timestamp."""
+        self.buff_events_log.clear()
+        self.player_buff_counts.clear()
+        self.hostile_monsters.clear()
+        self.engaged_monsters.clear()
+        self._prune_global_buff_history(timestamp)
+        for unit_id in [unit_id for unit_id, active_buffs in self.global_active_buffs.items() if not active_buffs]:
+            del self.global_active_buffs[unit_id]
+
+        if self.diagnostic:
+            self._print_memory_usage()
+
+    def get_memory_usage(self) -> Dict[str, int]:
+        """Approximate memory use in bytes of each long-lived accumulator."""
+        structures = {
+            'buff_events_log': self.buff_events_log,
+            'player_buff_counts': self.player_buff_counts,
+            'global_player_buffs': self.global_player_buffs,
+            'global_active_buffs': self.global_active_buffs,
+            'hostile_monsters': self.hostile_monsters,
+            'engaged_monsters': self.engaged_monsters,
+            'zone_reports': self.zone_reports,
+            'player_sessions': self.player_sessions,
+            'unit_id_to_handle': self.unit_id_to_handle,
+            'ability_cache': self.ability_cache,
+            'gear_cache': self.gear_cache,
+            'symbols': (self.symbols.units.codes, self.symbols.units.symbols,
+                        self.symbols.abilities.codes, self.symbols.abilities.symbols),
+        }
+        return {name: _deep_getsizeof(structure) for name, structure in structures.items()}
+
+    def _new_encounter(self) -> CombatEncounter:
+        """
+        Create an encounter sharing the log's symbol tables.
+
+        Once the tables hold more than max_symbols IDs the new encounter starts
+        fresh ones; earlier encounters keep the tables their codes refer to.
+        """
+        if len(self.symbols.units) + len(self.symbols.abilities) > self.max_symbols:
+            self.symbols = LogSymbols()
+        return CombatEncounter(self.symbols, self.damage_breakdown)
+
+    def get_checkpoint_state(self) -> Dict[str, object]:
+        """The session state to save in a checkpoint (see eso_checkpoint), by attribute name."""
+        return {name: getattr(self, name) for name in self.CHECKPOINT_ATTRIBUTES}
+
+    def get_checkpoint_columns(self) -> Dict[str, Sequence]:
+        """
+        The append-only sequences inside the checkpoint state, by name.
+
+        Checkpoints only save what was appended to them since the last save
+        (see eso_checkpoint): the current encounter's damage ledger and the
+        report lines of each zone, which grow for as long as the session runs.
+        """
+        columns: Dict[str, Sequence] = {f"zone_reports.{zone}": lines for zone, lines in self.zone_reports.items()}
+        if self.current_encounter:
+            ledger = self.current_encounter.damage_ledger
+            for name in DamageLedger.__slots__:
+                columns[f"damage_ledger.{name}"] = getattr(ledger, name)
+        return columns
+
+    def restore_checkpoint_state(self, state: Dict[str, object]):
+        """Continue the session of a checkpoint saved by get_checkpoint_state."""
+        for name in self.CHECKPOINT_ATTRIBUTES:
+            if name in state:
+                setattr(self, name, state[name])
+        self.log_parser.ability_cache.update(self.ability_cache)
+
+    def _print_memory_usage(self):
+        """Print the memory use of each long-lived accumulator (diagnostic mode)."""
+        timestamp_str = time.strftime("%H:%M:%S", time.localtime())
+        usage = self.get_memory_usage()
+        details = ", ".join(f"{name}: {size / 1024:.1f} KB" for name, size in usage.items())
+        print(f"{Fore.CYAN}[{timestamp_str}] DIAGNOSTIC: Memory use {sum(usage.values()) / 1024:.1f} KB ({details}){Style.RESET_ALL}")
+
+    def _update_live_dps(self, encounter: CombatEncounter, timestamp: int, player: int, target: int, amount: int):
+        """
+        Add a hit (by player and target unit code, player -1 if unknown) to the live DPS meter
+        and print the meter every live_dps_refresh ms of combat.
+        """
+        meter = encounter.dps_meter
+        if meter is None:
+            meter = encounter.dps_meter = SlidingDpsMeter(self.live_dps_window, encounter.start_time)
+        meter.add(timestamp, player, target, amount)
+        if timestamp - meter.last_report < self.live_dps_refresh:
+            return
+        meter.last_report = timestamp
+        meter.expire(timestamp)
+
+        start_time = encounter.start_time
+        units = encounter.symbols.units
+        parts = [f"DPS {meter.dps(timestamp, start_time):,.0f}"]
+        player_dps = [(meter.dps(timestamp, start_time, player=unit), unit) for unit in meter.players]
+        player_dps.sort(reverse=True)
+        for dps, unit in player_dps[:self.live_dps_top_players]:
+            player_info = encounter.players.get(unit)
+            parts.append(f"{player_info.name if player_info else units.symbol(unit)}: {dps:,.0f}")
+
+        # Time to kill the primary hostile at the damage rate it is taking now
+        primary = encounter.highest_health_hostile
+        primary_unit = units.code(primary.unit_id) if primary else None
+        if primary_unit is not None and primary.current_health > 0:
+            target_dps = meter.dps(timestamp, start_time, target=primary_unit)
+            if target_dps > 0:
+                health_pct = primary.current_health * 100.0 / primary.max_health if primary.max_health else 0.0
+                parts.append(f"{primary.name} {health_pct:.0f}% TTK {self._format_duration(primary.current_health / target_dps)}")
+
+        fight_time = self._format_duration(max(0, timestamp - start_time) / 1000)
+        print(f"{Fore.MAGENTA}[{fight_time}] {' | '.join(parts)}{Style.RESET_ALL}")
+
     def _log_buff_event(self, unit_id: str, buff_name: str, effect_type: str, timestamp: int):
         """Log buff events for diagnostic purposes."""
         if not self.diagnostic:
@@ -807,8 +1567,8 @@ class ESOLogAnalyzer:
             
         # Get player name if available
         player_name = "Unknown"
-        if self.current_encounter and unit_id in self.current_encounter.players:
-            player_name = self.current_encounter.players[unit_id].name
+        if self.current_encounter and self.current_encounter.has_player(unit_id):
+            player_name = self.current_encounter.get_player(unit_id).name
         elif unit_id in self.player_sessions:
             player_name = self.player_sessions[unit_id].get('name', 'Unknown')
         
@@ -830,6 +1590,8 @@ class ESOLogAnalyzer:
             'encounter_active': self.current_encounter.in_combat if self.current_encounter else False
         }
         self.buff_events_log.append(event)
+        while len(self.buff_events_log) > self.max_buff_events:
+            self.buff_events_log.popleft()
         
         # Update player count tracking
         timestamp_str = str(timestamp)
@@ -837,6 +1599,8 @@ class ESOLogAnalyzer:
             self.player_buff_counts[timestamp_str][buff_name] = active_count
         elif effect_type == "FADED":
             self.player_buff_counts[timestamp_str][buff_name] = active_count
+        while len(self.player_buff_counts) > self.max_buff_count_timestamps:
+            del self.player_buff_counts[next(iter(self.player_buff_counts))]
         
         # Print diagnostic output
         import time
@@ -934,33 +1698,18 @@ class ESOLogAnalyzer:
         self.current_zone = last_zone
         
         # Create a new encounter for this zone
-        self.current_encounter = CombatEncounter()
+        self.current_encounter = self._new_encounter()
         self.current_encounter.start_time = last_timestamp
         
         return True
 
-    def _process_log_file_from_position(self, log_file: Path, start_position: int = 0, end_position: Optional[int] = None) -> List[ESOLogEntry]:
-        """Process a portion of the log file to find zone changes and combat events."""
-        entries = []
-        
+    def _process_log_file_from_position(self, log_file: Path, start_position: int = 0, end_position: Optional[int] = None) -> Iterator[ESOLogEntry]:
+        """Stream the entries of a portion of the log file to find zone changes and combat events."""
         try:
-            with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                if start_position > 0:
-                    f.seek(start_position)
-                
-                for line in f:
-                    if end_position and f.tell() > end_position:
-                        break
-                        
-                    line = line.strip()
-                    if line:
-                        entry = self.log_parser.parse_line(line)
-                        if entry:
-                            entries.append(entry)
+            for _, entry, _ in iter_entries(log_file, start_position, end_position or None, parser=self.log_parser):
+                yield entry
         except (IOError, UnicodeDecodeError) as e:
             print(f"{Fore.RED}Error reading log file for rewind: {e}{Style.RESET_ALL}")
-        
-        return entries
 
     def _initialize_gear_database(self):
         """Initialize gear item ID to gear set name mapping."""
@@ -1050,50 +1799,83 @@ class ESOLogAnalyzer:
         # Check grace period before processing any events
         # Grace period logic removed - encounters are finalized immediately on END_COMBAT
         
-        if self.diagnostic and entry.event_type in ["ZONE_CHANGED", "UNIT_ADDED", "UNIT_CHANGED", "BEGIN_COMBAT", "END_COMBAT", "PLAYER_INFO", "COMBAT_EVENT", "EFFECT_CHANGED", "HEALTH_REGEN", "ENDLESS_DUNGEON_BEGIN", "ENDLESS_DUNGEON_STAGE_END", "ENDLESS_DUNGEON_BUFF_ADDED", "ENDLESS_DUNGEON_BUFF_REMOVED"]:
+        if self.diagnostic and entry.event_type in self.DIAGNOSTIC_EVENT_TYPES:
             timestamp_str = time.strftime("%H:%M:%S", time.localtime())
             print(f"{Fore.CYAN}[{timestamp_str}] DIAGNOSTIC: Processing {entry.event_type} at {entry.timestamp}{Style.RESET_ALL}")
-        
-        if entry.event_type == "UNIT_ADDED":
-            self._handle_unit_added(entry)
-        elif entry.event_type == "UNIT_CHANGED":
-            self._handle_unit_changed(entry)
-        elif entry.event_type == "ABILITY_INFO":
-            self._handle_ability_info(entry)
-        elif entry.event_type == "PLAYER_INFO":
-            self._handle_player_info(entry)
-        elif entry.event_type == "ZONE_CHANGED":
-            self._handle_zone_changed(entry)
-        elif entry.event_type == "BEGIN_CAST":
-            self._handle_begin_cast(entry)
-        elif entry.event_type == "EFFECT_CHANGED":
-            self._handle_effect_changed(entry)
-        elif entry.event_type == "COMBAT_EVENT":
-            self._handle_combat_event(entry)
-        elif entry.event_type == "BEGIN_COMBAT":
-            self._handle_begin_combat_event(entry)
-        elif entry.event_type == "END_COMBAT":
-            self._handle_end_combat_event(entry)
-        elif entry.event_type == "BEGIN_LOG":
-            self._handle_begin_log_event(entry)
-        elif entry.event_type == "TRIAL_INIT":
-            self._handle_trial_init(entry)
-        elif entry.event_type == "BEGIN_TRIAL":
-            self._handle_begin_trial(entry)
-        elif entry.event_type == "END_TRIAL":
-            self._handle_end_trial(entry)
-        elif entry.event_type == "END_LOG":
-            self._handle_end_log_event(entry)
-        elif entry.event_type == "HEALTH_REGEN":
-            self._handle_health_regen(entry)
-        elif entry.event_type == "ENDLESS_DUNGEON_BEGIN":
-            self._handle_endless_dungeon_begin(entry)
-        elif entry.event_type == "ENDLESS_DUNGEON_STAGE_END":
-            self._handle_endless_dungeon_stage_end(entry)
-        elif entry.event_type == "ENDLESS_DUNGEON_BUFF_ADDED":
-            self._handle_endless_dungeon_buff_added(entry)
-        elif entry.event_type == "ENDLESS_DUNGEON_BUFF_REMOVED":
-            self._handle_endless_dungeon_buff_removed(entry)
+
+        handlers = self.handlers.get(entry.event_type)
+        if handlers:
+            for handler in handlers:
+                handler(entry)
+
+    def register_handler(self, event_type: str, handler: Callable[[ESOLogEntry], None]):
+        """
+        Call handler with every entry of event_type, after the handlers already registered.
+
+        The log parser is subscribed to event_type if it was not already. Entries
+        of RECORD_EVENT_TYPES carry their eso_log_decoders record; use
+        self.log_parser.decode_record(entry) to get it.
+        """
+        self.handlers.setdefault(event_type, []).append(handler)
+        self.log_parser.subscribe(event_type)
+
+    def unregister_handler(self, event_type: str, handler: Callable[[ESOLogEntry], None]):
+        """
+        Stop calling a handler added with register_handler.
+
+        Once only the built-in handler (if any) of an event type outside
+        SUBSCRIBED_EVENT_TYPES is left, the log parser stops parsing it again.
+        """
+        handlers = self.handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            method_name = self.EVENT_HANDLERS.get(event_type)
+            built_in = [getattr(self, method_name)] if method_name else []
+            if event_type not in self.SUBSCRIBED_EVENT_TYPES and handlers in ([], built_in):
+                self.log_parser.unsubscribe(event_type)
+
+    def use_damage_columns(self, damage_columns):
+        """
+        Take damage totals and player deaths from the log's damage columns (see eso_log_columnar.load_damage_columns).
+
+        The log parser stops parsing COMBAT_EVENT lines. When an encounter is
+        shown, its total_damage, player_damage, enemy_damage and player deaths
+        are computed from the rows in its time range, with the players, pets
+        and hostile enemies known by then; enemy health is taken from the last
+        hit each enemy took. Per-hit views (the damage ledger and breakdown,
+        live DPS, the first damage dealer) are not tracked.
+        """
+        self.columnar_damage = True
+        self.damage_columns = damage_columns
+        self.log_parser.unsubscribe("COMBAT_EVENT")
+
+    def _apply_damage_columns(self, encounter: CombatEncounter):
+        """Fill an encounter's enemy health and damage totals and add its player deaths to the zone's from the damage columns."""
+        from eso_log_columnar import (encounter_damage_totals, encounter_enemy_health, encounter_killed_hostiles,
+                                      encounter_player_deaths)
+        for unit_id, (health, max_health) in encounter_enemy_health(self.damage_columns, encounter).items():
+            encounter.update_enemy_health(unit_id, health, max_health)
+        total_damage, player_damage, enemy_damage = encounter_damage_totals(self.damage_columns, encounter)
+        # Killed hostiles count as damaged even without tracked hits, as in _handle_combat_event_record
+        for unit_id in encounter_killed_hostiles(self.damage_columns, encounter):
+            enemy_damage.setdefault(unit_id, 1)
+        encounter.set_damage_totals(total_damage, player_damage, enemy_damage)
+        # An encounter shown again only adds the deaths not counted before
+        deaths = encounter_player_deaths(self.damage_columns, encounter)
+        self.zone_deaths += deaths - encounter.player_deaths
+        encounter.player_deaths = deaths
+
+    def process_record(self, record) -> bool:
+        """
+        Process a typed record from eso_log_decoders (see RECORD_EVENT_TYPES).
+
+        Returns False if there is no record handler for the record's type.
+        """
+        handler = self._record_handlers.get(type(record))
+        if handler is None:
+            return False
+        handler(record)
+        return True
 
     def _check_pending_encounter_display(self):
         """Check if we have an encounter that ended but hasn't been displayed yet."""
@@ -1135,7 +1917,7 @@ class ESOLogAnalyzer:
 
                 # Create encounter if it doesn't exist (UNIT_ADDED can happen before ZONE_CHANGED)
                 if not self.current_encounter:
-                    self.current_encounter = CombatEncounter()
+                    self.current_encounter = self._new_encounter()
                     self.current_encounter.start_time = entry.timestamp
                     if self.diagnostic:
                         timestamp_str = time.strftime("%H:%M:%S", time.localtime())
@@ -1202,7 +1984,13 @@ class ESOLogAnalyzer:
                         
                         # Track hostile monsters for testing flag
                         if self.list_hostiles:
-                            self.hostile_monsters.append((unit_id, clean_name, unit_type))
+                            self._add_hostile_monster(unit_id, clean_name, unit_type)
+
+    def _add_hostile_monster(self, unit_id: str, name: str, unit_type: str):
+        """Remember a hostile monster for --list-hostiles, dropping the oldest beyond max_hostile_monsters."""
+        self.hostile_monsters.append((unit_id, name, unit_type))
+        while len(self.hostile_monsters) > self.max_hostile_monsters:
+            self.hostile_monsters.popleft()
 
     def _handle_unit_changed(self, entry: ESOLogEntry):
         """Handle UNIT_CHANGED events to track when monsters become hostile."""
@@ -1229,7 +2017,7 @@ class ESOLogAnalyzer:
                 
                 # Track hostile monsters for testing flag
                 if self.list_hostiles:
-                    self.hostile_monsters.append((unit_id, clean_name, enemy.unit_type))
+                    self._add_hostile_monster(unit_id, clean_name, enemy.unit_type)
 
     def _handle_ability_info(self, entry: ESOLogEntry):
         """Handle ABILITY_INFO events to cache ability names and gear sets."""
@@ -1279,8 +2067,8 @@ class ESOLogAnalyzer:
             back_bar_abilities = self.log_parser.get_back_bar_abilities(player_info)
             
             # Find the player and set their equipped abilities and gear
-            if self.current_encounter and player_info.unit_id in self.current_encounter.players:
-                player = self.current_encounter.players[player_info.unit_id]
+            if self.current_encounter and self.current_encounter.has_player(player_info.unit_id):
+                player = self.current_encounter.get_player(player_info.unit_id)
                 if self.diagnostic:
                     print(f"{Fore.MAGENTA}[DIAGNOSTIC] Found player {player.name} in current encounter, setting abilities{Style.RESET_ALL}")
                 player.set_equipped_abilities(equipped_ability_names)
@@ -1299,8 +2087,8 @@ class ESOLogAnalyzer:
             player_handle = ""
             player_class_id = None
             
-            if self.current_encounter and player_info.unit_id in self.current_encounter.players:
-                player = self.current_encounter.players[player_info.unit_id]
+            if self.current_encounter and self.current_encounter.has_player(player_info.unit_id):
+                player = self.current_encounter.get_player(player_info.unit_id)
                 player_name = player.name
                 player_handle = player.handle
                 player_class_id = player.class_id
@@ -1365,12 +2153,15 @@ class ESOLogAnalyzer:
             
             # Clean up offline players
             self._cleanup_offline_players()
+
+            # Drop what only the previous zone's encounters needed
+            self._prune_for_new_zone(entry.timestamp)
             
             # Reset death counter for new zone
             self.zone_deaths = 0
             
             # Reset all tracking - create new encounter for this zone
-            self.current_encounter = CombatEncounter()
+            self.current_encounter = self._new_encounter()
             self.current_encounter.start_time = entry.timestamp
             
             if self.diagnostic:
@@ -1401,18 +2192,18 @@ class ESOLogAnalyzer:
         # Create a new encounter if we don't have one or if the previous one was finalized
         if not self.current_encounter or self.current_encounter.finalized:
             # Create new encounter but preserve players and enemies from previous encounter in same zone
-            old_players = {}
+            old_players = []
             old_enemies = {}
             if self.current_encounter:
                 if self.current_encounter.players:
-                    old_players = self.current_encounter.players.copy()
+                    old_players = list(self.current_encounter.players.values())
                 if self.current_encounter.enemies:
                     old_enemies = self.current_encounter.enemies.copy()
             
-            self.current_encounter = CombatEncounter()
+            self.current_encounter = self._new_encounter()
 
             # Restore players and enemies from previous encounter (they persist across combats in same zone)
-            self.current_encounter.players = old_players
+            self.current_encounter.set_players(old_players)
             self.current_encounter.enemies = old_enemies
 
             # Reset resource tracking for all players for the new encounter
@@ -1424,15 +2215,21 @@ class ESOLogAnalyzer:
         self.current_encounter.start_time = entry.timestamp
         
         # Transfer any globally tracked buffs that are active when combat starts
-        for player_id in self.current_encounter.players.keys():
-            # Transfer completed buff periods from global tracking
-            for buff_name, buff_periods in self.global_player_buffs[player_id].items():
-                self.current_encounter.player_buffs[player_id][buff_name].extend(buff_periods)
+        combat_start = self.current_encounter.start_time
+        for player in self.current_encounter.players.values():
+            player_id = player.unit_id
+            # Transfer completed buff periods that reach into this pull, clipped to its start
+            for buff_name, buff_periods in self.global_player_buffs.get(player_id, {}).items():
+                for start_time, end_time in buff_periods:
+                    if start_time <= combat_start < end_time:
+                        self.current_encounter.player_buffs[player_id][buff_name].append((combat_start, end_time))
             
             # Transfer currently active buffs from global tracking
-            for buff_name, start_time in self.global_active_buffs[player_id].items():
+            for buff_name, start_time in self.global_active_buffs.get(player_id, {}).items():
                 if buff_name not in self.current_encounter.active_buffs[player_id]:
                     self.current_encounter.active_buffs[player_id][buff_name] = start_time
+        self.current_encounter.start_buff_coverage()
+        self._prune_global_buff_history(combat_start)
         
         if self.diagnostic:
             timestamp_str = time.strftime("%H:%M:%S", time.localtime())
@@ -1486,6 +2283,8 @@ class ESOLogAnalyzer:
         # Note: The timestamp in the log is in milliseconds, convert to seconds for Unix timestamp
         if entry.timestamp > 0:
             self.log_start_unix_timestamp = entry.timestamp // 1000  # Convert milliseconds to seconds
+        # IDs are only meaningful within one log; encounters already started keep their table
+        self.symbols = LogSymbols()
 
     def _handle_trial_init(self, entry: ESOLogEntry):
         """Handle TRIAL_INIT events to track trial initialization."""
@@ -1566,38 +2365,36 @@ class ESOLogAnalyzer:
             print(f"{Fore.CYAN}[{timestamp_str}] DIAGNOSTIC: END_LOG detected, saving final zone report{Style.RESET_ALL}")
 
     def _handle_begin_cast(self, entry: ESOLogEntry):
-        """Handle BEGIN_CAST events."""
+        """Handle BEGIN_CAST events (legacy entry adapter for _handle_begin_cast_record)."""
+        cast = self.log_parser.decode_record(entry)
+        if cast:
+            self._handle_begin_cast_record(cast)
+
+    def _handle_begin_cast_record(self, cast: BeginCastLine):
+        """Handle a decoded BEGIN_CAST line."""
         if not self.current_encounter:
-            self.current_encounter = CombatEncounter()
+            self.current_encounter = self._new_encounter()
 
         # Only set combat start time if we're not already in combat and not finalized
         # This prevents BEGIN_CAST from overriding BEGIN_COMBAT timestamps or finalized encounters
         if not self.current_encounter.in_combat and not self.current_encounter.finalized:
             self.current_encounter.in_combat = True
-            self.current_encounter.start_time = entry.timestamp
+            self.current_encounter.start_time = cast.line_number
 
-        # BEGIN_CAST format: durationMS, channeled, castTrackId, abilityId, <sourceUnitState>, <targetUnitState>
-        # sourceUnitState: unitId, health/max, magicka/max, stamina/max, ultimate/max, werewolf/max, shield, x, y, heading
-        if len(entry.fields) >= 7:
-            ability_id = entry.fields[3]  # abilityId
-            caster_unit_id = entry.fields[4]  # sourceUnitState.unitId
-            
-            if self.diagnostic and caster_unit_id == "31":
-                print(f"{Fore.MAGENTA}[DIAGNOSTIC] BEGIN_CAST for unit_id 31: {entry.fields[5:8] if len(entry.fields) >= 8 else 'insufficient fields'}{Style.RESET_ALL}")
+        caster = cast.source_unit_state
+        caster_unit_id = str(caster.unit_id)
 
-            if ability_id in self.ability_cache:
-                ability_name = self.ability_cache[ability_id]
-                self.current_encounter.add_ability_use(caster_unit_id, ability_name)
+        if self.diagnostic and caster_unit_id == "31":
+            print(f"{Fore.MAGENTA}[DIAGNOSTIC] BEGIN_CAST for unit_id 31: {caster!r}{Style.RESET_ALL}")
 
-            # Parse resource information: health/max, magicka/max, stamina/max in fields 5, 6, 7
-            if len(entry.fields) >= 8:
-                self._parse_and_update_player_resources(caster_unit_id, entry.fields[5:8])
-                # Also update enemy health if the caster is an enemy
-                self._parse_and_update_enemy_health(caster_unit_id, entry.fields[5:8])
+        self.current_encounter.add_ability_use(caster_unit_id, str(cast.ability_id))
 
+        self._update_player_resources(caster_unit_id, caster)
+        # Also update enemy health if the caster is an enemy
+        self._update_enemy_max_health(caster_unit_id, caster)
 
-    def _parse_and_update_enemy_health(self, unit_id: str, resource_fields: List[str]):
-        """Parse health information and update the corresponding enemy's maximum health."""
+    def _update_enemy_max_health(self, unit_id: str, unit_state: UnitState):
+        """Raise an enemy's maximum health to the one in a unit state, if it is higher."""
         if not self.current_encounter:
             return
 
@@ -1606,22 +2403,19 @@ class ESOLogAnalyzer:
         if not enemy:
             return
 
-        # Parse health field: "current/max" - we want the max (second number)
         try:
-            if len(resource_fields) >= 1 and "/" in resource_fields[0]:
-                current_health, max_health = resource_fields[0].split("/")
-                max_health = int(max_health)
-                if max_health > 0 and max_health > enemy.max_health:
-                    enemy.max_health = max_health
-                    enemy.current_health = int(current_health)
-                    # Update highest health hostile if this enemy is hostile
-                    if enemy.is_hostile:
-                        self.current_encounter.update_highest_health_hostile(enemy)
-        except (ValueError, IndexError):
+            max_health = unit_state.health_max
+            if max_health > 0 and max_health > enemy.max_health:
+                enemy.max_health = max_health
+                enemy.current_health = unit_state.health
+                # Update highest health hostile if this enemy is hostile
+                if enemy.is_hostile:
+                    self.current_encounter.update_highest_health_hostile(enemy)
+        except ValueError:
             pass  # Skip invalid health data
 
-    def _parse_and_update_player_resources(self, unit_id: str, resource_fields: List[str]):
-        """Parse resource information and update the corresponding player's maximum values."""
+    def _update_player_resources(self, unit_id: str, unit_state: UnitState):
+        """Update a player's maximum health, magicka and stamina from a unit state."""
         if not self.current_encounter:
             return
 
@@ -1631,308 +2425,186 @@ class ESOLogAnalyzer:
         if not player:
             return
 
-        # Parse resource fields: [health_current/health_max, magicka_current/magicka_max, stamina_current/stamina_max]
         try:
-            if len(resource_fields) >= 1 and "/" in resource_fields[0]:
-                # Health format: "current/max" - we want the max (second number)
-                current_health, max_health = resource_fields[0].split("/")
-                max_health = int(max_health)
-                player.update_resources(health=max_health)
-
-            if len(resource_fields) >= 2 and "/" in resource_fields[1]:
-                # Magicka format: "current/max" - we want the max (second number)
-                current_magicka, max_magicka = resource_fields[1].split("/")
-                max_magicka = int(max_magicka)
-                # Only update if max is not 0 (0/0 means empty resource, not max=0)
-                if max_magicka > 0:
-                    player.update_resources(magicka=max_magicka)
-
-            if len(resource_fields) >= 3 and "/" in resource_fields[2]:
-                # Stamina format: "current/max" - we want the max (second number)
-                current_stamina, max_stamina = resource_fields[2].split("/")
-                max_stamina = int(max_stamina)
-                # Only update if max is not 0 (0/0 means empty resource, not max=0)
-                if max_stamina > 0:
-                    player.update_resources(stamina=max_stamina)
-
-        except (ValueError, IndexError):
+            player.update_resources(health=unit_state.health_max)
+
+            # Only update magicka and stamina if max is not 0 (0/0 means empty resource, not max=0)
+            max_magicka = unit_state.magicka_max
+            if max_magicka > 0:
+                player.update_resources(magicka=max_magicka)
+
+            max_stamina = unit_state.stamina_max
+            if max_stamina > 0:
+                player.update_resources(stamina=max_stamina)
+
+        except ValueError:
             pass  # Skip invalid resource data
 
     def _handle_combat_event(self, entry: ESOLogEntry):
-        """Handle COMBAT_EVENT events."""
-        
+        """Handle COMBAT_EVENT events (legacy entry adapter for _handle_combat_event_record)."""
+        event = self.log_parser.decode_record(entry)
+        if event:
+            self._handle_combat_event_record(event)
+
+    def _handle_combat_event_record(self, event: CombatEventLine):
+        """Handle a decoded COMBAT_EVENT line."""
+
         # Check if we need to rewind to a previous zone
         if not self.current_zone and self.zone_history:
             self._rewind_to_last_zone()
-        
+
         if not self.current_encounter:
-            self.current_encounter = CombatEncounter()
-            self.current_encounter.start_time = entry.timestamp
+            self.current_encounter = self._new_encounter()
+            self.current_encounter.start_time = event.line_number
 
         if not self.current_encounter.in_combat:
             self.current_encounter.in_combat = True
-            self.current_encounter.start_time = entry.timestamp
-
-        # Track damage events for DPS calculation (only friendly damage)
-        # COMBAT_EVENT format: timestamp,COMBAT_EVENT,event_type,damage_type,source_unit_id,damage_value,...
-        if len(entry.fields) >= 4:
-            combat_event_type = entry.fields[0]  # DAMAGE/CRITICAL_DAMAGE is at index 0
-            
-            if self.diagnostic and len(entry.fields) >= 10:
-                unit_id = entry.fields[0]
-                if unit_id == "31":
-                    print(f"{Fore.MAGENTA}[DIAGNOSTIC] COMBAT_EVENT for unit_id 31: {entry.fields[9:12] if len(entry.fields) >= 12 else 'insufficient fields'}{Style.RESET_ALL}")
-            
-            # Track any monster that appears in combat events as "engaged"
-            if self.list_hostiles and self.current_encounter:
-                # COMBAT_EVENT format: timestamp,COMBAT_EVENT,actionResult,damageType,powerType,hitValue,overflow,castTrackId,abilityId,sourceUnitState,targetUnitState
-                # After parsing: fields[0]=actionResult, fields[1]=damageType, ..., fields[8]=sourceUnitId, fields[17]=targetUnitId
-                if combat_event_type in ['DAMAGE', 'CRITICAL_DAMAGE']:
-                    if len(entry.fields) > 17:
-                        source_unit_id = entry.fields[7]  # Source unit (dealing damage)
-                        target_unit_id = entry.fields[17]  # Target unit (receiving damage)
-                        
-                        # Track when players damage hostile monsters
-                        if (target_unit_id and target_unit_id in self.current_encounter.enemies):
-                            enemy = self.current_encounter.enemies[target_unit_id]
-                            if enemy.is_hostile:
-                                # Check if source is a player or player's pet
-                                if (self.current_encounter.find_player_by_unit_id(source_unit_id) or 
-                                    source_unit_id in self.current_encounter.pet_ownership):
-                                    self.engaged_monsters.add(target_unit_id)
-            
-            if combat_event_type in ['DAMAGE', 'CRITICAL_DAMAGE']:
-                pass  # Damage events are handled in the elif block below
-            
-            # Track death events
-            if combat_event_type == 'DIED_XP':
-                # Check if it's a player death by looking up the dying unit ID in known players
-                # DIED_XP format: timestamp,COMBAT_EVENT,DIED_XP,damageType,powerType,hitValue,overflow,castTrackId,abilityId,sourceUnitState,targetUnitState
-                # After parsing: fields[0]=DIED_XP, fields[1]=damageType, ..., fields[7]=sourceUnitId, fields[17]=dyingUnitId
-                dying_unit_id = entry.fields[17] if len(entry.fields) > 17 else ""
-                if (self.current_encounter and 
-                    self.current_encounter.find_player_by_unit_id(dying_unit_id)):
-                    self.zone_deaths += 1
-                
-                # If it's a hostile enemy death, mark it as damaged by players
-                elif (self.current_encounter and 
-                      dying_unit_id in self.current_encounter.enemies):
-                    enemy = self.current_encounter.enemies[dying_unit_id]
-                    # Only track deaths of hostile monsters, not friendly pets or NPCs
-                    if enemy.is_hostile:
-                        # Mark this enemy as damaged (even if we didn't track individual damage events)
-                        if dying_unit_id not in self.current_encounter.enemy_damage:
-                            self.current_encounter.enemy_damage[dying_unit_id] = 0
-                            # Add enemy's max health to total when first damaged
-                            if enemy.max_health > 0:
-                                self.current_encounter.total_health_damaged += enemy.max_health
-                        # Set a minimum damage amount to indicate it was killed
-                        if self.current_encounter.enemy_damage[dying_unit_id] == 0:
-                            self.current_encounter.enemy_damage[dying_unit_id] = 1
-                        # Update the most damaged hostile monster
-                        self.current_encounter.update_most_damaged_hostile(dying_unit_id)
-            
-            
-            # Track damage events
-            elif combat_event_type in ['DAMAGE', 'CRITICAL_DAMAGE']:
+            self.current_encounter.start_time = event.line_number
+
+        encounter = self.current_encounter
+        action_result = event.action_result
+        source_unit_id = str(event.source_unit_state.unit_id)
+        # A target of * (same as source) is decoded as the source's unit state
+        target_unit_id = str(event.target_unit_state.unit_id)
+
+        # Track any monster that appears in combat events as "engaged"
+        if self.list_hostiles and action_result in ('DAMAGE', 'CRITICAL_DAMAGE'):
+            enemy = encounter.enemies.get(target_unit_id)
+            # Track when players (or their pets) damage hostile monsters
+            if enemy and enemy.is_hostile:
+                if (encounter.find_unit_owner(source_unit_id) or
+                        encounter.is_pet(source_unit_id)):
+                    self.engaged_monsters.add(target_unit_id)
+
+        # Track death events
+        if action_result == 'DIED_XP':
+            # Check if it's a player death by looking up the dying (target) unit in known players
+            dying_unit_id = target_unit_id
+            if encounter.find_player_by_unit_id(dying_unit_id):
+                self.zone_deaths += 1
+
+            # If it's a hostile enemy death, mark it as damaged by players
+            elif dying_unit_id in encounter.enemies:
+                enemy = encounter.enemies[dying_unit_id]
+                # Only track deaths of hostile monsters, not friendly pets or NPCs
+                if enemy.is_hostile:
+                    # Mark this enemy as damaged (even if we didn't track individual damage events)
+                    if encounter.add_enemy_damage(dying_unit_id, 0):
+                        # Add enemy's max health to total when first damaged
+                        if enemy.max_health > 0:
+                            encounter.total_health_damaged += enemy.max_health
+                    # Set a minimum damage amount to indicate it was killed
+                    if encounter.get_damage_taken(dying_unit_id) == 0:
+                        encounter.add_enemy_damage(dying_unit_id, 1)
+                    # Update the most damaged hostile monster
+                    encounter.update_most_damaged_hostile(dying_unit_id)
+
+        # Track damage dealt by players to hostile monsters
+        elif action_result in ('DAMAGE', 'CRITICAL_DAMAGE'):
+            hit_value = event.hit_value
+            enemy = encounter.enemies.get(target_unit_id)
+            if hit_value > 0 and enemy and enemy.is_hostile:
+                # Check if source is a player or player's pet (the owner of a pet)
+                owner = encounter.find_unit_owner(source_unit_id)
+                if owner or encounter.is_pet(source_unit_id):
+
+                    # Track first damage dealer
+                    if encounter.first_damage_dealer is None:
+                        if owner:
+                            encounter.first_damage_dealer = owner.unit_id
+                        encounter.first_damage_timestamp = event.line_number
+
+                    if encounter.add_enemy_damage(target_unit_id, hit_value):
+                        # Add enemy's max health to total when first damaged
+                        if enemy.max_health > 0:
+                            encounter.total_health_damaged += enemy.max_health
+                    # Update total group damage
+                    encounter.total_damage += hit_value
+
+                    # Track individual player damage
+                    ability_id = str(event.ability_id)
+                    encounter.add_damage_to_player(source_unit_id, hit_value, target_unit_id, ability_id)
+                    encounter.record_damage(event.line_number, source_unit_id, owner, target_unit_id,
+                                            ability_id, hit_value)
+                    if self.live_dps:
+                        # The unit codes the hit was just recorded under
+                        ledger = encounter.damage_ledger
+                        self._update_live_dps(encounter, event.line_number, ledger.player[-1], ledger.target[-1],
+                                              hit_value)
+
+                    # Update the most damaged hostile monster
+                    encounter.update_most_damaged_hostile(target_unit_id)
+
+        # Update the health of known enemies from the source and target unit states
+        for unit_id, unit_state in ((source_unit_id, event.source_unit_state),
+                                    (target_unit_id, event.target_unit_state)):
+            if unit_id in encounter.enemies:
                 try:
-                    # COMBAT_EVENT format: timestamp,COMBAT_EVENT,actionResult,damageType,powerType,hitValue,overflow,castTrackId,abilityId,sourceUnitState,targetUnitState
-                    # After parsing: fields[0]=actionResult, fields[1]=damageType, fields[3]=hitValue, fields[7]=sourceUnitId, fields[17]=targetUnitId
-                    hit_value = int(entry.fields[3])  # hitValue is at index 3
-                    source_unit_id = entry.fields[7] if len(entry.fields) > 7 else ""  # source unit ID
-                    target_unit_id = entry.fields[17] if len(entry.fields) > 17 else ""  # target unit ID
-                    
-                    # Track damage dealt by players to hostile monsters
-                    if hit_value > 0 and self.current_encounter:
-                        if target_unit_id and target_unit_id in self.current_encounter.enemies:
-                            enemy = self.current_encounter.enemies[target_unit_id]
-                            if enemy.is_hostile:
-                                # Check if source is a player or player's pet
-                                if (self.current_encounter.find_player_by_unit_id(source_unit_id) or 
-                                    source_unit_id in self.current_encounter.pet_ownership):
-                                    
-                                    # Track first damage dealer
-                                    if self.current_encounter.first_damage_dealer is None:
-                                        # Attribute to owner if it's a pet
-                                        if source_unit_id in self.current_encounter.pet_ownership:
-                                            owner_id = self.current_encounter.pet_ownership[source_unit_id]
-                                            owner_player = self.current_encounter.find_player_by_unit_id(owner_id)
-                                            if owner_player:
-                                                self.current_encounter.first_damage_dealer = owner_player.unit_id
-                                        else:
-                                            player = self.current_encounter.find_player_by_unit_id(source_unit_id)
-                                            if player:
-                                                self.current_encounter.first_damage_dealer = player.unit_id
-                                        self.current_encounter.first_damage_timestamp = entry.timestamp
-                                    
-                                    if target_unit_id not in self.current_encounter.enemy_damage:
-                                        self.current_encounter.enemy_damage[target_unit_id] = 0
-                                        # Add enemy's max health to total when first damaged
-                                        if target_unit_id in self.current_encounter.enemies:
-                                            enemy = self.current_encounter.enemies[target_unit_id]
-                                            if enemy.max_health > 0:
-                                                self.current_encounter.total_health_damaged += enemy.max_health
-                                    self.current_encounter.enemy_damage[target_unit_id] += hit_value
-                                    # Update total group damage
-                                    self.current_encounter.total_damage += hit_value
-                                    
-                                    # Track individual player damage
-                                    self.current_encounter.add_damage_to_player(source_unit_id, hit_value)
-                                    
-                                    # Update the most damaged hostile monster
-                                    self.current_encounter.update_most_damaged_hostile(target_unit_id)
-                except (ValueError, IndexError):
-                    pass  # Skip invalid damage values
-            
-            # Parse health information from COMBAT_EVENT (similar to EFFECT_CHANGED)
-            # COMBAT_EVENT format can include health info in various positions depending on event type
-            if len(entry.fields) > 17:  # Check if we have enough fields for health info
-                # Look for health info in the format "current_health/max_health"
-                for i, field in enumerate(entry.fields):
-                    if "/" in field and field.count("/") == 1:
-                        try:
-                            current_health, max_health = field.split("/")
-                            current_health = int(current_health)
-                            max_health = int(max_health)
-                            
-                            # If this looks like valid health data (reasonable values)
-                            if 1000 <= max_health <= 100000000:  # Reasonable health range
-                                # Try to find the target unit ID - it's usually a few fields before health
-                                target_unit_id = None
-                                for j in range(max(0, i-5), i):
-                                    if entry.fields[j].isdigit() and len(entry.fields[j]) > 3:  # Unit IDs are usually longer
-                                        target_unit_id = entry.fields[j]
-                                        break
-                                
-                                # Update enemy health if this is a known enemy
-                                if (target_unit_id and self.current_encounter and 
-                                    target_unit_id in self.current_encounter.enemies):
-                                    self.current_encounter.update_enemy_health(target_unit_id, current_health, max_health)
-                                    
-                        except (ValueError, IndexError):
-                            pass  # Skip invalid health data
+                    max_health = unit_state.health_max
+                    # Only trust plausible health values
+                    if 1000 <= max_health <= 100000000:
+                        encounter.update_enemy_health(unit_id, unit_state.health, max_health)
+                except ValueError:
+                    pass  # Skip invalid health data
 
     def _handle_effect_changed(self, entry: ESOLogEntry):
-        """Handle EFFECT_CHANGED events for buffs/debuffs."""
-        # EFFECT_CHANGED format: changeType, stackCount, castTrackId, abilityId, <sourceUnitState>, <targetUnitState>, playerInitiatedRemoveCastTrackId:optional
-        # Where <targetUnitState> is replaced with * if the target unit is the same as the source unit (self-cast)
-        # Note: entry.fields starts after line_number and event_type, so indices are shifted
-        if len(entry.fields) >= 4:
-            effect_type = entry.fields[0]  # changeType (GAINED/FADED/UPDATED)
-            stack_count = entry.fields[1]  # stackCount
-            cast_track_id = entry.fields[2]  # castTrackId
-            ability_id = entry.fields[3]  # abilityId
-            
-            # Extract source unit ID from sourceUnitState (first field after abilityId)
-            source_unit_id = entry.fields[4] if len(entry.fields) > 4 else "0"
-            
-            # Determine target unit ID
-            # If targetUnitState is "*", then target is same as source
-            # Otherwise, target unit ID is in the targetUnitState (first field of targetUnitState)
-            target_unit_id = source_unit_id  # Default to source
-            if len(entry.fields) > 10:
-                # Check if targetUnitState is "*" (same as source)
-                if entry.fields[-1] == "*":
-                    target_unit_id = source_unit_id
-                else:
-                    # Extract target unit ID from targetUnitState
-                    # targetUnitState starts after sourceUnitState (which has 6 fields: unitId, health, magicka, stamina, ultimate, werewolf)
-                    target_unit_id = entry.fields[10] if len(entry.fields) > 10 else source_unit_id
-            
-            if self.diagnostic and target_unit_id == "31":
-                print(f"{Fore.MAGENTA}[DIAGNOSTIC] EFFECT_CHANGED for unit_id 31: {entry.fields[9:12] if len(entry.fields) >= 12 else 'insufficient fields'}{Style.RESET_ALL}")
-
-            # Always track group buffs globally, regardless of encounter state
-            for buff_name, buff_ids in self.group_buff_ids.items():
-                if ability_id in buff_ids:
-                    # Track buff globally
-                    self._track_global_buff(target_unit_id, buff_name, effect_type, entry.timestamp)
-                    
-                    # Also track in current encounter if it exists and player is in encounter
-                    if (self.current_encounter and 
-                        target_unit_id in self.current_encounter.players):
-                        self.current_encounter.track_buff(target_unit_id, buff_name, effect_type, entry.timestamp)
-                        # Note: Buff event already logged by _track_global_buff, no need to log again
+        """Handle EFFECT_CHANGED events (legacy entry adapter for _handle_effect_changed_record)."""
+        effect = self.log_parser.decode_record(entry)
+        if effect:
+            self._handle_effect_changed_record(effect)
+
+    def _handle_effect_changed_record(self, effect: EffectChangedLine):
+        """Handle a decoded EFFECT_CHANGED line (buffs/debuffs)."""
+        effect_type = effect.change_type  # GAINED/FADED/UPDATED
+        ability_id = str(effect.ability_id)
+        source_unit_id = str(effect.source_unit_state.unit_id)
+        # A target of * (self-cast) is decoded as the source's unit state
+        target_unit_id = str(effect.target_unit_state.unit_id)
+
+        if self.diagnostic and target_unit_id == "31":
+            print(f"{Fore.MAGENTA}[DIAGNOSTIC] EFFECT_CHANGED for unit_id 31: {effect.target_unit_state!r}{Style.RESET_ALL}")
+
+        # Always track group buffs globally, regardless of encounter state
+        for buff_name, buff_ids in self.group_buff_ids.items():
+            if ability_id in buff_ids:
+                # Track buff globally
+                self._track_global_buff(target_unit_id, buff_name, effect_type, effect.line_number)
+
+                # Also track in current encounter if it exists and player is in encounter
+                if (self.current_encounter and
+                    self.current_encounter.has_player(target_unit_id)):
+                    coverage_changed = self.current_encounter.track_buff(target_unit_id, buff_name, effect_type, effect.line_number)
+                    # Note: Buff event already logged by _track_global_buff, no need to log again
+                    if coverage_changed and self.live_buff_alerts:
+                        self._print_live_buff_alert(buff_name, effect.line_number)
+
+        # Only process encounter-specific logic if we have an active encounter
+        # Don't start combat from EFFECT_CHANGED events alone
+        encounter = self.current_encounter
+        if not encounter:
+            return
 
-            # Only process other encounter-specific logic if we have an active encounter
-            if self.current_encounter:
-                # Associate long unit ID with target player if we can find the target
-                if target_unit_id in self.current_encounter.players:
-                    self.current_encounter.associate_long_unit_id(target_unit_id, source_unit_id)
-            
-            # Track pet ownership: if source is a player and target is not a player, target might be a pet
-            if (source_unit_id in self.current_encounter.players and 
-                target_unit_id not in self.current_encounter.players):
-                # Check if target is likely a pet (not a known enemy)
-                if target_unit_id not in self.current_encounter.enemies:
-                    self.current_encounter.track_pet_ownership(target_unit_id, source_unit_id)
+        # Track pet ownership: if source is a player and target is not a player, target might be a pet
+        if (encounter.has_player(source_unit_id) and
+            not encounter.has_player(target_unit_id)):
+            # Check if target is likely a pet (not a known enemy)
+            if target_unit_id not in encounter.enemies:
+                encounter.track_pet_ownership(target_unit_id, source_unit_id)
+
+        # Update the health of known enemies from the source and target unit states
+        for unit_id, unit_state in ((source_unit_id, effect.source_unit_state),
+                                    (target_unit_id, effect.target_unit_state)):
+            if unit_id in encounter.enemies:
+                try:
+                    max_health = unit_state.health_max
+                    if max_health > 100:  # Filter out small health values
+                        encounter.update_enemy_health(unit_id, unit_state.health, max_health)
+                except ValueError:
+                    pass  # Skip invalid health data
 
-            # Parse health information for enemies and players from EFFECT_CHANGED events
-            # EFFECT_CHANGED format: GAINED/FADED/UPDATED,stacks,source_unit_id,ability_id,target_unit_id,source_health/max,source_magicka/max,source_stamina/max,source_ultimate/max,source_werewolf/max,source_shield,source_x,source_y,source_heading,target_unit_id,target_health/max,target_magicka/max,target_stamina/max,target_ultimate/max,target_werewolf/max,target_shield,target_x,target_y,target_heading
-            
-            # Only process health parsing if we have an active encounter
-            if self.current_encounter:
-                # Look for the second target_unit_id (field 15) and its corresponding health (field 16)
-                if len(entry.fields) >= 16:
-                    second_target_unit_id = str(entry.fields[14])  # Field 15 (0-indexed)
-                    target_health_info = str(entry.fields[15])     # Field 16 (0-indexed)
-                    
-                    if "/" in target_health_info and second_target_unit_id in self.current_encounter.enemies:
-                        try:
-                            current_health, max_health = target_health_info.split("/")
-                            current_health = int(current_health)
-                            max_health = int(max_health)
-                            
-                            if max_health > 0 and max_health > 100:  # Filter out small health values
-                                self.current_encounter.update_enemy_health(second_target_unit_id, current_health, max_health)
-                                
-                        except (ValueError, IndexError):
-                            pass  # Skip invalid health data
-            
-            # Also check the first target_unit_id (original logic for backward compatibility)
-            if len(entry.fields) >= 6:
-                first_target_health_info = str(entry.fields[5])  # Field 6 (0-indexed)
-                if "/" in first_target_health_info and target_unit_id in self.current_encounter.enemies:
-                    try:
-                        current_health, max_health = first_target_health_info.split("/")
-                        current_health = int(current_health)
-                        max_health = int(max_health)
-                        
-                        if max_health > 0 and max_health > 100:  # Filter out small health values
-                            self.current_encounter.update_enemy_health(target_unit_id, current_health, max_health)
-                            
-                    except (ValueError, IndexError):
-                        pass  # Skip invalid health data
-
-            # Only track GAINED effects to avoid spam, and only from valid source units
-            if (effect_type == "GAINED" and source_unit_id != "0" and
-                ability_id in self.ability_cache):
-                ability_name = self.ability_cache[ability_id]
-                self.current_encounter.add_ability_use(source_unit_id, ability_name)
-
-            # Check if this is a health-related effect (field [7] contains health info)
-            if len(entry.fields) >= 8:
-                health_info = entry.fields[7] if len(entry.fields) > 7 else ""
-                
-                # Look for health information in format "current/max"
-                if '/' in health_info and target_unit_id:
-                    try:
-                        current_health, max_health = health_info.split('/')
-                        current_health = int(current_health)
-                        max_health = int(max_health)
-                        
-                        # Update enemy health if this is an enemy unit
-                        enemy = self.current_encounter.enemies.get(target_unit_id)
-                        if enemy and max_health > 0:
-                            # Update with the highest max health we've seen
-                            if max_health > enemy.max_health:
-                                enemy.max_health = max_health
-                                enemy.current_health = current_health
-                    except (ValueError, IndexError):
-                        pass  # Skip invalid health data
-
-            # Only mark combat activity if we're already in combat (after BEGIN_COMBAT)
-            # Don't start combat from EFFECT_CHANGED events alone
+        # Only track GAINED effects to avoid spam, and only from valid source units
+        if effect_type == "GAINED" and source_unit_id != "0":
+            encounter.add_ability_use(source_unit_id, ability_id)
 
     def _end_combat(self, end_time: int):
         """End the current combat encounter and display results."""
@@ -1970,6 +2642,8 @@ class ESOLogAnalyzer:
         """Display a summary of the completed encounter."""
         if not self.current_encounter:
             return
+        if self.columnar_damage:
+            self._apply_damage_columns(self.current_encounter)
 
         # Use grace period end time if available, otherwise use end_time
         end_time = self.current_encounter.end_time
@@ -2003,7 +2677,7 @@ class ESOLogAnalyzer:
             
             # Add monsters from hostile_monsters list
             for unit_id, name, unit_type in self.hostile_monsters:
-                if unit_id in self.engaged_monsters or unit_id in self.current_encounter.enemy_damage:
+                if unit_id in self.engaged_monsters or self.current_encounter.get_damage_taken(unit_id) is not None:
                     all_engaged_monsters.add(unit_id)
             
             # Add monsters that appeared in combat events but weren't in hostile_monsters list
@@ -2053,8 +2727,8 @@ class ESOLogAnalyzer:
             buff_status = []
             for buff_name, is_present in buff_analysis.items():
                 if is_present:
-                    # Calculate group uptime (time buff was active on any player)
-                    group_uptime = self.current_encounter.get_group_buff_uptime(buff_name)
+                    # Group uptime (time buff was active on any player)
+                    group_uptime = self.current_encounter.get_live_group_buff_uptime(buff_name)
                     status = f"{group_uptime:.1f}%"
                 else:
                     status = "0.0%"
@@ -2090,7 +2764,7 @@ class ESOLogAnalyzer:
             # Skip players without PLAYER_INFO data (no equipped abilities)
             if not player.equipped_abilities:
                 continue
-            player_damage = self.current_encounter.player_damage.get(player.unit_id, 0)
+            player_damage = self.current_encounter.get_damage_dealt(player.unit_id)
             players_with_damage.append((player, player_damage))
         
         # Sort by damage (descending)
@@ -2367,6 +3041,26 @@ class ESOLogAnalyzer:
                 self._print_and_buffer(f"  Abilities: No PLAYER_INFO data")
                 self._print_and_buffer(f"  No data")
         
+        # Show each player's damage per ability and per target if enabled
+        damage_breakdown = self.current_encounter.get_damage_breakdown()
+        breakdown_players = [(player, player_damage) for player, player_damage in players_with_damage
+                             if player.unit_id in damage_breakdown and player_damage > 0]
+        if breakdown_players:
+            self._print_and_buffer(f"\n{Fore.YELLOW}=== Damage Breakdown ==={Style.RESET_ALL}")
+            for player, player_damage in breakdown_players:
+                player_breakdown = damage_breakdown[player.unit_id]
+                top_abilities = sorted(player_breakdown['abilities'].items(), key=lambda item: item[1], reverse=True)[:5]
+                top_targets = sorted(player_breakdown['targets'].items(), key=lambda item: item[1], reverse=True)[:3]
+                ability_parts = [f"{self.ability_cache.get(ability_id, ability_id)} {damage / player_damage * 100:.1f}%"
+                                 for ability_id, damage in top_abilities]
+                target_parts = []
+                for target_unit_id, damage in top_targets:
+                    enemy = self.current_encounter.enemies.get(target_unit_id)
+                    target_parts.append(f"{enemy.name if enemy else target_unit_id} {damage / player_damage * 100:.1f}%")
+                self._print_and_buffer(f"{Fore.GREEN}{player.get_display_name()}{Style.RESET_ALL}")
+                self._print_and_buffer(f"  Abilities: {', '.join(ability_parts)}")
+                self._print_and_buffer(f"  Targets: {', '.join(target_parts)}")
+
         # Display hostile monsters if testing flag is enabled
         if self.list_hostiles and (self.hostile_monsters or self.engaged_monsters):
             self._print_and_buffer(f"\n{Fore.YELLOW}=== Hostile Monsters Engaged by Players ==={Style.RESET_ALL}")
@@ -2376,7 +3070,7 @@ class ESOLogAnalyzer:
             
             # Add monsters from hostile_monsters list
             for unit_id, name, unit_type in self.hostile_monsters:
-                if unit_id in self.engaged_monsters or unit_id in self.current_encounter.enemy_damage:
+                if unit_id in self.engaged_monsters or self.current_encounter.get_damage_taken(unit_id) is not None:
                     all_engaged_monsters.add((unit_id, name, unit_type))
             
             # Add monsters that appeared in combat events but weren't in hostile_monsters list
@@ -2392,7 +3086,7 @@ class ESOLogAnalyzer:
                 key = (unit_id, name)
                 if key not in seen:
                     seen.add(key)
-                    damage = self.current_encounter.enemy_damage.get(unit_id, 0)
+                    damage = self.current_encounter.get_damage_taken(unit_id) or 0
                     unique_hostiles.append((unit_id, name, unit_type, damage))
             
             # Sort by damage (highest first), then by name
@@ -2600,6 +3294,11 @@ class ESOLogAnalyzer:
         
         # Clear the report buffer after adding to zone collection
         self.report_buffer.clear()
+
+        # Save an overgrown zone report now; the rest of the zone goes to a file named after its next encounter
+        if len(self.zone_reports.get(self.current_zone, ())) > self.max_zone_report_lines:
+            self._save_zone_report(self.current_zone)
+            self.zone_start_time = None
     
     def _save_zone_report(self, zone_name: str):
         """Save the accumulated report for a zone to a file."""
@@ -2730,6 +3429,27 @@ class ESOLogAnalyzer:
             if gear_data:
                 self.player_sessions[session_key]['gear_data'] = gear_data
             self.player_sessions[session_key]['last_seen'] = 0
+            self.player_sessions.move_to_end(session_key)
+
+        if len(self.player_sessions) > self.max_player_sessions:
+            self._evict_player_sessions()
+
+    def _evict_player_sessions(self):
+        """Drop the least recently updated sessions beyond max_player_sessions, keeping players in the current encounter."""
+        current_unit_ids = ({player.unit_id for player in self.current_encounter.players.values()}
+                            if self.current_encounter else set())
+        excess = len(self.player_sessions) - self.max_player_sessions
+        for session_key in list(self.player_sessions):
+            if excess <= 0:
+                break
+            session_data = self.player_sessions[session_key]
+            if session_data['unit_id'] in current_unit_ids:
+                continue
+            del self.player_sessions[session_key]
+            handle = session_key.split('+', 1)[0]
+            if self.unit_id_to_handle.get(session_data['unit_id']) == handle:
+                del self.unit_id_to_handle[session_data['unit_id']]
+            excess -= 1
 
     def _get_player_from_session(self, unit_id: str, name: str, handle: str) -> Optional[PlayerInfo]:
         """Get player info from session data if available."""
@@ -2762,7 +3482,7 @@ class ESOLogAnalyzer:
         """Check if a player is currently offline (not in current encounter)."""
         if not self.current_encounter:
             return True
-        return unit_id not in self.current_encounter.players
+        return not self.current_encounter.has_player(unit_id)
 
     def _restore_player_from_session(self, unit_id: str, name: str, handle: str):
         """Restore a player from session data when they come back online."""
@@ -2778,7 +3498,7 @@ class ESOLogAnalyzer:
         self._update_player_session(unit_id, name, handle, player.equipped_abilities, player.gear_data, player.class_id)
 
         # Add player to current encounter with session data
-        self.current_encounter.players[unit_id] = player
+        self.current_encounter.add_player_info(player)
 
         # Associate long unit ID if available
         if hasattr(self.current_encounter, 'unit_id_mapping') and unit_id in self.current_encounter.unit_id_mapping:
@@ -2791,7 +3511,7 @@ class ESOLogAnalyzer:
         if not self.current_encounter:
             return
             
-        current_unit_ids = set(self.current_encounter.players.keys())
+        current_unit_ids = {player.unit_id for player in self.current_encounter.players.values()}
         
         # Find handles for players no longer in current encounter
         offline_handles = []
@@ -3195,32 +3915,80 @@ class LogSplitter:
 class LogFileMonitor:
     """Simple file polling monitor for log file changes."""
 
-    def __init__(self, analyzer: ESOLogAnalyzer, log_file: Path, read_all_then_tail: bool = False, tail_and_split: bool = False, split_dir: Optional[Path] = None):
+    def __init__(self, analyzer: ESOLogAnalyzer, log_file: Path, read_all_then_tail: bool = False, tail_and_split: bool = False, split_dir: Optional[Path] = None, parse_cache: bool = False,
+                 checkpoint: bool = False, checkpoint_interval: float = 30.0):
         self.analyzer = analyzer
         self.log_file = log_file
         self.last_position = 0
         self.read_all_then_tail = read_all_then_tail
         self.tail_and_split = tail_and_split
+        self.parse_cache = parse_cache
         self.has_read_all = False
         self.diagnostic = analyzer.diagnostic
         self.running = False
+
+        # Save the analyzer state with last_position every checkpoint_interval seconds and resume from it
+        self.checkpoint = checkpoint
+        self.checkpoint_interval = checkpoint_interval
+        self.last_checkpoint_time = time.monotonic()
+        self.checkpoint_writer = CheckpointWriter(log_file)
+        if self.checkpoint and tail_and_split:
+            # Split files are written from the start of each log, which a resumed tail does not see
+            print(f"{Fore.YELLOW}Checkpoints are not used with --tail-and-split{Style.RESET_ALL}")
+            self.checkpoint = False
         
         # Initialize log splitter if needed
         self.log_splitter = LogSplitter(log_file, diagnostic=self.diagnostic, split_dir=split_dir) if tail_and_split else None
+        if self.log_splitter:
+            # Split files must contain every line, so every event type has to be parsed
+            self.analyzer.log_parser.subscribe_all()
 
         # Initialize position based on mode
         if self.log_file.exists():
-            if read_all_then_tail:
+            if self.checkpoint and self._resume_from_checkpoint():
+                # Catch up on the lines written since the checkpoint
+                self._process_new_lines()
+                self.write_checkpoint()
+                print(f"{Fore.GREEN}Monitoring for new data. Ctrl-C to stop...{Style.RESET_ALL}\n")
+            elif read_all_then_tail:
                 # Start from the beginning to read everything first
                 print(f"{Fore.CYAN}Reading entire log file from the beginning...{Style.RESET_ALL}")
                 self.last_position = 0
                 self._process_entire_file()
+                if self.checkpoint:
+                    self.write_checkpoint()
                 print(f"{Fore.GREEN}Monitoring for new data. Ctrl-C to stop...{Style.RESET_ALL}\n")
             else:
                 # Look back through recent log entries to find zone changes
                 self._initialize_zone_history()
                 self.last_position = self.log_file.stat().st_size
 
+        # Only new lines are live, not the ones read above
+        self.analyzer.live_buff_alerts = True
+        self.analyzer.live_dps = True
+
+    def _resume_from_checkpoint(self) -> bool:
+        """Restore the analyzer state and position from the log's checkpoint, if it has a valid one."""
+        checkpoint = load_checkpoint(self.log_file)
+        if checkpoint is None:
+            return False
+        position, state = checkpoint
+        self.analyzer.restore_checkpoint_state(state)
+        self.last_position = position
+        zone = f" in {self.analyzer.current_zone}" if self.analyzer.current_zone else ""
+        print(f"{Fore.GREEN}Resumed from checkpoint at offset {position:,}{zone}{Style.RESET_ALL}")
+        return True
+
+    def write_checkpoint(self):
+        """Save the analyzer state covering the log up to last_position."""
+        started = time.perf_counter()
+        if self.checkpoint_writer.save(self.last_position, self.analyzer.get_checkpoint_state(),
+                                       self.analyzer.get_checkpoint_columns()):
+            if self.diagnostic:
+                timestamp = time.strftime("%H:%M:%S", time.localtime())
+                print(f"{Fore.GREEN}[{timestamp}] DIAGNOSTIC: Saved checkpoint {checkpoint_path_for(self.log_file).name} at offset {self.last_position} in {(time.perf_counter() - started) * 1000:.1f} ms{Style.RESET_ALL}")
+        self.last_checkpoint_time = time.monotonic()
+
     def _initialize_zone_history(self):
         """Look back through recent log entries to find zone changes."""
         if not self.log_file.exists():
@@ -3231,13 +3999,15 @@ class LogFileMonitor:
         lookback_size = min(50000, file_size)
         start_position = max(0, file_size - lookback_size)
         
+        # Start at the first full line of the lookback window
+        start_position = next_line_start(self.log_file, start_position)
+        
         print(f"{Fore.CYAN}Scanning recent log entries for zone changes...{Style.RESET_ALL}")
         
-        entries = self.analyzer._process_log_file_from_position(self.log_file, start_position)
         zone_found = False
         
         # Process entries in chronological order to find the most recent zone change
-        for entry in entries:
+        for entry in self.analyzer._process_log_file_from_position(self.log_file, start_position):
             if entry.event_type == "ZONE_CHANGED" and len(entry.fields) >= 3:
                 zone_id = entry.fields[0].strip('"')
                 zone_name = entry.fields[1].strip('"')
@@ -3255,37 +4025,40 @@ class LogFileMonitor:
         if not self.log_file.exists():
             return
         
-            if self.diagnostic:
-                timestamp = time.strftime("%H:%M:%S", time.localtime())
-                print(f"{Fore.GREEN}[{timestamp}] DIAGNOSTIC: Processing entire file {self.log_file.name} from beginning{Style.RESET_ALL}")
-            line_count = 0
-            with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                while True:
-                    line = f.readline()
-                    if not line:  # End of file
-                        break
-                        
-                    line = line.strip()
-                    if line:
-                        entry = self.analyzer.log_parser.parse_line(line)
-                        if entry:
-                            # Handle log splitting if enabled
-                            if self.log_splitter:
-                                self._handle_log_splitting(entry, line)
-                            
-                        self.analyzer.process_log_entry(entry)
-                        line_count += 1
-                
-                # Update position to current position
-                self.last_position = f.tell()
+        if self.diagnostic:
+            timestamp = time.strftime("%H:%M:%S", time.localtime())
+            print(f"{Fore.GREEN}[{timestamp}] DIAGNOSTIC: Processing entire file {self.log_file.name} from beginning{Style.RESET_ALL}")
+
+        # Pin the end of the read to the last complete line so the position handed
+        # to the tail loop is exactly where bulk parsing stopped
+        end_position = complete_lines_end(self.log_file, 0, self.log_file.stat().st_size)
+        log_cache = ParsedLogCache(self.log_file) if self.parse_cache else None
+        if log_cache:
+            entries = log_cache.iter_entries(self.analyzer.log_parser, end_position, lines=bool(self.log_splitter))
+        else:
+            entries = iter_entries(self.log_file, 0, end_position, parser=self.analyzer.log_parser)
+        entry_count = 0
+        for _, entry, line in entries:
+            # Handle log splitting if enabled
+            if self.log_splitter:
+                self._handle_log_splitting(entry, line)
+
+            self.analyzer.process_log_entry(entry)
+            entry_count += 1
+
+        if log_cache and log_cache.error:
+            print(f"{Fore.YELLOW}{log_cache.error}{Style.RESET_ALL}")
+
+        # Update position to where bulk parsing stopped
+        self.last_position = end_position
         
         if self.diagnostic:
             timestamp = time.strftime("%H:%M:%S", time.localtime())
-            print(f"{Fore.GREEN}[{timestamp}] DIAGNOSTIC: Processed {line_count} lines from {self.log_file.name}, now tailing{Style.RESET_ALL}")
+            print(f"{Fore.GREEN}[{timestamp}] DIAGNOSTIC: Processed {entry_count} entries from {self.log_file.name}, now tailing{Style.RESET_ALL}")
         
-            # Close any open split files after processing entire file
-            if self.log_splitter:
-                self.log_splitter.end_encounter()
+        # Close the split file until the tail loop sees new data (it reopens for append)
+        if self.log_splitter:
+            self.log_splitter.close_for_waiting()
             
         self.has_read_all = True
 
@@ -3304,6 +4077,8 @@ class LogFileMonitor:
                 timestamp = time.strftime("%H:%M:%S", time.localtime())
                 print(f"{Fore.GREEN}[{timestamp}] DIAGNOSTIC: File growth detected in {self.log_file.name} (size: {current_size}, pos: {self.last_position}){Style.RESET_ALL}")
             self._process_new_lines()
+            if self.checkpoint and time.monotonic() - self.last_checkpoint_time >= self.checkpoint_interval:
+                self.write_checkpoint()
             return True
         else:
             # Close split file when waiting for new data
@@ -3331,25 +4106,21 @@ class LogFileMonitor:
             timestamp = time.strftime("%H:%M:%S", time.localtime())
             print(f"{Fore.GREEN}[{timestamp}] DIAGNOSTIC: Reading new data from {self.log_file.name} (size: {current_size}, pos: {self.last_position}){Style.RESET_ALL}")
 
-        with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            f.seek(self.last_position)
-            new_lines = f.readlines()
-            self.last_position = f.tell()
+        # Stop before a line the game is still writing; it is read once complete
+        end_position = complete_lines_end(self.log_file, self.last_position, current_size)
+        entry_count = 0
+        for _, entry, line in iter_entries(self.log_file, self.last_position, end_position, parser=self.analyzer.log_parser):
+            # Handle log splitting if enabled
+            if self.log_splitter:
+                self._handle_log_splitting(entry, line)
+                    
+            self.analyzer.process_log_entry(entry)
+            entry_count += 1
+        self.last_position = end_position
 
         if self.diagnostic:
             timestamp = time.strftime("%H:%M:%S", time.localtime())
-            print(f"{Fore.GREEN}[{timestamp}] DIAGNOSTIC: Read {len(new_lines)} lines from {self.log_file.name}{Style.RESET_ALL}")
-
-        for line in new_lines:
-            line = line.strip()
-            if line:
-                entry = self.analyzer.log_parser.parse_line(line)
-            if entry:
-                # Handle log splitting if enabled
-                if self.log_splitter:
-                    self._handle_log_splitting(entry, line)
-                        
-                self.analyzer.process_log_entry(entry)
+            print(f"{Fore.GREEN}[{timestamp}] DIAGNOSTIC: Processed {entry_count} entries from {self.log_file.name}{Style.RESET_ALL}")
     
     def _handle_log_splitting(self, entry, line: str):
         """Handle log splitting logic based on log entry type."""
@@ -3429,6 +4200,12 @@ class LogFileMonitor:
               help='Exit immediately if log file does not exist (default: wait for file to appear)')
 @click.option('--replay-speed', '-r', default=100, type=int,
               help='Replay speed multiplier for read mode (default: 100x)')
+@click.option('--parse-workers', default=1, type=click.IntRange(0),
+              help='Read mode: parse the log in this many worker processes (0 = one per CPU but one, default: 1)')
+@click.option('--parse-cache', is_flag=True,
+              help='Keep parsed entries in a sidecar file next to the log (<log>.esocache) so later reads only parse new data')
+@click.option('--columnar-damage', is_flag=True,
+              help='Read mode: decode damage and deaths into NumPy columns in one pass instead of analyzing each COMBAT_EVENT (totals only, no per-hit views)')
 @click.option('--version', '-v', is_flag=True,
               help='Show version information and exit')
 @click.option('--list-hostiles', is_flag=True,
@@ -3443,7 +4220,13 @@ class LogFileMonitor:
               help='Save encounter reports to files with timestamp-based naming')
 @click.option('--reports-dir', type=click.Path(), default=None,
               help='Directory for saved reports (default: same directory as source log file)')
-def main(log_file: Optional[str], read_all_then_stop: bool, read_all_then_tail: bool, no_wait: bool, replay_speed: int, version: bool, list_hostiles: bool, diagnostic: bool, tail_and_split: bool, split_dir: Optional[str], save_reports: bool, reports_dir: Optional[str]):
+@click.option('--damage-breakdown', is_flag=True,
+              help="Show each player's damage per ability and per target in encounter reports")
+@click.option('--checkpoint', is_flag=True,
+              help='Periodically save the analyzer state next to the log file (<log>.esocheckpoint) and resume from it on restart')
+@click.option('--checkpoint-interval', type=click.IntRange(1), default=30,
+              help='Seconds between checkpoints while tailing (default: 30)')
+def main(log_file: Optional[str], read_all_then_stop: bool, read_all_then_tail: bool, no_wait: bool, replay_speed: int, parse_workers: int, parse_cache: bool, columnar_damage: bool, version: bool, list_hostiles: bool, diagnostic: bool, tail_and_split: bool, split_dir: Optional[str], save_reports: bool, reports_dir: Optional[str], damage_breakdown: bool, checkpoint: bool, checkpoint_interval: int):
     """ESO Encounter Log Analyzer - Monitor and analyze ESO combat encounters."""
     
     # Handle version flag early (before any other processing)
@@ -3478,12 +4261,15 @@ def main(log_file: Optional[str], read_all_then_stop: bool, read_all_then_tail:
         active_options.append("list-hostiles")
     if diagnostic:
         active_options.append("diagnostic")
+    if checkpoint:
+        active_options.append("checkpoint")
     
     if active_options:
         print(f"{Fore.CYAN}Active options: {', '.join(active_options)}{Style.RESET_ALL}")
     print()
 
-    analyzer = ESOLogAnalyzer(list_hostiles=list_hostiles, diagnostic=diagnostic, save_reports=save_reports)
+    analyzer = ESOLogAnalyzer(list_hostiles=list_hostiles, diagnostic=diagnostic, save_reports=save_reports,
+                              damage_breakdown=damage_breakdown)
 
     if read_all_then_stop:
         # Determine which log file to use
@@ -3529,8 +4315,14 @@ def main(log_file: Optional[str], read_all_then_stop: bool, read_all_then_tail:
             # Update analyzer with reports directory
             analyzer.reports_dir = reports_path
         
+        if columnar_damage and tail_and_split:
+            # Split files must contain every line, so COMBAT_EVENT lines have to be parsed
+            print(f"{Fore.RED}Error: --columnar-damage cannot be used with --tail-and-split{Style.RESET_ALL}")
+            sys.exit(1)
+
         split_dir_path = Path(split_dir) if split_dir else None
-        _replay_log_file(analyzer, read_log, replay_speed, tail_and_split, split_dir_path)
+        _replay_log_file(analyzer, read_log, replay_speed, tail_and_split, split_dir_path, parse_cache, columnar_damage,
+                         parse_workers)
         return
 
     # Determine log file path
@@ -3577,6 +4369,11 @@ def main(log_file: Optional[str], read_all_then_stop: bool, read_all_then_tail:
     else:
         print(f"{Fore.GREEN}Encounter.log found at {log_path}{Style.RESET_ALL}")
 
+    compression = detect_compression(log_path)
+    if compression:
+        print(f"{Fore.RED}Error: {log_path} is {compression}-compressed; compressed logs can only be read with --read-all-then-stop{Style.RESET_ALL}")
+        sys.exit(1)
+
     print(f"{Fore.GREEN}Monitoring: {log_path}{Style.RESET_ALL}")
 
     # Set up reports directory now that we have the log path
@@ -3611,7 +4408,8 @@ def main(log_file: Optional[str], read_all_then_stop: bool, read_all_then_tail:
 
     # Set up file monitoring with simple polling
     split_dir_path = Path(split_dir) if split_dir else None
-    file_monitor = LogFileMonitor(analyzer, log_path, read_all_then_tail, tail_and_split, split_dir_path)
+    file_monitor = LogFileMonitor(analyzer, log_path, read_all_then_tail, tail_and_split, split_dir_path, parse_cache,
+                                  checkpoint, checkpoint_interval)
     file_monitor.running = True
 
 
@@ -3629,6 +4427,10 @@ def main(log_file: Optional[str], read_all_then_stop: bool, read_all_then_tail:
     except KeyboardInterrupt:
         print(f"\n{Fore.YELLOW}Stopping monitor...{Style.RESET_ALL}")
         file_monitor.running = False
+
+        # Keep the state up to the last line read for the next run
+        if file_monitor.checkpoint:
+            file_monitor.write_checkpoint()
         
         # Clean up log splitter if it exists
         if file_monitor.log_splitter:
@@ -4002,45 +4804,112 @@ def _handle_replay_log_splitting(log_splitter, entry, line: str):
     else:
         log_splitter.write_log_line(line)
 
-def _replay_log_file(analyzer: ESOLogAnalyzer, log_file: Path, speed_multiplier: int, tail_and_split: bool = False, split_dir: Optional[Path] = None):
-    """Replay a log file for testing purposes."""
+def _replay_log_file(analyzer: ESOLogAnalyzer, log_file: Path, speed_multiplier: int, tail_and_split: bool = False, split_dir: Optional[Path] = None, parse_cache: bool = False,
+                     columnar_damage: bool = False, parse_workers: int = 1):
+    """Replay a log file for testing purposes.
+
+    With parse_workers other than 1, newline-aligned byte ranges of the log
+    are parsed in worker processes (0 = one per CPU but one) and reach the
+    analyzer in file order as packed records (see eso_log_parallel).
+
+    With parse_cache, entries are read from the log's
+    sidecar parse cache and only data appended since the last run is parsed.
+
+    With columnar_damage, the log's hits and deaths are decoded into columns
+    up front (see eso_log_columnar) and COMBAT_EVENT lines are skipped; each
+    encounter's damage totals and player deaths are filled from the columns.
+
+    gzip, bz2 and xz compressed logs are detected by their magic bytes and
+    decompressed as a stream in this process; decompression and parse
+    throughput are reported separately.
+    """
 
     print(f"{Fore.YELLOW}Reading log file...{Style.RESET_ALL}")
 
     # Initialize log splitter if needed
     log_splitter = LogSplitter(log_file, diagnostic=analyzer.diagnostic, split_dir=split_dir) if tail_and_split else None
+    if log_splitter:
+        # Split files must contain every line, so every event type has to be parsed
+        analyzer.log_parser.subscribe_all()
+
+    if columnar_damage:
+        from eso_log_columnar import NUMPY_AVAILABLE, load_damage_columns
+        if NUMPY_AVAILABLE:
+            columns_start = time.perf_counter()
+            damage_columns = load_damage_columns(log_file)
+            analyzer.use_damage_columns(damage_columns)
+            print(f"{Fore.YELLOW}Decoded {len(damage_columns) if damage_columns is not None else 0:,} damage and death events "
+                  f"into columns in {time.perf_counter() - columns_start:.2f}s{Style.RESET_ALL}")
+        else:
+            print(f"{Fore.YELLOW}NumPy is not installed; analyzing each COMBAT_EVENT instead of --columnar-damage{Style.RESET_ALL}")
 
-    entries = []
-    with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-        for line_num, line in enumerate(f, 1):
-            if line_num % 10000 == 0:
-                print(f"{Fore.YELLOW}Processed {line_num} lines...{Style.RESET_ALL}")
-
-            line = line.strip()
-            if line:
-                entry = analyzer.log_parser.parse_line(line)
-                if entry:
-                    entries.append(entry)
-                    
-                    # Handle log splitting if enabled
-                    if log_splitter:
-                        _handle_replay_log_splitting(log_splitter, entry, line)
-
-    print(f"{Fore.GREEN}Loaded {len(entries)} log entries{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}Starting replay at full speed...{Style.RESET_ALL}\n")
 
-    if not entries:
+    # Entries are streamed straight into the analyzer; the log is never held in memory
+    compression = detect_compression(log_file)
+    read_stats = ReadStats() if compression else None
+    log_cache = ParsedLogCache(log_file) if parse_cache and not compression else None
+    if compression:
+        print(f"{Fore.YELLOW}Decompressing {compression} log as a stream{Style.RESET_ALL}")
+        entries = iter_entries(log_file, parser=analyzer.log_parser, stats=read_stats)
+    elif log_cache:
+        # Lines are only read back from the log for the split files
+        entries = log_cache.iter_entries(analyzer.log_parser, lines=bool(log_splitter))
+    elif parse_workers != 1:
+        entries = iter_entries_parallel(log_file, analyzer.log_parser, parse_workers, lines=bool(log_splitter))
+    else:
+        entries = iter_entries(log_file, parser=analyzer.log_parser)
+
+    entry_count = 0
+    analysis_seconds = 0.0
+    replay_start = time.perf_counter()
+    for _, entry, line in entries:
+        if read_stats:
+            analysis_start = time.perf_counter()
+
+        # Handle log splitting if enabled
+        if log_splitter:
+            _handle_replay_log_splitting(log_splitter, entry, line)
+
+        analyzer.process_log_entry(entry)
+        entry_count += 1
+        if analyzer.diagnostic and entry_count % 10000 == 0:
+            print(f"{Fore.YELLOW}Processed {entry_count} entries...{Style.RESET_ALL}")
+
+        if read_stats:
+            analysis_seconds += time.perf_counter() - analysis_start
+    replay_seconds = time.perf_counter() - replay_start
+
+    if log_cache and log_cache.error:
+        print(f"{Fore.YELLOW}{log_cache.error}{Style.RESET_ALL}")
+
+    if not entry_count:
         print(f"{Fore.RED}No valid log entries found{Style.RESET_ALL}")
         return
 
-    # Process all entries at full speed without delays
-    for entry in entries:
-        analyzer.process_log_entry(entry)
+    print(f"{Fore.GREEN}Replayed {entry_count} log entries{Style.RESET_ALL}")
+    if read_stats:
+        _print_read_throughput(read_stats, replay_seconds - analysis_seconds)
 
     # Final check to ensure any remaining encounters are displayed
     analyzer._check_pending_encounter_display()
 
     print(f"\n{Fore.GREEN}Replay complete!{Style.RESET_ALL}")
 
+def _print_read_throughput(read_stats: ReadStats, read_and_parse_seconds: float):
+    """Report decompression and parse throughput of a compressed replay separately."""
+    megabytes = read_stats.bytes_read / (1024 * 1024)
+    compressed_megabytes = read_stats.file_bytes / (1024 * 1024)
+    decompress_seconds = read_stats.read_seconds
+    parse_seconds = max(read_and_parse_seconds - decompress_seconds, 0.0)
+
+    decompress_rate = megabytes / decompress_seconds if decompress_seconds > 0 else 0.0
+    parse_rate = megabytes / parse_seconds if parse_seconds > 0 else 0.0
+    print(f"{Fore.CYAN}Decompression ({read_stats.compression}): {compressed_megabytes:.1f} MB -> {megabytes:.1f} MB "
+          f"in {decompress_seconds:.2f}s ({decompress_rate:.1f} MB/s){Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Parsing: {megabytes:.1f} MB in {parse_seconds:.2f}s ({parse_rate:.1f} MB/s){Style.RESET_ALL}")
+
 if __name__ == "__main__":
+    # Needed by the --parse-workers process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
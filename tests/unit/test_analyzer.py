@@ -9,7 +9,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'fixtures'))
 
-from esolog_tail import ESOLogEntry, ESOLogAnalyzer
+from esolog_tail import ESOLogEntry, ESOLogAnalyzer, LogFileMonitor
 from eso_sets import ESOSubclassAnalyzer
 from sample_data import SAMPLE_LOG_LINES, SAMPLE_ABILITIES, SAMPLE_GEAR_SET_IDS
 
@@ -174,6 +174,220 @@ class TestESOLogAnalyzer(unittest.TestCase):
         # Should not crash
         self.assertIsNotNone(analyzer.current_encounter)
 
+    def test_abilities_used_are_interned(self):
+        """Test that ability uses are stored as symbol codes and resolved by name on demand."""
+        analyzer = ESOLogAnalyzer()
+        unit_entry = ESOLogEntry(100, "UNIT_ADDED",
+                               ["1", "PLAYER", "T", "1", "0", "F", "117", "7",
+                                "Test Player", "@testhandle", "123456789", "50", "3084", "0", "PLAYER_ALLY", "T"])
+        analyzer.process_log_entry(unit_entry)
+        for timestamp in (300, 400):
+            analyzer.process_log_entry(ESOLogEntry(timestamp, "BEGIN_CAST",
+                                                   ["0", "F", "1", "12345", "1", "100/100", "50/50", "25/25", "0/0", "0/0",
+                                                    "0", "0.5", "0.5", "0.0", "*"]))
+
+        encounter = analyzer.current_encounter
+        self.assertIs(encounter.symbols, analyzer.symbols)
+        unit_code = analyzer.symbols.units.code("1")
+        self.assertEqual(encounter.abilities_used[unit_code], {analyzer.symbols.abilities.code("12345")})
+        self.assertEqual(analyzer.symbols.units.symbol(unit_code), "1")
+
+        # The name is looked up when rendering, so ABILITY_INFO may arrive after the cast
+        self.assertEqual(encounter.get_abilities_used({}), {})
+        self.assertEqual(encounter.get_abilities_used({"12345": "Test Ability"}), {"1": {"Test Ability"}})
+
+    def test_typed_records_and_legacy_entries_are_handled_alike(self):
+        """Test that a decoded record and the legacy entry of the same line have the same effect."""
+        from eso_log_decoders import decode_effect_changed
+        from eso_log_structures import tokenize_line
+        # Player 2 gains Powerful Assault from player 1 (not a self-cast)
+        line = ('600,EFFECT_CHANGED,GAINED,1,5001,61771,1,20000/20000,10000/10000,10000/10000,100/500,0/1000,0,0.5,0.5,1.0,'
+                '2,18000/20000,9000/10000,10000/10000,200/500,0/1000,0,0.5,0.5,1.0')
+
+        analyzers = []
+        for typed in (True, False):
+            analyzer = ESOLogAnalyzer()
+            for unit_id, name in (("1", "Healer"), ("2", "Damage")):
+                analyzer.process_log_entry(ESOLogEntry(100, "UNIT_ADDED",
+                                                       [unit_id, "PLAYER", "F", unit_id, "0", "F", "117", "7",
+                                                        name, "@" + name, "12345" + unit_id, "50", "3084", "0", "PLAYER_ALLY", "T"]))
+            if typed:
+                self.assertTrue(analyzer.process_record(decode_effect_changed(tokenize_line(line))))
+            else:
+                analyzer.process_log_entry(ESOLogEntry.parse(line))
+            analyzers.append(analyzer)
+
+        for analyzer in analyzers:
+            self.assertEqual(analyzer.current_encounter.active_buffs["2"], {"PA": 600})
+            self.assertEqual(analyzer.current_encounter.active_buffs["1"], {})
+        self.assertFalse(analyzers[0].process_record(object()))
+
+    def test_register_handler(self):
+        """Test that registered handlers subscribe the parser and run after the built-in handlers."""
+        line = '252431,HEALTH_REGEN,898,72,19576/19576,14844/15729,32560/33221,500/500,1000/1000,0,0.6681,0.9093,5.7946'
+        analyzer = ESOLogAnalyzer()
+        self.assertIsNone(analyzer.log_parser.parse_line(line))
+
+        seen = []
+        analyzer.register_handler("HEALTH_REGEN", seen.append)
+        entry = analyzer.log_parser.parse_line(line)
+        self.assertEqual(entry.event_type, "HEALTH_REGEN")
+        analyzer.process_log_entry(entry)
+        self.assertEqual(seen, [entry])
+
+        # Extra handlers of a built-in event type run after it
+        analyzer.register_handler("ZONE_CHANGED", lambda entry: seen.append(analyzer.current_zone))
+        analyzer.process_log_entry(analyzer.log_parser.parse_line(SAMPLE_LOG_LINES['zone_changed']))
+        self.assertEqual(seen[-1], analyzer.current_zone)
+        self.assertIsNotNone(analyzer.current_zone)
+
+        analyzer.unregister_handler("HEALTH_REGEN", seen.append)
+        analyzer.process_log_entry(entry)
+        self.assertEqual(len(seen), 2)
+
+    def test_unregister_handler_unsubscribes(self):
+        """Test that removing the last extra handler of an event type stops the parser parsing it."""
+        analyzer = ESOLogAnalyzer()
+        is_subscribed = analyzer.log_parser.structured_parser.is_subscribed
+        first, second = [], []
+        analyzer.register_handler("END_CAST", first.append)
+        analyzer.register_handler("END_CAST", second.append)
+        analyzer.unregister_handler("END_CAST", first.append)
+        self.assertTrue(is_subscribed("END_CAST"))
+        analyzer.unregister_handler("END_CAST", second.append)
+        self.assertFalse(is_subscribed("END_CAST"))
+        self.assertIsNone(analyzer.log_parser.parse_line('3000,END_CAST,COMPLETED,1234,0'))
+
+        # HEALTH_REGEN keeps its no-op built-in handler but is not parsed by default
+        analyzer.register_handler("HEALTH_REGEN", first.append)
+        analyzer.unregister_handler("HEALTH_REGEN", first.append)
+        self.assertFalse(is_subscribed("HEALTH_REGEN"))
+
+        # Built-in event types stay subscribed
+        analyzer.register_handler("ZONE_CHANGED", first.append)
+        analyzer.unregister_handler("ZONE_CHANGED", first.append)
+        self.assertTrue(is_subscribed("ZONE_CHANGED"))
+
+    def test_global_buff_history_is_clipped_and_pruned(self):
+        """Test that BEGIN_COMBAT only carries over buff periods reaching into the pull and prunes the rest."""
+        analyzer = ESOLogAnalyzer()
+        analyzer.process_log_entry(ESOLogEntry(100, "UNIT_ADDED",
+                                               ["1", "PLAYER", "T", "1", "0", "F", "117", "7",
+                                                "Test Player", "@testhandle", "123456789", "50", "3084", "0", "PLAYER_ALLY", "T"]))
+        analyzer.global_player_buffs["1"]["PA"] = [(200, 300), (400, 1200)]
+        analyzer.global_player_buffs["99"]["PA"] = [(500, 600)]
+
+        analyzer.process_log_entry(ESOLogEntry(1000, "BEGIN_COMBAT", []))
+        self.assertEqual(analyzer.current_encounter.player_buffs["1"]["PA"], [(1000, 1200)])
+        self.assertEqual(dict(analyzer.global_player_buffs), {"1": {"PA": [(400, 1200)]}})
+
+    def test_long_session_accumulators_are_capped(self):
+        """Test the caps on session-long accumulators and the memory use report."""
+        import contextlib
+        import io
+        analyzer = ESOLogAnalyzer(diagnostic=True)
+        analyzer.max_buff_events = 3
+        analyzer.max_buff_count_timestamps = 3
+        analyzer.max_player_sessions = 2
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            for timestamp in range(10):
+                analyzer._log_buff_event("1", "PA", "GAINED", timestamp)
+            self.assertEqual([event['timestamp'] for event in analyzer.buff_events_log], [7, 8, 9])
+            self.assertEqual(list(analyzer.player_buff_counts), ["7", "8", "9"])
+
+            # Sessions of players in the current encounter are kept even if they are the oldest
+            analyzer.process_log_entry(ESOLogEntry(100, "UNIT_ADDED",
+                                                   ["1", "PLAYER", "T", "1", "0", "F", "117", "7",
+                                                    "Test Player", "@testhandle", "123456789", "50", "3084", "0", "PLAYER_ALLY", "T"]))
+            analyzer._update_player_session("1", "Test Player", "@testhandle")
+            for unit_id in ("2", "3"):
+                analyzer._update_player_session(unit_id, "Other " + unit_id, "@other" + unit_id)
+            self.assertEqual(list(analyzer.player_sessions), ["@testhandle+Test Player", "@other3+Other 3"])
+            self.assertNotIn("2", analyzer.unit_id_to_handle)
+
+            analyzer.process_log_entry(analyzer.log_parser.parse_line('500,ZONE_CHANGED,1301,"Coral Aerie",VETERAN'))
+        self.assertEqual(len(analyzer.buff_events_log), 0)
+        usage = analyzer.get_memory_usage()
+        self.assertGreater(usage['player_sessions'], 0)
+        self.assertGreater(usage['symbols'], 0)
+        self.assertIn('global_player_buffs', usage)
+
+    def test_symbol_tables_are_capped(self):
+        """Test that the next encounter starts fresh symbol tables once they outgrow max_symbols."""
+        analyzer = ESOLogAnalyzer()
+        analyzer.max_symbols = 2
+        analyzer.process_log_entry(ESOLogEntry(100, "UNIT_ADDED",
+                                               ["1", "PLAYER", "T", "1", "0", "F", "117", "7",
+                                                "Test Player", "@testhandle", "123456789", "50", "3084", "0", "PLAYER_ALLY", "T"]))
+        analyzer.process_log_entry(ESOLogEntry(200, "BEGIN_COMBAT", []))
+        analyzer.process_log_entry(ESOLogEntry(300, "BEGIN_CAST",
+                                               ["0", "F", "1", "12345", "1", "100/100", "50/50", "25/25", "0/0", "0/0",
+                                                "0", "0.5", "0.5", "0.0", "*"]))
+        analyzer.current_encounter.add_damage_to_player("1", 1000)
+        first = analyzer.current_encounter
+        first.finalized = True
+
+        # The players carried into the next encounter are interned in its tables
+        analyzer.process_log_entry(ESOLogEntry(1000, "BEGIN_COMBAT", []))
+        encounter = analyzer.current_encounter
+        self.assertIsNot(encounter, first)
+        self.assertIsNot(encounter.symbols, first.symbols)
+        self.assertIs(encounter.symbols, analyzer.symbols)
+        self.assertEqual(encounter.get_player("1").name, "Test Player")
+        self.assertEqual(len(analyzer.symbols.abilities), 0)
+
+        # The earlier encounter still resolves its codes through its own tables
+        self.assertEqual(first.get_player_damage(), {"1": 1000})
+        self.assertEqual(first.get_abilities_used({"12345": "Test Ability"}), {"1": {"Test Ability"}})
+
+    def test_process_log_file_from_position(self):
+        """Test reading entries from a byte range of a log file."""
+        import tempfile
+        lines = [SAMPLE_LOG_LINES['begin_log'], SAMPLE_LOG_LINES['zone_changed'], SAMPLE_LOG_LINES['ability_info']]
+        handle = tempfile.NamedTemporaryFile('wb', suffix='.log', delete=False)
+        with handle:
+            handle.write(('\n'.join(lines) + '\n').encode('utf-8'))
+        self.addCleanup(os.unlink, handle.name)
+
+        analyzer = ESOLogAnalyzer()
+        entries = analyzer._process_log_file_from_position(handle.name)
+        self.assertEqual([entry.event_type for entry in entries], ["BEGIN_LOG", "ZONE_CHANGED", "ABILITY_INFO"])
+
+        second_line_offset = len(lines[0]) + 1
+        entries = analyzer._process_log_file_from_position(handle.name, second_line_offset, second_line_offset + 1)
+        self.assertEqual([entry.event_type for entry in entries], ["ZONE_CHANGED"])
+
+
+class TestLogFileMonitor(unittest.TestCase):
+    """Test tailing a growing log file."""
+
+    def test_partial_line_is_read_once_complete(self):
+        """Test that a line the game is still writing is deferred to the next poll."""
+        import tempfile
+        from pathlib import Path
+        handle = tempfile.NamedTemporaryFile('wb', suffix='.log', delete=False)
+        with handle:
+            handle.write((SAMPLE_LOG_LINES['begin_log'] + '\n').encode('utf-8'))
+        self.addCleanup(os.unlink, handle.name)
+
+        analyzer = ESOLogAnalyzer()
+        monitor = LogFileMonitor(analyzer, Path(handle.name))
+        start_position = monitor.last_position
+
+        zone_line = SAMPLE_LOG_LINES['zone_changed'].encode('utf-8')
+        with open(handle.name, 'ab') as f:
+            f.write(zone_line[:20])
+        self.assertTrue(monitor.check_for_changes())
+        self.assertEqual(monitor.last_position, start_position)
+        self.assertIsNone(analyzer.current_zone)
+
+        with open(handle.name, 'ab') as f:
+            f.write(zone_line[20:] + b'\n')
+        self.assertTrue(monitor.check_for_changes())
+        self.assertEqual(monitor.last_position, start_position + len(zone_line) + 1)
+        self.assertEqual(analyzer.current_zone, "Coral Aerie")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Unit tests for analyzer checkpoints (src/eso_checkpoint.py).
+"""
+
+import unittest
+import sys
+import os
+import io
+import contextlib
+import tempfile
+from pathlib import Path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from esolog_tail import ESOLogAnalyzer, LogFileMonitor, BUFF_ABILITY_IDS
+from eso_checkpoint import CheckpointWriter, checkpoint_path_for, load_checkpoint, save_checkpoint
+
+
+def unit_state(unit_id: int, health: str = "30000/30000") -> str:
+    """A unit state block (unitId, resources, shield, position)"""
+    return f"{unit_id},{health},20000/20000,20000/20000,500/500,1000/1000,0,0.5000,0.5000,1.0000"
+
+
+class TestAnalyzerCheckpoint(unittest.TestCase):
+    """Test saving, resuming and invalidating analyzer checkpoints."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.log_file = Path(self.directory.name) / 'Encounter.log'
+
+        self.lines = [
+            '0,BEGIN_LOG,1755729685851,15,"NA Megaserver","en","eso.live.11.1"',
+            '1,ZONE_CHANGED,1301,"Coral Aerie",VETERAN',
+        ]
+        for unit_id in range(1, 4):
+            self.lines.append(f'2,UNIT_ADDED,{unit_id},PLAYER,F,{unit_id},0,F,117,7,"Player {unit_id}","@player{unit_id}",'
+                              f'{1000 + unit_id},50,3084,0,PLAYER_ALLY,T')
+        self.lines.append('3,UNIT_ADDED,200,MONSTER,F,0,1234,T,0,0,"Boss","",0,50,0,0,HOSTILE,F')
+        self.lines.append('100,BEGIN_COMBAT')
+        buff_id = BUFF_ABILITY_IDS['powerful_assault']
+        for hit in range(40):
+            timestamp = 200 + hit * 100
+            source = hit % 3 + 1
+            if hit % 10 == 0:
+                self.lines.append(f'{timestamp},EFFECT_CHANGED,GAINED,1,{hit},{buff_id},{unit_state(1)},{unit_state(source)}')
+            if hit % 10 == 5:
+                self.lines.append(f'{timestamp},EFFECT_CHANGED,FADED,1,{hit - 5},{buff_id},{unit_state(1)},{unit_state(source)}')
+            self.lines.append(f'{timestamp},COMBAT_EVENT,DAMAGE,FIRE,0,{1000 + hit},0,{hit},{100 + hit % 4},'
+                              f'{unit_state(source)},{unit_state(200, f"{1000000 - hit * 1000}/1000000")}')
+        self.lines.append('4500,END_COMBAT')
+
+    def _write(self, lines, mode='w'):
+        with open(self.log_file, mode, encoding='utf-8', newline='\n') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def _monitor(self, checkpoint: bool) -> LogFileMonitor:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return LogFileMonitor(ESOLogAnalyzer(), self.log_file, read_all_then_tail=True, checkpoint=checkpoint)
+
+    def test_resume_matches_uninterrupted_read(self):
+        """Test that resuming from a mid-fight checkpoint ends in the state of a single read."""
+        split = len(self.lines) - 20
+        self._write(self.lines[:split])
+        first = self._monitor(checkpoint=True)
+        self.assertTrue(checkpoint_path_for(self.log_file).exists())
+        self.assertTrue(first.analyzer.current_encounter.in_combat)
+
+        self._write(self.lines[split:], mode='a')
+        resumed = self._monitor(checkpoint=True)
+        uninterrupted = self._monitor(checkpoint=False)
+
+        self.assertEqual(resumed.last_position, os.path.getsize(self.log_file))
+        self.assertEqual(resumed.last_position, uninterrupted.last_position)
+        encounter = resumed.analyzer.current_encounter
+        expected = uninterrupted.analyzer.current_encounter
+        self.assertEqual(encounter.get_player_damage(), expected.get_player_damage())
+        self.assertEqual(encounter.total_damage, expected.total_damage)
+        self.assertEqual(encounter.get_buff_uptime_table().rows(), expected.get_buff_uptime_table().rows())
+        self.assertEqual(resumed.analyzer.current_zone, "Coral Aerie")
+
+        # The catch-up read saved a checkpoint at the end of the log
+        position, _ = load_checkpoint(self.log_file)
+        self.assertEqual(position, resumed.last_position)
+
+    def test_checkpoint_of_other_log_is_ignored(self):
+        """Test that a checkpoint is ignored once the log is rewritten or truncated."""
+        self._write(self.lines)
+        analyzer = ESOLogAnalyzer()
+        size = os.path.getsize(self.log_file)
+        self.assertTrue(save_checkpoint(self.log_file, size, analyzer.get_checkpoint_state()))
+        self.assertFalse(checkpoint_path_for(self.log_file).with_name('Encounter.log.esocheckpoint.tmp').exists())
+        self.assertEqual(load_checkpoint(self.log_file)[0], size)
+
+        # Truncated below the checkpoint offset
+        self._write(self.lines[:5])
+        self.assertIsNone(load_checkpoint(self.log_file))
+
+        # A new log of the same size
+        self._write([self.lines[0].replace('1755729685851', '1755729999999')] + self.lines[1:])
+        self.assertIsNone(load_checkpoint(self.log_file))
+
+        # A damaged checkpoint
+        checkpoint_path_for(self.log_file).write_bytes(b'not a checkpoint')
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(load_checkpoint(self.log_file))
+
+    def test_saves_append_to_columns(self):
+        """Test that later saves append the new ledger rows rather than rewriting the checkpoint."""
+        split = len(self.lines) - 20
+        self._write(self.lines[:split])
+        analyzer = self._monitor(checkpoint=False).analyzer
+        checkpoint_file = checkpoint_path_for(self.log_file)
+        writer = CheckpointWriter(self.log_file)
+        self.assertTrue(writer.save(100, analyzer.get_checkpoint_state(), analyzer.get_checkpoint_columns()))
+        base_size = checkpoint_file.stat().st_size
+
+        # Rows added after the save are appended in a frame smaller than a full checkpoint
+        ledger = analyzer.current_encounter.damage_ledger
+        rows = len(ledger)
+        for row in range(3):
+            ledger.append(5000 + row, 1, 1, 2, 3, 1000)
+        self.assertTrue(writer.save(200, analyzer.get_checkpoint_state(), analyzer.get_checkpoint_columns()))
+        appended_size = checkpoint_file.stat().st_size - base_size
+        self.assertLess(appended_size, base_size)
+
+        position, state = load_checkpoint(self.log_file)
+        self.assertEqual(position, 200)
+        restored = state['current_encounter'].damage_ledger
+        self.assertEqual(len(restored), rows + 3)
+        self.assertEqual(list(restored.timestamp), list(ledger.timestamp))
+
+        # A frame cut short by an interrupted save falls back to the one before it
+        with open(checkpoint_file, 'r+b') as f:
+            f.truncate(base_size + appended_size // 2)
+        position, state = load_checkpoint(self.log_file)
+        self.assertEqual(position, 100)
+        self.assertEqual(len(state['current_encounter'].damage_ledger), rows)
+
+    def test_unpicklable_state_is_not_saved(self):
+        """Test that a state that cannot be pickled is reported and leaves the checkpoint alone."""
+        self._write(self.lines)
+        size = os.path.getsize(self.log_file)
+        self.assertTrue(save_checkpoint(self.log_file, size, ESOLogAnalyzer().get_checkpoint_state()))
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertFalse(save_checkpoint(self.log_file, 0, {'handler': lambda entry: None}))
+        self.assertIn("Cannot write checkpoint", output.getvalue())
+        self.assertEqual(load_checkpoint(self.log_file)[0], size)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the NumPy columnar decoder (src/eso_log_columnar.py).
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from eso_log_columnar import (
+    NUMPY_AVAILABLE, decode_columns, iter_column_batches, concat_batches, encounter_damage_totals,
+    load_damage_columns
+)
+from esolog_tail import ESOLogEntry, ESOLogAnalyzer, CombatEncounter, EnemyInfo
+
+SOURCE_STATE = '{source},22762/22762,26657/26657,13021/13021,500/500,1000/1000,0,0.2696,0.5942,5.5492'
+TARGET_STATE = '{target},{health}/1500000,0/0,0/0,0/500,0/1000,0,0.2700,0.5950,1.0000'
+
+
+def combat_line(line_number, result, hit_value, source, target, health=1000000):
+    """Build a COMBAT_EVENT line with full source and target unit states."""
+    return (f'{line_number},COMBAT_EVENT,{result},PHYSICAL,1,{hit_value},0,4021681,22141,'
+            + SOURCE_STATE.format(source=source) + ',' + TARGET_STATE.format(target=target, health=health))
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestColumnarDecoder(unittest.TestCase):
+    """Test decoding COMBAT_EVENT/EFFECT_CHANGED blocks into columns."""
+
+    def setUp(self):
+        self.combat_lines = [
+            combat_line(100, 'DAMAGE', 1000, 1, 200, 999000),
+            combat_line(110, 'CRITICAL_DAMAGE', 2500, 2, 200, 996500),
+            combat_line(120, 'DAMAGE', 400, 50, 200),
+            combat_line(130, 'DAMAGE', 300, 4021667, 201),
+            combat_line(140, 'DAMAGE', 700, 1, 300),
+            combat_line(150, 'HEAL', 900, 2, 1),
+            combat_line(160, 'DAMAGE', 0, 1, 200),
+            combat_line(170, 'DAMAGE', 600, 99, 200),
+            combat_line(180, 'DAMAGE', 800, 51, 201),
+        ]
+
+    def test_decode_combat_columns(self):
+        """Test the decoded columns of COMBAT_EVENT lines."""
+        batch = decode_columns(self.combat_lines + ['100,BEGIN_COMBAT', '1,COMBAT_EVENT,DAMAGE'])
+        self.assertEqual(len(batch), len(self.combat_lines))
+        self.assertEqual(batch.event_type, 'COMBAT_EVENT')
+        self.assertEqual(batch.line_number[0], 100)
+        self.assertEqual(batch.value[1], 2500)
+        self.assertEqual(batch.ability_id[0], 22141)
+        self.assertEqual(batch.source_unit_id[3], 4021667)
+        self.assertEqual(batch.target_unit_id[0], 200)
+        self.assertEqual(batch.target_health[0], 999000)
+        self.assertEqual(batch.target_health_max[0], 1500000)
+        self.assertEqual(batch.result_names[batch.result[1]], 'CRITICAL_DAMAGE')
+        self.assertEqual(int(batch.result_mask('HEAL').sum()), 1)
+
+    def test_decode_effect_changed_columns(self):
+        """Test that a '*' target resolves to the source unit."""
+        line = '2928,EFFECT_CHANGED,GAINED,3,4021667,84734,1,22762/22762,26657/26657,13021/13021,500/500,1000/1000,0,0.2696,0.5942,5.5492,*'
+        batch = decode_columns([line], 'EFFECT_CHANGED')
+        self.assertEqual(len(batch), 1)
+        self.assertEqual(batch.result_names, ['GAINED'])
+        self.assertEqual(batch.value[0], 3)
+        self.assertEqual(batch.overflow[0], 0)
+        self.assertEqual(batch.ability_id[0], 84734)
+        self.assertEqual(batch.target_unit_id[0], 1)
+        self.assertEqual(batch.target_health_max[0], 22762)
+
+    def test_malformed_rows_are_dropped(self):
+        """Test that a row with a non-numeric value does not spoil the batch."""
+        lines = self.combat_lines[:2] + [combat_line(105, 'DAMAGE', 'abc', 1, 200)]
+        batch = decode_columns(lines)
+        self.assertEqual(list(batch.line_number), [100, 110])
+        self.assertEqual(batch.result_names, ['CRITICAL_DAMAGE', 'DAMAGE'])
+
+    def test_iter_column_batches(self):
+        """Test batching a log file and concatenating the batches."""
+        handle, path = tempfile.mkstemp(suffix='.log')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            f.write('1,BEGIN_COMBAT\n' + '\n'.join(self.combat_lines) + '\n')
+
+        batches = list(iter_column_batches(path, batch_size=4))
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 1])
+        combined = concat_batches(batches)
+        self.assertEqual(list(combined.line_number), [100, 110, 120, 130, 140, 150, 160, 170, 180])
+        self.assertEqual(combined.result_names[combined.result[5]], 'HEAL')
+
+    def test_damage_totals_match_analyzer(self):
+        """Test that vectorized aggregates match ESOLogAnalyzer's per-event tracking."""
+        encounter = CombatEncounter()
+        encounter.add_player("1", "Player1", "@player1", "117")
+        encounter.add_player("2", "Player2", "@player2", "6")
+        encounter.associate_long_unit_id("1", "4021667")
+        encounter.track_pet_ownership("50", "1")
+        encounter.track_pet_ownership("51", "77")
+        for unit_id, hostile in (("200", True), ("201", True), ("300", False)):
+            enemy = EnemyInfo(unit_id, "Enemy", "MONSTER")
+            enemy.is_hostile = hostile
+            encounter.enemies[unit_id] = enemy
+
+        analyzer = ESOLogAnalyzer()
+        analyzer.current_encounter = encounter
+        for line in self.combat_lines:
+            analyzer._handle_combat_event(ESOLogEntry.parse(line))
+
+        total_damage, player_damage, enemy_damage = encounter_damage_totals(decode_columns(self.combat_lines), encounter)
+        self.assertEqual(total_damage, encounter.total_damage)
+        self.assertEqual(player_damage, encounter.get_player_damage())
+        self.assertEqual(enemy_damage, encounter.get_enemy_damage())
+        self.assertEqual(total_damage, 5000)
+
+    def test_use_damage_columns_matches_analyzer(self):
+        """Test that --columnar-damage fills an encounter like per-event analysis."""
+        lines = self.combat_lines + [
+            combat_line(190, 'DIED_XP', 0, 99, 2),
+            combat_line(195, 'DIED_XP', 0, 1, 202),
+        ]
+        handle, path = tempfile.mkstemp(suffix='.log')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            f.write('1,BEGIN_COMBAT\n' + '\n'.join(lines) + '\n')
+
+        analyzers = []
+        for columnar in (False, True):
+            encounter = CombatEncounter()
+            encounter.add_player("1", "Player1", "@player1", "117")
+            encounter.add_player("2", "Player2", "@player2", "6")
+            encounter.track_pet_ownership("50", "1")
+            for unit_id in ("200", "201", "202"):
+                enemy = EnemyInfo(unit_id, "Enemy", "MONSTER")
+                enemy.is_hostile = True
+                # Health known from earlier events, so the first hit adds it to the health pool
+                enemy.max_health = 1500000
+                encounter.enemies[unit_id] = enemy
+            encounter.start_time = 1
+            encounter.end_time = 200
+
+            analyzer = ESOLogAnalyzer()
+            analyzer.current_encounter = encounter
+            if columnar:
+                analyzer.use_damage_columns(load_damage_columns(path))
+                analyzer._apply_damage_columns(encounter)
+                # Showing the encounter again does not count its deaths twice
+                analyzer._apply_damage_columns(encounter)
+            else:
+                for line in lines:
+                    analyzer._handle_combat_event(ESOLogEntry.parse(line))
+            analyzers.append(analyzer)
+
+        per_event, columnar = analyzers
+        self.assertNotIn('COMBAT_EVENT', columnar.log_parser.structured_parser.subscribed_event_types)
+        self.assertEqual(columnar.zone_deaths, per_event.zone_deaths)
+        self.assertEqual(columnar.zone_deaths, 1)
+        expected, actual = per_event.current_encounter, columnar.current_encounter
+        self.assertEqual(actual.total_damage, expected.total_damage)
+        self.assertEqual(actual.get_player_damage(), expected.get_player_damage())
+        self.assertEqual(actual.get_enemy_damage(), expected.get_enemy_damage())
+        self.assertEqual(actual.get_damage_taken("202"), 1)
+        self.assertEqual(actual.total_health_damaged, expected.total_health_damaged)
+        self.assertEqual(actual.most_damaged_hostile.unit_id, expected.most_damaged_hostile.unit_id)
+        self.assertEqual(actual.enemies["200"].current_health, expected.enemies["200"].current_health)
+        self.assertEqual(actual.highest_health_hostile.unit_id, expected.highest_health_hostile.unit_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,8 +27,8 @@ class TestDamageAttribution(unittest.TestCase):
         encounter.add_damage_to_player("1", 1000)
         
         # Verify damage was attributed
-        self.assertIn("1", encounter.player_damage)
-        self.assertEqual(encounter.player_damage["1"], 1000)
+        self.assertIn("1", encounter.get_player_damage())
+        self.assertEqual(encounter.get_player_damage()["1"], 1000)
     
     def test_pet_damage_attribution(self):
         """Test damage attribution from pets to their owners."""
@@ -44,8 +44,8 @@ class TestDamageAttribution(unittest.TestCase):
         encounter.add_damage_to_player("pet_123", 500)
         
         # Verify damage was attributed to owner
-        self.assertIn("1", encounter.player_damage)
-        self.assertEqual(encounter.player_damage["1"], 500)
+        self.assertIn("1", encounter.get_player_damage())
+        self.assertEqual(encounter.get_player_damage()["1"], 500)
     
     def test_unit_id_matching(self):
         """Test unit ID matching between short and long formats."""
@@ -67,6 +67,208 @@ class TestDamageAttribution(unittest.TestCase):
         self.assertIsNotNone(player)
         self.assertEqual(player.unit_id, "1")
     
+    def test_unit_owner_index(self):
+        """Test that short IDs, long IDs and pets resolve through unit_owners as they are tracked."""
+        encounter = CombatEncounter()
+
+        # A pet whose owner is not known yet resolves once the owner joins
+        encounter.track_pet_ownership("50", "2")
+        self.assertIsNone(encounter.find_unit_owner("50"))
+        self.assertFalse(encounter.is_friendly_unit("50"))
+        encounter.add_player("1", "Player1", "@player1", "117")
+        encounter.add_player("2", "Player2", "@player2", "6")
+        self.assertEqual(encounter.find_unit_owner("50").unit_id, "2")
+        self.assertTrue(encounter.is_friendly_unit("50"))
+
+        # Pets resolve to their owner but are not players themselves
+        self.assertIsNone(encounter.find_player_by_unit_id("50"))
+        encounter.associate_long_unit_id("1", "4021667")
+        encounter.track_pet_ownership("51", "4021667")
+        self.assertEqual(encounter.find_unit_owner("51").unit_id, "1")
+        self.assertEqual(encounter.find_player_by_unit_id("4021667").unit_id, "1")
+
+        # A replaced player takes over its pets but not the old player's long IDs
+        encounter.add_player("1", "Player1b", "@player1b", "117")
+        self.assertIsNone(encounter.find_player_by_unit_id("4021667"))
+        self.assertIsNone(encounter.find_unit_owner("51"))
+        self.assertEqual(encounter.find_player_by_unit_id("1").name, "Player1b")
+
+        # Players carried over from the previous encounter are indexed
+        next_encounter = CombatEncounter()
+        next_encounter.set_players(encounter.players.values())
+        self.assertEqual(next_encounter.find_player_by_unit_id("2").name, "Player2")
+        self.assertIsNone(next_encounter.find_unit_owner("50"))
+
+    def test_unit_maps_are_interned(self):
+        """Test that players, damage totals and pets are keyed by unit code and resolved by unit ID."""
+        encounter = CombatEncounter()
+        encounter.add_player("1", "Player1", "@player1", "117")
+        encounter.track_pet_ownership("50", "1")
+        encounter.add_damage_to_player("50", 300)
+        encounter.add_enemy_damage("70", 300)
+        self.assertFalse(encounter.add_enemy_damage("70", 200))
+
+        units = encounter.symbols.units
+        self.assertEqual(set(encounter.players), {units.code("1")})
+        self.assertEqual(encounter.pet_ownership, {units.code("50"): units.code("1")})
+        self.assertEqual(encounter.player_damage, {units.code("1"): 300})
+        self.assertEqual(encounter.get_player_damage(), {"1": 300})
+        self.assertEqual(encounter.get_enemy_damage(), {"70": 500})
+        self.assertEqual(encounter.get_pet_ownership(), {"50": "1"})
+        self.assertEqual(encounter.get_damage_dealt("1"), 300)
+        self.assertEqual(encounter.get_damage_taken("70"), 500)
+        self.assertTrue(encounter.has_player("1"))
+        self.assertTrue(encounter.is_pet("50"))
+
+        # Looking up an unseen ID does not intern it
+        symbols = len(units)
+        self.assertIsNone(encounter.get_player("99"))
+        self.assertIsNone(encounter.get_damage_taken("99"))
+        self.assertFalse(encounter.is_friendly_unit("99"))
+        self.assertEqual(len(units), symbols)
+
+    def test_buff_uptime_table(self):
+        """Test per-player and group buff uptime from overlapping, clamped and still active buffs."""
+        encounter = CombatEncounter()
+        encounter.add_player("1", "Player1", "@player1", "117")
+        encounter.add_player("2", "Player2", "@player2", "6")
+        encounter.start_time = 1000
+        encounter.end_time = 2000
+
+        # Player 1 gained PA before the encounter started
+        encounter.player_buffs["1"]["PA"] = [(900, 1200), (1500, 1700)]
+        encounter.player_buffs["2"]["PA"] = [(1100, 1300)]
+        encounter.active_buffs["2"]["PA"] = 1900
+        # Not a player: counts for itself but not for the group
+        encounter.player_buffs["70"]["PA"] = [(1300, 1500)]
+        encounter.player_buffs["1"]["MCourage"] = [(1000, 1500), (1500, 2000)]
+
+        table = encounter.get_buff_uptime_table()
+        self.assertAlmostEqual(table.uptime("PA", "1"), 40.0)
+        self.assertAlmostEqual(table.uptime("PA", "2"), 30.0)
+        self.assertAlmostEqual(table.uptime("PA", "70"), 20.0)
+        self.assertAlmostEqual(table.uptime("PA"), 60.0)
+        self.assertAlmostEqual(table.uptime("MCourage"), 100.0)
+        self.assertEqual(table.uptime("LE"), 0.0)
+        self.assertEqual([row[:2] for row in table.rows()],
+                         [("MCourage", None), ("MCourage", "1"), ("PA", None), ("PA", "1"), ("PA", "2"), ("PA", "70")])
+
+        self.assertAlmostEqual(encounter.get_group_buff_uptime("PA"), 60.0)
+        self.assertAlmostEqual(encounter.get_buff_uptime("2", "PA"), 30.0)
+
+    def test_live_group_buff_coverage(self):
+        """Test that track_buff keeps group buff holder counts and covered time up to date."""
+        encounter = CombatEncounter()
+        encounter.add_player("1", "Player1", "@player1", "117")
+        encounter.add_player("2", "Player2", "@player2", "6")
+
+        # Held before combat starts: covered from the start of combat
+        self.assertTrue(encounter.track_buff("1", "PA", "GAINED", 500))
+        encounter.start_time = 1000
+        encounter.start_buff_coverage()
+        self.assertEqual(encounter.buff_holders["PA"], 1)
+
+        # A second holder and a refresh do not change group coverage
+        self.assertFalse(encounter.track_buff("2", "PA", "GAINED", 1100))
+        self.assertFalse(encounter.track_buff("2", "PA", "GAINED", 1150))
+        self.assertFalse(encounter.track_buff("1", "PA", "FADED", 1200))
+        self.assertTrue(encounter.track_buff("2", "PA", "FADED", 1400))
+        self.assertEqual(encounter.buff_holders["PA"], 0)
+        self.assertAlmostEqual(encounter.get_live_group_buff_uptime("PA", 1800), 50.0)
+
+        # Not a player: tracked but not part of group coverage
+        self.assertFalse(encounter.track_buff("70", "PA", "GAINED", 1800))
+        self.assertTrue(encounter.track_buff("1", "PA", "GAINED", 1900))
+        encounter.end_time = 2000
+        encounter.finalize_buff_tracking()
+        self.assertAlmostEqual(encounter.get_live_group_buff_uptime("PA"), 50.0)
+        self.assertAlmostEqual(encounter.get_group_buff_uptime("PA"), 50.0)
+
+    def test_damage_ledger(self):
+        """Test time-resolved damage views of the damage ledger."""
+        encounter = CombatEncounter()
+        encounter.add_player("1", "Player1", "@player1", "117")
+        encounter.add_player("2", "Player2", "@player2", "6")
+        player1, player2 = encounter.get_player("1"), encounter.get_player("2")
+        encounter.start_time = 1000
+        encounter.end_time = 4500
+
+        encounter.record_damage(1000, "1", player1, "70", "100", 500)
+        encounter.record_damage(1500, "50", player1, "70", "200", 300)  # Pet of player 1
+        encounter.record_damage(2100, "2", player2, "71", "100", 1000)
+        encounter.record_damage(4400, "2", player2, "70", "100", 50)
+        encounter.record_damage(4499, "60", None, "70", "300", 7)  # Pet with unknown owner
+
+        ledger = encounter.damage_ledger
+        units = encounter.symbols.units
+        self.assertEqual(len(ledger), 5)
+        self.assertEqual(encounter.get_damage_timeline(), [800, 1000, 0, 57])
+        self.assertEqual(encounter.get_damage_timeline(player_unit_id="1"), [800, 0, 0, 0])
+        self.assertEqual(encounter.get_damage_timeline(player_unit_id="99"), [0, 0, 0, 0])
+        self.assertEqual(ledger.window(1500, 4400), range(1, 3))
+
+        self.assertEqual(ledger.burst(1000), (1500, 1300))
+        self.assertEqual(ledger.burst(1000, player=units.code("1")), (1000, 800))
+        for window in (0, -1000):
+            with self.assertRaises(ValueError):
+                ledger.burst(window)
+        self.assertEqual(ledger.totals_by('target'), {units.code("70"): 857, units.code("71"): 1000})
+        self.assertEqual(ledger.totals_by('player', target=units.code("70")),
+                         {units.code("1"): 800, units.code("2"): 50, -1: 7})
+
+    def test_sliding_dps_meter(self):
+        """Test group, player and target DPS over a sliding window."""
+        from esolog_tail import SlidingDpsMeter
+        meter = SlidingDpsMeter(window=2000, start_time=0)
+        meter.add(0, 1, 70, 1000)
+        meter.add(500, -1, 70, 500)  # Pet of an unknown owner counts for the group only
+        self.assertEqual(meter.dps(1000, 0), 1500.0)  # Only 1s into the fight
+        meter.add(1500, 2, 71, 2000)
+        meter.add(2500, 1, 70, 1000)
+
+        # At 3000 the hits at 0 and 500 have left the 2s window
+        self.assertEqual(meter.dps(3000, 0), 1500.0)
+        self.assertEqual(meter.dps(3000, 0, player=1), 500.0)
+        self.assertEqual(meter.dps(3000, 0, target=70), 500.0)
+        self.assertEqual(meter.dps(3000, 0, player=99), 0.0)
+        self.assertEqual(len(meter.group.hits), 2)
+
+        # A target that is no longer hit leaves the meter on the next refresh
+        meter.expire(4000)
+        self.assertEqual(set(meter.targets), {70})
+        self.assertEqual(set(meter.players), {1})
+        self.assertEqual(meter.dps(4000, 0, target=71), 0.0)
+        meter.expire(4500)
+        self.assertEqual((dict(meter.players), dict(meter.targets), meter.group.total), ({}, {}, 0))
+
+    def test_damage_breakdown(self):
+        """Test the per-ability and per-target damage breakdown of each player."""
+        # Disabled by default: totals are still tracked, the breakdown is not
+        encounter = CombatEncounter()
+        encounter.add_player("1", "Player1", "@player1", "117")
+        encounter.add_damage_to_player("1", 1000, "70", "100")
+        self.assertEqual(encounter.get_player_damage()["1"], 1000)
+        self.assertEqual(encounter.get_damage_breakdown(), {})
+
+        encounter = CombatEncounter(damage_breakdown=True)
+        encounter.add_player("1", "Player1", "@player1", "117")
+        encounter.add_player("2", "Player2", "@player2", "6")
+        encounter.track_pet_ownership("50", "1")
+        encounter.add_damage_to_player("1", 1000, "70", "100")
+        encounter.add_damage_to_player("1", 500, "71", "100")
+        encounter.add_damage_to_player("50", 300, "70", "200")  # Pet damage counts for its owner
+        encounter.add_damage_to_player("2", 2000, "70", "100")
+        encounter.add_damage_to_player("99", 700, "70", "100")  # Unknown unit
+        encounter.add_damage_to_player("2", 400)  # No ability or target: totals only
+
+        breakdown = encounter.get_damage_breakdown()
+        self.assertEqual(set(breakdown), {"1", "2"})
+        self.assertEqual(breakdown["1"]["abilities"], {"100": 1500, "200": 300})
+        self.assertEqual(breakdown["1"]["targets"], {"70": 1300, "71": 500})
+        self.assertEqual(breakdown["2"]["abilities"], {"100": 2000})
+        self.assertEqual(breakdown["2"]["targets"], {"70": 2000})
+        self.assertEqual(encounter.get_player_damage()["2"], 2400)
+
     def test_multiple_players_damage(self):
         """Test damage attribution with multiple players."""
         encounter = CombatEncounter()
@@ -80,10 +282,10 @@ class TestDamageAttribution(unittest.TestCase):
         encounter.add_damage_to_player("2", 2000)
         
         # Verify both players have damage attributed
-        self.assertIn("1", encounter.player_damage)
-        self.assertIn("2", encounter.player_damage)
-        self.assertEqual(encounter.player_damage["1"], 1500)
-        self.assertEqual(encounter.player_damage["2"], 2000)
+        self.assertIn("1", encounter.get_player_damage())
+        self.assertIn("2", encounter.get_player_damage())
+        self.assertEqual(encounter.get_player_damage()["1"], 1500)
+        self.assertEqual(encounter.get_player_damage()["2"], 2000)
     
     def test_unknown_unit_damage(self):
         """Test damage from unknown units."""
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the sidecar parse cache (src/eso_log_cache.py).
+"""
+
+import unittest
+import sys
+import os
+import pickle
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from eso_log_parser import ESOLogParser, iter_entries
+from eso_log_cache import CachedLogEntry, ParsedLogCache, iter_cached_entries, cache_path_for
+
+
+class TestParsedLogCache(unittest.TestCase):
+    """Test building, reusing, extending and invalidating the sidecar."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.log_file = os.path.join(self.directory.name, 'Encounter.log')
+        self.lines = [
+            '5,BEGIN_LOG,1755729685851,15,"NA Megaserver","en","eso.live.11.1"',
+            '5,ZONE_CHANGED,1301,"Coral Aerie",VETERAN',
+            '5,TRIAL_INIT,18,F,F,0,0,F,0',
+            '2928,ABILITY_INFO,84734,"Witchfest Food: Max HM, Reg M","/esoui/art/icons/ability_mage_065.dds",T,T',
+            '2928,MAP_CHANGED,2110,"Brackish Cove","summerset/CoralAerie_Beach_001"',
+            '3000,BEGIN_COMBAT',
+        ]
+        self._write(self.lines)
+
+    def _write(self, lines, mode='w'):
+        with open(self.log_file, mode, encoding='utf-8', newline='\n') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def _assert_matches_parser(self, event_types=None):
+        """Cached entries must equal those of a fresh parse"""
+        expected = list(iter_entries(self.log_file, parser=ESOLogParser(event_types=event_types)))
+        cached = list(iter_cached_entries(self.log_file, ESOLogParser(event_types=event_types)))
+        self.assertEqual(cached, expected)
+        return cached
+
+    def test_build_and_reuse(self):
+        """Test that the first read builds the sidecar and later reads are served from it."""
+        self._assert_matches_parser()
+        self.assertTrue(cache_path_for(self.log_file).exists())
+
+        cache = ParsedLogCache(self.log_file)
+        self.assertEqual(cache.covered_end, os.path.getsize(self.log_file))
+        # Trial entries keep their converted fields and empty original_line
+        cached = self._assert_matches_parser()
+        trial = [entry for _, entry, _ in cached if entry.event_type == 'TRIAL_INIT'][0]
+        self.assertEqual(trial.original_line, '')
+        self.assertEqual(trial.fields[0], '18')
+
+        # A subscription is served from the same sidecar
+        self._assert_matches_parser(event_types=['ZONE_CHANGED', 'BEGIN_COMBAT'])
+
+    def test_incremental_append(self):
+        """Test that appended lines are parsed and added to the sidecar."""
+        self._assert_matches_parser()
+        records_end = ParsedLogCache(self.log_file).records_end
+
+        self._write(['3500,END_COMBAT', '4000,END_LOG'], mode='a')
+        self._assert_matches_parser()
+        cache = ParsedLogCache(self.log_file)
+        self.assertGreater(cache.records_end, records_end)
+        self.assertEqual(cache.covered_end, os.path.getsize(self.log_file))
+
+    def test_partial_line_is_not_cached(self):
+        """Test that a trailing partial line is parsed but left out of the sidecar."""
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            f.write('3500,END_COMBAT')
+        self._assert_matches_parser()
+        self.assertEqual(ParsedLogCache(self.log_file).covered_end,
+                         os.path.getsize(self.log_file) - len('3500,END_COMBAT'))
+
+    def test_rewritten_log_invalidates_cache(self):
+        """Test that a log with a different prefix rebuilds the sidecar."""
+        self._assert_matches_parser()
+        self._write(['9,BEGIN_LOG,1755800000000,15,"EU Megaserver","en","eso.live.11.1"', '10,BEGIN_COMBAT'])
+        self.assertEqual(ParsedLogCache(self.log_file).covered_end, 0)
+        cached = self._assert_matches_parser()
+        self.assertEqual(len(cached), 2)
+
+    def test_packed_records(self):
+        """Test that record event types are read back packed, without their lines unless asked for."""
+        combat_lines = [
+            '3001,COMBAT_EVENT,DAMAGE,FIRE,0,4279,0,0,1120,2,21896/21896,27034/29628,11388/13021,500/500,1000/1000,0,0.3121,0.5651,5.1608,200,900000/1000000,0/0,0/0,0/0,0/0,0,0.4,0.5,1.2',
+            '3002,COMBAT_EVENT,HEAL,GENERIC,0,500,0,11,1009,2,21896/21896,27034/29628,11388/13021,500/500,1000/1000,0,0.3121,0.5651,5.1608,*',
+            # More than four decimals does not fit the packed form and is kept as its line
+            '3003,COMBAT_EVENT,DAMAGE,FIRE,0,10,0,12,1120,2,21896/21896,27034/29628,11388/13021,500/500,1000/1000,0,0.31215,0.5651,5.1608,*',
+        ]
+        self._write(combat_lines, mode='a')
+        record_types = ['COMBAT_EVENT']
+
+        def read(lines=True):
+            parser = ESOLogParser(event_types=['COMBAT_EVENT', 'ZONE_CHANGED'], record_event_types=record_types)
+            entries = list(iter_cached_entries(self.log_file, parser, lines=lines))
+            return [(offset, entry.event_type, entry.timestamp, parser.decode_record(entry), entry.original_line, line)
+                    for offset, entry, line in entries]
+
+        expected = read()
+        self.assertEqual(len(expected), 4)
+        self.assertEqual(read(), expected)
+        self.assertEqual([line for *_, line in read(lines=False)], [self.lines[1], '', '', combat_lines[2]])
+        self.assertEqual([record for _, _, _, record, _, _ in read(lines=False)],
+                         [record for _, _, _, record, _, _ in expected])
+
+        parser = ESOLogParser(record_event_types=record_types)
+        cached = [entry for _, entry, _ in iter_cached_entries(self.log_file, parser)]
+        combat = [entry for entry in cached if entry.event_type == 'COMBAT_EVENT']
+        self.assertEqual([isinstance(entry, CachedLogEntry) for entry in combat], [True, True, False])
+        # Packed entries read their fields and line back from the log, field by field like a fresh parse
+        fresh = [entry for _, entry, _ in iter_entries(self.log_file, parser=ESOLogParser(record_event_types=record_types))
+                 if entry.event_type == 'COMBAT_EVENT']
+        unread = [entry for _, entry, _ in iter_cached_entries(self.log_file, parser, lines=False)
+                  if entry.event_type == 'COMBAT_EVENT']
+        for entries in (combat, unread):
+            self.assertEqual(len(entries), len(fresh))
+            for entry, fresh_entry in zip(entries, fresh):
+                self.assertEqual(entry.fields, fresh_entry.fields)
+                self.assertEqual(entry.original_line, fresh_entry.original_line)
+                self.assertEqual((entry.timestamp, entry.event_type), (fresh_entry.timestamp, fresh_entry.event_type))
+                self.assertEqual(entry.structured, fresh_entry.structured)
+        self.assertEqual(pickle.loads(pickle.dumps(combat[0])), fresh[0])
+        self.assertIs(combat[1].structured.target_unit_state, combat[1].structured.source_unit_state)
+        self.assertEqual(combat[0].structured.target_unit_state.map_normalised_x, 0.4)
+        # Legacy entries of every other type still equal a fresh parse
+        self.assertEqual([entry for entry in cached if entry.event_type != 'COMBAT_EVENT'],
+                         [entry for _, entry, _ in iter_entries(self.log_file, parser=ESOLogParser())
+                          if entry.event_type != 'COMBAT_EVENT'])
+
+    def test_end_offset(self):
+        """Test reading only up to an end offset."""
+        self._assert_matches_parser()
+        end_offset = len('\n'.join(self.lines[:2])) + 1
+        cached = list(iter_cached_entries(self.log_file, ESOLogParser(), end_offset))
+        self.assertEqual([line for _, _, line in cached], self.lines[:2])
+
+
+if __name__ == '__main__':
+    unittest.main()
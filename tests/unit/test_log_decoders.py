@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the generated encounter log decoders (src/eso_log_decoders.py).
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+
+import eso_log_decoders
+from eso_log_structures import ESOLogStructureParser, tokenize_line
+
+
+class TestLogDecoders(unittest.TestCase):
+    """Test the spec-generated per-line-type decoders."""
+
+    def setUp(self):
+        self.sample_lines = {
+            'combat_event': '2980,COMBAT_EVENT,DAMAGE,PHYSICAL,1,3546,0,4021681,22141,1,22762/22762,26657/26657,13021/13021,500/500,1000/1000,0,0.2696,0.5942,5.5492,7,1000000/1500000,0/0,0/0,0/500,0/1000,0,0.2700,0.5950,1.0000',
+            'effect_changed': '2928,EFFECT_CHANGED,GAINED,1,4021667,84734,1,22762/22762,26657/26657,13021/13021,500/500,1000/1000,0,0.2696,0.5942,5.5492,*',
+            'ability_info': '2928,ABILITY_INFO,84734,"Witchfest Food: Max HM, Reg M","/esoui/art/icons/ability_mage_065.dds",T,T',
+            'ability_info_scribed': '2928,ABILITY_INFO,214960,"Ulfsild\'s Contingency","/esoui/art/icons/ability_grimoire.dds",T,T,"Healing Contingency","Gladiator\'s Tenacity","Cowardice"',
+            'end_cast': '3000,END_CAST,INTERRUPTED,4021700,22141,38984,7',
+            'player_info': '40604,PLAYER_INFO,1,[142210,142079],[1,2],[[HEAD,95044,T,16,ARMOR_DIVINES,LEGENDARY,270,MAGICKA,T,16,LEGENDARY],[NECK,194512,F,16,JEWELRY_INFUSED,LEGENDARY,694,INCREASE_SPELL_DAMAGE,T,16,LEGENDARY]],[183006,183122],[39028,86169]',
+        }
+
+    def test_decode_combat_event(self):
+        """Test decoding a COMBAT_EVENT with an explicit target unit state."""
+        entry = eso_log_decoders.decode_fields(tokenize_line(self.sample_lines['combat_event']))
+        self.assertIsInstance(entry, eso_log_decoders.CombatEventLine)
+        self.assertEqual(entry.line_number, 2980)
+        self.assertEqual(entry.action_result, "DAMAGE")
+        self.assertEqual(entry.damage_type, "PHYSICAL")
+        self.assertEqual(entry.hit_value, 3546)
+        self.assertEqual(entry.cast_track_id, 4021681)
+        self.assertEqual(entry.ability_id, 22141)
+        self.assertEqual(entry.source_unit_state.unit_id, 1)
+        self.assertEqual(entry.source_unit_state.magicka_max, 26657)
+        self.assertEqual(entry.target_unit_state.unit_id, 7)
+        self.assertEqual(entry.target_unit_state.health, 1000000)
+        self.assertEqual(entry.target_unit_state.health_max, 1500000)
+        self.assertAlmostEqual(entry.target_unit_state.heading_radians, 1.0)
+
+    def test_unit_state_is_decoded_lazily(self):
+        """Test that unit states keep their raw tokens and decode components on access."""
+        fields = tokenize_line(self.sample_lines['combat_event'].replace('26657/26657', 'x/26657'))
+        entry = eso_log_decoders.decode_combat_event(fields)
+        self.assertEqual(entry.source_unit_state.unit_id, 1)
+        self.assertEqual(entry.source_unit_state.magicka_max, 26657)
+        with self.assertRaises(ValueError):
+            entry.source_unit_state.magicka
+        self.assertIn("health_max=1500000", repr(entry.target_unit_state))
+        self.assertEqual(entry.target_unit_state,
+                         eso_log_decoders.decode_combat_event(tokenize_line(self.sample_lines['combat_event'])).target_unit_state)
+
+        # A malformed unit ID still rejects the line
+        self.assertIsNone(eso_log_decoders.decode_fields(tokenize_line(self.sample_lines['combat_event'].replace(',7,', ',x,'))))
+
+    def test_decode_target_same_as_source(self):
+        """Test that a '*' target reuses the source unit state and optional fields default to None."""
+        entry = eso_log_decoders.decode_effect_changed(tokenize_line(self.sample_lines['effect_changed']))
+        self.assertEqual(entry.change_type, "GAINED")
+        self.assertEqual(entry.ability_id, 84734)
+        self.assertIs(entry.target_unit_state, entry.source_unit_state)
+        self.assertIsNone(entry.player_initiated_remove_cast_track_id)
+
+        entry = eso_log_decoders.decode_effect_changed(tokenize_line(self.sample_lines['effect_changed'] + ',4021700'))
+        self.assertEqual(entry.player_initiated_remove_cast_track_id, 4021700)
+
+    def test_decode_optional_fields(self):
+        """Test trailing optional fields and composites."""
+        entry = eso_log_decoders.decode_fields(tokenize_line(self.sample_lines['ability_info']))
+        self.assertEqual(entry.name, "Witchfest Food: Max HM, Reg M")
+        self.assertTrue(entry.blockable)
+        self.assertIsNone(entry.scribing_info)
+
+        entry = eso_log_decoders.decode_fields(tokenize_line(self.sample_lines['ability_info_scribed']))
+        self.assertEqual(entry.scribing_info.focus_script, "Healing Contingency")
+        self.assertEqual(entry.scribing_info.affix_script, "Cowardice")
+
+        entry = eso_log_decoders.decode_fields(tokenize_line(self.sample_lines['end_cast']))
+        self.assertEqual(entry.end_reason, "INTERRUPTED")
+        self.assertEqual(entry.interrupting_ability_id, 38984)
+        self.assertEqual(entry.interrupting_unit_id, 7)
+
+    def test_decode_player_info(self):
+        """Test decoding the bracketed arrays of PLAYER_INFO."""
+        entry = eso_log_decoders.decode_fields(tokenize_line(self.sample_lines['player_info']))
+        self.assertEqual(entry.unit_id, 1)
+        self.assertEqual(entry.long_term_effect_ability_ids, [142210, 142079])
+        self.assertEqual(entry.long_term_effect_stack_counts, [1, 2])
+        self.assertEqual(len(entry.equipment), 2)
+        self.assertEqual(entry.equipment[0].slot, "HEAD")
+        self.assertEqual(entry.equipment[0].set_id, 270)
+        self.assertFalse(entry.equipment[1].is_cp)
+        self.assertEqual(entry.primary_ability_ids, [183006, 183122])
+        self.assertEqual(entry.backup_ability_ids, [39028, 86169])
+
+    def test_decode_malformed_lines(self):
+        """Test that malformed or mistyped lines decode to None."""
+        self.assertIsNone(eso_log_decoders.decode_fields([]))
+        self.assertIsNone(eso_log_decoders.decode_fields(tokenize_line("1,NOT_A_TYPE,1")))
+        self.assertIsNone(eso_log_decoders.decode_fields(tokenize_line("1,COMBAT_EVENT,DAMAGE")))
+        self.assertIsNone(eso_log_decoders.decode_combat_event(tokenize_line(self.sample_lines['effect_changed'])))
+        self.assertIsNone(eso_log_decoders.decode_fields(tokenize_line("1,UNIT_REMOVED,abc")))
+
+    def test_structure_parser_decode_respects_subscriptions(self):
+        """Test ESOLogStructureParser.decode_line with event type subscriptions."""
+        parser = ESOLogStructureParser(event_types=["COMBAT_EVENT"])
+        self.assertIsInstance(parser.decode_line(self.sample_lines['combat_event']), eso_log_decoders.CombatEventLine)
+        self.assertIsNone(parser.decode_line(self.sample_lines['effect_changed']))
+
+    def test_generated_module_is_up_to_date(self):
+        """Test that src/eso_log_decoders.py matches the spec it was generated from."""
+        from generate_log_decoders import load_spec, generate_python_module, OUTPUT_FILE
+        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), generate_python_module(load_spec()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -254,6 +254,244 @@ class TestESOLogParser(unittest.TestCase):
         self.assertEqual(parsed.name, "")
         self.assertEqual(parsed.handle, "")
 
+    def test_tokenize_line_matches_csv_reader(self):
+        """Test that the tokenizer fast path yields the same fields as csv.reader."""
+        import csv
+        import io
+        from eso_log_structures import tokenize_line
+
+        for line in self.sample_lines.values():
+            expected = next(csv.reader(io.StringIO(line)))
+            self.assertEqual(tokenize_line(line), expected)
+            self.assertEqual(tokenize_line(line + '\n'), expected)
+
+        self.assertEqual(tokenize_line(""), [])
+        self.assertEqual(tokenize_line("   \n"), [])
+
+    def test_parse_helpers_reuse_tokenized_entry(self):
+        """Test that parse_* helpers reuse the structured entry instead of re-parsing the line."""
+        entry = self.parser.parse_line(self.sample_lines['begin_cast'])
+        self.assertIsNotNone(entry.structured)
+
+        # Any further decoding of the raw line would fail loudly
+        def fail(line):
+            raise AssertionError("line was tokenized twice")
+        self.parser.structured_parser.parse_line = fail
+
+        parsed = self.parser.parse_begin_cast(entry)
+        self.assertIsNotNone(parsed)
+        self.assertEqual(parsed.stats, entry.fields[5:])
+
+        entry = self.parser.parse_line(self.sample_lines['player_info'])
+        parsed = self.parser.parse_player_info(entry)
+        self.assertEqual(parsed.champion_points, ["183006", "183122", "38901", "25267", "217699", "113105"])
+        self.assertEqual(parsed.additional_data, ["39028", "86169", "86156", "185842", "217699", "86113"])
+
+    def test_record_event_types_carry_decoder_records(self):
+        """Test that record event types are decoded straight into eso_log_decoders records."""
+        from eso_log_decoders import BeginCastLine, EffectChangedLine
+        parser = ESOLogParser(record_event_types=['BEGIN_CAST', 'EFFECT_CHANGED'])
+        for name, record_type in (('begin_cast', BeginCastLine), ('effect_changed_gained', EffectChangedLine)):
+            line = self.sample_lines[name]
+            entry = parser.parse_line(line)
+            self.assertIsInstance(entry.structured, record_type)
+            self.assertIs(parser.decode_record(entry), entry.structured)
+            # The legacy view of the entry is unchanged
+            self.assertEqual(entry, self.parser.parse_line(line))
+
+        # The adapter decodes entries that carry no record from their fields
+        legacy = self.parser.parse_line(self.sample_lines['begin_cast'])
+        record = parser.decode_record(legacy)
+        self.assertEqual(record, parser.parse_line(self.sample_lines['begin_cast']).structured)
+        self.assertEqual(record.line_number, 2928)
+        self.assertEqual(record.source_unit_state.unit_id, 1)
+        self.assertEqual(record.source_unit_state.health_max, 22762)
+        self.assertIsNone(parser.decode_record(ESOLogEntry(1, 'BEGIN_CAST', ['0', 'F'], '')))
+
+        # The parse_* helpers still get the hand-written structured entry
+        parsed = parser.parse_begin_cast(parser.parse_line(self.sample_lines['begin_cast']))
+        self.assertEqual(parsed.ability_id, '84734')
+
+    def test_player_info_memoized_by_payload(self):
+        """Test that a re-emitted PLAYER_INFO build is decoded once and re-stamped per line."""
+        line = self.sample_lines['player_info']
+        repeated_line = '50000' + line[line.index(','):]
+
+        first = self.parser.parse_player_info(self.parser.parse_line(line))
+        second_entry = self.parser.parse_line(repeated_line)
+        second = self.parser.parse_player_info(second_entry)
+
+        self.assertEqual(first.timestamp, 40604)
+        self.assertEqual(second.timestamp, 50000)
+        self.assertEqual(second_entry.timestamp, 50000)
+        self.assertEqual(second_entry.structured.line_number, 50000)
+        self.assertIs(second.gear_data, first.gear_data)
+        self.assertEqual(second.champion_points, first.champion_points)
+
+        # The cache is bounded
+        self.parser.PLAYER_INFO_CACHE_SIZE = 2
+        for unit_id in range(5):
+            self.parser.parse_line(line.replace('PLAYER_INFO,1,', f'PLAYER_INFO,{unit_id + 10},', 1))
+        self.assertEqual(len(self.parser._player_info_cache), 2)
+
+    def _write_log(self, lines, newline='\n'):
+        """Write lines to a temporary log file and return its path."""
+        import tempfile
+        handle = tempfile.NamedTemporaryFile('wb', suffix='.log', delete=False)
+        with handle:
+            handle.write(newline.join(lines).encode('utf-8') + newline.encode('utf-8'))
+        self.addCleanup(os.unlink, handle.name)
+        return handle.name
+
+    def test_iter_raw_lines_offsets(self):
+        """Test that the binary line reader yields exact offsets across chunk boundaries."""
+        from eso_log_parser import iter_raw_lines
+        lines = [self.sample_lines['begin_log'], '', self.sample_lines['zone_changed'], self.sample_lines['begin_cast']]
+        path = self._write_log(lines, newline='\r\n')
+
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        for chunk_size in (7, 64, 1024 * 1024):
+            result = list(iter_raw_lines(path, chunk_size=chunk_size))
+            self.assertEqual([raw.decode('utf-8') for _, raw in result],
+                             [line for line in lines if line])
+            for offset, raw in result:
+                self.assertTrue(data[offset:].startswith(raw))
+
+        # end_offset stops before the first line starting at or after it
+        second_offset = result[1][0]
+        self.assertEqual(len(list(iter_raw_lines(path, end_offset=second_offset))), 1)
+        self.assertEqual(len(list(iter_raw_lines(path, start_offset=second_offset))), 2)
+
+    def test_iter_mmap_lines_matches_raw_reader(self):
+        """Test that the memory-mapped reader yields the same lines and offsets as the chunked reader."""
+        from eso_log_parser import iter_raw_lines, iter_mmap_lines
+        lines = [self.sample_lines['begin_log'], '', self.sample_lines['zone_changed'], self.sample_lines['begin_cast']]
+        path = self._write_log(lines, newline='\r\n')
+        expected = list(iter_raw_lines(path))
+
+        for chunk_size in (7, 64, 1024 * 1024):
+            self.assertEqual(list(iter_mmap_lines(path, chunk_size=chunk_size)), expected)
+
+        second_offset = expected[1][0]
+        self.assertEqual(list(iter_mmap_lines(path, end_offset=second_offset)), expected[:1])
+        self.assertEqual(list(iter_mmap_lines(path, start_offset=second_offset, chunk_size=7)), expected[1:])
+
+        # Empty files cannot be mapped and fall back to the chunked reader
+        self.assertEqual(list(iter_mmap_lines(self._write_log([], newline=''))), [])
+
+    def test_parse_file_skips_unsubscribed_lines(self):
+        """Test bulk file parsing with event type subscriptions."""
+        path = self._write_log([self.sample_lines['begin_log'], self.sample_lines['map_changed'],
+                                self.sample_lines['ability_info']])
+
+        parser = ESOLogParser(event_types=["BEGIN_LOG", "ABILITY_INFO"])
+        results = list(parser.parse_file(path))
+
+        self.assertEqual([entry.event_type for entry, _ in results], ["BEGIN_LOG", "ABILITY_INFO"])
+        self.assertEqual(results[1][1], self.sample_lines['ability_info'])
+        self.assertEqual(len(list(self.parser.parse_file(path))), 3)
+
+    def test_iter_entries_streams_offsets(self):
+        """Test the streaming entry API and its byte offsets."""
+        import types
+        from eso_log_parser import iter_entries, complete_lines_end, next_line_start
+        lines = [self.sample_lines['begin_log'], self.sample_lines['map_changed'], self.sample_lines['zone_changed']]
+        path = self._write_log(lines)
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        stream = iter_entries(path, event_types=["BEGIN_LOG", "ZONE_CHANGED"])
+        self.assertIsInstance(stream, types.GeneratorType)
+        results = list(stream)
+        self.assertEqual([entry.event_type for _, entry, _ in results], ["BEGIN_LOG", "ZONE_CHANGED"])
+        for offset, _, line in results:
+            self.assertTrue(data[offset:].startswith(line.encode('utf-8')))
+
+        # Resume from the offset of an entry, reusing an existing parser
+        resumed = list(iter_entries(path, start_offset=results[1][0], parser=self.parser))
+        self.assertEqual([line for _, _, line in resumed], [self.sample_lines['zone_changed']])
+
+        # A trailing partial line is excluded by complete_lines_end
+        self.assertEqual(complete_lines_end(path, 0, len(data)), len(data))
+        self.assertEqual(complete_lines_end(path, 0, len(data) - 1), len(data) - len(lines[-1]) - 1)
+        self.assertEqual(complete_lines_end(path, 3, 4), 3)
+
+        # The first full line at or after an arbitrary offset
+        self.assertEqual(next_line_start(path, 0), 0)
+        self.assertEqual(next_line_start(path, 1), results[1][0] - len(lines[1]) - 1)
+        self.assertEqual(next_line_start(path, results[1][0]), results[1][0])
+
+    def test_compressed_input(self):
+        """Test that gzip, bz2 and xz logs are detected and streamed like the plain file."""
+        import bz2
+        import gzip
+        import lzma
+        from eso_log_parser import iter_entries, detect_compression, ReadStats
+        lines = [self.sample_lines['begin_log'], self.sample_lines['zone_changed'], self.sample_lines['ability_info']]
+        path = self._write_log(lines)
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.assertIsNone(detect_compression(path))
+        expected = list(iter_entries(path))
+
+        for compression, compress in (('gzip', gzip.compress), ('bz2', bz2.compress), ('xz', lzma.compress)):
+            compressed_path = path + '.' + compression
+            with open(compressed_path, 'wb') as f:
+                f.write(compress(data))
+            self.addCleanup(os.unlink, compressed_path)
+
+            self.assertEqual(detect_compression(compressed_path), compression)
+            stats = ReadStats()
+            self.assertEqual(list(iter_entries(compressed_path, stats=stats)), expected)
+            self.assertEqual(stats.compression, compression)
+            self.assertEqual(stats.bytes_read, len(data))
+            self.assertEqual(stats.file_bytes, os.path.getsize(compressed_path))
+
+    def test_split_byte_ranges(self):
+        """Test that byte ranges cover the file and end on line boundaries."""
+        from eso_log_parser import split_byte_ranges
+        path = self._write_log([self.sample_lines[key] for key in sorted(self.sample_lines)])
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        ranges = split_byte_ranges(path, chunk_size=100)
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(data))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[end - 1:end], b'\n')
+
+    def test_iter_entries_parallel_matches_sequential(self):
+        """Test that worker processes yield the entries of a serial parse, in file order."""
+        from eso_log_parser import iter_entries
+        from eso_log_parallel import iter_entries_parallel
+        lines = [self.sample_lines[key] for key in sorted(self.sample_lines)] * 3
+        path = self._write_log(lines)
+
+        def new_parser():
+            return ESOLogParser(event_types=['BEGIN_CAST', 'EFFECT_CHANGED', 'PLAYER_INFO', 'ZONE_CHANGED'],
+                                record_event_types=['BEGIN_CAST', 'EFFECT_CHANGED'])
+
+        def summary(entries):
+            return [(offset, entry.timestamp, entry.event_type, entry.fields, entry.original_line, entry.structured, line)
+                    for offset, entry, line in entries]
+
+        expected = summary(iter_entries(path, parser=new_parser()))
+        self.assertEqual(len(expected), 18)
+        parallel = summary(iter_entries_parallel(path, new_parser(), workers=2, chunk_size=512))
+        self.assertEqual(parallel, expected)
+
+        # Without lines, packed records come back with '' as their line
+        unread = list(iter_entries_parallel(path, new_parser(), workers=2, chunk_size=512, lines=False))
+        self.assertEqual([line for _, entry, line in unread if entry.event_type == 'EFFECT_CHANGED'], [''] * 9)
+        self.assertEqual([entry[:-1] for entry in summary(unread)], [entry[:-1] for entry in expected])
+
+        # A single range is parsed in this process
+        self.assertEqual(summary(iter_entries_parallel(path, new_parser(), workers=2)), expected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -9,7 +9,13 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
+from unittest import mock
+
+import eso_log_decoders
 from eso_log_structures import (
+    AbilityInfoEntry,
+    BeginLogEntry,
+    EndCastEntry,
     ESOLogStructureParser,
     HealthRegenEntry,
     EndlessDungeonBeginEntry,
@@ -166,6 +172,22 @@ class TestNewLogEntryTypes(unittest.TestCase):
             result = self.parser.parse_line(line)
             self.assertIsNone(result, f"Expected None for invalid line: {line}")
 
+    def test_legacy_field_names(self):
+        """Test which spec fields the legacy ABILITY_INFO, END_CAST and BEGIN_LOG names carry."""
+        ability = AbilityInfoEntry.parse('2928,ABILITY_INFO,84734,"Witchfest Food","/esoui/art/icons/food.dds",T,F')
+        self.assertEqual((ability.is_passive, ability.is_ultimate), (True, False))  # interruptible, blockable
+
+        end_cast = EndCastEntry.parse('2928,END_CAST,COMPLETED,4021667,84734')
+        self.assertEqual((end_cast.caster_unit_id, end_cast.ability_id), (4021667, 84734))  # castTrackId, interruptedAbilityId
+        self.assertIsNone(EndCastEntry.parse('2928,END_CAST,COMPLETED,4021667'))
+        # A record without the ability ID is rejected rather than giving ability_id None
+        record = eso_log_decoders.EndCastLine(2928, 'COMPLETED', 4021667, None, None, None)
+        with mock.patch.object(eso_log_decoders, 'decode_end_cast', return_value=record):
+            self.assertIsNone(EndCastEntry.parse('2928,END_CAST,COMPLETED,4021667,84734'))
+
+        begin_log = BeginLogEntry.parse('5,BEGIN_LOG,1755729685851,15,"NA Megaserver","en","eso.live.11.1"')
+        self.assertEqual(begin_log.session_id, 15)  # logVersion
+
     def test_health_regen_edge_cases(self):
         """Test HEALTH_REGEN parsing with edge cases."""
         # Test with different health/magicka/stamina values
@@ -225,6 +247,67 @@ class TestNewLogEntryTypes(unittest.TestCase):
             self.assertGreaterEqual(entry.effective_regen, 0)
             self.assertGreater(entry.unit_id, 0)
 
+    def test_event_type_subscriptions(self):
+        """Test that unsubscribed event types are skipped and subscribed ones decoded."""
+        parser = ESOLogStructureParser(event_types=[EventType.ENDLESS_DUNGEON_BEGIN, "ENDLESS_DUNGEON_BUFF_ADDED"])
+
+        self.assertIsNone(parser.parse_line(self.sample_lines['health_regen']))
+        self.assertIsNone(parser.parse_line(self.sample_lines['endless_dungeon_stage_end']))
+        self.assertIsInstance(parser.parse_line(self.sample_lines['endless_dungeon_begin']), EndlessDungeonBeginEntry)
+        self.assertIsInstance(parser.parse_line(self.sample_lines['endless_dungeon_buff_added']), EndlessDungeonBuffAddedEntry)
+
+        parser.subscribe(EventType.HEALTH_REGEN)
+        self.assertIsInstance(parser.parse_line(self.sample_lines['health_regen']), HealthRegenEntry)
+
+        parser.unsubscribe("ENDLESS_DUNGEON_BEGIN")
+        self.assertIsNone(parser.parse_line(self.sample_lines['endless_dungeon_begin']))
+
+        parser.subscribe_all()
+        self.assertIsInstance(parser.parse_line(self.sample_lines['endless_dungeon_stage_end']), EndlessDungeonStageEndEntry)
+
+    def test_entries_are_slotted(self):
+        """Test that entry records carry no per-instance __dict__ and still behave like dataclasses."""
+        import pickle
+        entry = self.parser.parse_line(self.sample_lines['health_regen'])
+
+        self.assertFalse(hasattr(entry, '__dict__'))
+        self.assertEqual(pickle.loads(pickle.dumps(entry)), entry)
+        self.assertIn("HealthRegenEntry(line_number=252431", repr(entry))
+        with self.assertRaises(AttributeError):
+            entry.not_a_field = 1
+
+    def test_unit_stats_are_decoded_lazily(self):
+        """Test that UnitStats wraps the raw tokens and decodes components on access."""
+        import pickle
+        from eso_log_structures import UnitStats, CombatEventEntry
+        line = '20147,COMBAT_EVENT,POWER_ENERGIZE,GENERIC,4,625,0,4021356,118117,1,21896/21896,27034/29628,11388/13021,500/500,1000/1000,0,0.3121,0.5651,5.1608,*'
+        entry = CombatEventEntry.parse(line)
+        stats = entry.target_stats
+        self.assertFalse(hasattr(stats, '__dict__'))
+        self.assertEqual(stats.max_health, 21896)
+        self.assertEqual(stats.current_magicka, 27034)
+        self.assertEqual(stats.max_magicka, 29628)
+        self.assertAlmostEqual(stats.ultimate_regen, 5.1608)
+        self.assertEqual(stats, UnitStats.from_string('21896/21896,27034/29628,11388/13021,500/500,1000/1000,0,0.3121,0.5651,5.1608'))
+        self.assertEqual(pickle.loads(pickle.dumps(stats)), stats)
+        self.assertIn("max_health=21896", repr(stats))
+
+        # A malformed component only fails when it is read
+        entry = CombatEventEntry.parse(line.replace('27034/29628', 'x/29628'))
+        self.assertEqual(entry.target_stats.max_health, 21896)
+        with self.assertRaises(ValueError):
+            entry.target_stats.current_magicka
+
+        # Incomplete stats fall back to zeros
+        self.assertEqual(UnitStats.from_fields(['1/2']), UnitStats())
+
+    def test_sniff_event_type(self):
+        """Test reading the event type from a raw line without tokenizing it."""
+        from eso_log_structures import sniff_event_type
+        self.assertEqual(sniff_event_type(self.sample_lines['health_regen']), "HEALTH_REGEN")
+        self.assertEqual(sniff_event_type("40603,BEGIN_COMBAT\n"), "BEGIN_COMBAT")
+        self.assertEqual(sniff_event_type("garbage"), "")
+
 
 if __name__ == '__main__':
     unittest.main()
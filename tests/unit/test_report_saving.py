@@ -408,7 +408,7 @@ class TestReportSaving(unittest.TestCase):
         self.analyzer.current_encounter.add_player("1", "TestPlayer", "@test", "117")
         
         # Add equipped abilities so player appears in report
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.equipped_abilities = ["12345", "67890"]
         
         # Set current zone for zone-based reporting
@@ -43,7 +43,7 @@ class TestReportSplitting(unittest.TestCase):
         self.analyzer.current_difficulty = "NORMAL"
         
         # Add some damage to make the encounter meaningful
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -57,7 +57,7 @@ class TestReportSplitting(unittest.TestCase):
         self.analyzer.current_difficulty = "VETERAN"
         
         # Add some damage to make the encounter meaningful
-        player = self.analyzer.current_encounter.players["2"]
+        player = self.analyzer.current_encounter.get_player("2")
         player.total_damage = 2000
         player.equipped_abilities = ["67890"]
         
@@ -71,7 +71,7 @@ class TestReportSplitting(unittest.TestCase):
         self.analyzer.current_difficulty = "NORMAL"
         
         # Add some damage to make the encounter meaningful
-        player = self.analyzer.current_encounter.players["3"]
+        player = self.analyzer.current_encounter.get_player("3")
         player.total_damage = 1500
         player.equipped_abilities = ["11111"]
         
@@ -115,7 +115,7 @@ class TestReportSplitting(unittest.TestCase):
         self.analyzer.current_zone = "Zone A"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -127,7 +127,7 @@ class TestReportSplitting(unittest.TestCase):
         self.analyzer.current_zone = "Zone B"
         self.analyzer.current_difficulty = "VETERAN"
         
-        player = self.analyzer.current_encounter.players["2"]
+        player = self.analyzer.current_encounter.get_player("2")
         player.total_damage = 2000
         player.equipped_abilities = ["67890"]
         
@@ -181,7 +181,7 @@ class TestReportSplitting(unittest.TestCase):
         self.analyzer.current_zone = "Test Zone"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -193,7 +193,7 @@ class TestReportSplitting(unittest.TestCase):
         self.analyzer.current_zone = "Test Zone"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -220,7 +220,7 @@ class TestReportSplitting(unittest.TestCase):
         self.analyzer.current_zone = "Test Zone"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -232,7 +232,7 @@ class TestReportSplitting(unittest.TestCase):
         self.analyzer.current_zone = "Different Zone"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["2"]
+        player = self.analyzer.current_encounter.get_player("2")
         player.total_damage = 2000
         player.equipped_abilities = ["67890"]
         
@@ -293,7 +293,7 @@ class TestReportSplitting(unittest.TestCase):
             timestamp_str = dt.strftime("%y%m%d%H%M%S")
             print(f"DEBUG: Expected timestamp_str = {timestamp_str}")
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -327,7 +327,7 @@ class TestReportSplitting(unittest.TestCase):
         self.analyzer.current_zone = "Test Zone With Spaces & Special!@#"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -359,7 +359,7 @@ class TestReportSplitting(unittest.TestCase):
         self.analyzer.current_zone = "Test Zone"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
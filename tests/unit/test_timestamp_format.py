@@ -59,7 +59,7 @@ class TestTimestampFormat(unittest.TestCase):
         self.analyzer.current_zone = "Test Zone"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -88,7 +88,7 @@ class TestTimestampFormat(unittest.TestCase):
         self.analyzer.current_zone = "Test Zone"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -118,7 +118,7 @@ class TestTimestampFormat(unittest.TestCase):
         self.analyzer.current_zone = "Test Zone"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -147,7 +147,7 @@ class TestTimestampFormat(unittest.TestCase):
         self.analyzer.current_zone = "Test Zone"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -179,7 +179,7 @@ class TestTimestampFormat(unittest.TestCase):
             self.analyzer.current_zone = zone
             self.analyzer.current_difficulty = "NORMAL"
             
-            player = self.analyzer.current_encounter.players[f"{i+1}"]
+            player = self.analyzer.current_encounter.get_player(f"{i+1}")
             player.total_damage = 1000
             player.equipped_abilities = ["12345"]
             
@@ -212,7 +212,7 @@ class TestTimestampFormat(unittest.TestCase):
         self.analyzer.current_zone = "Test Zone"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         
@@ -242,7 +242,7 @@ class TestTimestampFormat(unittest.TestCase):
         self.analyzer.current_zone = "Test Zone"
         self.analyzer.current_difficulty = "NORMAL"
         
-        player = self.analyzer.current_encounter.players["1"]
+        player = self.analyzer.current_encounter.get_player("1")
         player.total_damage = 1000
         player.equipped_abilities = ["12345"]
         